@@ -48,8 +48,11 @@ def log_api_call(endpoint: str, method: str, request_data: Dict, response_data:
 
 from ..core.api_config import APIConfig, GeoscapeEndpoints, GeoscapeAddressData
 from ..models import ProfileAddress, APIUsageTracking
-from ..services.geoscape_service import GeoscapeService
-from ..services.address_validation_service import AddressValidationService
+from ..services.geoscape_service import GeoscapeService, geoscape_breaker, coordinate_resolution_stats
+from ..services.address_validation_service import AddressValidationService, search_cache
+from ..services.api_quota import QuotaExceededError, get_geoscape_quota
+from ..services.property_coordinate_cache import get_property_coordinate_store
+from ..services.bulk_address_validation import BulkAddressValidator, items_from_rows
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -83,6 +86,21 @@ class AddressValidationResponse(BaseModel):
     confidence_score: float
     property_id: Optional[str] = None
 
+class BulkAddressItemRequest(BaseModel):
+    address: str = Field(..., description="Full address to validate")
+    key: Optional[str] = Field(None, description="Caller's identifier for this row")
+    profile_id: Optional[int] = Field(None, description="Profile to attach a ProfileAddress to")
+    property_id: Optional[str] = Field(None, description="Geoscape property ID for precise validation")
+    country: str = Field(default="AU", description="Country code")
+
+class BulkAddressValidationRequest(BaseModel):
+    items: List[BulkAddressItemRequest] = Field(..., min_length=1, description="Addresses to validate")
+    save: bool = Field(default=False, description="Write validated addresses with a profile_id to ProfileAddress")
+
+class BulkAddressValidationResponse(BaseModel):
+    results: List[Dict[str, Any]]
+    summary: Dict[str, Any]
+
 class AddressCoordinatesRequest(BaseModel):
     address: str = Field(..., description="Full address to get coordinates for")
     property_id: Optional[str] = Field(None, description="Geoscape property ID for precise coordinates")
@@ -115,6 +133,7 @@ async def search_addresses(
     q: str = Query(..., min_length=3, description="Address search query"),
     country: str = Query(default="AU", description="Country code"),
     limit: int = Query(default=10, ge=1, le=50, description="Maximum suggestions"),
+    state: Optional[str] = Query(default=None, max_length=3, description="Only suggest addresses in this state (e.g. NSW)"),
     request: Request = None,
     db: Session = Depends(get_db_session)
 ):
@@ -125,7 +144,8 @@ async def search_addresses(
     using Geoscape API for Australian addresses and SmartyStreets for US addresses.
     """
     start_time = datetime.now()
-    request_data = {"query": q, "country": country, "limit": limit}
+    request_data = {"query": q, "country": country, "limit": limit, "state": state}
+    address_service = None
     
     try:
         # Initialize address validation service
@@ -136,7 +156,17 @@ async def search_addresses(
             suggestions = await address_service.search_addresses(
                 query=q,
                 country=country,
-                limit=limit
+                limit=limit,
+                state=state
+            )
+        except QuotaExceededError as e:
+            logger.warning(f"Address search degraded to {e.mode} mode: Geoscape budget reached")
+            return AddressSearchResponse(
+                suggestions=[],
+                total_count=0,
+                query=q,
+                country=country,
+                error=str(e)
             )
         except Exception as e:
             # Log the error
@@ -154,7 +184,7 @@ async def search_addresses(
             log_api_call(
                 endpoint="/api/address/search",
                 method="GET",
-                request_data={"query": q, "country": country, "limit": limit},
+                request_data=request_data,
                 response_data=error_response,
                 status_code=503,
                 response_time=response_time
@@ -198,7 +228,8 @@ async def search_addresses(
                 response_status="success",
                 response_time=(datetime.now() - start_time).total_seconds() * 1000,
                 user_id=None,  # TODO: Get from authentication
-                request=request
+                request=request,
+                credit_cost=usage_credit_cost(address_service)
             )
         
         return AddressSearchResponse(
@@ -234,7 +265,8 @@ async def search_addresses(
                 response_time=0,
                 error_message=str(e),
                 user_id=None,
-                request=request
+                request=request,
+                credit_cost=usage_credit_cost(address_service)
             )
         
         raise HTTPException(
@@ -256,6 +288,7 @@ async def validate_address(
     """
     start_time = datetime.now()
     request_data_dict = request_data.dict()
+    address_service = None
     
     try:
         # Initialize address validation service
@@ -298,7 +331,8 @@ async def validate_address(
                 response_status="success",
                 response_time=(datetime.now() - start_time).total_seconds() * 1000,
                 user_id=None,  # TODO: Get from authentication
-                request=request
+                request=request,
+                credit_cost=usage_credit_cost(address_service)
             )
         
         # Save validated address to database if validation was successful
@@ -352,7 +386,8 @@ async def validate_address(
                 response_time=0,
                 error_message=str(e),
                 user_id=None,
-                request=request
+                request=request,
+                credit_cost=usage_credit_cost(address_service)
             )
         
         raise HTTPException(
@@ -360,6 +395,61 @@ async def validate_address(
             detail=f"Address validation failed: {str(e)}"
         )
 
+@router.post("/validate/bulk", response_model=BulkAddressValidationResponse)
+async def validate_addresses_bulk(
+    request_data: BulkAddressValidationRequest,
+    request: Request = None,
+    db: Session = Depends(get_db_session)
+):
+    """
+    Validate a batch of addresses in one call.
+    
+    Addresses are validated with bounded concurrency and upstream pacing,
+    duplicates are validated once, and validated rows with a profile_id are
+    inserted into ProfileAddress in batches when ``save`` is set.
+    
+    The whole batch is validated inside this request at the upstream pace
+    (BULK_ADDRESS_REQUESTS_PER_SECOND), so the batch size is capped to keep
+    the request short. Larger imports should use bulk_validate_addresses.py,
+    which runs offline and can resume.
+    """
+    if len(request_data.items) > APIConfig.BULK_ADDRESS_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=(f"At most {APIConfig.BULK_ADDRESS_MAX_ITEMS} addresses per request; "
+                    f"use bulk_validate_addresses.py for larger imports")
+        )
+    
+    start_time = datetime.now()
+    session_factory = None
+    if request_data.save:
+        from mcp.db.session import SessionLocal
+        session_factory = SessionLocal
+    
+    validator = BulkAddressValidator(
+        session_factory=session_factory,
+        concurrency=APIConfig.BULK_ADDRESS_CONCURRENCY,
+        requests_per_second=APIConfig.BULK_ADDRESS_REQUESTS_PER_SECOND
+    )
+    rows = [item.dict() for item in request_data.items]
+    results = [result.to_dict() async for result in validator.run(items_from_rows(rows))]
+    results.sort(key=lambda result: result["sequence"])
+    summary = validator.summary()
+    
+    if db:
+        await log_api_usage(
+            db=db,
+            api_provider="geoscape",
+            endpoint="/address/validate/bulk",
+            request_data={"items": len(rows), "save": request_data.save},
+            response_status="error" if summary["aborted"] else "success",
+            response_time=(datetime.now() - start_time).total_seconds() * 1000,
+            request=request,
+            credit_cost=usage_credit_cost(validator.service)
+        )
+    
+    return BulkAddressValidationResponse(results=results, summary=summary)
+
 @router.post("/coordinates", response_model=AddressCoordinatesResponse)
 async def get_address_coordinates(
     request_data: AddressCoordinatesRequest,
@@ -373,6 +463,7 @@ async def get_address_coordinates(
     with 15 decimal precision for mapping and geocoding purposes.
     """
     start_time = time.time()
+    address_service = None
     
     try:
         # Log the request
@@ -415,7 +506,8 @@ async def get_address_coordinates(
             response_status="success" if result.get("success") else "error",
             response_time=response_time,
             request=request,
-            error_message=result.get("error")
+            error_message=result.get("error"),
+            credit_cost=usage_credit_cost(address_service)
         )
         
         if result.get("success"):
@@ -470,7 +562,8 @@ async def get_address_coordinates(
             response_status="error",
             response_time=response_time,
             request=request,
-            error_message=error_msg
+            error_message=error_msg,
+            credit_cost=usage_credit_cost(address_service)
         )
         
         return AddressCoordinatesResponse(
@@ -479,6 +572,12 @@ async def get_address_coordinates(
             error=error_msg
         )
 
+def usage_credit_cost(address_service: Optional[AddressValidationService]) -> float:
+    """Credits spent by a request, based on the paid calls its service made"""
+    if address_service is None:
+        return 0.0
+    return APIConfig.GEOSCAPE_CREDIT_COST * address_service.billable_calls
+
 async def log_api_usage(
     db: Session,
     api_provider: str,
@@ -488,14 +587,21 @@ async def log_api_usage(
     response_time: float,
     user_id: Optional[int] = None,
     request: Request = None,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    credit_cost: Optional[float] = None
 ):
     """
     Log API usage for billing and monitoring purposes.
     
     This function records API calls in the APIUsageTracking table for
     cost tracking, quota management, and performance monitoring.
+    Billable Geoscape spend is also added to the in-memory quota.
     """
+    if credit_cost is None:
+        credit_cost = APIConfig.GEOSCAPE_CREDIT_COST
+    if api_provider == "geoscape" and credit_cost > 0:
+        get_geoscape_quota().record(credit_cost)
+    
     try:
         # Create API usage tracking record
         usage_record = APIUsageTracking(
@@ -504,14 +610,14 @@ async def log_api_usage(
             APIEndpoint=endpoint,
             RequestType="address_validation",  # Add the required RequestType field
             CallCount=1,
-            CreditCost=0.001,  # TODO: Calculate actual cost based on provider
+            CreditCost=credit_cost,
             ResponseTime=response_time,
             RequestData=json.dumps(request_data),
             ResponseStatus=response_status,
             ResponseData=json.dumps({"status": response_status}),
             ErrorMessage=error_message,
             BillingPeriod=datetime.now().strftime("%Y-%m"),
-            IsBillable=True,
+            IsBillable=credit_cost > 0,
             IPAddress=request.client.host if request else None,
             UserAgent=request.headers.get("user-agent") if request else None
         )
@@ -591,12 +697,17 @@ async def health_check():
         "services": {
             "geoscape": {
                 "configured": APIConfig.validate_geoscape_config(),
-                "base_url": APIConfig.GEOSCAPE_BASE_URL
+                "base_url": APIConfig.GEOSCAPE_BASE_URL,
+                "circuit_breaker": geoscape_breaker.snapshot(),
+                "coordinate_resolution": dict(coordinate_resolution_stats)
             },
             "smarty_streets": {
                 "configured": APIConfig.validate_smarty_streets_config(),
                 "base_url": APIConfig.SMARTY_STREETS_BASE_URL
             }
         },
+        "quota": get_geoscape_quota().snapshot(),
+        "search_cache": search_cache.stats(),
+        "coordinate_cache": get_property_coordinate_store().snapshot(),
         "timestamp": datetime.now().isoformat()
     } 
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Job Application API Endpoints
+
+Endpoints:
+- GET /api/v1/applications - Keyset-paginated application pipeline with current status and status counts
+- GET /api/v1/applications/{application_id} - Application with status history, interviews, tasks and notes
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from mcp.db.session import get_db
+from app.models import User
+from app.services.application_pipeline import get_application_detail, list_applications
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1/applications",
+    tags=["Applications"]
+)
+
+
+class ApplicationSummary(BaseModel):
+    job_application_id: int
+    job_title: str
+    company_name: str
+    location: Optional[str] = None
+    source: Optional[str] = None
+    date_applied: datetime
+    status: str
+    status_date: Optional[datetime] = None
+
+
+class ApplicationListResponse(BaseModel):
+    items: List[ApplicationSummary]
+    status_counts: Dict[str, int]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+def _profile_id(db: Session, user_id: int) -> int:
+    profile_id = db.execute(select(User.ProfileID).where(User.UserID == user_id)).scalar_one_or_none()
+    if profile_id is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return profile_id
+
+
+@router.get("", response_model=ApplicationListResponse)
+async def get_applications(
+    user_id: int = Query(..., description="User whose applications are listed"),
+    limit: int = Query(25, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    status: Optional[str] = Query(None, description="Only applications currently in this status"),
+    db: Session = Depends(get_db)
+):
+    """
+    List a user's applications, newest first.
+
+    Pages are addressed by cursor rather than offset, so deep pages cost the
+    same as the first. status_counts and total cover all of the user's
+    applications regardless of the status filter.
+    """
+    profile_id = _profile_id(db, user_id)
+    try:
+        page = list_applications(db, profile_id, limit=limit, cursor=cursor, status=status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ApplicationListResponse(
+        items=[ApplicationSummary(**item) for item in page.items],
+        status_counts=page.status_counts,
+        total=page.total,
+        next_cursor=page.next_cursor
+    )
+
+
+@router.get("/{application_id}", response_model=Dict[str, Any])
+async def get_application(
+    application_id: int,
+    user_id: int = Query(..., description="Owner of the application"),
+    db: Session = Depends(get_db)
+):
+    """Get an application with its status history, interviews, tasks and notes"""
+    detail = get_application_detail(db, _profile_id(db, user_id), application_id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return detail
@@ -0,0 +1,57 @@
+"""
+Dashboard API Endpoints
+
+Endpoints:
+- GET /api/v1/dashboard/{user_id} - Profile score, analytics, recent applications, notifications and gamification
+"""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+
+from mcp.db.session import SessionLocal
+from app.services.dashboard import build_dashboard, dashboard_body, dashboard_etag, etag_matches
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1/dashboard",
+    tags=["Dashboard"]
+)
+
+
+def get_session_factory():
+    """Session factory for the dashboard sections (each section opens its own session)"""
+    return SessionLocal
+
+
+@router.get("/{user_id}")
+async def get_dashboard(
+    user_id: int,
+    if_none_match: Optional[str] = Header(None),
+    session_factory=Depends(get_session_factory)
+):
+    """
+    Get a user's career dashboard.
+
+    Sections are fetched concurrently on separate pooled connections. The
+    response carries an ETag; send it back in If-None-Match to get a 304
+    when nothing has changed.
+    """
+    dashboard = await build_dashboard(session_factory, user_id)
+    if dashboard is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    body = dashboard_body(dashboard)
+    if dashboard["errors"]:
+        # A partial dashboard must not be revalidated as current
+        return Response(content=body, media_type="application/json", headers={"Cache-Control": "no-store"})
+
+    etag = dashboard_etag(body)
+    # Revalidate on every view; the dashboard is per-user
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
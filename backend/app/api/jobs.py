@@ -0,0 +1,99 @@
+"""
+Job Board API Endpoints
+
+Endpoints:
+- POST /api/v1/jobs/ingest - Import a JSON Lines or CSV job feed
+"""
+
+import asyncio
+import io
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from mcp.db.session import get_db
+from app.core.api_config import APIConfig
+from app.services.fit_score_recompute import get_fit_score_recomputer
+from app.services.job_ingestion import (
+    IngestSummary, JobIngestor, feed_format, get_job_fingerprint_index, iter_feed_records,
+)
+from app.services.search_index import get_search_index_sync
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1/jobs",
+    tags=["Jobs"]
+)
+
+
+class JobIngestResponse(BaseModel):
+    success: bool
+    message: str
+    summary: Dict[str, Any]
+
+
+def _refresh_ingested_jobs(summary: IngestSummary):
+    """Queue fit score and search index work for the jobs committed by an ingestion run"""
+    # New jobs need scoring; jobs whose requirements changed need their stored scores refreshed
+    recomputer = get_fit_score_recomputer()
+    for job_id in summary.inserted_job_ids:
+        recomputer.mark_new_job(job_id)
+    for job_id in summary.skill_changed_job_ids:
+        recomputer.mark_job(job_id)
+    # Bulk writes bypass the ORM commit hooks; index the new and changed jobs now
+    get_search_index_sync().wake()
+
+
+@router.post("/ingest", response_model=JobIngestResponse)
+async def ingest_jobs(
+    file: UploadFile = File(...),
+    board: Optional[str] = Form(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Import a job feed.
+
+    The upload is read line by line and processed in chunks; postings are
+    de-duplicated against every stored job, reposts and content changes are
+    recorded, and new jobs are bulk inserted. Uploads share one fingerprint
+    index and run one at a time. Use ingest_jobs.py for very large feeds.
+    """
+    fmt = feed_format(file.filename or "")
+    ingestor = JobIngestor(
+        db,
+        chunk_size=APIConfig.JOB_INGEST_CHUNK_SIZE,
+        max_distance=APIConfig.JOB_DEDUP_MAX_DISTANCE,
+        repost_after_days=APIConfig.JOB_REPOST_AFTER_DAYS,
+        default_board=board,
+        index=get_job_fingerprint_index(),
+    )
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    summary = IngestSummary()
+
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            None, ingestor.ingest, iter_feed_records(stream, fmt), None, summary
+        )
+    except ValueError as e:
+        # Unreadable feed (not UTF-8, malformed CSV); malformed records are counted as invalid
+        raise HTTPException(status_code=400, detail=f"Could not read job feed: {str(e)}")
+    except Exception as e:
+        logger.error(f"❌ Job ingestion failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Job ingestion failed: {str(e)}")
+    finally:
+        stream.detach()
+        # Chunks committed before a failure still need their follow-up work
+        _refresh_ingested_jobs(summary)
+
+    result = summary.to_dict()
+    return JobIngestResponse(
+        success=True,
+        message=f"Processed {summary.processed} postings: {result['inserted']} new, "
+                f"{result['updated']} updated, {result['duplicate']} duplicates",
+        summary=result
+    )
@@ -3,7 +3,7 @@ MCP (Model Context Protocol) FastAPI Routes
 Exposes database operations through REST API endpoints with comprehensive logging.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 import logging
@@ -21,6 +21,8 @@ router = APIRouter(
 class QueryRequest(BaseModel):
     query: str
     params: Optional[Dict[str, Any]] = None
+    explain: bool = False  # Include the query plan in the response
+    profile: bool = False  # Include execution time and rows returned in the response
 
 class RecordCreateRequest(BaseModel):
     table: str
@@ -57,7 +59,12 @@ async def execute_query(request: QueryRequest):
     logger.info(f"🔍 MCP Query Request: {request.query}")
     
     try:
-        result = await mcp_server.execute_query(request.query, request.params)
+        result = await mcp_server.execute_query(
+            request.query,
+            request.params,
+            explain=request.explain,
+            profile=request.profile
+        )
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -70,6 +77,37 @@ async def execute_query(request: QueryRequest):
         logger.error(f"❌ MCP Query Failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}")
 
+@router.get("/slow-queries")
+async def get_slow_queries(limit: int = Query(default=20, ge=1, le=100)):
+    """Get the slowest queries executed since startup (or the last reset)"""
+    logger.info("🔍 MCP Slow Queries Request")
+    
+    queries = mcp_server.slow_queries.top(limit)
+    return {
+        "success": True,
+        "queries": queries,
+        "query_count": len(queries),
+        "capacity": mcp_server.slow_queries.capacity
+    }
+
+@router.delete("/slow-queries")
+async def reset_slow_queries():
+    """Clear the slow query log"""
+    logger.info("🔍 MCP Slow Queries Reset Request")
+    
+    mcp_server.slow_queries.clear()
+    return {"success": True}
+
+@router.get("/statement-cache")
+async def get_statement_cache_stats():
+    """Get statement cache size and hit rate"""
+    logger.info("🔍 MCP Statement Cache Stats Request")
+    
+    return {
+        "success": True,
+        "statement_cache": mcp_server.statement_cache.stats()
+    }
+
 @router.post("/create")
 async def create_record(request: RecordCreateRequest):
     """Create a new record in the specified table"""
@@ -181,9 +219,19 @@ async def get_mcp_capabilities():
             },
             {
                 "name": "execute_query",
-                "description": "Execute custom SQL queries",
+                "description": "Execute custom SQL queries (optional explain/profile flags)",
                 "endpoint": "POST /api/v1/mcp/query"
             },
+            {
+                "name": "slow_queries",
+                "description": "List the slowest queries seen by the server",
+                "endpoint": "GET /api/v1/mcp/slow-queries"
+            },
+            {
+                "name": "statement_cache",
+                "description": "Report statement cache size and hit rate",
+                "endpoint": "GET /api/v1/mcp/statement-cache"
+            },
             {
                 "name": "create_record",
                 "description": "Create new records in any table",
@@ -216,6 +264,8 @@ async def get_mcp_capabilities():
             "Database connection management",
             "Transaction support",
             "Parameterized query support",
+            "Query plan and timing capture",
+            "Normalized statement cache with literal parameterization",
             "Health monitoring"
         ]
     }
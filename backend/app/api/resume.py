@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from openai import OpenAI
 from mcp.db.session import get_db
 from app.models import User, Profile, ProfileWorkExperience, ProfileEducation, Skills, ProfileCertification, ProfileSocialLink, GlobalLinkType, ProfileAddress
+from app.services.fit_score_recompute import create_profile_version, get_fit_score_recomputer
+from app.services.skill_dictionary import get_skill_normalizer
+from app.services.profile_score import calculate_profile_score
 import tempfile
 import docx
 import PyPDF2
@@ -542,9 +545,12 @@ async def save_first_resume_to_profile(
                     skill = Skills(
                         ProfileID=profile.ProfileID,
                         SkillName=skill_name,
+                        SkillDictionaryID=get_skill_normalizer().resolve(db, skill_name, str(user_id)),
                         createdBy=str(user_id)
                     )
                     db.add(skill)
+            # Fit scores are kept per profile version
+            create_profile_version(db, profile.ProfileID, str(user_id))
             updated_fields.append("skills")
 
         # Save certifications
@@ -563,6 +569,9 @@ async def save_first_resume_to_profile(
 
         # Commit all changes
         db.commit()
+
+        if "skills" in updated_fields:
+            get_fit_score_recomputer().mark_profile(user_id)
         
         logger.info(f"✅ Successfully saved resume data for user {user_id}. Updated fields: {', '.join(updated_fields)}")
         
@@ -1124,10 +1133,13 @@ async def save_profile_section(
                     skill = Skills(
                         ProfileID=profile.ProfileID,
                         SkillName=skill_name,
+                        SkillDictionaryID=get_skill_normalizer().resolve(db, skill_name, str(user_id)),
                         Category=skill_type,
                         createdBy=str(user_id)
                     )
                     db.add(skill)
+            # Fit scores are kept per profile version
+            create_profile_version(db, profile.ProfileID, str(user_id))
             updated_fields.append("skills")
 
         # Commit changes
@@ -1141,6 +1153,9 @@ async def save_profile_section(
             import traceback
             logger.error(f"❌ Commit traceback: {traceback.format_exc()}")
             raise
+
+        if section == "skills":
+            get_fit_score_recomputer().mark_profile(user_id)
         
         logger.info(f"✅ Successfully saved profile section '{section}' for user {user_id}. Updated: {', '.join(updated_fields)}")
         
@@ -1221,170 +1236,19 @@ async def get_profile_completion_score(
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        # Calculate scores for each section
-        scores = {}
-        total_points = 0
-        max_points = 0
-
-        # Basic Info (25 points)
-        basic_info_score = 0
-        basic_info_max = 25
-        if profile.FirstName and profile.LastName:
-            basic_info_score += 10
-        if profile.EmailAddress:
-            basic_info_score += 5
-        if profile.PhoneNumber:
-            basic_info_score += 5
-        if profile.DateOfBirth:
-            basic_info_score += 5
-        scores["basic_info"] = {
-            "score": basic_info_score,
-            "max": basic_info_max,
-            "percentage": (basic_info_score / basic_info_max) * 100
-        }
-        total_points += basic_info_score
-        max_points += basic_info_max
-
-        # Work Experience (30 points)
-        work_exp_count = db.query(ProfileWorkExperience).filter(
-            ProfileWorkExperience.ProfileID == profile.ProfileID
-        ).count()
-        work_exp_score = min(work_exp_count * 10, 30)  # 10 points per experience, max 30
-        work_exp_max = 30
-        scores["work_experience"] = {
-            "score": work_exp_score,
-            "max": work_exp_max,
-            "percentage": (work_exp_score / work_exp_max) * 100,
-            "count": work_exp_count
-        }
-        total_points += work_exp_score
-        max_points += work_exp_max
-
-        # Education (20 points)
-        education_count = db.query(ProfileEducation).filter(
-            ProfileEducation.ProfileID == profile.ProfileID
-        ).count()
-        education_score = min(education_count * 10, 20)  # 10 points per education, max 20
-        education_max = 20
-        scores["education"] = {
-            "score": education_score,
-            "max": education_max,
-            "percentage": (education_score / education_max) * 100,
-            "count": education_count
-        }
-        total_points += education_score
-        max_points += education_max
-
-        # Skills (15 points)
-        skills_count = db.query(Skills).filter(
-            Skills.ProfileID == profile.ProfileID
-        ).count()
-        skills_score = min(skills_count * 2, 15)  # 2 points per skill, max 15
-        skills_max = 15
-        scores["skills"] = {
-            "score": skills_score,
-            "max": skills_max,
-            "percentage": (skills_score / skills_max) * 100,
-            "count": skills_count
-        }
-        total_points += skills_score
-        max_points += skills_max
-
-        # Certifications (10 points)
-        cert_count = db.query(ProfileCertification).filter(
-            ProfileCertification.ProfileID == profile.ProfileID
-        ).count()
-        cert_score = min(cert_count * 5, 10)  # 5 points per certification, max 10
-        cert_max = 10
-        scores["certifications"] = {
-            "score": cert_score,
-            "max": cert_max,
-            "percentage": (cert_score / cert_max) * 100,
-            "count": cert_count
-        }
-        total_points += cert_score
-        max_points += cert_max
-
-        # Calculate overall score
-        overall_percentage = (total_points / max_points) * 100 if max_points > 0 else 0
-        
-        # Determine profile level
-        if overall_percentage >= 90:
-            level = "Expert"
-            badge = "🏆"
-        elif overall_percentage >= 75:
-            level = "Advanced"
-            badge = "🥇"
-        elif overall_percentage >= 50:
-            level = "Intermediate"
-            badge = "🥈"
-        elif overall_percentage >= 25:
-            level = "Beginner"
-            badge = "🥉"
-        else:
-            level = "New"
-            badge = "🌟"
-
-        # Generate recommendations
-        recommendations = []
-        if basic_info_score < basic_info_max:
-            recommendations.append("Complete your basic information")
-        if work_exp_score < work_exp_max:
-            recommendations.append("Add more work experience")
-        if education_score < education_max:
-            recommendations.append("Add your education details")
-        if skills_score < skills_max:
-            recommendations.append("Add more skills to your profile")
-        if cert_score < cert_max:
-            recommendations.append("Add certifications to boost your profile")
-
-        logger.info(f"✅ Profile score calculated for user {user_id}: {overall_percentage:.1f}% ({level})")
+        data = calculate_profile_score(db, profile)
+        overall = data["overall_score"]
+        logger.info(f"✅ Profile score calculated for user {user_id}: {overall['percentage']:.1f}% ({overall['level']})")
         
         return {
             "success": True,
-            "data": {
-                "overall_score": {
-                    "points": total_points,
-                    "max_points": max_points,
-                    "percentage": overall_percentage,
-                    "level": level,
-                    "badge": badge
-                },
-                "section_scores": scores,
-                "recommendations": recommendations,
-                "next_milestone": get_next_milestone(overall_percentage)
-            }
+            "data": data
         }
 
     except Exception as e:
         logger.error(f"❌ Error calculating profile score for user {user_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to calculate profile score: {str(e)}")
 
-def get_next_milestone(current_percentage: float) -> dict:
-    """Get the next milestone to achieve"""
-    milestones = [
-        {"percentage": 25, "title": "Beginner", "description": "Complete basic profile"},
-        {"percentage": 50, "title": "Intermediate", "description": "Add work experience"},
-        {"percentage": 75, "title": "Advanced", "description": "Add skills and certifications"},
-        {"percentage": 90, "title": "Expert", "description": "Complete all sections"}
-    ]
-    
-    for milestone in milestones:
-        if current_percentage < milestone["percentage"]:
-            return {
-                "target_percentage": milestone["percentage"],
-                "points_needed": milestone["percentage"] - current_percentage,
-                "title": milestone["title"],
-                "description": milestone["description"]
-            }
-    
-    return {
-        "target_percentage": 100,
-        "points_needed": 0,
-        "title": "Perfect",
-        "description": "Your profile is complete!"
-    } 
-
 @router.post("/profile/reset-score/{user_id}")
 async def reset_profile_score(
     user_id: int,
@@ -0,0 +1,85 @@
+"""
+Search API Endpoints
+
+Endpoints:
+- GET /api/v1/search - Ranked full-text search over a user's tracked jobs, applications and notes
+"""
+
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from mcp.db.session import get_db
+from app.services.search_index import DOC_TYPES, get_search_backend, search_documents
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["Search"]
+)
+
+
+class SearchResult(BaseModel):
+    type: str
+    id: int
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    snippet: Optional[str] = None
+    score: float
+    job_application_id: Optional[int] = None
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    page: int
+    page_size: int
+    backend: str
+    results: List[SearchResult]
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    user_id: int = Query(..., description="User whose documents are searched"),
+    types: Optional[str] = Query(None, description="Comma-separated subset of: job, application, note"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """
+    Search job descriptions, applications and application notes.
+
+    Jobs are limited to those the user has interacted with; applications and
+    notes to the user's profile. Results are ranked by relevance with title
+    matches weighted above body matches.
+    """
+    doc_types = [t.strip() for t in types.split(",") if t.strip()] if types else []
+    unknown = sorted(set(doc_types) - set(DOC_TYPES))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search types: {', '.join(unknown)}")
+
+    backend = get_search_backend()
+    try:
+        result = search_documents(db, backend, q, user_id, doc_types, page=page, page_size=page_size)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Search failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+    return SearchResponse(
+        query=q,
+        total=result.total,
+        page=page,
+        page_size=page_size,
+        backend=backend.name,
+        results=[SearchResult(**hit.to_dict()) for hit in result.hits]
+    )
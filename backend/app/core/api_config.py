@@ -10,11 +10,63 @@ class APIConfig:
     # Geoscape Predictive API Configuration
     GEOSCAPE_API_KEY: str = "9x4fpNyrr8VxVqWvPeKnuEWaH9vxgGxS"
     GEOSCAPE_CONSUMER_SECRET: str = "8XkTgtu0Sz1D0aG9"
-    GEOSCAPE_BASE_URL: str = "https://api.psma.com.au/v1"
+    GEOSCAPE_BASE_URL: str = os.getenv('GEOSCAPE_BASE_URL', "https://api.psma.com.au/v1")  # point at geoscape_replay_server.py for load tests
     GEOSCAPE_TIMEOUT: int = 30  # seconds
+    # Write every Geoscape response to fixture files in this directory (for replay)
+    GEOSCAPE_RECORD_DIR: Optional[str] = os.getenv('GEOSCAPE_RECORD_DIR')
+    
+    # Geoscape circuit breaker
+    GEOSCAPE_BREAKER_FAILURE_RATE: float = float(os.getenv('GEOSCAPE_BREAKER_FAILURE_RATE', '0.5'))
+    GEOSCAPE_BREAKER_MINIMUM_CALLS: int = int(os.getenv('GEOSCAPE_BREAKER_MINIMUM_CALLS', '5'))
+    GEOSCAPE_BREAKER_WINDOW_SECONDS: float = float(os.getenv('GEOSCAPE_BREAKER_WINDOW_SECONDS', '60'))
+    GEOSCAPE_BREAKER_OPEN_SECONDS: float = float(os.getenv('GEOSCAPE_BREAKER_OPEN_SECONDS', '30'))
+    
+    # Geoscape spend control (credits per billing period, 0 disables the budget)
+    GEOSCAPE_CREDIT_COST: float = float(os.getenv('GEOSCAPE_CREDIT_COST', '0.001'))
+    GEOSCAPE_MONTHLY_CREDIT_BUDGET: float = float(os.getenv('GEOSCAPE_MONTHLY_CREDIT_BUDGET', '100'))
+    GEOSCAPE_BUDGET_SOFT_RATIO: float = float(os.getenv('GEOSCAPE_BUDGET_SOFT_RATIO', '0.9'))
+    
+    # Cached address search results (served for free, and while over the soft budget)
+    ADDRESS_SEARCH_CACHE_TTL: int = int(os.getenv('ADDRESS_SEARCH_CACHE_TTL', '3600'))  # seconds
+    ADDRESS_SEARCH_CACHE_SIZE: int = int(os.getenv('ADDRESS_SEARCH_CACHE_SIZE', '5000'))
+    
+    # PropertyID -> coordinates cache (PropertyCoordinateCache table plus in-process LRU)
+    PROPERTY_CACHE_TTL_DAYS: int = int(os.getenv('PROPERTY_CACHE_TTL_DAYS', '30'))
+    PROPERTY_CACHE_MEMORY_SIZE: int = int(os.getenv('PROPERTY_CACHE_MEMORY_SIZE', '10000'))
+    
+    # Bulk address validation (imports and legacy Profile.AddressLine migration)
+    BULK_ADDRESS_MAX_ITEMS: int = int(os.getenv('BULK_ADDRESS_MAX_ITEMS', '50'))  # per API request (~10s at 5 rps)
+    BULK_ADDRESS_CONCURRENCY: int = int(os.getenv('BULK_ADDRESS_CONCURRENCY', '4'))
+    BULK_ADDRESS_REQUESTS_PER_SECOND: float = float(os.getenv('BULK_ADDRESS_REQUESTS_PER_SECOND', '5'))
+    
+    # Job feed ingestion (ingest_jobs.py and POST /api/v1/jobs/ingest)
+    JOB_INGEST_CHUNK_SIZE: int = int(os.getenv('JOB_INGEST_CHUNK_SIZE', '500'))
+    JOB_REPOST_AFTER_DAYS: int = int(os.getenv('JOB_REPOST_AFTER_DAYS', '7'))
+    JOB_DEDUP_MAX_DISTANCE: int = int(os.getenv('JOB_DEDUP_MAX_DISTANCE', '4'))  # SimHash bits (0-6)
+    
+    # Full-text search (GET /api/v1/search)
+    SEARCH_BACKEND: str = os.getenv('SEARCH_BACKEND', 'auto')  # auto, mssql or embedded
+    SEARCH_INDEX_PATH: str = os.getenv('SEARCH_INDEX_PATH', 'search_index.db')  # embedded index file
+    SEARCH_SYNC_INTERVAL: float = float(os.getenv('SEARCH_SYNC_INTERVAL', '30'))  # seconds
+    
+    # Analytics rollups (UserAnalytics, UserJobBoardJobSearchAnalytics)
+    ANALYTICS_ROLLUP_INTERVAL: float = float(os.getenv('ANALYTICS_ROLLUP_INTERVAL', '30'))  # seconds between drains
+    ANALYTICS_REBUILD_INTERVAL: float = float(os.getenv('ANALYTICS_REBUILD_INTERVAL', '86400'))  # full rebuild; 0 disables
+    
+    # Notification emails (UserNotification / UserNotificationPreference)
+    NOTIFICATION_DISPATCH_INTERVAL: float = float(os.getenv('NOTIFICATION_DISPATCH_INTERVAL', '60'))  # seconds
+    NOTIFICATION_BATCH_SIZE: int = int(os.getenv('NOTIFICATION_BATCH_SIZE', '500'))  # notifications per batch
+    NOTIFICATION_DIGEST_HOUR: int = int(os.getenv('NOTIFICATION_DIGEST_HOUR', '8'))  # UTC hour for digests
+    NOTIFICATION_DIGEST_WEEKDAY: int = int(os.getenv('NOTIFICATION_DIGEST_WEEKDAY', '0'))  # 0 = Monday
+    NOTIFICATION_MAX_EMAIL_ATTEMPTS: int = int(os.getenv('NOTIFICATION_MAX_EMAIL_ATTEMPTS', '5'))  # refused sends before giving up
     
 
     
+    # Offline AU address index for autocomplete (built by build_address_index.py)
+    LOCAL_ADDRESS_INDEX_PATH: Optional[str] = os.getenv('LOCAL_ADDRESS_INDEX_PATH')
+    # Suburb/postcode centroids for approximate coordinates (defaults to <index>/centroids.json)
+    FALLBACK_CENTROIDS_PATH: Optional[str] = os.getenv('FALLBACK_CENTROIDS_PATH')
+    
     # Geoscape API Products (per your subscription)
     GEOSCAPE_ADDRESSES_API: bool = True
     GEOSCAPE_PREDICTIVE_API: bool = True
@@ -45,6 +97,13 @@ class APIConfig:
     
 
     
+    @classmethod
+    def validate_local_address_index_config(cls) -> bool:
+        """Validate that a local address index has been built at the configured path"""
+        return bool(cls.LOCAL_ADDRESS_INDEX_PATH) and os.path.exists(
+            os.path.join(cls.LOCAL_ADDRESS_INDEX_PATH, "meta.json")
+        )
+    
     @classmethod
     def validate_smarty_streets_config(cls) -> bool:
         """Validate that Smarty Streets API is properly configured"""
@@ -0,0 +1,208 @@
+# Rate limiting for auth and address endpoints
+# Token buckets keyed per endpoint and client, enforced as ASGI middleware
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """A token bucket applied to one endpoint.
+
+    Args:
+        name: Bucket name, used in keys and logs
+        path: Exact request path the rule applies to
+        methods: HTTP methods the rule applies to
+        limit: Requests allowed per ``period`` (also the burst size)
+        period: Window length in seconds
+        scope: ``ip`` to key by client address, ``user`` to key by the
+            Authorization header. The app does not issue credentials yet, so
+            only ``ip`` rules are enabled by default; requests without an
+            Authorization header skip ``user`` rules.
+    """
+
+    name: str
+    path: str
+    methods: Tuple[str, ...]
+    limit: int
+    period: float
+    scope: str = "ip"
+
+    @property
+    def refill_rate(self) -> float:
+        return self.limit / self.period
+
+
+class RateLimitBackend(ABC):
+    """Storage for token bucket state.
+
+    The in-memory backend is per process. A shared backend (e.g. Redis)
+    only has to implement ``acquire`` atomically to enforce limits across
+    workers.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        """Take one token from ``key``'s bucket.
+
+        Returns ``(allowed, retry_after_seconds)``.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local token buckets.
+
+    Buckets refill continuously, so the limit behaves as a sliding window
+    rather than resetting on fixed boundaries. Once ``max_keys`` buckets
+    exist, the least recently used one is evicted, so a client spraying
+    new keys only pushes out idle buckets instead of resetting active ones.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                while len(self._buckets) >= self.max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [float(rule.limit), now]
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens = min(float(rule.limit), bucket[0] + (now - bucket[1]) * rule.refill_rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return True, 0.0
+
+            bucket[0] = tokens
+            return False, (1.0 - tokens) / rule.refill_rate
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+REJECTION_BODY = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+
+
+class RateLimitMiddleware:
+    """ASGI middleware that rejects requests exceeding a rule with 429.
+
+    Works on the raw ASGI scope, so a rejected request never reaches
+    routing, dependencies, the request body or the database.
+    """
+
+    def __init__(
+        self,
+        app,
+        rules: List[RateLimitRule],
+        backend: Optional[RateLimitBackend] = None,
+        enabled: bool = True,
+        trust_forwarded: bool = False
+    ):
+        self.app = app
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.enabled = enabled
+        # Only honour X-Forwarded-For behind a proxy that overwrites it
+        self.trust_forwarded = trust_forwarded
+        self._rules: Dict[str, List[RateLimitRule]] = {}
+        for rule in rules:
+            self._rules.setdefault(rule.path, []).append(rule)
+
+    def _client_ip(self, scope) -> str:
+        if self.trust_forwarded:
+            for name, value in scope.get("headers", []):
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    def _user_key(scope) -> Optional[str]:
+        for name, value in scope.get("headers", []):
+            if name == b"authorization":
+                return hashlib.blake2b(value, digest_size=12).hexdigest()
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rules = self._rules.get(scope["path"])
+        if rules:
+            method = scope["method"]
+            for rule in rules:
+                if method not in rule.methods:
+                    continue
+                identity = self._client_ip(scope) if rule.scope == "ip" else self._user_key(scope)
+                if identity is None:
+                    continue
+                allowed, retry_after = self.backend.acquire(f"{rule.name}:{rule.scope}:{identity}", rule)
+                if not allowed:
+                    await self._reject(send, retry_after)
+                    return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, retry_after: float):
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(REJECTION_BODY)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": REJECTION_BODY})
+
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+
+def parse_rate(value: str) -> Tuple[int, float]:
+    """Parse ``"10/minute"`` into ``(10, 60.0)``"""
+    count, _, period = value.partition("/")
+    return int(count), float(PERIODS[period.strip().lower()])
+
+
+def default_rules() -> List[RateLimitRule]:
+    """Rules for the auth, address and job ingestion endpoints, overridable via environment"""
+    specs = [
+        ("login", "/api/v1/auth/login", ("POST",), "ip", "RATE_LIMIT_LOGIN", "10/minute"),
+        ("forgot_password", "/api/v1/auth/forgot-password", ("POST",), "ip", "RATE_LIMIT_FORGOT_PASSWORD", "5/minute"),
+        ("address_search", "/api/address/search", ("GET",), "ip", "RATE_LIMIT_ADDRESS_SEARCH_IP", "120/minute"),
+        ("address_bulk", "/api/address/validate/bulk", ("POST",), "ip", "RATE_LIMIT_ADDRESS_BULK", "5/minute"),
+        ("jobs_ingest", "/api/v1/jobs/ingest", ("POST",), "ip", "RATE_LIMIT_JOBS_INGEST", "5/minute"),
+        ("search", "/api/v1/search", ("GET",), "ip", "RATE_LIMIT_SEARCH", "60/minute"),
+    ]
+    rules = []
+    for name, path, methods, scope, env_var, default in specs:
+        limit, period = parse_rate(os.getenv(env_var, default))
+        rules.append(RateLimitRule(name=name, path=path, methods=methods, limit=limit, period=period, scope=scope))
+    return rules
+
+
+def rate_limiting_enabled() -> bool:
+    return os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+def trust_forwarded_for() -> bool:
+    return os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() in ("1", "true", "yes")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -11,8 +12,23 @@ from app.api.address import router as address_router
 from app.api.resume import router as resume_router
 from app.api.mcp_routes import router as mcp_router
 from app.api.prompt_routes import router as prompt_router
+from app.api.jobs import router as jobs_router
+from app.api.search import router as search_router
+from app.api.applications import router as applications_router
+from app.api.dashboard import router as dashboard_router
 from app.monitoring import get_health_status, is_healthy
+from app.core.rate_limit import RateLimitMiddleware, default_rules, rate_limiting_enabled, trust_forwarded_for
 from mcp.db.session import get_db
+from app.services.last_login_writer import get_last_login_writer
+from app.services.auth_logging import get_auth_log_buffer
+from app.services.api_quota import seed_geoscape_quota
+from app.services.password_hashing import get_password_hasher
+from app.services.fallback_geocoder import get_fallback_geocoder
+from app.services.fit_score_recompute import get_fit_score_recomputer
+from app.services.search_index import get_search_index_sync
+from app.services.analytics_rollup import get_analytics_rollup
+from app.services.notification_dispatcher import get_notification_dispatcher
+from app.services.email_utils import get_mail_queue
 
 app = FastAPI(
     title="JobTrackerDB API",
@@ -20,6 +36,14 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Rate limiting sits inside CORS so 429 responses still carry CORS headers
+app.add_middleware(
+    RateLimitMiddleware,
+    rules=default_rules(),
+    enabled=rate_limiting_enabled(),
+    trust_forwarded=trust_forwarded_for(),
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +59,37 @@ app.include_router(address_router)  # Address endpoints
 app.include_router(resume_router)  # Resume parsing endpoints
 app.include_router(mcp_router)  # MCP database operations
 app.include_router(prompt_router)  # Prompt management endpoints
+app.include_router(jobs_router)  # Job feed ingestion
+app.include_router(search_router)  # Full-text search
+app.include_router(applications_router)  # Job application pipeline
+app.include_router(dashboard_router)  # Career dashboard
+
+@app.on_event("startup")
+async def start_background_writers():
+    """Start background writers and load shared state used by the request path"""
+    get_last_login_writer().start()
+    get_auth_log_buffer().start()
+    get_fit_score_recomputer().start()
+    get_search_index_sync().start()
+    get_analytics_rollup().start()
+    get_mail_queue().start()
+    if get_mail_queue().pool.settings.configured:
+        get_notification_dispatcher().start()
+    await asyncio.get_running_loop().run_in_executor(None, seed_geoscape_quota)
+    # Calibrate the password hash work factor now rather than on the first login
+    await asyncio.get_running_loop().run_in_executor(None, get_password_hasher)
+    await asyncio.get_running_loop().run_in_executor(None, get_fallback_geocoder)
+
+@app.on_event("shutdown")
+async def stop_background_writers():
+    """Flush and stop background writers"""
+    await get_last_login_writer().stop()
+    await get_auth_log_buffer().stop()
+    await get_fit_score_recomputer().stop()
+    await get_search_index_sync().stop()
+    await get_analytics_rollup().stop()
+    await get_notification_dispatcher().stop()
+    await get_mail_queue().stop()
 
 @app.get("/health")
 async def health_check(db=Depends(get_db)):
@@ -14,7 +14,7 @@ Naming Convention
 This naming convention ensures clarity, consistency, and ease of discovery for all database entities.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, DECIMAL, Text, Unicode, UnicodeText, func
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, ForeignKey, DECIMAL, Text, Unicode, UnicodeText, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime, timedelta
@@ -126,6 +126,31 @@ class APIUsageTracking(Base):
     def __repr__(self):
         return f"<APIUsageTracking(Provider={self.APIProvider}, Endpoint={self.APIEndpoint}, Cost={self.CreditCost})>"
 
+class PropertyCoordinateCache(Base):
+    """Cached coordinates and standardized address per provider property ID"""
+    __tablename__ = "PropertyCoordinateCache"
+    
+    PropertyID = Column(Unicode(100), primary_key=True)  # Geoscape property identifier
+    
+    # Resolved location
+    Latitude = Column(DECIMAL(18, 15), nullable=False)
+    Longitude = Column(DECIMAL(18, 15), nullable=False)
+    StandardizedAddress = Column(UnicodeText)  # JSON of the standardized address fields
+    ConfidenceScore = Column(DECIMAL(3, 2))
+    Source = Column(Unicode(50), nullable=False, default='geoscape')
+    
+    # Refresh policy
+    FetchedDate = Column(DateTime, nullable=False, default=datetime.utcnow)
+    ExpiresDate = Column(DateTime, nullable=False, index=True)
+    HitCount = Column(Integer, nullable=False, default=0)
+    
+    # Metadata
+    createdDate = Column(DateTime, default=datetime.utcnow)
+    lastUpdated = Column(DateTime)
+    
+    def __repr__(self):
+        return f"<PropertyCoordinateCache(PropertyID={self.PropertyID}, Lat={self.Latitude}, Lng={self.Longitude})>"
+
 class Role(Base):
     __tablename__ = "Role"
     RoleID = Column(Integer, primary_key=True, autoincrement=True)
@@ -201,6 +226,15 @@ class User(Base):
     role = relationship("Role")
     profile = relationship("Profile")
 
+    __table_args__ = (
+        # Covers the login lookup so it is a single index seek with no key lookup
+        Index(
+            "IX_User_EmailAddress_Login",
+            "EmailAddress",
+            mssql_include=["UserID", "Username", "HashedPassword", "ProfileID"],
+        ),
+    )
+
 class UserPreferences(Base):
     __tablename__ = "UserPreferences"
     PreferenceID = Column(Integer, primary_key=True, autoincrement=True)
@@ -277,6 +311,11 @@ class JobApplication(Base):
     lastUpdated = Column(DateTime)
     updatedBy = Column(Unicode(100))
 
+    __table_args__ = (
+        # Keyset pagination of a profile's applications, newest first
+        Index("IX_JobApplication_Profile_DateApplied", "ProfileID", "DateApplied", "JobApplicationID"),
+    )
+
 class JobApplicationNote(Base):
     __tablename__ = "JobApplicationNote"
     JobApplicationNoteID = Column(Integer, primary_key=True, autoincrement=True)
@@ -305,6 +344,15 @@ class JobApplicationStatusHistory(Base):
     StatusDate = Column(DateTime, default=datetime.utcnow)
     updatedBy = Column(Unicode(100))
 
+    __table_args__ = (
+        # Latest status per application (ROW_NUMBER over this order) without a sort
+        Index(
+            "IX_JobApplicationStatusHistory_Latest",
+            "JobApplicationID", "StatusDate", "StatusHistoryID",
+            mssql_include=["Status"],
+        ),
+    )
+
 class JobApplicationInterview(Base):
     __tablename__ = "JobApplicationInterview"
     InterviewID = Column(Integer, primary_key=True, autoincrement=True)
@@ -330,12 +378,37 @@ class JobApplicationTask(Base):
     lastUpdated = Column(DateTime)
     updatedBy = Column(Unicode(100))
 
+class SkillDictionary(Base):
+    """Canonical skill; Skills, JobBoardJobSkill and UserSkillGapResolution rows point here"""
+    __tablename__ = "SkillDictionary"
+    SkillDictionaryID = Column(Integer, primary_key=True, autoincrement=True)
+    CanonicalName = Column(Unicode(255), unique=True, nullable=False)
+    Category = Column(Unicode(100))
+    IsCurated = Column(Boolean, default=False, nullable=False)  # Seeded/reviewed vs created from free text
+    createdDate = Column(DateTime, default=datetime.utcnow)
+    createdBy = Column(Unicode(100))
+    lastUpdated = Column(DateTime)
+    updatedBy = Column(Unicode(100))
+
+class SkillDictionaryAlias(Base):
+    """Lookup spelling of a canonical skill (the canonical name is stored as an alias too)"""
+    __tablename__ = "SkillDictionaryAlias"
+    SkillDictionaryAliasID = Column(Integer, primary_key=True, autoincrement=True)
+    SkillDictionaryID = Column(Integer, ForeignKey("SkillDictionary.SkillDictionaryID"), nullable=False, index=True)
+    Alias = Column(Unicode(255), nullable=False)
+    NormalizedAlias = Column(Unicode(255), unique=True, nullable=False)  # Case/punctuation folded lookup key
+    createdDate = Column(DateTime, default=datetime.utcnow)
+    createdBy = Column(Unicode(100))
+
+    skill = relationship("SkillDictionary")
+
 class Skills(Base):
     __tablename__ = "Skills"
 
     SkillID = Column(Integer, primary_key=True, autoincrement=True)
     ProfileID = Column(Integer, ForeignKey("Profile.ProfileID"), nullable=False)
     SkillName = Column(Unicode(100), nullable=False)
+    SkillDictionaryID = Column(Integer, ForeignKey("SkillDictionary.SkillDictionaryID"), index=True)
     Proficiency = Column(Unicode(50))
     createdDate = Column(DateTime, default=datetime.utcnow)
     createdBy = Column(Unicode(100))
@@ -479,6 +552,11 @@ class ProfileVersion(Base):
 
     profile = relationship("Profile")
 
+    __table_args__ = (
+        # create_profile_version retries when a concurrent save took the number
+        UniqueConstraint("ProfileID", "VersionNumber", name="UQ_ProfileVersion_ProfileID_VersionNumber"),
+    )
+
 class ProfileCareerAspiration(Base):
     __tablename__ = "ProfileCareerAspiration"
     ProfileCareerAspirationID = Column(Integer, primary_key=True, autoincrement=True)
@@ -614,6 +692,10 @@ class JobBoardJob(Base):
     RepostFrequency = Column(Integer)
     UnitCount = Column(Integer, default=1)
     IsActive = Column(Boolean, default=True)
+    # Ingestion de-duplication
+    ContentFingerprint = Column(BigInteger)  # 64-bit SimHash of title, company and description (signed)
+    ContentHash = Column(Unicode(40))  # SHA-1 of the stored content fields
+    LastSeenDate = Column(DateTime)  # Last time a feed contained this posting
     # Contact Person Profile (nullable)
     ContactPersonProfileID = Column(Integer, ForeignKey("Profile.ProfileID"))
     ContactPersonType = Column(Unicode(50))  # 'recruiter', 'hiring_manager', 'hr_representative'
@@ -659,6 +741,7 @@ class JobBoardJobSkill(Base):
     JobBoardJobSkillID = Column(Integer, primary_key=True, autoincrement=True)
     JobBoardJobID = Column(Integer, ForeignKey("JobBoardJob.JobBoardJobID"), nullable=False)
     SkillName = Column(Unicode(255), nullable=False)
+    SkillDictionaryID = Column(Integer, ForeignKey("SkillDictionary.SkillDictionaryID"), index=True)
     SkillType = Column(Unicode(50))  # 'required', 'preferred', 'optional'
     Importance = Column(DECIMAL(3,2))
     createdDate = Column(DateTime, default=datetime.utcnow)
@@ -712,6 +795,7 @@ class UserSkillGapResolution(Base):
     UserSkillGapResolutionID = Column(Integer, primary_key=True, autoincrement=True)
     UserID = Column(Integer, ForeignKey("User.UserID"), nullable=False)
     SkillName = Column(Unicode(255), nullable=False)
+    SkillDictionaryID = Column(Integer, ForeignKey("SkillDictionary.SkillDictionaryID"), index=True)
     ResolutionType = Column(Unicode(50))  # 'added', 'confirmed', 'learning'
     ResolutionDate = Column(DateTime, default=datetime.utcnow)
     Notes = Column(Unicode(1000))
@@ -820,6 +904,7 @@ class UserNotification(Base):
     Message = Column(Unicode(1000))
     IsRead = Column(Boolean, default=False)
     IsEmailSent = Column(Boolean, default=False)
+    EmailAttempts = Column(Integer, default=0)  # Sends the mail server refused (5xx); stops retrying at the limit
     createdDate = Column(DateTime, default=datetime.utcnow)
     createdBy = Column(Unicode(100))
     lastUpdated = Column(DateTime)
@@ -827,6 +912,11 @@ class UserNotification(Base):
 
     user = relationship("User")
 
+    __table_args__ = (
+        # Dispatcher scan of unsent notifications in (UserID, UserNotificationID) order
+        Index("IX_UserNotification_EmailPending", "IsEmailSent", "UserID", "UserNotificationID"),
+    )
+
 class UserNotificationPreference(Base):
     __tablename__ = "UserNotificationPreference"
     UserNotificationPreferenceID = Column(Integer, primary_key=True, autoincrement=True)
@@ -849,7 +939,7 @@ class UserNotificationPreference(Base):
 class UserAnalytics(Base):
     __tablename__ = "UserAnalytics"
     UserAnalyticsID = Column(Integer, primary_key=True, autoincrement=True)
-    UserID = Column(Integer, ForeignKey("User.UserID"), nullable=False)
+    UserID = Column(Integer, ForeignKey("User.UserID"), nullable=False, index=True)
     ProfileCompleteness = Column(DECIMAL(5,2))
     TotalJobApplications = Column(Integer)
     AverageFitScore = Column(DECIMAL(5,2))
@@ -872,6 +962,7 @@ class UserJobBoardJobSearchAnalytics(Base):
     OfferCount = Column(Integer)
     SuccessRate = Column(DECIMAL(5,2))
     Period = Column(Unicode(20))  # 'weekly', 'monthly', 'yearly'
+    PeriodStart = Column(DateTime)  # Monday / first of month / 1 January
     createdDate = Column(DateTime, default=datetime.utcnow)
     createdBy = Column(Unicode(100))
     lastUpdated = Column(DateTime)
@@ -880,6 +971,11 @@ class UserJobBoardJobSearchAnalytics(Base):
     user = relationship("User")
     job_board = relationship("JobBoard")
 
+    __table_args__ = (
+        # Dashboard reads of the current period and per-user rebuild deletes
+        Index("IX_UserJobBoardJobSearchAnalytics_Period", "UserID", "Period", "PeriodStart"),
+    )
+
 # =============================================================================
 # PRIVACY & CONSENT SYSTEM
 # =============================================================================
@@ -43,9 +43,14 @@ class HealthChecker:
         
         # Check Geoscape API
         try:
-            # Add your Geoscape API health check here
+            from app.services.geoscape_service import geoscape_breaker
+            from app.services.circuit_breaker import STATE_CLOSED
+            
+            breaker = geoscape_breaker.snapshot()
             api_status["geoscape"] = {
-                "status": "healthy",
+                # Address entry falls back to manual while the circuit is not closed
+                "status": "healthy" if breaker["state"] == STATE_CLOSED else "degraded",
+                "circuit_breaker": breaker,
                 "response_time": time.time()
             }
         except Exception as e:
@@ -86,6 +91,33 @@ class HealthChecker:
             logger.error(f"Failed to get system metrics: {e}")
             return {"error": str(e)}
     
+    def get_background_queue_metrics(self) -> Dict[str, Any]:
+        """Get counters for background write queues"""
+        from app.services.auth_logging import get_auth_log_buffer
+        from app.services.last_login_writer import get_last_login_writer
+        from app.services.fit_score_recompute import get_fit_score_recomputer
+        from app.services.search_index import get_search_index_sync
+        from app.services.analytics_rollup import get_analytics_rollup
+        from app.services.notification_dispatcher import get_notification_dispatcher
+        from app.services.email_utils import get_mail_queue
+
+        auth_log = get_auth_log_buffer().metrics()
+        last_login_writer = get_last_login_writer()
+        recomputer = get_fit_score_recomputer()
+        search_sync = get_search_index_sync()
+        rollup = get_analytics_rollup()
+        dispatcher = get_notification_dispatcher()
+        return {
+            "status": "degraded" if auth_log["last_flush_failed"] or auth_log["dropped_since_flush"] else "healthy",
+            "auth_log": auth_log,
+            "last_login": {**last_login_writer.stats, "pending": last_login_writer.pending},
+            "fit_score_recompute": {**recomputer.stats, "pending": recomputer.pending},
+            "search_index": {**search_sync.stats, "pending": search_sync.pending, "backend": search_sync.backend.name},
+            "analytics_rollup": {**rollup.stats, "pending": rollup.pending},
+            "notification_email": dispatcher.stats,
+            "outbound_mail": get_mail_queue().metrics()
+        }
+    
     def comprehensive_health_check(self, db_session) -> Dict[str, Any]:
         """Perform comprehensive health check"""
         health_status = {
@@ -108,6 +140,9 @@ class HealthChecker:
         system_metrics = self.get_system_metrics()
         health_status["checks"]["system"] = system_metrics
         
+        # Background queues
+        health_status["checks"]["background_queues"] = self.get_background_queue_metrics()
+        
         # Determine overall status
         all_healthy = True
         for check_name, check_result in health_status["checks"].items():
@@ -0,0 +1,130 @@
+"""
+Address Suggestions
+
+This module converts raw Geoscape ``/predictive/address`` suggestions into
+the address API's suggestion shape in a single pass.
+
+Features:
+- ``__slots__`` record per suggestion; no intermediate dicts
+- Address strings parsed once with partition/rsplit instead of list splits
+- Output is the final API shape, so callers do not standardize again
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class AddressSuggestion:
+    """Parsed address suggestion"""
+
+    __slots__ = (
+        "address", "id", "street_number", "street_name", "street_type",
+        "suburb", "state", "postcode", "latitude", "longitude", "confidence",
+    )
+
+    def __init__(
+        self,
+        address: str,
+        id: str,
+        street_number: str = "",
+        street_name: str = "",
+        street_type: str = "",
+        suburb: str = "",
+        state: str = "",
+        postcode: str = "",
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        confidence: float = 0.0
+    ):
+        self.address = address
+        self.id = id
+        self.street_number = street_number
+        self.street_name = street_name
+        self.street_type = street_type
+        self.suburb = suburb
+        self.state = state
+        self.postcode = postcode
+        self.latitude = latitude
+        self.longitude = longitude
+        self.confidence = confidence
+
+    @classmethod
+    def from_geoscape(cls, item: Dict[str, Any]) -> "AddressSuggestion":
+        """
+        Parse a Geoscape suggestion, e.g. ``{"address": "4 MILBURN CCT, BOOLAROO NSW 2284", "id": ..., "rank": 0}``.
+        """
+        address = item.get("address", "")
+        suggestion = cls(address, item.get("id", ""), confidence=1.0 - (item.get("rank", 0) * 0.1))
+
+        street_part, separator, rest = address.partition(", ")
+        if not separator:
+            # Addresses without comma separation are returned unparsed
+            return suggestion
+        location_part = rest.partition(", ")[0]
+
+        # Street part: "4 MILBURN CCT" -> number, name (middle words), type
+        street_words = street_part.split()
+        if len(street_words) >= 3:
+            suggestion.street_number = street_words[0]
+            suggestion.street_name = " ".join(street_words[1:-1])
+            suggestion.street_type = street_words[-1]
+        elif len(street_words) == 2:
+            suggestion.street_number, suggestion.street_name = street_words
+        else:
+            suggestion.street_name = street_part
+
+        # Location part: "BOOLAROO NSW 2284" -> suburb, state, postcode
+        location_words = location_part.rsplit(None, 2)
+        if len(location_words) == 3:
+            suggestion.suburb, suggestion.state, suggestion.postcode = location_words
+        elif len(location_words) == 2:
+            suggestion.suburb, suggestion.state = location_words
+        else:
+            suggestion.suburb = location_part
+
+        return suggestion
+
+    def to_api(self, country: str) -> Dict[str, Any]:
+        """Suggestion in the address API's response shape"""
+        return {
+            "address": self.address,
+            "id": self.id,
+            "data": {
+                "streetNumber": self.street_number,
+                "streetName": self.street_name,
+                "streetType": self.street_type,
+                "suburb": self.suburb,
+                "state": self.state,
+                "postcode": self.postcode,
+                "country": country,
+                "latitude": self.latitude,
+                "longitude": self.longitude,
+                "propertyType": None,  # Not provided by the predictive endpoint
+                "landArea": None,
+                "floorArea": None
+            },
+            "confidence": self.confidence
+        }
+
+
+def standardize_geoscape_suggestions(items: Iterable[Dict[str, Any]], country: str = "AU") -> List[Dict[str, Any]]:
+    """
+    Map a raw Geoscape ``suggest`` list straight to API suggestions.
+
+    Args:
+        items: Raw suggestion items
+        country: Country code included in each suggestion
+
+    Returns:
+        Suggestions in the address API's response shape; unparseable items are skipped
+    """
+    suggestions = []
+    for item in items:
+        try:
+            suggestions.append(AddressSuggestion.from_geoscape(item).to_api(country))
+        except Exception as e:
+            logger.error(f"Failed to standardize address suggestion: {str(e)}")
+    return suggestions
@@ -11,15 +11,66 @@ Supported Providers:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from .geoscape_service import GeoscapeService
+from .geoscape_service import GeoscapeService, RESOLUTION_FALLBACK
+from .local_address_index import LocalAddressProvider, get_local_address_index
+from .api_quota import get_geoscape_quota, MODE_MANUAL_ENTRY, QuotaExceededError
+from .property_coordinate_cache import get_property_coordinate_store
 from ..core.api_config import APIConfig
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+class SearchResultCache:
+    """
+    LRU cache of standardized search results with a time-to-live.
+    
+    Shared across requests so repeated queries don't reach the paid provider.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, int, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(query: str, country: str, limit: int, state: Optional[str] = None) -> Tuple[str, str, int, str]:
+        return (country.upper(), " ".join(query.lower().split()), limit, (state or "").upper())
+    
+    def get(self, key: Tuple[str, str, int, str]) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: Tuple[str, str, int, str], suggestions: List[Dict[str, Any]]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, suggestions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+# Shared by every AddressValidationService instance
+search_cache = SearchResultCache(APIConfig.ADDRESS_SEARCH_CACHE_SIZE, APIConfig.ADDRESS_SEARCH_CACHE_TTL)
+
 class AddressValidationService:
     """
     Unified address validation service with multi-provider support.
@@ -33,6 +84,12 @@ class AddressValidationService:
         self.providers = {}
         self._initialize_providers()
     
+    @property
+    def billable_calls(self) -> int:
+        """Paid upstream requests sent by this instance, used for usage billing"""
+        provider = self.providers.get('geoscape')
+        return getattr(provider, "requests_sent", 0) if provider else 0
+    
     def _initialize_providers(self):
         """Initialize available API providers based on configuration."""
         try:
@@ -46,6 +103,15 @@ class AddressValidationService:
         except Exception as e:
             logger.error(f"Failed to initialize Geoscape service: {str(e)}")
         
+        # Initialize the offline index for Australian autocomplete
+        try:
+            if APIConfig.validate_local_address_index_config():
+                self.providers['local'] = LocalAddressProvider(
+                    get_local_address_index(APIConfig.LOCAL_ADDRESS_INDEX_PATH)
+                )
+        except Exception as e:
+            logger.error(f"Failed to open local address index: {str(e)}")
+        
         # TODO: Initialize SmartyStreets for US addresses
         # if APIConfig.validate_smarty_streets_config():
         #     self.providers['smarty_streets'] = SmartyStreetsService()
@@ -76,20 +142,37 @@ class AddressValidationService:
         self, 
         query: str, 
         country: str = "AU",
-        limit: int = 10
+        limit: int = 10,
+        state: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for addresses using autocomplete functionality.
         
+        Cached results are served without an upstream call. While over the
+        soft budget only cached results are served; over the hard budget
+        QuotaExceededError is raised so the caller falls back to manual entry.
+        
         Args:
             query: Address search query
             country: Country code (AU, US, etc.)
             limit: Maximum number of suggestions
+            state: Only suggest addresses in this state, e.g. NSW (optional)
             
         Returns:
             List of address suggestions in standardized format
         """
         try:
+            # Autocomplete from the offline index when available; Geoscape is only
+            # needed when the index has no match (e.g. addresses newer than the extract)
+            if country.upper() == 'AU' and 'local' in self.providers:
+                local_suggestions = await self.providers['local'].search_addresses(query, limit, state=state)
+                if local_suggestions:
+                    return [
+                        standardized for standardized in
+                        (self._standardize_suggestion(suggestion, country) for suggestion in local_suggestions)
+                        if standardized
+                    ]
+            
             # Get appropriate provider
             provider_name = self._get_provider_for_country(country)
             if not provider_name or provider_name not in self.providers:
@@ -98,9 +181,18 @@ class AddressValidationService:
             
             provider = self.providers[provider_name]
             
+            cache_key = search_cache.key(query, country, limit, state)
+            if provider_name == 'geoscape':
+                quota = get_geoscape_quota()
+                if quota.mode_for() != MODE_MANUAL_ENTRY:
+                    cached = search_cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+                quota.check()
+            
             # Perform search based on provider
             if provider_name == 'geoscape':
-                suggestions = await provider.search_addresses(query, limit)
+                suggestions = await provider.search_addresses(query, limit, state=state)
             elif provider_name == 'smarty_streets':
                 # TODO: Implement SmartyStreets search
                 suggestions = []
@@ -108,15 +200,23 @@ class AddressValidationService:
                 logger.error(f"Unknown provider: {provider_name}")
                 return []
             
-            # Standardize suggestions
-            standardized_suggestions = []
-            for suggestion in suggestions:
-                standardized = self._standardize_suggestion(suggestion, country)
-                if standardized:
-                    standardized_suggestions.append(standardized)
+            # Geoscape suggestions are already in the API shape; standardize the rest
+            if provider_name == 'geoscape':
+                standardized_suggestions = suggestions
+            else:
+                standardized_suggestions = []
+                for suggestion in suggestions:
+                    standardized = self._standardize_suggestion(suggestion, country)
+                    if standardized:
+                        standardized_suggestions.append(standardized)
+            
+            if standardized_suggestions:
+                search_cache.put(cache_key, standardized_suggestions)
             
             return standardized_suggestions
             
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.error(f"Address search failed: {str(e)}")
             raise e
@@ -153,7 +253,26 @@ class AddressValidationService:
             
             # Get coordinates from provider
             if provider_name == 'geoscape':
+                # Known properties are answered from the coordinate cache
+                coordinate_store = get_property_coordinate_store()
+                cached = await coordinate_store.get(property_id) if property_id else None
+                if cached and cached[1]:
+                    return cached[0]
+                
+                try:
+                    get_geoscape_quota().check()
+                except QuotaExceededError:
+                    if cached:
+                        return cached[0]
+                    raise
+                
                 result = await provider.get_address_coordinates(address, property_id)
+                if cached and (not result.get("success") or result.get("resolution_path") == RESOLUTION_FALLBACK):
+                    # Serve the stale entry rather than failing the lookup or approximating it
+                    logger.warning(f"Coordinate refresh failed for {property_id}; serving cached coordinates")
+                    result = cached[0]
+                elif result.get("success"):
+                    await coordinate_store.put(result, property_id)
             else:
                 # For other providers, use validation endpoint
                 validation_result = await provider.validate_address(address, property_id)
@@ -212,6 +331,7 @@ class AddressValidationService:
             
             # Perform validation based on provider
             if provider_name == 'geoscape':
+                get_geoscape_quota().check()
                 validation_result = await provider.validate_address(address, property_id)
             elif provider_name == 'smarty_streets':
                 # TODO: Implement SmartyStreets validation
@@ -390,7 +510,7 @@ class AddressValidationService:
         """
         available_countries = []
         
-        if 'geoscape' in self.providers:
+        if 'geoscape' in self.providers or 'local' in self.providers:
             available_countries.append('AU')
         
         if 'smarty_streets' in self.providers:
@@ -0,0 +1,508 @@
+"""
+Analytics Rollup Service
+
+This module maintains the per-user analytics tables so dashboards read
+stored rows instead of aggregating on every view.
+
+Features:
+- UserAnalytics: TotalJobApplications, AverageFitScore, ResumeGeneratedCount
+  and LastActivityDate per user
+- UserJobBoardJobSearchAnalytics: weekly, monthly and yearly application,
+  interview and offer counts with SuccessRate, per job board (matched on
+  JobApplication.Source) and across all boards (JobBoardID NULL)
+- Every rollup is set-based SQL (INSERT ... SELECT / UPDATE with
+  subqueries), scoped to a set of users or the whole table
+- Incremental refresh from application, status-change, interview and
+  fit-score events via a dirty-set worker, plus a periodic full rebuild
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from sqlalchemy import DateTime, and_, case, delete, event, exists, func, insert, literal, null, or_, select, union_all, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.functions import FunctionElement
+
+from ..models import (
+    JobApplication, JobApplicationInterview, JobApplicationStatusHistory, JobBoard, Resume, ResumeResumeVersion,
+    User, UserAnalytics, UserJobBoardJobFitScore, UserJobBoardJobSearchAnalytics,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PERIODS = ("weekly", "monthly", "yearly")
+# Statuses (lower case) that show an application reached each stage; an
+# offer implies an interview
+OFFER_STATUSES = ("offer", "offered", "accepted", "hired")
+INTERVIEW_STATUSES = ("interview", "interviewing", "interviewed") + OFFER_STATUSES
+ROLLUP_BY = "analytics_rollup"
+USER_CHUNK = 500
+
+
+class period_start(FunctionElement):
+    """Start of the weekly (Monday), monthly or yearly period containing a datetime column"""
+    type = DateTime()
+    # ``period`` is not part of the cache key, so statements using this are not cached
+    inherit_cache = False
+
+    def __init__(self, period: str, column):
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period: {period}")
+        self.period = period
+        super().__init__(column)
+
+
+@compiles(period_start)
+def _period_start_default(element, compiler, **kw):
+    unit = {"weekly": "week", "monthly": "month", "yearly": "year"}[element.period]
+    return f"date_trunc('{unit}', {compiler.process(element.clauses, **kw)})"
+
+
+@compiles(period_start, "mssql")
+def _period_start_mssql(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if element.period == "weekly":
+        # Day 0 (1900-01-01) was a Monday, so this is independent of DATEFIRST
+        return f"DATEADD(day, DATEDIFF(day, 0, {column}) / 7 * 7, 0)"
+    unit = "month" if element.period == "monthly" else "year"
+    return f"DATEADD({unit}, DATEDIFF({unit}, 0, {column}), 0)"
+
+
+@compiles(period_start, "sqlite")
+def _period_start_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if element.period == "weekly":
+        start = (f"datetime({column}, 'start of day', "
+                 f"'-' || ((CAST(strftime('%w', {column}) AS INTEGER) + 6) % 7) || ' days')")
+    else:
+        start = f"datetime({column}, 'start of {'month' if element.period == 'monthly' else 'year'}')"
+    # Match SQLAlchemy's stored DateTime text so equality filters on PeriodStart work
+    return f"({start} || '.000000')"
+
+
+def period_start_of(period: str, value: datetime) -> datetime:
+    """Python equivalent of ``period_start`` for a single value"""
+    day = datetime(value.year, value.month, value.day)
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "monthly":
+        return day.replace(day=1)
+    if period == "yearly":
+        return day.replace(month=1, day=1)
+    raise ValueError(f"Unknown period: {period}")
+
+
+def _application_facts(user_ids: Optional[Sequence[int]]):
+    """One row per application: owner, matched board, DateApplied and stage flags"""
+    history = JobApplicationStatusHistory
+    app = JobApplication
+
+    def history_has(statuses):
+        return exists().where(history.JobApplicationID == app.JobApplicationID, func.lower(history.Status).in_(statuses))
+
+    interviewed = or_(
+        exists().where(JobApplicationInterview.JobApplicationID == app.JobApplicationID),
+        history_has(INTERVIEW_STATUSES),
+        func.lower(app.ApplicationStatus).in_(INTERVIEW_STATUSES),
+    )
+    offered = or_(history_has(OFFER_STATUSES), func.lower(app.ApplicationStatus).in_(OFFER_STATUSES))
+    # BoardName is not unique; attribute to the first board with the name
+    boards = (
+        select(func.lower(JobBoard.BoardName).label("name"), func.min(JobBoard.JobBoardID).label("JobBoardID"))
+        .group_by(func.lower(JobBoard.BoardName))
+        .subquery("boards")
+    )
+
+    facts = (
+        select(
+            User.UserID,
+            boards.c.JobBoardID,
+            app.DateApplied,
+            case((interviewed, 1), else_=0).label("Interviewed"),
+            case((offered, 1), else_=0).label("Offered"),
+        )
+        .join(User, User.ProfileID == app.ProfileID)
+        .outerjoin(boards, boards.c.name == func.lower(app.Source))
+    )
+    if user_ids is not None:
+        facts = facts.where(User.UserID.in_(user_ids))
+    return facts.subquery("facts")
+
+
+def rebuild_search_analytics(db: Session, user_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    Replace UserJobBoardJobSearchAnalytics rows (not committed).
+
+    Applications count toward the period they were applied in; interviews
+    and offers count toward the same period, so SuccessRate is offers per
+    application for that cohort.
+
+    Args:
+        db: Database session
+        user_ids: Users to rebuild (all users when None)
+
+    Returns:
+        Number of rows written
+    """
+    target = UserJobBoardJobSearchAnalytics
+    facts = _application_facts(user_ids)
+    now = datetime.utcnow()
+
+    selects = []
+    for period in PERIODS:
+        start = period_start(period, facts.c.DateApplied)
+        for by_board in (True, False):
+            board = facts.c.JobBoardID if by_board else null()
+            query = select(
+                facts.c.UserID,
+                board,
+                literal(period),
+                start,
+                func.count(),
+                func.sum(facts.c.Interviewed),
+                func.sum(facts.c.Offered),
+                func.round(100.0 * func.sum(facts.c.Offered) / func.count(), 2),
+                literal(now),
+                literal(ROLLUP_BY),
+            )
+            if by_board:
+                query = query.where(facts.c.JobBoardID.isnot(None)).group_by(facts.c.UserID, facts.c.JobBoardID, start)
+            else:
+                query = query.group_by(facts.c.UserID, start)
+            selects.append(query)
+
+    scope = delete(target)
+    if user_ids is not None:
+        scope = scope.where(target.UserID.in_(user_ids))
+    db.execute(scope)
+    result = db.execute(insert(target).from_select(
+        ["UserID", "JobBoardID", "Period", "PeriodStart", "ApplicationsCount", "InterviewCount", "OfferCount",
+         "SuccessRate", "createdDate", "createdBy"],
+        union_all(*selects)
+    ))
+    return result.rowcount
+
+
+def _user_metrics(user_id_column) -> Dict[str, Any]:
+    """Correlated scalar subqueries for one user's UserAnalytics values"""
+    app = JobApplication
+    # Aliased so the subqueries stay correlated when the outer query selects from User
+    owner = aliased(User)
+    applied = select(func.max(app.DateApplied)).join(owner, owner.ProfileID == app.ProfileID).where(
+        owner.UserID == user_id_column).scalar_subquery()
+    status_changed = (
+        select(func.max(JobApplicationStatusHistory.StatusDate))
+        .join(app, app.JobApplicationID == JobApplicationStatusHistory.JobApplicationID)
+        .join(owner, owner.ProfileID == app.ProfileID)
+        .where(owner.UserID == user_id_column)
+        .scalar_subquery()
+    )
+    return {
+        "TotalJobApplications": select(func.count()).select_from(app).join(
+            owner, owner.ProfileID == app.ProfileID).where(owner.UserID == user_id_column).scalar_subquery(),
+        "AverageFitScore": select(func.round(func.avg(UserJobBoardJobFitScore.OverallScore), 2)).where(
+            UserJobBoardJobFitScore.UserID == user_id_column).scalar_subquery(),
+        "ResumeGeneratedCount": (
+            select(func.count())
+            .select_from(ResumeResumeVersion)
+            .join(Resume, Resume.ResumeID == ResumeResumeVersion.ResumeID)
+            .join(owner, owner.ProfileID == Resume.ProfileID)
+            .where(owner.UserID == user_id_column)
+            .scalar_subquery()
+        ),
+        "LastActivityDate": case((status_changed > applied, status_changed), else_=applied),
+    }
+
+
+def rebuild_user_analytics(db: Session, user_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    Refresh UserAnalytics rows in place and add missing ones (not committed).
+
+    ProfileCompleteness is left as is.
+
+    Args:
+        db: Database session
+        user_ids: Users to refresh (all users when None)
+
+    Returns:
+        Number of rows updated or inserted
+    """
+    now = datetime.utcnow()
+    refresh = update(UserAnalytics).values(
+        **_user_metrics(UserAnalytics.UserID), lastUpdated=now, updatedBy=ROLLUP_BY
+    )
+    missing = select(User.UserID).where(~exists().where(UserAnalytics.UserID == User.UserID))
+    if user_ids is not None:
+        refresh = refresh.where(UserAnalytics.UserID.in_(user_ids))
+        missing = missing.where(User.UserID.in_(user_ids))
+
+    updated = db.execute(refresh.execution_options(synchronize_session=False)).rowcount
+    metrics = _user_metrics(User.UserID)
+    inserted = db.execute(insert(UserAnalytics).from_select(
+        ["UserID", *metrics, "createdDate", "createdBy"],
+        missing.add_columns(*metrics.values(), literal(now), literal(ROLLUP_BY))
+    )).rowcount
+    return updated + inserted
+
+
+def rebuild_analytics(db: Session, user_ids: Optional[Iterable[int]] = None) -> Dict[str, int]:
+    """
+    Rebuild both rollup tables and commit, in chunks of users when scoped.
+
+    Args:
+        db: Database session
+        user_ids: Users to rebuild (all users when None)
+
+    Returns:
+        Rows written per table
+    """
+    counts = {"user_analytics": 0, "search_analytics": 0}
+    if user_ids is None:
+        chunks: List[Optional[List[int]]] = [None]
+    else:
+        ids = sorted(set(user_ids))
+        chunks = [ids[start:start + USER_CHUNK] for start in range(0, len(ids), USER_CHUNK)]
+    for chunk in chunks:
+        try:
+            counts["user_analytics"] += rebuild_user_analytics(db, chunk)
+            counts["search_analytics"] += rebuild_search_analytics(db, chunk)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return counts
+
+
+def get_user_analytics(db: Session, user_id: int, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """
+    Stored rollups for a user: the UserAnalytics row and the current
+    weekly/monthly/yearly totals across all boards.
+
+    Returns:
+        Analytics dict, or None when nothing has been rolled up yet
+    """
+    row = db.execute(select(UserAnalytics).where(UserAnalytics.UserID == user_id)).scalars().first()
+    if row is None:
+        return None
+    now = now or datetime.utcnow()
+    current = or_(*(
+        and_(UserJobBoardJobSearchAnalytics.Period == period,
+             UserJobBoardJobSearchAnalytics.PeriodStart == period_start_of(period, now))
+        for period in PERIODS
+    ))
+    periods = {
+        r.Period: {
+            "period_start": r.PeriodStart,
+            "applications": r.ApplicationsCount,
+            "interviews": r.InterviewCount,
+            "offers": r.OfferCount,
+            "success_rate": float(r.SuccessRate) if r.SuccessRate is not None else None,
+        }
+        for r in db.execute(
+            select(UserJobBoardJobSearchAnalytics).where(
+                UserJobBoardJobSearchAnalytics.UserID == user_id,
+                UserJobBoardJobSearchAnalytics.JobBoardID.is_(None),
+                current,
+            )
+        ).scalars()
+    }
+    return {
+        "total_job_applications": row.TotalJobApplications,
+        "average_fit_score": float(row.AverageFitScore) if row.AverageFitScore is not None else None,
+        "resume_generated_count": row.ResumeGeneratedCount,
+        "profile_completeness": float(row.ProfileCompleteness) if row.ProfileCompleteness is not None else None,
+        "last_activity_date": row.LastActivityDate,
+        "updated": row.lastUpdated or row.createdDate,
+        "periods": {period: periods.get(period) for period in PERIODS},
+    }
+
+
+class AnalyticsRollupWorker:
+    """
+    Dirty-set refresh of the analytics rollups.
+
+    Events mark users, profiles or applications; each drain resolves them
+    to users and rebuilds just those users. A full rebuild also runs every
+    ``rebuild_interval`` seconds to catch writes made outside the ORM.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        drain_interval: Seconds between drains
+        rebuild_interval: Seconds between full rebuilds (0 disables them)
+    """
+
+    def __init__(self, session_factory, drain_interval: float = 30.0, rebuild_interval: float = 86400.0):
+        self.session_factory = session_factory
+        self.drain_interval = drain_interval
+        self.rebuild_interval = rebuild_interval
+        self._users: Set[int] = set()
+        self._profiles: Set[int] = set()
+        self._applications: Set[int] = set()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_rebuild: Optional[float] = None
+        self.stats = {"marked": 0, "drains": 0, "users_refreshed": 0, "full_rebuilds": 0, "failures": 0}
+
+    def _mark(self, target: Set[int], ids: Iterable[int]):
+        with self._lock:
+            target.update(ids)
+            self.stats["marked"] += 1
+
+    def mark_users(self, user_ids: Iterable[int]):
+        """Users whose fit scores or resumes changed; safe to call from any thread"""
+        self._mark(self._users, user_ids)
+
+    def mark_user(self, user_id: int):
+        self.mark_users([user_id])
+
+    def mark_profiles(self, profile_ids: Iterable[int]):
+        """Profiles whose applications were added or edited"""
+        self._mark(self._profiles, profile_ids)
+
+    def mark_applications(self, application_ids: Iterable[int]):
+        """Applications whose status history or interviews changed"""
+        self._mark(self._applications, application_ids)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._users) + len(self._profiles) + len(self._applications)
+
+    def _take(self):
+        with self._lock:
+            taken = (self._users, self._profiles, self._applications)
+            self._users, self._profiles, self._applications = set(), set(), set()
+        return taken
+
+    def _refresh(self, users: Set[int], profiles: Set[int], applications: Set[int]) -> int:
+        db = self.session_factory()
+        try:
+            user_ids = set(users)
+            if applications:
+                profiles = profiles | set(db.execute(
+                    select(JobApplication.ProfileID).where(JobApplication.JobApplicationID.in_(sorted(applications)))
+                ).scalars())
+            if profiles:
+                user_ids |= set(db.execute(select(User.UserID).where(User.ProfileID.in_(sorted(profiles)))).scalars())
+            if user_ids:
+                rebuild_analytics(db, user_ids)
+            return len(user_ids)
+        finally:
+            db.close()
+
+    def _rebuild_all(self):
+        db = self.session_factory()
+        try:
+            counts = rebuild_analytics(db)
+            logger.info(f"Analytics full rebuild: {counts}")
+        finally:
+            db.close()
+
+    async def drain(self):
+        """Refresh every user marked since the last drain."""
+        if not self.pending:
+            return
+        users, profiles, applications = self._take()
+        try:
+            refreshed = await asyncio.get_running_loop().run_in_executor(
+                None, self._refresh, users, profiles, applications
+            )
+            self.stats["drains"] += 1
+            self.stats["users_refreshed"] += refreshed
+        except Exception as e:
+            logger.error(f"Analytics rollup drain failed: {e}")
+            self.stats["failures"] += 1
+            self.mark_users(users)
+            self.mark_profiles(profiles)
+            self.mark_applications(applications)
+
+    async def rebuild(self):
+        """Full set-based rebuild of both rollup tables."""
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._rebuild_all)
+            self.stats["full_rebuilds"] += 1
+        except Exception as e:
+            logger.error(f"Analytics full rebuild failed: {e}")
+            self.stats["failures"] += 1
+        self._last_rebuild = time.monotonic()
+
+    async def _run(self):
+        self._last_rebuild = time.monotonic()
+        while True:
+            await asyncio.sleep(self.drain_interval)
+            if self.rebuild_interval and time.monotonic() - self._last_rebuild >= self.rebuild_interval:
+                self._take()  # Covered by the full rebuild
+                await self.rebuild()
+            else:
+                await self.drain()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Analytics rollup worker started (interval={self.drain_interval}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.drain()
+
+
+def install_analytics_hooks(session_factory, worker: AnalyticsRollupWorker):
+    """Mark users affected by ORM commits that touch rolled-up tables"""
+
+    def after_flush(session, flush_context):
+        marked = session.info.setdefault("analytics_marked", {"users": set(), "profiles": set(), "applications": set()})
+        for obj in chain(session.new, session.dirty, session.deleted):
+            if isinstance(obj, JobApplication):
+                marked["profiles"].add(obj.ProfileID)
+            elif isinstance(obj, (JobApplicationStatusHistory, JobApplicationInterview)):
+                marked["applications"].add(obj.JobApplicationID)
+            elif isinstance(obj, UserJobBoardJobFitScore):
+                marked["users"].add(obj.UserID)
+
+    def after_commit(session):
+        if session.in_nested_transaction():
+            return
+        marked = session.info.pop("analytics_marked", None)
+        if marked:
+            worker.mark_users(marked["users"] - {None})
+            worker.mark_profiles(marked["profiles"] - {None})
+            worker.mark_applications(marked["applications"] - {None})
+
+    def after_rollback(session):
+        if not session.in_nested_transaction():
+            session.info.pop("analytics_marked", None)
+
+    event.listen(session_factory, "after_flush", after_flush)
+    event.listen(session_factory, "after_commit", after_commit)
+    event.listen(session_factory, "after_rollback", after_rollback)
+
+
+_worker: Optional[AnalyticsRollupWorker] = None
+
+
+def get_analytics_rollup() -> AnalyticsRollupWorker:
+    """Get the shared analytics rollup worker (hooks installed on first use)"""
+    global _worker
+    if _worker is None:
+        from mcp.db.session import SessionLocal
+        from app.core.api_config import APIConfig
+        _worker = AnalyticsRollupWorker(
+            SessionLocal,
+            drain_interval=APIConfig.ANALYTICS_ROLLUP_INTERVAL,
+            rebuild_interval=APIConfig.ANALYTICS_REBUILD_INTERVAL,
+        )
+        install_analytics_hooks(SessionLocal, _worker)
+    return _worker
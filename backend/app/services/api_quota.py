@@ -0,0 +1,196 @@
+"""
+API Quota Manager
+
+This module tracks paid address-provider spend against monthly budgets and
+decides how much upstream work a request may trigger.
+
+Features:
+- Running per-billing-period credit counters in memory
+- Counters seeded from APIUsageTracking aggregates at startup
+- Graceful degradation: normal -> cache_only -> manual_entry
+- Automatic reset when the billing period rolls over
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+
+from ..core.api_config import APIConfig
+from ..models import APIUsageTracking
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MODE_NORMAL = "normal"
+MODE_CACHE_ONLY = "cache_only"
+MODE_MANUAL_ENTRY = "manual_entry"
+
+
+class QuotaExceededError(Exception):
+    """Raised instead of calling a paid provider when the budget is spent."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        super().__init__(
+            "Address lookup is temporarily limited. Please use manual address entry below."
+        )
+
+
+def current_billing_period() -> str:
+    """Billing period key, matching APIUsageTracking.BillingPeriod"""
+    return datetime.now().strftime("%Y-%m")
+
+
+class APIQuotaManager:
+    """
+    Track credits spent on a paid provider and map spend to a service mode.
+
+    Args:
+        provider: APIProvider value tracked in APIUsageTracking
+        period_budget: Credits available per billing period
+        soft_limit_ratio: Fraction of the budget after which only cached results are served
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        period_budget: float,
+        soft_limit_ratio: float = 0.9
+    ):
+        self.provider = provider
+        self.period_budget = period_budget
+        self.soft_limit_ratio = soft_limit_ratio
+        self.period = current_billing_period()
+        self.period_credits = 0.0
+        self.period_calls = 0
+        self.degraded_requests = {MODE_CACHE_ONLY: 0, MODE_MANUAL_ENTRY: 0}
+        self.seeded = False
+        self._lock = threading.Lock()
+
+    def _roll_period(self):
+        period = current_billing_period()
+        if period != self.period:
+            logger.info(f"Billing period rolled over from {self.period} to {period}; resetting {self.provider} quota")
+            self.period = period
+            self.period_credits = 0.0
+            self.period_calls = 0
+            self.degraded_requests = {MODE_CACHE_ONLY: 0, MODE_MANUAL_ENTRY: 0}
+
+    def seed(self, db) -> None:
+        """
+        Load spend for the current billing period from APIUsageTracking.
+
+        Args:
+            db: Database session
+        """
+        period = current_billing_period()
+        credits, calls = (
+            db.query(
+                func.coalesce(func.sum(APIUsageTracking.CreditCost), 0),
+                func.coalesce(func.sum(APIUsageTracking.CallCount), 0),
+            )
+            .filter(
+                APIUsageTracking.APIProvider == self.provider,
+                APIUsageTracking.BillingPeriod == period,
+                APIUsageTracking.IsBillable == True,  # noqa: E712
+            )
+            .one()
+        )
+
+        with self._lock:
+            self.period = period
+            self.period_credits = float(credits)
+            self.period_calls = int(calls)
+            self.seeded = True
+
+        logger.info(
+            f"Seeded {self.provider} quota for {period}: "
+            f"{self.period_credits:.4f} credits over {self.period_calls} calls"
+        )
+
+    def _mode_for_spend(self, spent: float, budget: float) -> str:
+        if budget <= 0:
+            return MODE_NORMAL
+        if spent >= budget:
+            return MODE_MANUAL_ENTRY
+        if spent >= budget * self.soft_limit_ratio:
+            return MODE_CACHE_ONLY
+        return MODE_NORMAL
+
+    def mode_for(self) -> str:
+        """
+        Get the service mode for a request.
+
+        Returns:
+            One of ``normal``, ``cache_only`` or ``manual_entry``
+        """
+        with self._lock:
+            self._roll_period()
+            return self._mode_for_spend(self.period_credits, self.period_budget)
+
+    def check(self) -> None:
+        """Raise QuotaExceededError unless an upstream call is allowed."""
+        mode = self.mode_for()
+        if mode != MODE_NORMAL:
+            with self._lock:
+                self.degraded_requests[mode] += 1
+            raise QuotaExceededError(mode)
+
+    def record(self, credits: float, calls: int = 1) -> None:
+        """
+        Add spend for calls made to the provider.
+
+        Args:
+            credits: Credits spent
+            calls: Number of upstream calls
+        """
+        with self._lock:
+            self._roll_period()
+            self.period_credits += credits
+            self.period_calls += calls
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current spend and mode, for health endpoints"""
+        with self._lock:
+            self._roll_period()
+            return {
+                "provider": self.provider,
+                "billing_period": self.period,
+                "seeded": self.seeded,
+                "mode": self._mode_for_spend(self.period_credits, self.period_budget),
+                "period_credits": round(self.period_credits, 4),
+                "period_budget": self.period_budget,
+                "period_calls": self.period_calls,
+                "degraded_requests": dict(self.degraded_requests),
+            }
+
+
+_geoscape_quota: Optional[APIQuotaManager] = None
+
+
+def get_geoscape_quota() -> APIQuotaManager:
+    """Get the shared Geoscape quota manager"""
+    global _geoscape_quota
+    if _geoscape_quota is None:
+        _geoscape_quota = APIQuotaManager(
+            provider="geoscape",
+            period_budget=APIConfig.GEOSCAPE_MONTHLY_CREDIT_BUDGET,
+            soft_limit_ratio=APIConfig.GEOSCAPE_BUDGET_SOFT_RATIO,
+        )
+    return _geoscape_quota
+
+
+def seed_geoscape_quota() -> None:
+    """Seed the Geoscape quota from APIUsageTracking; failures leave counters at zero"""
+    from mcp.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        get_geoscape_quota().seed(db)
+    except Exception as e:
+        logger.error(f"Failed to seed Geoscape quota from APIUsageTracking: {str(e)}")
+    finally:
+        db.close()
@@ -0,0 +1,249 @@
+"""
+Application Pipeline Service
+
+This module provides read queries for a user's job application pipeline.
+
+Features:
+- Keyset pagination on (DateApplied, JobApplicationID), newest first
+- Latest status per application from JobApplicationStatusHistory via one
+  ROW_NUMBER() window (falls back to JobApplication.ApplicationStatus)
+- Per-status counts returned in the same statement as the page (UNION ALL)
+- Application detail with status history, interviews, tasks and notes
+"""
+
+import base64
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from ..models import (
+    JobApplication, JobApplicationInterview, JobApplicationNote, JobApplicationStatusHistory, JobApplicationTask,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+UNKNOWN_STATUS = "Unknown"
+
+
+def encode_cursor(date_applied: datetime, application_id: int) -> str:
+    """Opaque cursor for the row after which the next page starts"""
+    raw = json.dumps([date_applied.isoformat(), application_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from encode_cursor.
+
+    Raises:
+        ValueError: When the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date_applied, application_id = json.loads(raw)
+        return datetime.fromisoformat(date_applied), int(application_id)
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def latest_status_query(profile_id: int):
+    """Each of a profile's applications' history rows ranked newest first (rn = 1 is current)"""
+    history = JobApplicationStatusHistory
+    return (
+        select(
+            history.JobApplicationID,
+            history.Status,
+            history.StatusDate,
+            func.row_number().over(
+                partition_by=history.JobApplicationID,
+                order_by=(history.StatusDate.desc(), history.StatusHistoryID.desc())
+            ).label("rn")
+        )
+        .join(JobApplication, JobApplication.JobApplicationID == history.JobApplicationID)
+        .where(JobApplication.ProfileID == profile_id)
+        .subquery("latest_status")
+    )
+
+
+@dataclass
+class ApplicationPage:
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    next_cursor: Optional[str] = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.status_counts.values())
+
+
+def list_applications(
+    db: Session,
+    profile_id: int,
+    limit: int = 25,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None
+) -> ApplicationPage:
+    """
+    One page of a profile's applications with current status, plus status counts.
+
+    Args:
+        db: Database session
+        profile_id: Profile whose applications are listed
+        limit: Page size
+        cursor: ``next_cursor`` from the previous page
+        status: Only list applications currently in this status (counts
+            still cover every status)
+
+    Returns:
+        ApplicationPage with items, status_counts and next_cursor
+
+    Raises:
+        ValueError: When the cursor is malformed
+    """
+    latest = latest_status_query(profile_id)
+    current_status = func.coalesce(latest.c.Status, JobApplication.ApplicationStatus, UNKNOWN_STATUS)
+    pipeline = (
+        select(
+            JobApplication.JobApplicationID,
+            JobApplication.JobTitle,
+            JobApplication.CompanyName,
+            JobApplication.Location,
+            JobApplication.Source,
+            JobApplication.DateApplied,
+            current_status.label("Status"),
+            latest.c.StatusDate,
+        )
+        .outerjoin(latest, and_(latest.c.JobApplicationID == JobApplication.JobApplicationID, latest.c.rn == 1))
+        .where(JobApplication.ProfileID == profile_id)
+        .cte("pipeline")
+    )
+
+    page = select(
+        literal("row").label("kind"),
+        pipeline.c.JobApplicationID,
+        pipeline.c.JobTitle,
+        pipeline.c.CompanyName,
+        pipeline.c.Location,
+        pipeline.c.Source,
+        pipeline.c.DateApplied,
+        pipeline.c.Status,
+        pipeline.c.StatusDate,
+        null().label("StatusCount"),
+    )
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        page = page.where(or_(
+            pipeline.c.DateApplied < after_date,
+            and_(pipeline.c.DateApplied == after_date, pipeline.c.JobApplicationID < after_id)
+        ))
+    if status:
+        page = page.where(pipeline.c.Status == status)
+    # One extra row tells whether another page exists
+    page = page.order_by(pipeline.c.DateApplied.desc(), pipeline.c.JobApplicationID.desc()).limit(limit + 1)
+
+    counts = select(
+        literal("count"), null(), null(), null(), null(), null(), null(),
+        pipeline.c.Status, null(), func.count(),
+    ).group_by(pipeline.c.Status)
+
+    page_rows = page.subquery("page")
+    statement = union_all(select(page_rows), counts)
+
+    result = ApplicationPage()
+    rows = []
+    for row in db.execute(statement):
+        if row.kind == "count":
+            result.status_counts[row.Status] = row.StatusCount
+        else:
+            rows.append(row)
+    # UNION ALL does not keep the branch order; restore the page order
+    rows.sort(key=lambda row: (row.DateApplied, row.JobApplicationID), reverse=True)
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        result.next_cursor = encode_cursor(rows[-1].DateApplied, rows[-1].JobApplicationID)
+    result.items = [
+        {
+            "job_application_id": row.JobApplicationID,
+            "job_title": row.JobTitle,
+            "company_name": row.CompanyName,
+            "location": row.Location,
+            "source": row.Source,
+            "date_applied": row.DateApplied,
+            "status": row.Status,
+            "status_date": row.StatusDate,
+        }
+        for row in rows
+    ]
+    return result
+
+
+def get_application_detail(db: Session, profile_id: int, application_id: int) -> Optional[Dict[str, Any]]:
+    """
+    An application with its status history, interviews, tasks and notes.
+
+    Returns:
+        Detail dict, or None when the application does not belong to the profile
+    """
+    application = db.execute(
+        select(JobApplication).where(
+            JobApplication.JobApplicationID == application_id, JobApplication.ProfileID == profile_id
+        )
+    ).scalar_one_or_none()
+    if application is None:
+        return None
+
+    history = db.execute(
+        select(JobApplicationStatusHistory)
+        .where(JobApplicationStatusHistory.JobApplicationID == application_id)
+        .order_by(JobApplicationStatusHistory.StatusDate.desc(), JobApplicationStatusHistory.StatusHistoryID.desc())
+    ).scalars().all()
+    interviews = db.execute(
+        select(JobApplicationInterview)
+        .where(JobApplicationInterview.JobApplicationID == application_id)
+        .order_by(JobApplicationInterview.InterviewDate)
+    ).scalars().all()
+    tasks = db.execute(
+        select(JobApplicationTask)
+        .where(JobApplicationTask.JobApplicationID == application_id)
+        .order_by(JobApplicationTask.DueDate, JobApplicationTask.TaskID)
+    ).scalars().all()
+    notes = db.execute(
+        select(JobApplicationNote)
+        .where(JobApplicationNote.JobApplicationID == application_id)
+        .order_by(JobApplicationNote.NoteDate.desc(), JobApplicationNote.JobApplicationNoteID.desc())
+    ).scalars().all()
+
+    return {
+        "job_application_id": application.JobApplicationID,
+        "job_title": application.JobTitle,
+        "company_name": application.CompanyName,
+        "location": application.Location,
+        "source": application.Source,
+        "date_applied": application.DateApplied,
+        "job_listing_url": application.JobListingURL,
+        "resume_version": application.ResumeVersion,
+        "cover_letter_version": application.CoverLetterVersion,
+        "status": history[0].Status if history else application.ApplicationStatus or UNKNOWN_STATUS,
+        "status_history": [
+            {"status": h.Status, "status_date": h.StatusDate, "updated_by": h.updatedBy} for h in history
+        ],
+        "interviews": [
+            {"interview_id": i.InterviewID, "interview_date": i.InterviewDate, "interview_type": i.InterviewType,
+             "interviewer": i.Interviewer, "notes": i.InterviewNotes}
+            for i in interviews
+        ],
+        "tasks": [
+            {"task_id": t.TaskID, "description": t.TaskDescription, "status": t.TaskStatus, "due_date": t.DueDate}
+            for t in tasks
+        ],
+        "notes": [
+            {"note_id": n.JobApplicationNoteID, "text": n.NoteText, "note_date": n.NoteDate} for n in notes
+        ],
+    }
@@ -1,6 +1,18 @@
+import asyncio
 import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import insert, text
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# AuthLog column sizes
+MAX_PROVIDER = 50
+MAX_ERROR_MESSAGE = 500
+MAX_IP_ADDRESS = 50
 
 def log_auth_attempt_sp(
     db,
@@ -34,4 +46,176 @@ def log_auth_attempt_sp(
         db.commit()
     except Exception as e:
         import logging
-        logging.error(f"Failed to log auth attempt: {e}") 
\ No newline at end of file
+        logging.error(f"Failed to log auth attempt: {e}") 
+
+class AuthLogBuffer:
+    """In-memory ring buffer of auth attempts flushed to AuthLog in batches.
+
+    Attempts are appended by request handlers and written by a background
+    task with one multi-row INSERT per flush. When the buffer is full,
+    identical attempts (same user, provider, outcome, message and IP) are
+    folded into a single row with a repeat count; anything that cannot be
+    folded is dropped and counted. A batch that fails to insert is put back
+    at the front of the buffer and retried on the next flush.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        capacity: Maximum number of buffered attempts
+        max_aggregates: Maximum number of distinct folded attempts held while full
+        flush_interval: Seconds between flushes
+        batch_size: Maximum rows per INSERT
+    """
+
+    def __init__(self, session_factory, capacity=10000, max_aggregates=1000, flush_interval=1.0, batch_size=500):
+        self.session_factory = session_factory
+        self.capacity = capacity
+        self.max_aggregates = max_aggregates
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._events = deque()
+        self._aggregates = {}
+        self._lock = threading.Lock()
+        self._task = None
+        self.stats = {"enqueued": 0, "flushed": 0, "aggregated": 0, "dropped": 0, "failed": 0, "requeued": 0}
+        # Health reflects the latest flush, not the cumulative counters above
+        self._last_flush_failed = False
+        self._dropped_at_last_flush = 0
+
+    def record(self, provider, success, error_message=None, user_id=None, ip_address=None):
+        """Buffer one auth attempt without touching the database."""
+        provider = provider[:MAX_PROVIDER] if provider else provider
+        error_message = str(error_message)[:MAX_ERROR_MESSAGE] if error_message is not None else None
+        ip_address = ip_address[:MAX_IP_ADDRESS] if ip_address else ip_address
+        event = {
+            "UserID": user_id,
+            "Provider": provider,
+            "AttemptTime": datetime.utcnow(),
+            "Success": bool(success),
+            "ErrorMessage": error_message,
+            "IPAddress": ip_address,
+        }
+        with self._lock:
+            if len(self._events) < self.capacity:
+                self._events.append(event)
+                self.stats["enqueued"] += 1
+                return
+
+            key = (user_id, provider, bool(success), error_message, ip_address)
+            aggregate = self._aggregates.get(key)
+            if aggregate is not None:
+                aggregate["count"] += 1
+                aggregate["event"]["AttemptTime"] = event["AttemptTime"]
+                self.stats["aggregated"] += 1
+            elif len(self._aggregates) < self.max_aggregates:
+                self._aggregates[key] = {"event": event, "count": 1}
+                self.stats["aggregated"] += 1
+            else:
+                self.stats["dropped"] += 1
+
+    def _drain(self):
+        with self._lock:
+            rows = list(self._events)
+            self._events.clear()
+            aggregates, self._aggregates = self._aggregates, {}
+
+        for aggregate in aggregates.values():
+            row = dict(aggregate["event"])
+            if aggregate["count"] > 1:
+                suffix = f" (x{aggregate['count']})"
+                row["ErrorMessage"] = ((row["ErrorMessage"] or "")[:MAX_ERROR_MESSAGE - len(suffix)] + suffix).strip()
+            rows.append(row)
+        return rows
+
+    def _requeue(self, rows):
+        """Put a failed batch back ahead of newer attempts, as far as capacity allows"""
+        with self._lock:
+            room = max(self.capacity - len(self._events), 0)
+            self._events.extendleft(reversed(rows[:room]))
+            self.stats["requeued"] += min(room, len(rows))
+            self.stats["dropped"] += max(len(rows) - room, 0)
+
+    def flush_sync(self):
+        """Write all buffered attempts; returns the number of rows written."""
+        from app.models import AuthLog
+
+        rows = self._drain()
+        if not rows:
+            return 0
+
+        db = self.session_factory()
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                db.execute(insert(AuthLog), rows[start:start + self.batch_size])
+            db.commit()
+            self.stats["flushed"] += len(rows)
+            self._last_flush_failed = False
+            self._dropped_at_last_flush = self.stats["dropped"]
+        except Exception as e:
+            db.rollback()
+            self.stats["failed"] += len(rows)
+            self._last_flush_failed = True
+            logger.error(f"Failed to flush {len(rows)} auth attempts: {e}")
+            self._requeue(rows)
+            return 0
+        finally:
+            db.close()
+        return len(rows)
+
+    async def flush(self):
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush_sync)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def metrics(self):
+        """Cumulative counters plus the state of the most recent flush"""
+        with self._lock:
+            depth = len(self._events)
+            pending_aggregates = len(self._aggregates)
+            dropped_since_flush = self.stats["dropped"] - self._dropped_at_last_flush
+        return {
+            **self.stats,
+            "depth": depth,
+            "capacity": self.capacity,
+            "pending_aggregates": pending_aggregates,
+            "last_flush_failed": self._last_flush_failed,
+            "dropped_since_flush": dropped_since_flush,
+        }
+
+
+_auth_log_buffer = None
+
+
+def get_auth_log_buffer():
+    """Get the shared auth attempt buffer"""
+    global _auth_log_buffer
+    if _auth_log_buffer is None:
+        from mcp.db.session import SessionLocal
+        _auth_log_buffer = AuthLogBuffer(
+            SessionLocal,
+            capacity=int(os.getenv("AUTH_LOG_BUFFER_SIZE", "10000")),
+            max_aggregates=int(os.getenv("AUTH_LOG_MAX_AGGREGATES", "1000")),
+            flush_interval=float(os.getenv("AUTH_LOG_FLUSH_INTERVAL", "1.0")),
+        )
+    return _auth_log_buffer
+
+
+def record_auth_attempt(provider, success, error_message=None, user_id=None, ip_address=None):
+    """Queue an auth attempt for batched logging"""
+    get_auth_log_buffer().record(provider, success, error_message, user_id, ip_address)
@@ -0,0 +1,440 @@
+"""
+Bulk Address Validation Service
+
+This module validates large address lists (imports, legacy Profile.AddressLine
+migration) through AddressValidationService and writes the results to
+ProfileAddress in batches.
+
+Features:
+- Streams input; only a bounded window of items is in memory
+- Bounded concurrency with a token bucket pacing upstream calls
+- Duplicate addresses in a run are validated once
+- Batched ProfileAddress inserts
+- Resumable checkpoints (contiguous high-water mark of persisted items)
+- Stops early when the provider is failing instead of burning through the input
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import and_, exists, insert, or_
+
+from ..core.rate_limit import InMemoryRateLimitBackend, RateLimitRule
+from ..models import Profile, ProfileAddress
+from .address_validation_service import AddressValidationService
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+STATUS_VALIDATED = "validated"
+STATUS_NOT_VALIDATED = "not_validated"
+STATUS_ERROR = "error"
+
+# Distinct addresses remembered per run for de-duplication
+DEDUPE_WINDOW = 10000
+
+# createdBy marker on ProfileAddress rows written by bulk runs
+BULK_CREATED_BY = "bulk_address_validation"
+
+
+@dataclass
+class BulkAddressItem:
+    """One address to validate"""
+    key: str
+    address: str
+    profile_id: Optional[int] = None
+    property_id: Optional[str] = None
+    country: str = "AU"
+
+
+@dataclass
+class BulkAddressResult:
+    """Outcome for one input item"""
+    sequence: int
+    key: str
+    status: str
+    confidence_score: float = 0.0
+    property_id: Optional[str] = None
+    address: Dict[str, Any] = field(default_factory=dict)
+    profile_address_written: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sequence": self.sequence,
+            "key": self.key,
+            "status": self.status,
+            "confidence_score": self.confidence_score,
+            "property_id": self.property_id,
+            "address": self.address,
+            "profile_address_written": self.profile_address_written,
+            "error": self.error,
+        }
+
+
+class BulkCheckpoint:
+    """
+    Resumable progress for a bulk run.
+
+    ``completed_through`` is the highest sequence number such that every item
+    up to and including it has been validated and persisted.
+
+    Args:
+        path: JSON checkpoint file (None disables checkpointing)
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.completed_through = -1
+        self.counts = {STATUS_VALIDATED: 0, STATUS_NOT_VALIDATED: 0, STATUS_ERROR: 0, "written": 0}
+        self.errors: Dict[str, str] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            self.completed_through = state.get("completed_through", -1)
+            self.counts.update(state.get("counts", {}))
+            self.errors = state.get("errors", {})
+            logger.info(f"Resuming bulk address validation after item {self.completed_through}")
+
+    def save(self):
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "completed_through": self.completed_through,
+                "counts": self.counts,
+                "errors": self.errors,
+                "updated": datetime.utcnow().isoformat(),
+            }, f, indent=2)
+        os.replace(temp_path, self.path)
+
+
+def profile_address_row(item: BulkAddressItem, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map a standardized validation result to ProfileAddress column values"""
+    address = result.get("address", {})
+    metadata = result.get("metadata", {})
+    if item.profile_id is None or not all(address.get(k) for k in ("streetName", "suburb", "state", "postcode")):
+        return None
+
+    now = datetime.now()
+    return {
+        "ProfileID": item.profile_id,
+        "PropertyID": result.get("property_id"),
+        "StreetNumber": address.get("streetNumber"),
+        "StreetName": address.get("streetName"),
+        "StreetType": address.get("streetType"),
+        "Suburb": address.get("suburb"),
+        "State": address.get("state"),
+        "Postcode": address.get("postcode"),
+        "Country": "Australia" if item.country.upper() == "AU" else item.country,
+        "Latitude": address.get("latitude"),
+        "Longitude": address.get("longitude"),
+        "PropertyType": metadata.get("propertyType"),
+        "IsValidated": True,
+        "ValidationSource": metadata.get("validationSource", "geoscape"),
+        "ConfidenceScore": result.get("confidence_score", 0.0),
+        "ValidationDate": now,
+        "AddressType": "residential",
+        "IsActive": True,
+        "createdDate": now,
+        "createdBy": BULK_CREATED_BY,
+    }
+
+
+def items_from_rows(rows: Iterable[Dict[str, Any]]) -> Iterable[BulkAddressItem]:
+    """
+    Convert CSV/JSON rows into items.
+
+    Rows need an ``address`` (or ``address_line1``-``address_line3``) and may
+    carry ``key``, ``profile_id``, ``property_id`` and ``country``.
+    """
+    for number, row in enumerate(rows, start=1):
+        address = row.get("address") or ", ".join(
+            str(row[k]).strip() for k in ("address_line1", "address_line2", "address_line3") if row.get(k)
+        )
+        profile_id = row.get("profile_id")
+        yield BulkAddressItem(
+            key=str(row.get("key") or (f"profile:{profile_id}" if profile_id else f"row:{number}")),
+            address=address.strip(),
+            profile_id=int(profile_id) if profile_id not in (None, "") else None,
+            property_id=row.get("property_id") or None,
+            country=row.get("country") or "AU",
+        )
+
+
+def iter_legacy_profile_items(session_factory, page_size: int = 500) -> Iterable[BulkAddressItem]:
+    """
+    Yield Profile.AddressLine1-3 addresses that still need a ProfileAddress.
+
+    Profiles are read in ProfileID order with keyset paging. Rows written by
+    earlier bulk runs do not exclude a profile, so item order stays stable and
+    a checkpoint remains valid when the migration is resumed.
+    """
+    has_address = exists().where(and_(
+        ProfileAddress.ProfileID == Profile.ProfileID,
+        or_(ProfileAddress.createdBy.is_(None), ProfileAddress.createdBy != BULK_CREATED_BY),
+    ))
+    last_id = 0
+    while True:
+        db = session_factory()
+        try:
+            page = (
+                db.query(
+                    Profile.ProfileID, Profile.AddressLine1, Profile.AddressLine2,
+                    Profile.AddressLine3, Profile.CountryCode
+                )
+                .filter(Profile.ProfileID > last_id, Profile.AddressLine1.isnot(None), ~has_address)
+                .order_by(Profile.ProfileID)
+                .limit(page_size)
+                .all()
+            )
+        finally:
+            db.close()
+        if not page:
+            return
+        for profile_id, line1, line2, line3, country_code in page:
+            yield BulkAddressItem(
+                key=f"profile:{profile_id}",
+                address=", ".join(line.strip() for line in (line1, line2, line3) if line and line.strip()),
+                profile_id=profile_id,
+                country=(country_code or "AU").upper()[:2],
+            )
+        last_id = page[-1][0]
+
+
+class BulkAddressValidator:
+    """
+    Validate a stream of addresses with bounded concurrency.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session (None skips DB writes)
+        concurrency: Maximum validations in flight
+        requests_per_second: Upstream pacing for the whole run
+        batch_size: ProfileAddress rows per INSERT / checkpoint
+        checkpoint_path: JSON file used to resume an interrupted run (optional)
+        max_consecutive_errors: Stop after this many provider errors in a row
+        service: AddressValidationService to use (a new one by default)
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        concurrency: int = 4,
+        requests_per_second: float = 5.0,
+        batch_size: int = 100,
+        checkpoint_path: Optional[str] = None,
+        max_consecutive_errors: int = 20,
+        service: Optional[AddressValidationService] = None
+    ):
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.batch_size = batch_size
+        self.max_consecutive_errors = max_consecutive_errors
+        self.service = service or AddressValidationService()
+        self.checkpoint = BulkCheckpoint(checkpoint_path)
+
+        burst = max(1, int(requests_per_second))
+        self._pacing_rule = RateLimitRule(
+            "bulk_address", path="", methods=(), limit=burst, period=burst / requests_per_second
+        )
+        self._pacing = InMemoryRateLimitBackend()
+        self._validations: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self._finished: Dict[int, Tuple[BulkAddressResult, Optional[Dict[str, Any]]]] = {}
+        self._unflushed = 0
+        self._consecutive_errors = 0
+        self.aborted = False
+
+    async def _pace(self):
+        while True:
+            allowed, retry_after = self._pacing.acquire("run", self._pacing_rule)
+            if allowed:
+                return
+            await asyncio.sleep(retry_after)
+
+    async def _validate_once(self, item: BulkAddressItem) -> Dict[str, Any]:
+        await self._pace()
+        return await self.service.validate_address(
+            address=item.address, property_id=item.property_id, country=item.country
+        )
+
+    async def _validate(self, item: BulkAddressItem) -> Dict[str, Any]:
+        # Legacy data repeats addresses (shared offices, households); validate each once per run
+        dedupe_key = f"{item.country.upper()}|{item.property_id or ''}|{' '.join(item.address.upper().split())}"
+        future = self._validations.get(dedupe_key)
+        if future is None:
+            future = asyncio.ensure_future(self._validate_once(item))
+            self._validations[dedupe_key] = future
+            while len(self._validations) > DEDUPE_WINDOW:
+                self._validations.popitem(last=False)
+        else:
+            self._validations.move_to_end(dedupe_key)
+        return await asyncio.shield(future)
+
+    async def _process(
+        self, sequence: int, item: BulkAddressItem
+    ) -> Tuple[BulkAddressResult, Optional[Dict[str, Any]]]:
+        try:
+            result = await self._validate(item)
+        except Exception as e:
+            return BulkAddressResult(sequence, item.key, STATUS_ERROR, error=str(e)), None
+
+        error = result.get("metadata", {}).get("error")
+        if error:
+            return BulkAddressResult(sequence, item.key, STATUS_ERROR, error=error), None
+
+        status = STATUS_VALIDATED if result.get("validated") else STATUS_NOT_VALIDATED
+        bulk_result = BulkAddressResult(
+            sequence, item.key, status,
+            confidence_score=result.get("confidence_score", 0.0),
+            property_id=result.get("property_id"),
+            address=result.get("address", {}),
+        )
+        row = None
+        if status == STATUS_VALIDATED and self.session_factory is not None:
+            row = profile_address_row(item, result)
+            bulk_result.profile_address_written = row is not None
+        return bulk_result, row
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        db = self.session_factory()
+        try:
+            db.execute(insert(ProfileAddress), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _flush(self, final: bool = False):
+        """
+        Persist the contiguous run of finished items after the checkpoint and advance it.
+
+        Items finished beyond a gap stay pending, so an interrupted run never
+        leaves rows in ProfileAddress that the checkpoint does not cover. A
+        trailing run of provider errors also stays pending until a later item
+        succeeds or the run completes normally: if the errors turn into an
+        abort, a resumed run retries those items instead of skipping them.
+
+        Args:
+            final: Last flush of the run
+        """
+        advanced = []
+        next_sequence = self.checkpoint.completed_through + 1
+        while next_sequence in self._finished:
+            advanced.append(self._finished.pop(next_sequence))
+            next_sequence += 1
+        if not final or self.aborted:
+            while advanced and advanced[-1][0].status == STATUS_ERROR:
+                held = advanced.pop()
+                self._finished[held[0].sequence] = held
+        if not advanced:
+            return
+
+        rows = [row for _, row in advanced if row is not None]
+        if rows:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_rows, rows)
+            self.checkpoint.counts["written"] += len(rows)
+
+        for result, _ in advanced:
+            self.checkpoint.counts[result.status] += 1
+            if result.status == STATUS_ERROR:
+                self.checkpoint.errors[result.key] = result.error or "unknown error"
+        self.checkpoint.completed_through = advanced[-1][0].sequence
+        self.checkpoint.save()
+
+    async def run(
+        self,
+        items: Union[Iterable[BulkAddressItem], AsyncIterator[BulkAddressItem]]
+    ) -> AsyncIterator[BulkAddressResult]:
+        """
+        Validate ``items`` in order of arrival, yielding results as they finish.
+
+        Items at or below the checkpoint's high-water mark are skipped.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        stop = asyncio.Event()
+
+        async def produce():
+            sequence = 0
+            try:
+                if hasattr(items, "__aiter__"):
+                    async for item in items:
+                        if stop.is_set():
+                            break
+                        if sequence > self.checkpoint.completed_through:
+                            await queue.put((sequence, item))
+                        sequence += 1
+                else:
+                    for item in items:
+                        if stop.is_set():
+                            break
+                        if sequence > self.checkpoint.completed_through:
+                            await queue.put((sequence, item))
+                        sequence += 1
+            finally:
+                for _ in range(self.concurrency):
+                    await queue.put(None)
+
+        async def work():
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    break
+                if stop.is_set():
+                    continue
+                await results.put(await self._process(*entry))
+            await results.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        workers = [asyncio.ensure_future(work()) for _ in range(self.concurrency)]
+        finished_workers = 0
+        try:
+            while finished_workers < self.concurrency:
+                result = await results.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+
+                result, row = result
+                self._finished[result.sequence] = (result, row)
+                self._unflushed += 1
+                if result.status == STATUS_ERROR:
+                    self._consecutive_errors += 1
+                    if self._consecutive_errors >= self.max_consecutive_errors and not stop.is_set():
+                        logger.error(
+                            f"Stopping bulk validation after {self._consecutive_errors} consecutive errors: {result.error}"
+                        )
+                        self.aborted = True
+                        stop.set()
+                else:
+                    self._consecutive_errors = 0
+
+                if self._unflushed >= self.batch_size:
+                    await self._flush()
+                    self._unflushed = 0
+                yield result
+
+            await self._flush(final=True)
+        finally:
+            stop.set()
+            for task in [producer, *workers]:
+                if not task.done():
+                    task.cancel()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "completed_through": self.checkpoint.completed_through,
+            "aborted": self.aborted,
+            "billable_calls": self.service.billable_calls,
+            **self.checkpoint.counts,
+            "errors": len(self.checkpoint.errors),
+        }
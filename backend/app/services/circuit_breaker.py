@@ -0,0 +1,146 @@
+"""
+Circuit Breaker
+
+This module provides a circuit breaker for calls to external providers.
+
+States:
+- closed: calls go through; outcomes are tracked over a rolling window
+- open: calls fail immediately until the cool-down has elapsed
+- half_open: a single probe call decides whether to close or re-open
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker.
+
+    Args:
+        name: Name used in logs and health output
+        failure_rate_threshold: Failure ratio in the window that opens the circuit
+        minimum_calls: Calls required in the window before the rate is evaluated
+        window_seconds: Length of the rolling outcome window
+        open_seconds: Cool-down before a half-open probe is allowed
+        clock: Monotonic time source (overridable for tests)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_seconds: float = 30.0,
+        open_seconds: float = 30.0,
+        clock=time.monotonic
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.clock = clock
+
+        self.state = STATE_CLOSED
+        self._outcomes = deque()  # (timestamp, succeeded)
+        self._failures_in_window = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.stats = {"rejected": 0, "opened": 0, "successes": 0, "failures": 0}
+
+    def _trim(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, succeeded = self._outcomes.popleft()
+            if not succeeded:
+                self._failures_in_window -= 1
+
+    def _transition(self, state: str, now: float):
+        if state == self.state:
+            return
+        logger.warning(f"Circuit breaker '{self.name}' {self.state} -> {state}")
+        self.state = state
+        if state == STATE_OPEN:
+            self._opened_at = now
+            self._probe_started_at = None
+            self.stats["opened"] += 1
+        elif state == STATE_CLOSED:
+            self._outcomes.clear()
+            self._failures_in_window = 0
+            self._opened_at = None
+            self._probe_started_at = None
+
+    def allow_request(self) -> bool:
+        """Whether a call may be attempted now; rejected calls should fail fast."""
+        now = self.clock()
+        with self._lock:
+            if self.state == STATE_OPEN and now - self._opened_at >= self.open_seconds:
+                self._transition(STATE_HALF_OPEN, now)
+
+            if self.state == STATE_CLOSED:
+                return True
+
+            if self.state == STATE_HALF_OPEN:
+                # One probe at a time; a probe that never reports back expires after the cool-down
+                if self._probe_started_at is None or now - self._probe_started_at >= self.open_seconds:
+                    self._probe_started_at = now
+                    return True
+
+            self.stats["rejected"] += 1
+            return False
+
+    def record_success(self):
+        now = self.clock()
+        with self._lock:
+            self.stats["successes"] += 1
+            if self.state == STATE_HALF_OPEN:
+                self._transition(STATE_CLOSED, now)
+                return
+            self._outcomes.append((now, True))
+            self._trim(now)
+
+    def record_failure(self):
+        now = self.clock()
+        with self._lock:
+            self.stats["failures"] += 1
+            if self.state == STATE_HALF_OPEN:
+                self._transition(STATE_OPEN, now)
+                return
+            if self.state == STATE_OPEN:
+                return
+
+            self._outcomes.append((now, False))
+            self._failures_in_window += 1
+            self._trim(now)
+            calls = len(self._outcomes)
+            if calls >= self.minimum_calls and self._failures_in_window / calls >= self.failure_rate_threshold:
+                self._transition(STATE_OPEN, now)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state and window statistics, for health endpoints"""
+        now = self.clock()
+        with self._lock:
+            self._trim(now)
+            calls = len(self._outcomes)
+            snapshot = {
+                "name": self.name,
+                "state": self.state,
+                "window_calls": calls,
+                "window_failure_rate": round(self._failures_in_window / calls, 3) if calls else 0.0,
+                **self.stats,
+            }
+            if self.state == STATE_OPEN:
+                snapshot["retry_in_seconds"] = round(max(0.0, self.open_seconds - (now - self._opened_at)), 1)
+            return snapshot
@@ -0,0 +1,196 @@
+"""
+Dashboard Service
+
+This module assembles a user's career dashboard in one call.
+
+Features:
+- Sections loaded concurrently, each on its own pooled connection:
+  profile score, analytics rollups, recent applications, notifications
+  and gamification points
+- Sections run one after another when the engine has a single shared
+  connection (SQLite in-memory / StaticPool)
+- A failing section is reported in ``errors`` instead of failing the dashboard
+- Content-derived ETag for conditional requests
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from ..models import Profile, User, UserAchievement, UserGamificationPoints, UserNotification
+from .analytics_rollup import get_user_analytics
+from .application_pipeline import list_applications
+from .profile_score import calculate_profile_score
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+RECENT_APPLICATIONS = 5
+RECENT_NOTIFICATIONS = 5
+RECENT_ACHIEVEMENTS = 3
+
+
+def _profile_score(db: Session, user_id: int, profile_id: int) -> Optional[Dict[str, Any]]:
+    profile = db.get(Profile, profile_id)
+    return calculate_profile_score(db, profile) if profile is not None else None
+
+
+def _analytics(db: Session, user_id: int, profile_id: int) -> Optional[Dict[str, Any]]:
+    return get_user_analytics(db, user_id)
+
+
+def _recent_applications(db: Session, user_id: int, profile_id: int) -> Dict[str, Any]:
+    page = list_applications(db, profile_id, limit=RECENT_APPLICATIONS)
+    return {"items": page.items, "status_counts": page.status_counts, "total": page.total}
+
+
+def _notifications(db: Session, user_id: int, profile_id: int) -> Dict[str, Any]:
+    unread = db.execute(
+        select(func.count()).select_from(UserNotification).where(
+            UserNotification.UserID == user_id, UserNotification.IsRead.is_not(True)
+        )
+    ).scalar()
+    latest = db.execute(
+        select(UserNotification)
+        .where(UserNotification.UserID == user_id)
+        .order_by(UserNotification.createdDate.desc(), UserNotification.UserNotificationID.desc())
+        .limit(RECENT_NOTIFICATIONS)
+    ).scalars()
+    return {
+        "unread": unread,
+        "latest": [
+            {"notification_id": n.UserNotificationID, "type": n.NotificationType, "title": n.Title,
+             "message": n.Message, "is_read": bool(n.IsRead), "created": n.createdDate}
+            for n in latest
+        ],
+    }
+
+
+def _gamification(db: Session, user_id: int, profile_id: int) -> Dict[str, Any]:
+    by_type = db.execute(
+        select(UserGamificationPoints.PointsType, func.sum(UserGamificationPoints.PointsEarned))
+        .where(UserGamificationPoints.UserID == user_id)
+        .group_by(UserGamificationPoints.PointsType)
+    ).all()
+    achievements = db.execute(
+        select(UserAchievement)
+        .where(UserAchievement.UserID == user_id)
+        .order_by(UserAchievement.EarnedDate.desc(), UserAchievement.UserAchievementID.desc())
+        .limit(RECENT_ACHIEVEMENTS)
+    ).scalars()
+    return {
+        "total_points": sum(points or 0 for _, points in by_type),
+        "points_by_type": {points_type or "other": points or 0 for points_type, points in by_type},
+        "recent_achievements": [
+            {"name": a.AchievementName, "description": a.AchievementDescription, "earned": a.EarnedDate}
+            for a in achievements
+        ],
+    }
+
+
+SECTIONS: Dict[str, Callable[[Session, int, int], Any]] = {
+    "profile_score": _profile_score,
+    "analytics": _analytics,
+    "recent_applications": _recent_applications,
+    "notifications": _notifications,
+    "gamification": _gamification,
+}
+
+
+def _run_section(session_factory, loader, user_id: int, profile_id: int):
+    db = session_factory()
+    try:
+        return loader(db, user_id, profile_id)
+    finally:
+        db.close()
+
+
+def shares_one_connection(session_factory) -> bool:
+    """True when every session uses the same DBAPI connection, so queries cannot overlap"""
+    bind = session_factory.kw.get("bind")
+    return bind is not None and isinstance(bind.pool, (StaticPool, SingletonThreadPool))
+
+
+async def build_dashboard(session_factory, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Load every dashboard section for a user.
+
+    Args:
+        session_factory: sessionmaker; each section gets its own session
+        user_id: User whose dashboard is built
+
+    Returns:
+        Dashboard payload, or None when the user does not exist
+    """
+    loop = asyncio.get_running_loop()
+
+    def lookup():
+        db = session_factory()
+        try:
+            return db.execute(select(User.ProfileID).where(User.UserID == user_id)).scalar_one_or_none()
+        finally:
+            db.close()
+
+    profile_id = await loop.run_in_executor(None, lookup)
+    if profile_id is None:
+        return None
+
+    def load(loader):
+        return loop.run_in_executor(None, _run_section, session_factory, loader, user_id, profile_id)
+
+    if shares_one_connection(session_factory):
+        results = []
+        for loader in SECTIONS.values():
+            try:
+                results.append(await load(loader))
+            except Exception as e:
+                results.append(e)
+    else:
+        results = await asyncio.gather(*(load(loader) for loader in SECTIONS.values()), return_exceptions=True)
+
+    dashboard: Dict[str, Any] = {"user_id": user_id, "errors": {}}
+    for name, result in zip(SECTIONS, results):
+        if isinstance(result, Exception):
+            logger.error(f"❌ Dashboard section {name} failed for user {user_id}: {result}")
+            dashboard[name] = None
+            dashboard["errors"][name] = "unavailable"
+        else:
+            dashboard[name] = result
+    return dashboard
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def dashboard_body(dashboard: Dict[str, Any]) -> bytes:
+    """Canonical JSON encoding of a dashboard (stable key order for the ETag)"""
+    return json.dumps(dashboard, sort_keys=True, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def dashboard_etag(body: bytes) -> str:
+    """Weak ETag for an encoded dashboard"""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check using weak comparison (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
@@ -1,22 +1,349 @@
+import asyncio
+import logging
 import os
+import time
+from collections import deque
+from dataclasses import dataclass
 from email.message import EmailMessage
+from typing import List, Optional
+
 import aiosmtplib
 from dotenv import load_dotenv
 
 load_dotenv()
 
-async def send_reset_email(to_email: str, reset_link: str):
-    msg = EmailMessage()
-    msg["From"] = os.getenv("FROM_EMAIL")
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SMTPSettings:
+    hostname: Optional[str]
+    port: int
+    username: Optional[str] = None
+    password: Optional[str] = None
+    start_tls: bool = True
+    use_tls: bool = False
+    timeout: float = 30.0
+    from_email: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "SMTPSettings":
+        return cls(
+            hostname=os.getenv("SMTP_HOST"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=os.getenv("SMTP_USER") or None,
+            password=os.getenv("SMTP_PASS") or None,
+            start_tls=os.getenv("SMTP_START_TLS", "true").lower() == "true",
+            use_tls=os.getenv("SMTP_USE_TLS", "false").lower() == "true",
+            timeout=float(os.getenv("SMTP_TIMEOUT", "30")),
+            from_email=os.getenv("FROM_EMAIL"),
+        )
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.hostname)
+
+
+class SMTPConnectionPool:
+    """
+    Persistent, authenticated SMTP connections shared across sends.
+
+    At most ``size`` messages are in flight; each holds one connection, which
+    goes back to the pool afterwards instead of being closed. A connection the
+    server dropped while idle is reopened and the send retried once.
+
+    aiosmtplib does not implement ESMTP PIPELINING, so the saving comes from
+    skipping connect/STARTTLS/AUTH per message rather than batching commands.
+
+    Args:
+        settings: SMTP server settings
+        size: Maximum concurrent connections (and sends)
+    """
+
+    def __init__(self, settings: SMTPSettings, size: int = 4):
+        self.settings = settings
+        self.size = size
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.stats = {"connections_opened": 0, "reconnects": 0, "sent": 0, "failed": 0, "keepalive_dropped": 0}
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.settings.hostname,
+            port=self.settings.port,
+            username=self.settings.username,
+            password=self.settings.password,
+            use_tls=self.settings.use_tls,
+            start_tls=self.settings.start_tls,
+            timeout=self.settings.timeout,
+        )
+        await client.connect()
+        self.stats["connections_opened"] += 1
+        return client
+
+    @staticmethod
+    async def _discard(client: Optional[aiosmtplib.SMTP]):
+        if client is not None and client.is_connected:
+            try:
+                await client.quit()
+            except Exception:
+                client.close()
+
+    async def send(self, message: EmailMessage):
+        """
+        Send one message on a pooled connection.
+
+        Raises:
+            aiosmtplib.SMTPException: When the server rejects the message or
+                cannot be reached
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        if message["From"] is None and self.settings.from_email:
+            message["From"] = self.settings.from_email
+
+        async with self._slots:
+            client = self._idle.pop() if self._idle else None
+            try:
+                if client is None or not client.is_connected:
+                    client = await self._connect()
+                try:
+                    await client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Idle connection closed by the server; reconnect once
+                    self.stats["reconnects"] += 1
+                    client = await self._connect()
+                    await client.send_message(message)
+            except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+                # The server refused this message and aiosmtplib has already sent
+                # RSET, so the connection is still usable
+                self.stats["failed"] += 1
+                if client is not None and client.is_connected:
+                    await self._release(client)
+                raise
+            except Exception:
+                self.stats["failed"] += 1
+                await self._discard(client)
+                raise
+            self.stats["sent"] += 1
+            await self._release(client)
+
+    async def _release(self, client: aiosmtplib.SMTP):
+        if len(self._idle) < self.size:
+            self._idle.append(client)
+        else:
+            await self._discard(client)
+
+    async def keepalive(self) -> int:
+        """
+        NOOP every idle connection so servers with short idle timeouts keep it open.
+
+        Returns:
+            Number of dead connections dropped
+        """
+        idle, self._idle = self._idle, []
+        dropped = 0
+        for client in idle:
+            try:
+                await client.noop()
+                await self._release(client)
+            except Exception:
+                dropped += 1
+                await self._discard(client)
+        self.stats["keepalive_dropped"] += dropped
+        return dropped
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    async def close(self):
+        """QUIT every idle connection"""
+        idle, self._idle = self._idle, []
+        for client in idle:
+            await self._discard(client)
+
+
+class SMTPSendQueue:
+    """
+    Outbound mail queue drained by a fixed number of sender workers.
+
+    Every worker sends through the shared connection pool, so a surge of
+    emails (e.g. forgot-password requests) waits in the queue instead of
+    opening a connection per message. Idle pooled connections are kept
+    alive with NOOP between surges.
+
+    Args:
+        pool: SMTP connection pool used by the workers
+        workers: Number of concurrent sender workers
+        max_queue: Maximum queued messages; ``send`` waits when full
+        keepalive_interval: Seconds between NOOPs on idle connections (0 disables)
+        latency_window: Number of recent sends kept for latency metrics
+    """
+
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        workers: int = 4,
+        max_queue: int = 1000,
+        keepalive_interval: float = 60.0,
+        latency_window: int = 500
+    ):
+        self.pool = pool
+        self.workers = workers
+        self.max_queue = max_queue
+        self.keepalive_interval = keepalive_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+        self._latencies = deque(maxlen=latency_window)  # (queue wait, send) seconds
+        self.stats = {"queued": 0, "sent": 0, "failed": 0, "rejected": 0}
+
+    def start(self):
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.max_queue)
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        if self.keepalive_interval:
+            self._tasks.append(loop.create_task(self._keepalive()))
+        logger.info(f"SMTP send queue started ({self.workers} workers)")
+
+    async def send(self, message: EmailMessage):
+        """
+        Queue a message and wait until it is delivered.
+
+        Raises:
+            aiosmtplib.SMTPException: When delivery fails
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future, time.monotonic()))
+        self.stats["queued"] += 1
+        await future
+
+    def enqueue(self, message: EmailMessage) -> bool:
+        """
+        Queue a message without waiting for delivery; failures are logged.
+
+        Returns:
+            False when the queue is full and the message was not queued
+        """
+        self.start()
+        try:
+            self._queue.put_nowait((message, None, time.monotonic()))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            logger.warning(f"SMTP send queue full; dropped email to {message['To']}")
+            return False
+        self.stats["queued"] += 1
+        return True
+
+    async def _worker(self):
+        while True:
+            message, future, queued_at = await self._queue.get()
+            started = time.monotonic()
+            self._in_flight += 1
+            try:
+                await self.pool.send(message)
+            except Exception as e:
+                self.stats["failed"] += 1
+                if future is None:
+                    logger.error(f"Failed to send email to {message['To']}: {e}")
+                elif not future.done():
+                    future.set_exception(e)
+            else:
+                self.stats["sent"] += 1
+                if future is not None and not future.done():
+                    future.set_result(None)
+            finally:
+                self._in_flight -= 1
+                self._latencies.append((started - queued_at, time.monotonic() - started))
+                self._queue.task_done()
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self.pool.keepalive()
+            except Exception as e:
+                logger.warning(f"SMTP keep-alive failed: {e}")
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def metrics(self) -> dict:
+        """Counters, queue depth and recent latency (milliseconds)"""
+        waits = sorted(wait for wait, _ in self._latencies)
+        sends = sorted(send for _, send in self._latencies)
+
+        def ms(values, quantile=None):
+            if not values:
+                return None
+            if quantile is None:
+                return round(1000 * sum(values) / len(values), 1)
+            return round(1000 * values[min(len(values) - 1, int(quantile * len(values)))], 1)
+
+        return {
+            **self.stats,
+            "queue_depth": self.pending,
+            "in_flight": self._in_flight,
+            "workers": self.workers,
+            "queue_wait_ms_avg": ms(waits),
+            "send_ms_avg": ms(sends),
+            "send_ms_p95": ms(sends, 0.95),
+            "smtp": {**self.pool.stats, "idle": self.pool.idle},
+        }
+
+    async def stop(self, timeout: float = 10.0):
+        """Deliver what is queued (up to ``timeout`` seconds), then stop and close connections"""
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"SMTP send queue stopped with {self.pending} emails unsent")
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+        await self.pool.close()
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_mail_queue: Optional[SMTPSendQueue] = None
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Get the shared SMTP connection pool"""
+    global _pool
+    if _pool is None:
+        _pool = SMTPConnectionPool(SMTPSettings.from_env(), size=int(os.getenv("SMTP_POOL_SIZE", "4")))
+    return _pool
+
+
+def get_mail_queue() -> SMTPSendQueue:
+    """Get the shared outbound mail queue; all application email goes through it"""
+    global _mail_queue
+    if _mail_queue is None:
+        pool = get_smtp_pool()
+        _mail_queue = SMTPSendQueue(
+            pool,
+            workers=int(os.getenv("SMTP_SEND_WORKERS", str(pool.size))),
+            max_queue=int(os.getenv("SMTP_QUEUE_SIZE", "1000")),
+            keepalive_interval=float(os.getenv("SMTP_KEEPALIVE_INTERVAL", "60")),
+        )
+    return _mail_queue
+
+
+def build_reset_email(to_email: str, reset_link: str) -> EmailMessage:
+    msg = EmailMessage()  # From is filled in by the pool (FROM_EMAIL)
     msg["To"] = to_email
     msg["Subject"] = "Password Reset for JobTrackerDB"
     msg.set_content(f"Click the link to reset your password: {reset_link}")
+    return msg
+
 
-    await aiosmtplib.send(
-        msg,
-        hostname=os.getenv("SMTP_HOST"),
-        port=int(os.getenv("SMTP_PORT")),
-        username=os.getenv("SMTP_USER"),
-        password=os.getenv("SMTP_PASS"),
-        start_tls=True,
-    ) 
\ No newline at end of file
+async def send_reset_email(to_email: str, reset_link: str):
+    await get_mail_queue().send(build_reset_email(to_email, reset_link))
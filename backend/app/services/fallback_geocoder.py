@@ -0,0 +1,245 @@
+"""
+Fallback Geocoder
+
+This module approximates coordinates locally when the address provider
+cannot place an address precisely (no coordinates on the match, no property
+location, provider unavailable).
+
+Features:
+- Precomputed suburb and postcode centroids, built alongside the local
+  address index (centroids.json)
+- Array-backed tables loaded once per process: postcodes are found by binary
+  search, suburbs by hash lookup
+- State centroids as the last resort, so a state alone still geocodes
+- Confidence scores by match level, all below the coordinate cache threshold
+  so approximations are never cached as precise results
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+from array import array
+from typing import Any, Dict, Iterable, Optional
+
+from ..core.api_config import APIConfig
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CENTROIDS_FORMAT_VERSION = 1
+CENTROIDS_FILENAME = "centroids.json"
+
+MATCH_SUBURB = "suburb"
+MATCH_POSTCODE = "postcode"
+MATCH_STATE = "state"
+
+# Confidence by match level; must stay below the coordinate cache's minimum
+MATCH_CONFIDENCE = {
+    MATCH_SUBURB: 0.55,
+    MATCH_POSTCODE: 0.5,
+    MATCH_STATE: 0.3,
+}
+
+# Capital city coordinates, used when only the state is known
+STATE_CENTROIDS = {
+    'NSW': (-33.8688, 151.2093),  # Sydney
+    'VIC': (-37.8136, 144.9631),  # Melbourne
+    'QLD': (-27.4698, 153.0251),  # Brisbane
+    'WA': (-31.9505, 115.8605),   # Perth
+    'SA': (-34.9285, 138.6007),   # Adelaide
+    'TAS': (-42.8821, 147.3272),  # Hobart
+    'NT': (-12.4634, 130.8456),   # Darwin
+    'ACT': (-35.2809, 149.1300)   # Canberra
+}
+
+# Trailing "SUBURB STATE POSTCODE" of a free-text AU address
+_LOCALITY_RE = re.compile(r"([A-Z][A-Z '\-]*?)\s+(NSW|VIC|QLD|WA|SA|TAS|NT|ACT)\s*(\d{4})?\s*$")
+
+
+def _suburb_key(suburb: str, state: str) -> str:
+    return f"{' '.join(suburb.upper().split())}|{state.upper()}"
+
+
+def build_centroids(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Average record coordinates per postcode and per suburb.
+
+    Args:
+        records: Dicts with suburb, state, postcode, latitude and longitude
+
+    Returns:
+        Centroid table in the centroids.json format
+    """
+    postcodes: Dict[int, list] = {}
+    suburbs: Dict[str, list] = {}
+    for record in records:
+        try:
+            latitude = float(record.get("latitude"))
+            longitude = float(record.get("longitude"))
+        except (TypeError, ValueError):
+            continue
+
+        postcode = str(record.get("postcode") or "").strip()
+        if postcode.isdigit():
+            totals = postcodes.setdefault(int(postcode), [0.0, 0.0, 0])
+            totals[0] += latitude
+            totals[1] += longitude
+            totals[2] += 1
+
+        suburb, state = record.get("suburb"), record.get("state")
+        if suburb and state:
+            totals = suburbs.setdefault(_suburb_key(suburb, state), [0.0, 0.0, 0])
+            totals[0] += latitude
+            totals[1] += longitude
+            totals[2] += 1
+
+    return {
+        "version": CENTROIDS_FORMAT_VERSION,
+        "postcodes": [
+            [postcode, round(lat / n, 6), round(lng / n, 6), n]
+            for postcode, (lat, lng, n) in sorted(postcodes.items())
+        ],
+        "suburbs": [
+            [key, round(lat / n, 6), round(lng / n, 6), n]
+            for key, (lat, lng, n) in sorted(suburbs.items())
+        ],
+    }
+
+
+def write_centroids(centroids: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(centroids, f, separators=(",", ":"))
+
+
+class FallbackGeocoder:
+    """
+    Local suburb/postcode/state centroid lookup.
+
+    Args:
+        centroids: Table produced by build_centroids (None for state-only)
+    """
+
+    def __init__(self, centroids: Optional[Dict[str, Any]] = None):
+        centroids = centroids or {"version": CENTROIDS_FORMAT_VERSION, "postcodes": [], "suburbs": []}
+        if centroids.get("version") != CENTROIDS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported centroid table version: {centroids.get('version')}")
+
+        # Parallel arrays keep ~3k postcodes and ~15k suburbs compact and cache-friendly
+        self._postcodes = array("I", (row[0] for row in centroids["postcodes"]))
+        self._postcode_lat = array("d", (row[1] for row in centroids["postcodes"]))
+        self._postcode_lng = array("d", (row[2] for row in centroids["postcodes"]))
+        self._suburb_index = {row[0]: i for i, row in enumerate(centroids["suburbs"])}
+        self._suburb_lat = array("d", (row[1] for row in centroids["suburbs"]))
+        self._suburb_lng = array("d", (row[2] for row in centroids["suburbs"]))
+
+    @classmethod
+    def load(cls, path: str) -> "FallbackGeocoder":
+        with open(path) as f:
+            return cls(json.load(f))
+
+    @property
+    def postcode_count(self) -> int:
+        return len(self._postcodes)
+
+    @property
+    def suburb_count(self) -> int:
+        return len(self._suburb_index)
+
+    def _postcode(self, postcode: Any) -> Optional[tuple]:
+        postcode = str(postcode or "").strip()
+        if not postcode.isdigit():
+            return None
+        value = int(postcode)
+        index = bisect.bisect_left(self._postcodes, value)
+        if index < len(self._postcodes) and self._postcodes[index] == value:
+            return self._postcode_lat[index], self._postcode_lng[index]
+        return None
+
+    def geocode(
+        self,
+        suburb: Optional[str] = None,
+        state: Optional[str] = None,
+        postcode: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Approximate coordinates from locality fields, most precise level first.
+
+        Args:
+            suburb: Suburb/locality name (optional)
+            state: State abbreviation (optional)
+            postcode: Four-digit postcode (optional)
+
+        Returns:
+            Dict with latitude, longitude, match_level and confidence_score, or None
+        """
+        state = (state or "").strip().upper()
+        coordinates, level = None, None
+
+        if suburb and state:
+            index = self._suburb_index.get(_suburb_key(suburb, state))
+            if index is not None:
+                coordinates, level = (self._suburb_lat[index], self._suburb_lng[index]), MATCH_SUBURB
+        if coordinates is None:
+            found = self._postcode(postcode)
+            if found is not None:
+                coordinates, level = found, MATCH_POSTCODE
+        if coordinates is None and state in STATE_CENTROIDS:
+            coordinates, level = STATE_CENTROIDS[state], MATCH_STATE
+        if coordinates is None:
+            return None
+
+        return {
+            "latitude": coordinates[0],
+            "longitude": coordinates[1],
+            "match_level": level,
+            "confidence_score": MATCH_CONFIDENCE[level],
+        }
+
+    def geocode_text(self, address: str) -> Optional[Dict[str, Any]]:
+        """Approximate coordinates from a free-text address ending in ``SUBURB STATE POSTCODE``"""
+        match = _LOCALITY_RE.search(address.upper().strip())
+        if not match:
+            return None
+        suburb, state, postcode = match.groups()
+        # Without a comma before the suburb the capture includes street words; the postcode still matches
+        return self.geocode(suburb=suburb, state=state, postcode=postcode)
+
+
+_geocoder: Optional[FallbackGeocoder] = None
+_geocoder_lock = threading.Lock()
+
+
+def centroids_path() -> Optional[str]:
+    """Configured centroid table, defaulting to the one built with the local address index"""
+    if APIConfig.FALLBACK_CENTROIDS_PATH:
+        return APIConfig.FALLBACK_CENTROIDS_PATH
+    if APIConfig.LOCAL_ADDRESS_INDEX_PATH:
+        return os.path.join(APIConfig.LOCAL_ADDRESS_INDEX_PATH, CENTROIDS_FILENAME)
+    return None
+
+
+def get_fallback_geocoder() -> FallbackGeocoder:
+    """Get the process-wide fallback geocoder, loading the centroid table once"""
+    global _geocoder
+    if _geocoder is None:
+        with _geocoder_lock:
+            if _geocoder is None:
+                path = centroids_path()
+                geocoder = None
+                if path and os.path.exists(path):
+                    try:
+                        geocoder = FallbackGeocoder.load(path)
+                        logger.info(
+                            f"Loaded fallback centroids from {path}: "
+                            f"{geocoder.postcode_count} postcodes, {geocoder.suburb_count} suburbs"
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to load fallback centroids from {path}: {str(e)}")
+                if geocoder is None:
+                    logger.info("No fallback centroid table; using state centroids only")
+                    geocoder = FallbackGeocoder()
+                _geocoder = geocoder
+    return _geocoder
@@ -0,0 +1,411 @@
+"""
+Fit Score Engine
+
+This module scores a user's profile skills against job board jobs and fills
+UserJobBoardJobFitScore and UserJobBoardJobFitScoreDetail.
+
+Features:
+- Profile Skills and JobBoardJobSkill are matched by SkillDictionaryID; rows
+  not yet normalized fall back to the alias index or their folded name
+- Job requirements are held as a CSR-style sparse matrix (NumPy arrays), so
+  every job is scored in a handful of vectorized operations
+- Importance weights, defaulting from SkillType when Importance is empty
+- Matched/partial/missing counts and OverallScore per job
+- Score and detail rows written with bulk INSERTs; scores from earlier
+  profile versions are replaced in the same transaction
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from .skill_dictionary import SkillNormalizer, fold_skill_name
+from ..models import (
+    JobBoardJob,
+    JobBoardJobSkill,
+    ProfileVersion,
+    Skills,
+    User,
+    UserJobBoardJobFitScore,
+    UserJobBoardJobFitScoreDetail,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+MATCH_MATCHED = "matched"
+MATCH_PARTIAL = "partial"
+MATCH_MISSING = "missing"
+_STATUS_NAMES = np.array([MATCH_MISSING, MATCH_PARTIAL, MATCH_MATCHED], dtype=object)
+
+# Proficiency -> level in [0, 1]; a listed skill without a proficiency counts as working knowledge
+PROFICIENCY_LEVELS = {
+    "expert": 1.0,
+    "advanced": 1.0,
+    "proficient": 0.8,
+    "intermediate": 0.75,
+    "beginner": 0.4,
+    "basic": 0.4,
+    "novice": 0.3,
+}
+DEFAULT_PROFICIENCY_LEVEL = 0.75
+
+# Levels at or above this fully meet a requirement; anything lower is partial
+MATCH_THRESHOLD = 0.6
+
+# Importance used when JobBoardJobSkill.Importance is empty
+SKILL_TYPE_IMPORTANCE = {
+    "required": 1.0,
+    "preferred": 0.6,
+    "optional": 0.3,
+}
+DEFAULT_IMPORTANCE = 0.6
+
+CREATED_BY = "fit_score_engine"
+
+
+def proficiency_level(proficiency: Optional[str]) -> float:
+    if not proficiency:
+        return DEFAULT_PROFICIENCY_LEVEL
+    return PROFICIENCY_LEVELS.get(proficiency.strip().lower(), DEFAULT_PROFICIENCY_LEVEL)
+
+
+class SkillVocabulary:
+    """
+    Skill -> column index.
+
+    Skills are keyed by SkillDictionaryID. A row without one is looked up in
+    the alias index (when given), and otherwise keyed by its folded name.
+    """
+
+    def __init__(self, normalizer: Optional[SkillNormalizer] = None):
+        self.normalizer = normalizer
+        self._index: Dict[object, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _key(self, name: str, skill_id: Optional[int]):
+        if skill_id is None and self.normalizer is not None:
+            skill_id = self.normalizer.lookup(name)
+        return skill_id if skill_id is not None else fold_skill_name(name)
+
+    def add(self, name: str, skill_id: Optional[int] = None) -> int:
+        key = self._key(name, skill_id)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self._index)
+        return index
+
+    def get(self, name: str, skill_id: Optional[int] = None) -> Optional[int]:
+        return self._index.get(self._key(name, skill_id))
+
+
+@dataclass
+class JobSkillMatrix:
+    """
+    Job requirements in compressed sparse row form.
+
+    Row ``i`` (job ``job_ids[i]``) owns entries ``indptr[i]:indptr[i + 1]`` of
+    ``skill_index``, ``importance``, ``skill_names`` and ``skill_types``.
+    """
+    job_ids: np.ndarray
+    indptr: np.ndarray
+    skill_index: np.ndarray
+    importance: np.ndarray
+    skill_names: List[str]
+    skill_types: List[Optional[str]]
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Tuple[int, Optional[int], str, Optional[str], Optional[float]]],
+        vocabulary: SkillVocabulary
+    ) -> "JobSkillMatrix":
+        """
+        Build from ``(job_id, skill_dictionary_id, skill_name, skill_type, importance)``
+        rows sorted by job_id.
+        """
+        job_ids: List[int] = []
+        indptr = [0]
+        skill_index: List[int] = []
+        importance: List[float] = []
+        skill_names: List[str] = []
+        skill_types: List[Optional[str]] = []
+
+        for job_id, skill_id, skill_name, skill_type, weight in rows:
+            if not job_ids or job_ids[-1] != job_id:
+                if job_ids:
+                    indptr.append(len(skill_index))
+                job_ids.append(job_id)
+            skill_index.append(vocabulary.add(skill_name, skill_id))
+            if weight is None:
+                weight = SKILL_TYPE_IMPORTANCE.get((skill_type or "").lower(), DEFAULT_IMPORTANCE)
+            importance.append(float(weight))
+            skill_names.append(skill_name)
+            skill_types.append(skill_type)
+        if job_ids:
+            indptr.append(len(skill_index))
+
+        return cls(
+            job_ids=np.array(job_ids, dtype=np.int64),
+            indptr=np.array(indptr, dtype=np.int64),
+            skill_index=np.array(skill_index, dtype=np.int64),
+            importance=np.array(importance, dtype=np.float64),
+            skill_names=skill_names,
+            skill_types=skill_types,
+        )
+
+    @property
+    def job_count(self) -> int:
+        return len(self.job_ids)
+
+
+@dataclass
+class FitScores:
+    """Per-job scores plus the per-entry detail they were computed from"""
+    job_ids: np.ndarray
+    overall: np.ndarray         # 0-100 per job
+    matched: np.ndarray         # counts per job
+    partial: np.ndarray
+    missing: np.ndarray
+    entry_status: np.ndarray    # 0 missing, 1 partial, 2 matched (per matrix entry)
+    entry_level: np.ndarray     # user level per matrix entry
+    entry_score: np.ndarray     # 0-100 credit per matrix entry
+
+
+def score_matrix(matrix: JobSkillMatrix, user_levels: np.ndarray) -> FitScores:
+    """
+    Score every job in ``matrix`` against a user's skill levels.
+
+    Args:
+        matrix: Job requirements
+        user_levels: Level per vocabulary index (0 where the user lacks the skill)
+
+    Returns:
+        FitScores for all jobs
+    """
+    if matrix.job_count == 0:
+        empty = np.zeros(0)
+        return FitScores(matrix.job_ids, empty, empty, empty, empty, empty, empty, empty)
+
+    # Pad so skills added to the vocabulary after the user vector was built read as 0
+    if len(user_levels) <= int(matrix.skill_index.max()):
+        user_levels = np.pad(user_levels, (0, int(matrix.skill_index.max()) + 1 - len(user_levels)))
+
+    level = user_levels[matrix.skill_index]
+    status = np.where(level >= MATCH_THRESHOLD, 2, np.where(level > 0, 1, 0))
+    credit = np.where(status == 2, 1.0, level)
+
+    starts = matrix.indptr[:-1]
+    weighted = np.add.reduceat(credit * matrix.importance, starts)
+    total = np.add.reduceat(matrix.importance, starts)
+    overall = np.divide(weighted, total, out=np.zeros_like(weighted), where=total > 0) * 100
+
+    return FitScores(
+        job_ids=matrix.job_ids,
+        overall=np.round(overall, 2),
+        matched=np.add.reduceat((status == 2).astype(np.int64), starts),
+        partial=np.add.reduceat((status == 1).astype(np.int64), starts),
+        missing=np.add.reduceat((status == 0).astype(np.int64), starts),
+        entry_status=status,
+        entry_level=level,
+        entry_score=np.round(credit * 100, 2),
+    )
+
+
+class FitScoreEngine:
+    """
+    Score users against job board jobs and store the results.
+
+    Args:
+        chunk_size: Jobs per IN-list when loading and deleting by job id
+        normalizer: Alias index used for rows without a SkillDictionaryID
+    """
+
+    def __init__(self, chunk_size: int = 1000, normalizer: Optional[SkillNormalizer] = None):
+        self.chunk_size = chunk_size
+        self.normalizer = normalizer
+
+    def _chunks(self, values: Sequence[int]):
+        for start in range(0, len(values), self.chunk_size):
+            yield values[start:start + self.chunk_size]
+
+    def latest_profile_version(self, db: Session, user_id: int) -> Tuple[int, int]:
+        """``(ProfileID, ProfileVersionID)`` of the user's latest profile version"""
+        row = db.execute(
+            select(User.ProfileID, func.max(ProfileVersion.ProfileVersionID))
+            .join(ProfileVersion, ProfileVersion.ProfileID == User.ProfileID)
+            .where(User.UserID == user_id)
+            .group_by(User.ProfileID)
+        ).first()
+        if row is None or row[1] is None:
+            raise ValueError(f"User {user_id} has no profile version to score")
+        return row[0], row[1]
+
+    def user_levels(self, db: Session, profile_id: int, vocabulary: SkillVocabulary) -> Tuple[np.ndarray, Dict[int, str]]:
+        """User level per vocabulary index, and the proficiency text for detail rows"""
+        rows = db.execute(
+            select(Skills.SkillDictionaryID, Skills.SkillName, Skills.Proficiency).where(Skills.ProfileID == profile_id)
+        ).all()
+        indexed = [(vocabulary.add(name, skill_id), proficiency) for skill_id, name, proficiency in rows]
+        levels = np.zeros(len(vocabulary), dtype=np.float64)
+        proficiency_text: Dict[int, str] = {}
+        for index, proficiency in indexed:
+            level = proficiency_level(proficiency)
+            if level > levels[index]:
+                levels[index] = level
+                proficiency_text[index] = proficiency
+        return levels, proficiency_text
+
+    def load_jobs(
+        self,
+        db: Session,
+        vocabulary: SkillVocabulary,
+        job_ids: Optional[Sequence[int]] = None
+    ) -> JobSkillMatrix:
+        """Requirements of active jobs (optionally only ``job_ids``) as a sparse matrix"""
+        base = (
+            select(
+                JobBoardJobSkill.JobBoardJobID, JobBoardJobSkill.SkillDictionaryID, JobBoardJobSkill.SkillName,
+                JobBoardJobSkill.SkillType, JobBoardJobSkill.Importance
+            )
+            .join(JobBoardJob, JobBoardJob.JobBoardJobID == JobBoardJobSkill.JobBoardJobID)
+            .where(JobBoardJob.IsActive.is_(True))
+            .order_by(JobBoardJobSkill.JobBoardJobID, JobBoardJobSkill.JobBoardJobSkillID)
+        )
+        if job_ids is None:
+            rows = db.execute(base).all()
+        else:
+            rows = []
+            for chunk in self._chunks(sorted(set(job_ids))):
+                rows.extend(db.execute(base.where(JobBoardJobSkill.JobBoardJobID.in_(chunk))).all())
+        return JobSkillMatrix.from_rows(
+            ((job_id, skill_id, name, skill_type, float(weight) if weight is not None else None)
+             for job_id, skill_id, name, skill_type, weight in rows),
+            vocabulary
+        )
+
+    def score_user(
+        self,
+        db: Session,
+        user_id: int,
+        job_ids: Optional[Sequence[int]] = None,
+        profile_version_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Score a user against jobs and replace their stored scores for those jobs.
+
+        Args:
+            db: Database session (committed on success)
+            user_id: User to score
+            job_ids: Jobs to score (all active jobs with skills when None)
+            profile_version_id: Version to store scores against (latest when None)
+
+        Returns:
+            Counts of jobs scored and detail rows written
+        """
+        profile_id, latest_version_id = self.latest_profile_version(db, user_id)
+        profile_version_id = profile_version_id or latest_version_id
+
+        if self.normalizer is not None and not self.normalizer.loaded:
+            self.normalizer.load(db)
+        vocabulary = SkillVocabulary(self.normalizer)
+        levels, proficiency_text = self.user_levels(db, profile_id, vocabulary)
+        matrix = self.load_jobs(db, vocabulary, job_ids)
+        scores = score_matrix(matrix, levels)
+        written = self._write(db, user_id, profile_version_id, matrix, scores, proficiency_text)
+        logger.info(
+            f"Scored user {user_id} (profile version {profile_version_id}) against "
+            f"{matrix.job_count} jobs, {written} detail rows"
+        )
+        return {"jobs": matrix.job_count, "details": written}
+
+    def _delete_scores(self, db: Session, user_id: int, job_ids: Sequence[int], version_filter):
+        """Delete a user's scores (and their details) for ``job_ids`` matching ``version_filter``"""
+        conditions = (
+            UserJobBoardJobFitScore.UserID == user_id,
+            UserJobBoardJobFitScore.JobBoardJobID.in_(job_ids),
+            version_filter,
+        )
+        db.execute(delete(UserJobBoardJobFitScoreDetail).where(
+            UserJobBoardJobFitScoreDetail.UserJobBoardJobFitScoreID.in_(
+                select(UserJobBoardJobFitScore.UserJobBoardJobFitScoreID).where(*conditions)
+            )
+        ))
+        db.execute(delete(UserJobBoardJobFitScore).where(*conditions))
+
+    def _write(
+        self,
+        db: Session,
+        user_id: int,
+        profile_version_id: int,
+        matrix: JobSkillMatrix,
+        scores: FitScores,
+        proficiency_text: Dict[int, str]
+    ) -> int:
+        job_ids = [int(job_id) for job_id in matrix.job_ids]
+        if not job_ids:
+            return 0
+        now = datetime.utcnow()
+
+        try:
+            # Replace this version's previous scores for the same jobs
+            for chunk in self._chunks(job_ids):
+                self._delete_scores(db, user_id, chunk, UserJobBoardJobFitScore.ProfileVersionID == profile_version_id)
+
+            score_rows = [
+                {
+                    "UserID": user_id,
+                    "JobBoardJobID": job_id,
+                    "ProfileVersionID": profile_version_id,
+                    "OverallScore": float(overall),
+                    "SkillsMatched": int(matched),
+                    "SkillsPartial": int(partial),
+                    "SkillsMissing": int(missing),
+                    "createdDate": now,
+                    "createdBy": CREATED_BY,
+                }
+                for job_id, overall, matched, partial, missing in zip(
+                    job_ids, scores.overall, scores.matched, scores.partial, scores.missing
+                )
+            ]
+            # One INSERT ... RETURNING batch; ids come back in parameter order
+            score_ids = db.execute(
+                insert(UserJobBoardJobFitScore).returning(
+                    UserJobBoardJobFitScore.UserJobBoardJobFitScoreID, sort_by_parameter_order=True
+                ),
+                score_rows
+            ).scalars().all()
+
+            statuses = _STATUS_NAMES[scores.entry_status]
+            detail_rows = []
+            for row, score_id in enumerate(score_ids):
+                for entry in range(matrix.indptr[row], matrix.indptr[row + 1]):
+                    detail_rows.append({
+                        "UserJobBoardJobFitScoreID": score_id,
+                        "SkillName": matrix.skill_names[entry],
+                        "MatchStatus": statuses[entry],
+                        "UserSkillLevel": proficiency_text.get(int(matrix.skill_index[entry])) if scores.entry_level[entry] > 0 else None,
+                        "JobSkillRequirement": matrix.skill_types[entry],
+                        "Score": float(scores.entry_score[entry]),
+                        "createdDate": now,
+                        "createdBy": CREATED_BY,
+                    })
+            if detail_rows:
+                db.execute(insert(UserJobBoardJobFitScoreDetail), detail_rows)
+
+            # Scores from earlier profile versions are superseded; removing them in the
+            # same transaction keeps them readable until the new rows are committed
+            for chunk in self._chunks(job_ids):
+                self._delete_scores(db, user_id, chunk, UserJobBoardJobFitScore.ProfileVersionID < profile_version_id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(detail_rows)
@@ -0,0 +1,249 @@
+"""
+Fit Score Recompute Worker
+
+This module keeps UserJobBoardJobFitScore current without rescoring
+everything after each edit.
+
+Features:
+- Dirty sets of changed profiles (users) and changed jobs, coalesced between drains
+- A profile change rescores that user against all jobs; a job change rescores
+  only the users who already hold a score for that job; a new job is scored
+  for every user with a profile version
+- Drained by a background task; scoring runs in a worker thread
+- New scores replace the previous profile version's rows in the same
+  transaction, so old scores stay readable until the new ones land
+"""
+
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, Optional, Set
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import ProfileVersion, User, UserJobBoardJobFitScore
+from app.services.fit_score_engine import FitScoreEngine
+from app.services.analytics_rollup import get_analytics_rollup
+from app.services.skill_dictionary import get_skill_normalizer
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Attempts at claiming the next VersionNumber when concurrent saves race for it
+VERSION_NUMBER_ATTEMPTS = 5
+
+
+def create_profile_version(db: Session, profile_id: int, created_by: Optional[str] = None) -> ProfileVersion:
+    """
+    Add the next ProfileVersion for a profile (flushed, not committed).
+
+    Fit scores are stored per profile version, so a skills change starts a
+    new version and the recompute worker scores against it. The version is
+    inserted in a savepoint; when a concurrent save already took the number
+    (UQ_ProfileVersion_ProfileID_VersionNumber), the next one is tried.
+    """
+    db.flush()
+    for attempt in range(VERSION_NUMBER_ATTEMPTS):
+        latest = db.execute(
+            select(func.max(ProfileVersion.VersionNumber)).where(ProfileVersion.ProfileID == profile_id)
+        ).scalar()
+        version = ProfileVersion(ProfileID=profile_id, VersionNumber=(latest or 0) + 1, createdBy=created_by)
+        try:
+            with db.begin_nested():
+                db.add(version)
+                db.flush()
+            return version
+        except IntegrityError:
+            if attempt == VERSION_NUMBER_ATTEMPTS - 1:
+                raise
+            logger.info(f"Profile {profile_id} version {version.VersionNumber} taken concurrently; retrying")
+
+
+class FitScoreRecomputer:
+    """
+    Dirty-set queue of fit scores to recompute.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        engine: Scoring engine (a default FitScoreEngine when None)
+        drain_interval: Seconds between drains
+        max_pending: Drain early once this many users and jobs are dirty
+        on_scored: Called (from the worker thread) with each rescored user id
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        engine: Optional[FitScoreEngine] = None,
+        drain_interval: float = 5.0,
+        max_pending: int = 100,
+        on_scored: Optional[Callable[[int], None]] = None
+    ):
+        self.session_factory = session_factory
+        self.engine = engine or FitScoreEngine()
+        self.on_scored = on_scored
+        self.drain_interval = drain_interval
+        self.max_pending = max_pending
+        self._dirty_users: Set[int] = set()
+        self._dirty_jobs: Set[int] = set()
+        self._new_jobs: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.stats = {"marked": 0, "drains": 0, "users_scored": 0, "pairs_scored": 0, "failures": 0}
+
+    def _marked(self):
+        self.stats["marked"] += 1
+        if self._wakeup is not None and self.pending >= self.max_pending:
+            self._wakeup.set()
+
+    def mark_profile(self, user_id: int):
+        """A user's skills changed (new ProfileVersion): rescore them against all jobs."""
+        self._dirty_users.add(user_id)
+        self._marked()
+
+    def mark_job(self, job_id: int):
+        """A job's JobBoardJobSkill rows changed: rescore users who have a score for it."""
+        self._dirty_jobs.add(job_id)
+        self._marked()
+
+    def mark_new_job(self, job_id: int):
+        """A job was inserted: score it for every user with a profile version."""
+        self._new_jobs.add(job_id)
+        self._marked()
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty_users) + len(self._dirty_jobs) + len(self._new_jobs)
+
+    def plan(
+        self,
+        db: Session,
+        users: Set[int],
+        jobs: Set[int],
+        new_jobs: Optional[Set[int]] = None
+    ) -> Dict[int, Optional[Set[int]]]:
+        """
+        Affected (user, job) pairs grouped by user.
+
+        Args:
+            db: Database session
+            users: Users to rescore against every job
+            jobs: Changed jobs, rescored for users holding a score for them
+            new_jobs: Inserted jobs, scored for every user with a profile version
+
+        Returns:
+            user_id -> job ids to rescore, or None for all jobs
+        """
+        work: Dict[int, Optional[Set[int]]] = {user_id: None for user_id in users}
+        if new_jobs:
+            scorable = db.execute(
+                select(User.UserID)
+                .join(ProfileVersion, ProfileVersion.ProfileID == User.ProfileID)
+                .distinct()
+            ).scalars()
+            for user_id in scorable:
+                if user_id in work and work[user_id] is None:
+                    continue
+                work.setdefault(user_id, set()).update(new_jobs)
+        job_list = sorted(jobs)
+        for start in range(0, len(job_list), 1000):
+            rows = db.execute(
+                select(UserJobBoardJobFitScore.UserID, UserJobBoardJobFitScore.JobBoardJobID)
+                .where(UserJobBoardJobFitScore.JobBoardJobID.in_(job_list[start:start + 1000]))
+                .distinct()
+            ).all()
+            for user_id, job_id in rows:
+                if user_id in work and work[user_id] is None:
+                    continue  # Already rescoring this user against every job
+                work.setdefault(user_id, set()).add(job_id)
+        return work
+
+    def _recompute(self, users: Set[int], jobs: Set[int], new_jobs: Set[int]) -> Set[int]:
+        """Rescore the affected pairs; returns users whose rescore failed."""
+        db = self.session_factory()
+        failed: Set[int] = set()
+        try:
+            for user_id, job_ids in self.plan(db, users, jobs, new_jobs).items():
+                try:
+                    result = self.engine.score_user(db, user_id, job_ids=sorted(job_ids) if job_ids is not None else None)
+                    self.stats["users_scored"] += 1
+                    self.stats["pairs_scored"] += result["jobs"]
+                    if self.on_scored is not None:
+                        self.on_scored(user_id)
+                except ValueError as e:
+                    # No profile version yet; nothing to score against
+                    logger.info(f"Skipping fit score recompute for user {user_id}: {e}")
+                except Exception as e:
+                    logger.error(f"Fit score recompute failed for user {user_id}: {e}")
+                    failed.add(user_id)
+        finally:
+            db.close()
+        return failed
+
+    async def drain(self):
+        """Recompute everything marked dirty since the last drain."""
+        if not self.pending:
+            return
+        users, self._dirty_users = self._dirty_users, set()
+        jobs, self._dirty_jobs = self._dirty_jobs, set()
+        new_jobs, self._new_jobs = self._new_jobs, set()
+        try:
+            failed = await asyncio.get_running_loop().run_in_executor(None, self._recompute, users, jobs, new_jobs)
+            self.stats["drains"] += 1
+        except Exception as e:
+            logger.error(f"Fit score recompute drain failed: {e}")
+            self.stats["failures"] += 1
+            self._dirty_users |= users
+            self._dirty_jobs |= jobs
+            self._new_jobs |= new_jobs
+            return
+        if failed:
+            self.stats["failures"] += len(failed)
+            # Retry the whole user next drain; a full rescore covers any job-level work
+            self._dirty_users |= failed
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.drain_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.drain()
+
+    def start(self):
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Fit score recompute worker started (interval={self.drain_interval}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+        await self.drain()
+
+
+_recomputer: Optional[FitScoreRecomputer] = None
+
+
+def get_fit_score_recomputer() -> FitScoreRecomputer:
+    """Get the shared fit score recompute worker"""
+    global _recomputer
+    if _recomputer is None:
+        from mcp.db.session import SessionLocal
+        _recomputer = FitScoreRecomputer(
+            SessionLocal,
+            engine=FitScoreEngine(normalizer=get_skill_normalizer()),
+            drain_interval=float(os.getenv("FIT_SCORE_RECOMPUTE_INTERVAL", "5.0")),
+            max_pending=int(os.getenv("FIT_SCORE_RECOMPUTE_MAX_PENDING", "100")),
+            on_scored=get_analytics_rollup().mark_user,
+        )
+    return _recomputer
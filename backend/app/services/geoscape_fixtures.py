@@ -0,0 +1,234 @@
+"""
+Geoscape Record/Replay Fixtures
+
+This module captures real Geoscape responses into fixture files and serves
+them back from a local ASGI stand-in, so the address stack can be load
+tested without calling the paid API.
+
+Features:
+- Record mode: GeoscapeService writes each response to GEOSCAPE_RECORD_DIR
+- Fixtures keyed by method, endpoint and canonicalized parameters
+- Replay app with configurable latency, jitter and error injection
+- Unmatched requests can be answered from another fixture for the same endpoint
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _canonical_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    # Query strings arrive as text on replay, so compare values as text
+    return {str(key): str(value) for key, value in (params or {}).items() if value is not None}
+
+
+def fixture_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable identifier for a request"""
+    canonical = json.dumps(
+        {"method": method.upper(), "endpoint": endpoint, "params": _canonical_params(params)}, sort_keys=True
+    )
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def fixture_path(root: str, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    slug = endpoint.strip("/").replace("/", "_") or "root"
+    return os.path.join(root, slug, f"{method.lower()}_{fixture_key(method, endpoint, params)}.json")
+
+
+def record_response(
+    root: str,
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    status_code: int,
+    body: Any
+) -> Optional[str]:
+    """
+    Write one response as a fixture file.
+
+    Returns:
+        The fixture path, or None if it could not be written
+    """
+    path = fixture_path(root, method, endpoint, params)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({
+                "request": {"method": method.upper(), "endpoint": endpoint, "params": params or {}},
+                "status": status_code,
+                "body": body,
+                "recorded": datetime.utcnow().isoformat(),
+            }, f, indent=2, default=str)
+        return path
+    except Exception as e:
+        # Recording must never break a live request
+        logger.error(f"Failed to record Geoscape fixture {path}: {str(e)}")
+        return None
+
+
+class FixtureStore:
+    """
+    Recorded responses loaded from a fixture directory.
+
+    Args:
+        root: Directory written by record mode
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+        self._by_endpoint: Dict[tuple, List[Dict[str, Any]]] = {}
+        for directory, _, files in os.walk(root):
+            for name in sorted(files):
+                if not name.endswith(".json"):
+                    continue
+                with open(os.path.join(directory, name)) as f:
+                    fixture = json.load(f)
+                request = fixture["request"]
+                key = fixture_key(request["method"], request["endpoint"], request.get("params"))
+                self._by_key[key] = fixture
+                self._by_endpoint.setdefault((request["method"].upper(), request["endpoint"]), []).append(fixture)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    @property
+    def endpoints(self) -> List[str]:
+        return sorted({endpoint for _, endpoint in self._by_endpoint})
+
+    def match(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        fallback: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the fixture for a request.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path, e.g. ``/predictive/address``
+            params: Query parameters or JSON body
+            fallback: Answer unrecorded requests with a fixture for the same endpoint
+
+        Returns:
+            Fixture dict (request, status, body) or None
+        """
+        key = fixture_key(method, endpoint, params)
+        fixture = self._by_key.get(key)
+        if fixture is None and fallback:
+            candidates = self._by_endpoint.get((method.upper(), endpoint))
+            if candidates:
+                # Deterministic per request, so repeated queries get the same answer
+                fixture = candidates[int(key, 16) % len(candidates)]
+        return fixture
+
+
+class GeoscapeReplayApp:
+    """
+    ASGI stand-in for the Geoscape API serving recorded fixtures.
+
+    Args:
+        store: Recorded fixtures
+        latency_ms: Mean added latency per response
+        jitter_ms: Standard deviation of the added latency
+        error_rate: Fraction of requests answered with ``error_status``
+        error_status: Status code for injected errors (e.g. 503, 429)
+        fallback: Answer unrecorded requests from another fixture for the endpoint
+        prefix: Path prefix to strip (e.g. ``/v1`` when GEOSCAPE_BASE_URL ends in it)
+        seed: Random seed for reproducible latency and error injection
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        fallback: bool = True,
+        prefix: str = "",
+        seed: Optional[int] = None
+    ):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fallback = fallback
+        self.prefix = prefix.rstrip("/")
+        self.random = random.Random(seed)
+        self.stats: Counter = Counter()
+
+    async def _read_body(self, receive) -> bytes:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                return body
+
+    async def _respond(self, send, status: int, body: Any):
+        payload = json.dumps(body).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        method = scope["method"]
+        endpoint = scope["path"]
+        if self.prefix and endpoint.startswith(self.prefix):
+            endpoint = endpoint[len(self.prefix):]
+
+        if method == "GET":
+            params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        else:
+            raw = await self._read_body(receive)
+            params = json.loads(raw) if raw else {}
+
+        if endpoint == "/_replay/stats":
+            await self._respond(send, 200, {"fixtures": len(self.store), **self.stats})
+            return
+
+        if self.latency_ms or self.jitter_ms:
+            delay = max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms))
+            await asyncio.sleep(delay / 1000)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats["injected_errors"] += 1
+            await self._respond(send, self.error_status, {"message": "Injected replay error"})
+            return
+
+        fixture = self.store.match(method, endpoint, params, fallback=self.fallback)
+        if fixture is None:
+            self.stats["unmatched"] += 1
+            await self._respond(send, 404, {"message": f"No recorded response for {method} {endpoint}"})
+            return
+
+        self.stats["served"] += 1
+        await self._respond(send, fixture["status"], fixture["body"])
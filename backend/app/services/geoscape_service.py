@@ -12,19 +12,46 @@ Features:
 - Support for simple API key authentication
 """
 
+import asyncio
 import httpx
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import time
 
 from ..core.api_config import APIConfig, GeoscapeEndpoints, GeoscapeAddressData
+from .address_suggestions import standardize_geoscape_suggestions
+from .circuit_breaker import CircuitBreaker
+from .geoscape_fixtures import record_response
+from .fallback_geocoder import get_fallback_geocoder
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+UNAVAILABLE_MESSAGE = "Address validation service is temporarily unavailable. Please enter your address manually."
+
+# Coordinate resolution paths, in order of preference
+RESOLUTION_PROPERTY = "property_details"
+RESOLUTION_SEARCH = "search"
+RESOLUTION_SEARCH_PROPERTY = "search_property_details"
+RESOLUTION_FALLBACK = "local_fallback"
+RESOLUTION_NONE = "not_found"
+
+# How often each path produced the answer, reported by the address health endpoint
+coordinate_resolution_stats: Counter = Counter()
+
+# Shared by every GeoscapeService instance so failures seen by one request protect the rest
+geoscape_breaker = CircuitBreaker(
+    "geoscape",
+    failure_rate_threshold=APIConfig.GEOSCAPE_BREAKER_FAILURE_RATE,
+    minimum_calls=APIConfig.GEOSCAPE_BREAKER_MINIMUM_CALLS,
+    window_seconds=APIConfig.GEOSCAPE_BREAKER_WINDOW_SECONDS,
+    open_seconds=APIConfig.GEOSCAPE_BREAKER_OPEN_SECONDS,
+)
+
 class GeoscapeService:
     """
     Service class for interacting with Geoscape Predictive API.
@@ -40,6 +67,8 @@ class GeoscapeService:
         self.consumer_secret = APIConfig.GEOSCAPE_CONSUMER_SECRET
         self.base_url = APIConfig.GEOSCAPE_BASE_URL
         self.timeout = APIConfig.GEOSCAPE_TIMEOUT
+        # Requests actually sent upstream (each one is billable, even if later cancelled)
+        self.requests_sent = 0
         
 
         
@@ -77,6 +106,12 @@ class GeoscapeService:
         """
         Make a request to the Geoscape API with authentication fallback.
         
+        Calls go through the shared circuit breaker. Timeouts, connection
+        errors, 5xx and 429 responses count as failures; while the breaker
+        is open the request fails immediately with the manual-entry message.
+        When GEOSCAPE_RECORD_DIR is set each response is saved as a replay
+        fixture.
+        
         Args:
             endpoint: API endpoint path
             params: Query parameters or request body
@@ -88,6 +123,10 @@ class GeoscapeService:
         Raises:
             Exception: If the API request fails
         """
+        if not geoscape_breaker.allow_request():
+            logger.warning(f"Geoscape circuit open - skipping request to {endpoint}")
+            raise Exception(UNAVAILABLE_MESSAGE)
+        
         try:
             url = f"{self.base_url}{endpoint}"
             headers = await self._get_headers()
@@ -98,33 +137,52 @@ class GeoscapeService:
             
             async with httpx.AsyncClient(timeout=self.timeout) as client:
                 if method.upper() == "GET":
+                    self.requests_sent += 1
                     response = await client.get(url, headers=headers, params=params)
                 elif method.upper() == "POST":
+                    self.requests_sent += 1
                     response = await client.post(url, headers=headers, json=params)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                logger.info(f"Geoscape API response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(f"Geoscape API response: {data}")
-                    return data
-                
-                else:
-                    logger.error(f"Geoscape API request failed: {response.status_code}")
-                    logger.error(f"Response: {response.text}")
-                    raise Exception(f"API request failed with status {response.status_code}: {response.text}")
-                    
         except httpx.TimeoutException:
+            geoscape_breaker.record_failure()
             logger.error("Geoscape API request timed out")
-            raise Exception("Address validation service is temporarily unavailable. Please enter your address manually.")
+            raise Exception(UNAVAILABLE_MESSAGE)
         except httpx.RequestError as e:
+            geoscape_breaker.record_failure()
             logger.error(f"Geoscape API request error: {e}")
-            raise Exception("Address validation service is temporarily unavailable. Please enter your address manually.")
+            raise Exception(UNAVAILABLE_MESSAGE)
         except Exception as e:
             logger.error(f"Unexpected error in Geoscape API request: {e}")
-            raise Exception("Address validation service is temporarily unavailable. Please enter your address manually.")
+            raise Exception(UNAVAILABLE_MESSAGE)
+        
+        logger.info(f"Geoscape API response status: {response.status_code}")
+        
+        if APIConfig.GEOSCAPE_RECORD_DIR:
+            try:
+                recorded_body = response.json()
+            except ValueError:
+                recorded_body = response.text
+            record_response(APIConfig.GEOSCAPE_RECORD_DIR, method, endpoint, params, response.status_code, recorded_body)
+        
+        if response.status_code >= 500 or response.status_code == 429:
+            geoscape_breaker.record_failure()
+        else:
+            # Client errors still mean the service is answering
+            geoscape_breaker.record_success()
+        
+        if response.status_code != 200:
+            logger.error(f"Geoscape API request failed: {response.status_code}")
+            logger.error(f"Response: {response.text}")
+            raise Exception(UNAVAILABLE_MESSAGE)
+        
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Unexpected error in Geoscape API request: {e}")
+            raise Exception(UNAVAILABLE_MESSAGE)
+        logger.info(f"Geoscape API response: {data}")
+        return data
     
     def _get_mock_response(self, endpoint: str, params: Optional[Dict[str, Any]] = None, method: str = "GET") -> Dict[str, Any]:
         """
@@ -287,7 +345,7 @@ class GeoscapeService:
             state: Filter by state (optional)
             
         Returns:
-            List of address suggestions with standardized format
+            List of address suggestions in the address API's format
         """
         try:
             # Prepare request parameters
@@ -305,16 +363,10 @@ class GeoscapeService:
                 endpoint="/predictive/address",  # Correct working endpoint
                 params=params
             )
-            logger.info(f"Geoscape search response: {response}")
+            logger.debug("Geoscape search response: %s", response)
             
-            # Process and standardize response
-            suggestions = []
-            for item in response.get("suggest", []):  # Use "suggest" key as per their API
-                suggestion = self._standardize_address_suggestion(item)
-                if suggestion:
-                    suggestions.append(suggestion)
-            
-            return suggestions
+            # Map the "suggest" list straight to the API suggestion shape
+            return standardize_geoscape_suggestions(response.get("suggest", []))
             
         except Exception as e:
             logger.error(f"Address search failed: {str(e)}")
@@ -360,10 +412,95 @@ class GeoscapeService:
             logger.error(f"Address validation failed: {str(e)}")
             raise
     
+    async def _coordinates_from_property(
+        self,
+        property_id: str,
+        confidence_score: float,
+        address_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve coordinates from the property details endpoint.
+        
+        Returns:
+            Coordinates result, or None if the property has no location
+        """
+        try:
+            property_details = await self.get_property_details(property_id)
+        except Exception as e:
+            logger.warning(f"Failed to get property details for {property_id}: {e}")
+            return None
+        
+        latitude = property_details.get("latitude")
+        longitude = property_details.get("longitude")
+        if latitude is None or longitude is None:
+            return None
+        
+        return {
+            "success": True,
+            "latitude": latitude,
+            "longitude": longitude,
+            "address": address_data or {},
+            "property_id": property_id,
+            "confidence_score": confidence_score
+        }
+    
+    async def _coordinates_from_search(
+        self,
+        address: str,
+        skip_property_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], str]:
+        """
+        Resolve coordinates by searching for the address.
+        
+        Uses coordinates on the best match if present, otherwise the best
+        match's property details (unless that property is already being
+        fetched by a concurrent property-details call).
+        
+        Returns:
+            (result or None, best match or None, resolution path)
+        """
+        search_results = await self.search_addresses(address, limit=5)
+        if not search_results:
+            return None, None, RESOLUTION_SEARCH
+        
+        # Prefer an exact match, otherwise the first result
+        best_match = next(
+            (result for result in search_results if result.get("address", "").lower() == address.lower()),
+            search_results[0]
+        )
+        address_data = best_match.get("data", {})
+        latitude = address_data.get("latitude")
+        longitude = address_data.get("longitude")
+        
+        if latitude is not None and longitude is not None:
+            return {
+                "success": True,
+                "latitude": latitude,
+                "longitude": longitude,
+                "address": address_data,
+                "property_id": best_match.get("id"),
+                "confidence_score": 0.8
+            }, best_match, RESOLUTION_SEARCH
+        
+        match_id = best_match.get("id")
+        if match_id and match_id != skip_property_id:
+            result = await self._coordinates_from_property(match_id, 0.7, address_data)
+            return result, best_match, RESOLUTION_SEARCH_PROPERTY
+        
+        return None, best_match, RESOLUTION_SEARCH
+    
     async def get_address_coordinates(self, address: str, property_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get precise coordinates for a selected address.
         
+        The property-details lookup (when a property_id is known) and the
+        address search run concurrently. Property details win whenever they
+        produce coordinates. A search answer is accepted early only if it
+        resolved the same property, or once the property lookup has failed;
+        otherwise it is held until the property lookup finishes. The losing
+        path is cancelled, and the winning path is returned as
+        ``resolution_path`` and counted in ``coordinate_resolution_stats``.
+        
         Args:
             address: Full address string
             property_id: Geoscape property ID (optional)
@@ -371,115 +508,88 @@ class GeoscapeService:
         Returns:
             Dictionary with coordinates and address details
         """
+        started = time.perf_counter()
+        tasks: Dict[asyncio.Task, str] = {}
         try:
-            # First try to get coordinates from the property details endpoint if we have a property_id
             if property_id:
-                try:
-                    property_details = await self.get_property_details(property_id)
-                    if property_details.get("success") and property_details.get("coordinates"):
-                        return {
-                            "success": True,
-                            "latitude": property_details["coordinates"]["latitude"],
-                            "longitude": property_details["coordinates"]["longitude"],
-                            "address": property_details.get("address", {}),
-                            "property_id": property_id,
-                            "confidence_score": 0.9
-                        }
-                except Exception as e:
-                    logger.warning(f"Failed to get property details for {property_id}: {e}")
-            
-            # Fallback to search endpoint
-            search_results = await self.search_addresses(address, limit=5)
-            
-            if search_results:
-                # Find the best match
-                best_match = None
-                for result in search_results:
-                    if result.get("address", "").lower() == address.lower():
-                        best_match = result
-                        break
-                
-                # If no exact match, use the first result
-                if not best_match and search_results:
-                    best_match = search_results[0]
-                
-                if best_match:
-                    # Try to get coordinates from the search result data
-                    address_data = best_match.get("data", {})
-                    latitude = address_data.get("latitude")
-                    longitude = address_data.get("longitude")
-                    
-                    # If we have actual coordinates from the search, use them
-                    if latitude is not None and longitude is not None:
-                        address_data.update({
-                            "latitude": latitude,
-                            "longitude": longitude
-                        })
-                        
-                        return {
-                            "success": True,
-                            "latitude": latitude,
-                            "longitude": longitude,
-                            "address": address_data,
-                            "property_id": best_match.get("id"),
-                            "confidence_score": 0.8
-                        }
-                    
-                    # If no coordinates in search result, try to get them from property details
-                    property_id = best_match.get("id")
-                    if property_id:
-                        try:
-                            property_details = await self.get_property_details(property_id)
-                            if property_details.get("success") and property_details.get("coordinates"):
-                                return {
-                                    "success": True,
-                                    "latitude": property_details["coordinates"]["latitude"],
-                                    "longitude": property_details["coordinates"]["longitude"],
-                                    "address": address_data,
-                                    "property_id": property_id,
-                                    "confidence_score": 0.7
-                                }
-                        except Exception as e:
-                            logger.warning(f"Failed to get property details for {property_id}: {e}")
-                    
-                    # Last resort: use default coordinates based on state
-                    state = address_data.get("state", "NSW")
+                tasks[asyncio.ensure_future(self._coordinates_from_property(property_id, 0.9))] = RESOLUTION_PROPERTY
+            tasks[asyncio.ensure_future(self._coordinates_from_search(address, skip_property_id=property_id))] = "search"
+            
+            result = None
+            resolution_path = None
+            best_match = None
+            search_error = None
+            # Search answer waiting on the property lookup, as (result, path)
+            candidate = None
+            property_failed = not property_id
+            pending = set(tasks)
+            while pending and result is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if tasks[task] == RESOLUTION_PROPERTY:
+                        outcome = task.result()
+                        if outcome:
+                            result, resolution_path = outcome, RESOLUTION_PROPERTY
+                        else:
+                            property_failed = True
+                        continue
                     
-                    # Get default coordinates for the state
-                    state_coords = {
-                        'NSW': [-33.8688, 151.2093], # Sydney
-                        'VIC': [-37.8136, 144.9631], # Melbourne
-                        'QLD': [-27.4698, 153.0251], # Brisbane
-                        'WA': [-31.9505, 115.8605],  # Perth
-                        'SA': [-34.9285, 138.6007],  # Adelaide
-                        'TAS': [-42.8821, 147.3272], # Hobart
-                        'NT': [-12.4634, 130.8456],  # Darwin
-                        'ACT': [-35.2809, 149.1300]  # Canberra
-                    }
-                    
-                    default_lat, default_lng = state_coords.get(state, [-33.8688, 151.2093])
-                    
-                    # Include coordinates in the address object as well
-                    address_data.update({
-                        "latitude": default_lat,
-                        "longitude": default_lng
-                    })
-                    
-                    return {
+                    try:
+                        outcome, best_match, path = task.result()
+                    except Exception as e:
+                        search_error = e
+                        continue
+                    if outcome:
+                        candidate = (outcome, path)
+                
+                # A search answer for another property must not beat the requested one
+                if result is None and candidate and (property_failed or candidate[0]["property_id"] == property_id):
+                    result, resolution_path = candidate
+            
+            if result is None:
+                # Last resort: approximate coordinates from local centroids, without another upstream call
+                address_data = best_match.get("data", {}) if best_match else {}
+                geocoder = get_fallback_geocoder()
+                approximate = None
+                if best_match is not None:
+                    approximate = geocoder.geocode(
+                        suburb=address_data.get("suburb"),
+                        state=address_data.get("state"),
+                        postcode=address_data.get("postcode")
+                    )
+                if approximate is None:
+                    approximate = geocoder.geocode_text(address)
+                if approximate is not None:
+                    address_data.update({"latitude": approximate["latitude"], "longitude": approximate["longitude"]})
+                    result = {
                         "success": True,
-                        "latitude": default_lat,
-                        "longitude": default_lng,
+                        "latitude": approximate["latitude"],
+                        "longitude": approximate["longitude"],
                         "address": address_data,
-                        "property_id": property_id,
-                        "confidence_score": 0.5  # Lower confidence for default coordinates
+                        "property_id": best_match.get("id") if best_match else None,
+                        "confidence_score": approximate["confidence_score"],
+                        "match_level": approximate["match_level"]
                     }
+                    resolution_path = RESOLUTION_FALLBACK
+            
+            if result is None:
+                if search_error is not None:
+                    raise search_error
+                logger.warning(f"No address match found for: {address}")
+                coordinate_resolution_stats[RESOLUTION_NONE] += 1
+                return {
+                    "success": False,
+                    "error": "No address match found",
+                    "address": address
+                }
             
-            logger.warning(f"No address match found for: {address}")
-            return {
-                "success": False,
-                "error": "No address match found",
-                "address": address
-            }
+            coordinate_resolution_stats[resolution_path] += 1
+            result["resolution_path"] = resolution_path
+            logger.info(
+                f"Resolved coordinates via {resolution_path} in "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+            return result
                 
         except Exception as e:
             logger.error(f"Failed to get coordinates for address {address}: {str(e)}")
@@ -488,6 +598,10 @@ class GeoscapeService:
                 "error": str(e),
                 "address": address
             }
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def get_property_details(self, property_id: str) -> Dict[str, Any]:
         """
@@ -511,97 +625,6 @@ class GeoscapeService:
             logger.error(f"Property details retrieval failed: {str(e)}")
             raise
     
-    def _standardize_address_suggestion(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """
-        Standardize address suggestion from Geoscape API response.
-        
-        Args:
-            item: Raw suggestion item from API
-            
-        Returns:
-            Standardized suggestion dictionary
-        """
-        try:
-            # Extract address components from their format
-            address = item.get("address", "")
-            suggestion_id = item.get("id", "")
-            rank = item.get("rank", 0)
-            
-            # Parse the address string to extract components
-            # Example: "4 MILBURN CCT, BOOLAROO NSW 2284"
-            address_parts = address.split(", ")
-            if len(address_parts) >= 2:
-                street_part = address_parts[0]
-                location_part = address_parts[1]
-                
-                # Parse street part (e.g., "4 MILBURN CCT")
-                street_words = street_part.split()
-                if len(street_words) >= 3:
-                    street_number = street_words[0]
-                    # Join all words except first (number) and last (type) as street name
-                    street_name = " ".join(street_words[1:-1])
-                    street_type = street_words[-1]
-                elif len(street_words) == 2:
-                    # Handle cases like "4 MILBURN" (no street type)
-                    street_number = street_words[0]
-                    street_name = street_words[1]
-                    street_type = ""
-                else:
-                    street_number = ""
-                    street_name = street_part
-                    street_type = ""
-                
-                # Parse location part (e.g., "BOOLAROO NSW 2284")
-                location_words = location_part.split()
-                if len(location_words) >= 3:
-                    # Last two words are state and postcode
-                    suburb = " ".join(location_words[:-2])
-                    state = location_words[-2]
-                    postcode = location_words[-1]
-                elif len(location_words) == 2:
-                    # Handle cases with just suburb and state
-                    suburb = location_words[0]
-                    state = location_words[1]
-                    postcode = ""
-                else:
-                    suburb = location_part
-                    state = ""
-                    postcode = ""
-            else:
-                # Fallback for addresses without comma separation
-                street_number = ""
-                street_name = ""
-                street_type = ""
-                suburb = ""
-                state = ""
-                postcode = ""
-            
-            # Build standardized suggestion
-            suggestion = {
-                "address": address,
-                "id": suggestion_id,
-                "data": {
-                    "streetNumber": street_number,
-                    "streetName": street_name,
-                    "streetType": street_type,
-                    "suburb": suburb,
-                    "state": state,
-                    "postcode": postcode,
-                    "latitude": None,  # Not provided in this response
-                    "longitude": None,  # Not provided in this response
-                    "propertyType": None,  # Not provided in this response
-                    "landArea": None,  # Not provided in this response
-                    "floorArea": None  # Not provided in this response
-                },
-                "confidence": 1.0 - (rank * 0.1)  # Convert rank to confidence score
-            }
-            
-            return suggestion
-            
-        except Exception as e:
-            logger.error(f"Failed to standardize address suggestion: {str(e)}")
-            return None
-    
     def _standardize_validation_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Standardize address validation response.
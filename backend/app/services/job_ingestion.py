@@ -0,0 +1,715 @@
+"""
+Job Posting Ingestion Service
+
+This module streams job feeds (JSON Lines or CSV) into JobBoardJob,
+de-duplicating postings and tracking reposts and content changes.
+
+Features:
+- Streams input in fixed-size chunks; the feed is never loaded into memory
+- 64-bit SimHash over the words of title (weighted), company and
+  description, computed with NumPy per posting
+- In-memory fingerprint index with banded lookup (near-duplicates within a
+  few bits are found without scanning every job); the API keeps one index
+  per process and only reads jobs added since the last upload
+- Ingestion is serialized per process, and index changes are applied only
+  after their chunk commits
+- Exact duplicates and near-duplicates from the same company map to the same job
+- Seen again after a quiet period -> IsRepost / RepostFrequency
+- Content changed -> job updated, new JobBoardJobVersion, skills replaced
+- Bulk INSERTs and executemany UPDATEs, committed per chunk
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models import JobBoard, JobBoardJob, JobBoardJobSkill, JobBoardJobVersion
+from .skill_dictionary import SkillNormalizer, fold_skill_name, get_skill_normalizer
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CREATED_BY = "job_ingestion"
+
+# Fingerprints within this many differing bits are the same posting. Word
+# features keep small edits within 0-2 bits while a different role on the
+# same company template lands around 9+ bits apart.
+DEFAULT_MAX_DISTANCE = 4
+MAX_DISTANCE_LIMIT = 6
+# Title words count this many times, so a changed title moves the fingerprint
+TITLE_WEIGHT = 3
+
+# Token hashes cached across postings (vocabularies repeat heavily)
+TOKEN_CACHE_SIZE = 500000
+
+OUTCOME_INSERTED = "inserted"
+OUTCOME_UPDATED = "updated"
+OUTCOME_REPOSTED = "reposted"
+OUTCOME_UNCHANGED = "unchanged"
+OUTCOME_DUPLICATE = "duplicate"
+OUTCOME_INVALID = "invalid"
+
+# Accepted feed column names per posting field
+FIELD_ALIASES = {
+    "title": ("title", "job_title", "JobTitle"),
+    "company": ("company", "company_name", "CompanyName"),
+    "description": ("description", "job_description", "JobDescription"),
+    "location": ("location", "Location"),
+    "url": ("url", "job_url", "JobURL"),
+    "board": ("board", "board_name", "BoardName"),
+    "skills": ("skills", "Skills"),
+    "units": ("units", "unit_count", "UnitCount"),
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SKILL_SPLIT_RE = re.compile(r"[;|]")
+
+_SIGN_BIT = 1 << 63
+
+# One ingestion at a time per process: uploads share the fingerprint index,
+# and two concurrent runs could both insert the same new posting
+_ingest_lock = threading.RLock()
+
+# IN-list size for per-job lookups (SQL Server allows ~2100 parameters)
+LOOKUP_CHUNK = 1000
+
+
+@dataclass
+class JobSkillRequirement:
+    name: str
+    skill_type: Optional[str] = None
+    importance: Optional[float] = None
+
+
+@dataclass
+class JobPosting:
+    """One feed record"""
+    title: str
+    company: str
+    description: str = ""
+    location: Optional[str] = None
+    url: Optional[str] = None
+    board: Optional[str] = None
+    units: int = 1
+    skills: Optional[List[JobSkillRequirement]] = None   # None when the feed has no skills column
+    fingerprint: int = 0
+    content_hash: str = ""
+
+    @property
+    def company_key(self) -> str:
+        return company_key(self.company)
+
+
+def company_key(company: str) -> str:
+    """Company name as compared by near-duplicate matching"""
+    return _WHITESPACE_RE.sub(" ", company.strip().lower())
+
+
+def _field(record: Dict[str, Any], name: str) -> Any:
+    for key in FIELD_ALIASES[name]:
+        value = record.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _parse_skills(value: Any) -> Optional[List[JobSkillRequirement]]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [part for part in _SKILL_SPLIT_RE.split(value)]
+    skills = []
+    for item in value:
+        if isinstance(item, dict):
+            name = (item.get("name") or item.get("skill") or "").strip()
+            importance = item.get("importance")
+            skill = JobSkillRequirement(
+                name, item.get("type") or item.get("skill_type"),
+                float(importance) if importance not in (None, "") else None
+            )
+        else:
+            name = str(item).strip()
+            skill = JobSkillRequirement(name)
+        if name:
+            skills.append(skill)
+    return skills
+
+
+def posting_from_record(record: Dict[str, Any], default_board: Optional[str] = None) -> JobPosting:
+    """
+    Build a posting from a feed record.
+
+    Raises:
+        ValueError: When the title or company is missing
+    """
+    title = _field(record, "title")
+    company = _field(record, "company")
+    if not title or not company:
+        raise ValueError("Posting needs a title and a company")
+    units = _field(record, "units")
+    return JobPosting(
+        title=" ".join(str(title).split())[:255],
+        company=" ".join(str(company).split())[:255],
+        description=str(_field(record, "description") or ""),
+        location=(str(_field(record, "location")).strip()[:255] or None) if _field(record, "location") else None,
+        url=(str(_field(record, "url")).strip()[:500] or None) if _field(record, "url") else None,
+        board=_field(record, "board") or default_board,
+        units=int(units) if units else 1,
+        skills=_parse_skills(_field(record, "skills")),
+    )
+
+
+def iter_feed_records(stream: TextIO, fmt: str) -> Iterator[Union[str, Dict[str, Any]]]:
+    """
+    Yield records from a JSON Lines (``jsonl``) or CSV (``csv``) text stream, one at a time.
+
+    JSON Lines records are yielded as raw lines and decoded by
+    parse_feed_record, so one malformed line is counted as an invalid
+    record instead of ending the run.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "jsonl":
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield line
+    else:
+        raise ValueError(f"Unsupported feed format: {fmt}")
+
+
+def parse_feed_record(record: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Decode a feed record from iter_feed_records.
+
+    Raises:
+        ValueError: When a JSON line is malformed or not an object
+    """
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise ValueError("Record is not a JSON object")
+    return record
+
+
+def feed_format(filename: str) -> str:
+    """Feed format from a file name"""
+    return "csv" if filename.lower().endswith(".csv") else "jsonl"
+
+
+def _to_signed(value: int) -> int:
+    """Unsigned 64-bit fingerprint -> signed, for a BIGINT column"""
+    return value - (1 << 64) if value & _SIGN_BIT else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value & ((1 << 64) - 1)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHasher:
+    """
+    Stable 64-bit SimHash over words.
+
+    Word hashes come from BLAKE2b (so fingerprints are comparable across
+    processes and runs) and are cached; the per-bit vote is a NumPy
+    unpack/sum over all word hashes of a posting.
+    """
+
+    def __init__(self, cache_size: int = TOKEN_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._token_cache: Dict[str, int] = {}
+
+    def _token_hashes(self, tokens: List[str]) -> np.ndarray:
+        cache = self._token_cache
+        if len(cache) > self.cache_size:
+            cache.clear()
+        hashes = []
+        for token in tokens:
+            value = cache.get(token)
+            if value is None:
+                value = cache[token] = int.from_bytes(
+                    hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+            hashes.append(value)
+        return np.array(hashes, dtype=np.uint64)
+
+    def fingerprint(self, text: str) -> int:
+        tokens = _TOKEN_RE.findall(_TAG_RE.sub(" ", text).lower())
+        if not tokens:
+            return 0
+        hashes = self._token_hashes(tokens)
+        bits = np.unpackbits(hashes.view(np.uint8), bitorder="little").reshape(-1, 64)
+        votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(hashes)
+        return int(np.packbits(votes, bitorder="little").view(np.uint64)[0])
+
+    def posting_fingerprint(self, title: str, company: str, description: str) -> int:
+        return self.fingerprint(" ".join([title] * TITLE_WEIGHT + [company, description]))
+
+
+def content_hash(posting: JobPosting) -> str:
+    """Exact-change hash of the fields an update would overwrite"""
+    parts = [posting.title, posting.company, posting.location or "", posting.url or "",
+             _WHITESPACE_RE.sub(" ", posting.description).strip()]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IndexedJob:
+    """Index entry for a stored (or about to be stored) job"""
+    job_id: Optional[int]
+    fingerprint: int
+    content_hash: str
+    company_key: str
+    last_seen: Optional[datetime]
+    repost_frequency: int = 0
+
+
+class FingerprintIndex:
+    """
+    Near-duplicate lookup over job fingerprints.
+
+    Each fingerprint is split into ``max_distance + 1`` bands and a job is
+    filed under every band value. Two fingerprints within ``max_distance``
+    bits must agree on at least one whole band, so checking the Hamming
+    distance of jobs sharing a band finds every near-duplicate.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        if not 0 <= max_distance <= MAX_DISTANCE_LIMIT:
+            # Narrower bands make candidate lists too long to stay fast
+            raise ValueError(f"max_distance must be between 0 and {MAX_DISTANCE_LIMIT}")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        self._band_spans = []
+        shift = 0
+        for band in range(bands):
+            width = 64 // bands + (1 if band < 64 % bands else 0)
+            self._band_spans.append((shift, (1 << width) - 1))
+            shift += width
+        self.entries: List[IndexedJob] = []
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._by_hash: Dict[str, int] = {}
+        self._job_ids: Set[int] = set()
+        # Highest JobBoardJobID read from the database (see JobIngestor.load_index)
+        self.loaded_through = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _band_values(self, fingerprint: int):
+        for band, (shift, mask) in enumerate(self._band_spans):
+            yield band, (fingerprint >> shift) & mask
+
+    def add(self, entry: IndexedJob) -> int:
+        slot = len(self.entries)
+        self.entries.append(entry)
+        for band, value in self._band_values(entry.fingerprint):
+            self._bands[band].setdefault(value, []).append(slot)
+        self._by_hash.setdefault(entry.content_hash, slot)
+        if entry.job_id is not None:
+            self._job_ids.add(entry.job_id)
+        return slot
+
+    def has_job(self, job_id: int) -> bool:
+        return job_id in self._job_ids
+
+    def update(self, slot: int, fingerprint: int, content_hash: str):
+        """Re-file a job whose content changed"""
+        entry = self.entries[slot]
+        if fingerprint != entry.fingerprint:
+            for band, value in self._band_values(entry.fingerprint):
+                self._bands[band][value].remove(slot)
+            for band, value in self._band_values(fingerprint):
+                self._bands[band].setdefault(value, []).append(slot)
+        if self._by_hash.get(entry.content_hash) == slot:
+            del self._by_hash[entry.content_hash]
+        self._by_hash.setdefault(content_hash, slot)
+        entry.fingerprint, entry.content_hash = fingerprint, content_hash
+
+    def find(self, posting: JobPosting) -> Optional[int]:
+        """Slot of the stored job this posting duplicates (exact, else nearest from the same company)"""
+        slot = self._by_hash.get(posting.content_hash)
+        if slot is not None:
+            return slot
+        best, best_distance = None, self.max_distance + 1
+        seen: Set[int] = set()
+        for band, value in self._band_values(posting.fingerprint):
+            for candidate in self._bands[band].get(value, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                entry = self.entries[candidate]
+                if entry.company_key != posting.company_key:
+                    continue
+                distance = hamming_distance(entry.fingerprint, posting.fingerprint)
+                if distance < best_distance:
+                    best, best_distance = candidate, distance
+        return best
+
+
+@dataclass
+class IngestSummary:
+    counts: Dict[str, int] = field(default_factory=lambda: {
+        OUTCOME_INSERTED: 0, OUTCOME_UPDATED: 0, OUTCOME_REPOSTED: 0,
+        OUTCOME_UNCHANGED: 0, OUTCOME_DUPLICATE: 0, OUTCOME_INVALID: 0,
+    })
+    processed: int = 0
+    chunks: int = 0
+    errors: List[str] = field(default_factory=list)
+    # Job ids below are recorded only once their chunk has committed
+    # Existing jobs whose JobBoardJobSkill rows were replaced (for fit score recompute)
+    skill_changed_job_ids: Set[int] = field(default_factory=set)
+    # Jobs inserted by this run (scored for every user by the fit score recompute)
+    inserted_job_ids: Set[int] = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"processed": self.processed, "chunks": self.chunks, **self.counts, "errors": self.errors[:20]}
+
+
+class JobIngestor:
+    """
+    Streaming job feed importer.
+
+    Args:
+        db: Database session (committed once per chunk)
+        chunk_size: Postings per chunk / bulk statement
+        max_distance: Fingerprint bits that may differ for a near-duplicate
+        repost_after_days: A job seen again after this long counts as a repost
+        default_board: JobBoard name for records without one
+        normalizer: Skill alias index for JobBoardJobSkill.SkillDictionaryID
+        index: Fingerprint index to reuse, e.g. the process-wide one from
+            get_job_fingerprint_index (a new, empty index by default)
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        chunk_size: int = 500,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        repost_after_days: int = 7,
+        default_board: Optional[str] = None,
+        normalizer: Optional[SkillNormalizer] = None,
+        index: Optional[FingerprintIndex] = None
+    ):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.repost_after = timedelta(days=repost_after_days)
+        self.default_board = default_board
+        self.normalizer = normalizer or get_skill_normalizer()
+        self.hasher = SimHasher()
+        self.index = index if index is not None else FingerprintIndex(max_distance)
+        self._boards: Dict[str, int] = {}
+        self._run_started = datetime.utcnow()
+
+    def fingerprint(self, posting: JobPosting) -> JobPosting:
+        posting.fingerprint = self.hasher.posting_fingerprint(posting.title, posting.company, posting.description)
+        posting.content_hash = content_hash(posting)
+        return posting
+
+    def load_index(self, page_size: int = 5000):
+        """
+        Add stored jobs the fingerprint index does not hold yet.
+
+        The index remembers the highest JobBoardJobID it has read, so a
+        reused index only reads jobs added since (e.g. by ingest_jobs.py).
+        Descriptions are read only for jobs stored before fingerprints
+        existed, which are fingerprinted here and backfilled.
+        """
+        with _ingest_lock:
+            db = self.db
+            index = self.index
+            loaded = backfilled = 0
+            while True:
+                rows = db.execute(
+                    select(
+                        JobBoardJob.JobBoardJobID, JobBoardJob.CompanyName,
+                        JobBoardJob.ContentFingerprint, JobBoardJob.ContentHash,
+                        func.coalesce(JobBoardJob.LastSeenDate, JobBoardJob.createdDate), JobBoardJob.RepostFrequency,
+                    )
+                    .where(JobBoardJob.JobBoardJobID > index.loaded_through)
+                    .order_by(JobBoardJob.JobBoardJobID)
+                    .limit(page_size)
+                ).all()
+                if not rows:
+                    break
+
+                legacy = [row[0] for row in rows if row[2] is None or row[3] is None]
+                computed: Dict[int, Tuple[int, str]] = {}
+                for chunk_start in range(0, len(legacy), LOOKUP_CHUNK):
+                    backfill = []
+                    for job_id, title, company, description, location, url in db.execute(
+                        select(
+                            JobBoardJob.JobBoardJobID, JobBoardJob.JobTitle, JobBoardJob.CompanyName,
+                            JobBoardJob.JobDescription, JobBoardJob.Location, JobBoardJob.JobURL,
+                        ).where(JobBoardJob.JobBoardJobID.in_(legacy[chunk_start:chunk_start + LOOKUP_CHUNK]))
+                    ):
+                        posting = self.fingerprint(JobPosting(title=title, company=company,
+                                                              description=description or "",
+                                                              location=location, url=url))
+                        computed[job_id] = (posting.fingerprint, posting.content_hash)
+                        backfill.append({"JobBoardJobID": job_id, "ContentFingerprint": _to_signed(posting.fingerprint),
+                                         "ContentHash": posting.content_hash})
+                    db.execute(update(JobBoardJob), backfill)
+                    db.commit()
+                    backfilled += len(backfill)
+
+                for job_id, company, fingerprint, digest, last_seen, reposts in rows:
+                    if index.has_job(job_id):
+                        continue  # Inserted through this index
+                    if job_id in computed:
+                        fingerprint, digest = computed[job_id]
+                    else:
+                        fingerprint = _to_unsigned(fingerprint)
+                    index.add(IndexedJob(job_id, fingerprint, digest, company_key(company), last_seen, reposts or 0))
+                    loaded += 1
+                index.loaded_through = rows[-1][0]
+            logger.info(f"Loaded {loaded} job fingerprints ({backfilled} backfilled), {len(index)} indexed")
+
+    def _board_id(self, name: Optional[str]) -> int:
+        name = (name or self.default_board or "Imported").strip()[:255]
+        board_id = self._boards.get(name)
+        if board_id is None:
+            board_id = self.db.execute(select(JobBoard.JobBoardID).where(JobBoard.BoardName == name)).scalar()
+            if board_id is None:
+                board = JobBoard(BoardName=name, createdBy=CREATED_BY)
+                self.db.add(board)
+                self.db.flush()
+                board_id = board.JobBoardID
+            self._boards[name] = board_id
+        return board_id
+
+    def _skill_rows(self, job_id: int, skills: List[JobSkillRequirement], now: datetime) -> List[Dict[str, Any]]:
+        return [
+            {
+                "JobBoardJobID": job_id,
+                "SkillName": skill.name[:255],
+                "SkillDictionaryID": self.normalizer.resolve(self.db, skill.name, CREATED_BY),
+                "SkillType": skill.skill_type,
+                "Importance": skill.importance,
+                "createdDate": now,
+                "createdBy": CREATED_BY,
+            }
+            for skill in skills
+            if fold_skill_name(skill.name)
+        ]
+
+    def _process_chunk(self, records: List[Union[str, Dict[str, Any]]], start: int, summary: IngestSummary):
+        """
+        Match, write and commit one chunk.
+
+        New and changed content is matched against a chunk-local index; the
+        shared index is only updated once the chunk has committed, so a
+        failed chunk leaves it describing the database.
+        """
+        db = self.db
+        now = datetime.utcnow()
+        seen_before = now - self.repost_after
+
+        staged = FingerprintIndex(self.index.max_distance)       # Content new to this chunk
+        matched: Dict[int, int] = {}                              # slot -> repost frequency
+        new_postings: List[JobPosting] = []
+        changed: List[Tuple[int, JobPosting, bool]] = []          # (slot, posting, reposted)
+        touched: List[Dict[str, Any]] = []
+
+        for offset, record in enumerate(records):
+            try:
+                posting = self.fingerprint(posting_from_record(parse_feed_record(record), self.default_board))
+            except (ValueError, TypeError) as e:
+                summary.counts[OUTCOME_INVALID] += 1
+                summary.errors.append(f"Record {start + offset}: {e}")
+                continue
+
+            slot = self.index.find(posting)
+            if slot is None:
+                if staged.find(posting) is not None:
+                    # Repeats a posting new earlier in this chunk
+                    summary.counts[OUTCOME_DUPLICATE] += 1
+                    continue
+                staged.add(IndexedJob(None, posting.fingerprint, posting.content_hash, posting.company_key, now))
+                new_postings.append(posting)
+                continue
+
+            entry = self.index.entries[slot]
+            if slot in matched or (entry.last_seen is not None and entry.last_seen >= self._run_started):
+                # Already seen earlier in this run
+                summary.counts[OUTCOME_DUPLICATE] += 1
+                continue
+
+            reposted = entry.last_seen is not None and entry.last_seen < seen_before
+            matched[slot] = entry.repost_frequency + 1 if reposted else entry.repost_frequency
+            if posting.content_hash != entry.content_hash:
+                staged.add(IndexedJob(entry.job_id, posting.fingerprint, posting.content_hash,
+                                      posting.company_key, now))
+                changed.append((slot, posting, reposted))
+                summary.counts[OUTCOME_UPDATED] += 1
+            else:
+                row = {"JobBoardJobID": entry.job_id, "LastSeenDate": now, "IsActive": True}
+                if reposted:
+                    row.update(IsRepost=True, RepostFrequency=matched[slot])
+                touched.append(row)
+                summary.counts[OUTCOME_UNCHANGED] += 1
+            if reposted:
+                summary.counts[OUTCOME_REPOSTED] += 1
+
+        inserted_ids: List[int] = []
+        skill_jobs: List[int] = []
+        try:
+            if new_postings:
+                inserted_ids = db.execute(
+                    insert(JobBoardJob).returning(JobBoardJob.JobBoardJobID, sort_by_parameter_order=True),
+                    [
+                        {
+                            "JobBoardID": self._board_id(posting.board),
+                            "JobTitle": posting.title,
+                            "CompanyName": posting.company,
+                            "JobDescription": posting.description,
+                            "Location": posting.location,
+                            "JobURL": posting.url,
+                            "UnitCount": posting.units,
+                            "IsRepost": False,
+                            "RepostFrequency": 0,
+                            "IsActive": True,
+                            "ContentFingerprint": _to_signed(posting.fingerprint),
+                            "ContentHash": posting.content_hash,
+                            "LastSeenDate": now,
+                            "createdDate": now,
+                            "createdBy": CREATED_BY,
+                        }
+                        for posting in new_postings
+                    ]
+                ).scalars().all()
+                versions, skills = [], []
+                for posting, job_id in zip(new_postings, inserted_ids):
+                    versions.append({"JobBoardJobID": job_id, "VersionNumber": 1, "ChangeReason": "Imported",
+                                     "createdDate": now, "createdBy": CREATED_BY})
+                    if posting.skills:
+                        skills.extend(self._skill_rows(job_id, posting.skills, now))
+                db.execute(insert(JobBoardJobVersion), versions)
+                if skills:
+                    db.execute(insert(JobBoardJobSkill), skills)
+                summary.counts[OUTCOME_INSERTED] += len(inserted_ids)
+
+            if changed:
+                job_ids = [self.index.entries[slot].job_id for slot, _, _ in changed]
+                latest = dict(db.execute(
+                    select(JobBoardJobVersion.JobBoardJobID, func.max(JobBoardJobVersion.VersionNumber))
+                    .where(JobBoardJobVersion.JobBoardJobID.in_(job_ids))
+                    .group_by(JobBoardJobVersion.JobBoardJobID)
+                ).all())
+                updates, versions, skills = [], [], []
+                for (slot, posting, reposted), job_id in zip(changed, job_ids):
+                    row = {
+                        "JobBoardJobID": job_id,
+                        "JobTitle": posting.title,
+                        "JobDescription": posting.description,
+                        "Location": posting.location,
+                        "JobURL": posting.url,
+                        "UnitCount": posting.units,
+                        "IsActive": True,
+                        "ContentFingerprint": _to_signed(posting.fingerprint),
+                        "ContentHash": posting.content_hash,
+                        "LastSeenDate": now,
+                        "lastUpdated": now,
+                        "updatedBy": CREATED_BY,
+                    }
+                    if reposted:
+                        row.update(IsRepost=True, RepostFrequency=matched[slot])
+                    updates.append(row)
+                    latest[job_id] = latest.get(job_id, 0) + 1
+                    versions.append({"JobBoardJobID": job_id, "VersionNumber": latest[job_id],
+                                     "ChangeReason": "Reposted with changes" if reposted else "Content changed",
+                                     "createdDate": now, "createdBy": CREATED_BY})
+                    if posting.skills is not None:
+                        skill_jobs.append(job_id)
+                        skills.extend(self._skill_rows(job_id, posting.skills, now))
+                # ORM bulk UPDATE groups rows by key set into executemany batches
+                db.execute(update(JobBoardJob), updates)
+                db.execute(insert(JobBoardJobVersion), versions)
+                if skill_jobs:
+                    db.execute(delete(JobBoardJobSkill).where(JobBoardJobSkill.JobBoardJobID.in_(skill_jobs)))
+                    if skills:
+                        db.execute(insert(JobBoardJobSkill), skills)
+
+            if touched:
+                db.execute(update(JobBoardJob), touched)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        summary.inserted_job_ids.update(inserted_ids)
+        summary.skill_changed_job_ids.update(skill_jobs)
+        for posting, job_id in zip(new_postings, inserted_ids):
+            self.index.add(IndexedJob(job_id, posting.fingerprint, posting.content_hash, posting.company_key, now))
+        for slot, posting, _ in changed:
+            self.index.update(slot, posting.fingerprint, posting.content_hash)
+        for slot, repost_frequency in matched.items():
+            entry = self.index.entries[slot]
+            entry.last_seen, entry.repost_frequency = now, repost_frequency
+
+    def ingest(
+        self,
+        records: Iterable[Union[str, Dict[str, Any]]],
+        progress: Optional[Callable[[IngestSummary], None]] = None,
+        summary: Optional[IngestSummary] = None
+    ) -> IngestSummary:
+        """
+        Import feed records chunk by chunk.
+
+        Runs are serialized per process; the index is brought up to date with
+        jobs stored since it was last loaded before the first chunk.
+
+        Args:
+            records: Feed records (e.g. from iter_feed_records)
+            progress: Called with the running summary after each chunk
+            summary: Summary to fill in; pass one to see which jobs earlier
+                chunks committed when a later chunk raises
+
+        Returns:
+            IngestSummary
+        """
+        with _ingest_lock:
+            self.load_index()
+            self._run_started = datetime.utcnow()
+            summary = summary if summary is not None else IngestSummary()
+            iterator = iter(records)
+            while True:
+                chunk = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+                self._process_chunk(chunk, summary.processed, summary)
+                summary.processed += len(chunk)
+                summary.chunks += 1
+                if progress:
+                    progress(summary)
+        logger.info(f"Job ingestion finished: {summary.to_dict()}")
+        return summary
+
+
+_fingerprint_index: Optional[FingerprintIndex] = None
+
+
+def get_job_fingerprint_index() -> FingerprintIndex:
+    """Get the process-wide job fingerprint index shared by feed uploads"""
+    global _fingerprint_index
+    if _fingerprint_index is None:
+        from app.core.api_config import APIConfig
+        _fingerprint_index = FingerprintIndex(APIConfig.JOB_DEDUP_MAX_DISTANCE)
+    return _fingerprint_index
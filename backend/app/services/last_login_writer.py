@@ -0,0 +1,126 @@
+"""
+Last Login Writer
+
+This module defers ``User.LastLogin`` updates off the login request path.
+
+Features:
+- Coalesces repeated logins per user into one pending timestamp
+- Flushes pending timestamps in one batched UPDATE on an interval
+- Runs the database write in a worker thread so the event loop stays free
+- Final flush on application shutdown
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import update
+
+from app.models import User
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class LastLoginWriter:
+    """Batch ``LastLogin`` updates for successful logins.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        flush_interval: Seconds between flushes
+        max_pending: Flush early once this many users are pending
+    """
+
+    def __init__(self, session_factory, flush_interval: float = 2.0, max_pending: int = 500):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[int, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.stats = {"recorded": 0, "flushed": 0, "batches": 0, "failures": 0}
+
+    def record(self, user_id: int, when: Optional[datetime] = None):
+        """Queue a LastLogin update for ``user_id``; the latest timestamp wins."""
+        self._pending[user_id] = when or datetime.utcnow()
+        self.stats["recorded"] += 1
+        if self._wakeup is not None and len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _write(self, batch: Dict[int, datetime]):
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(User),
+                [{"UserID": user_id, "LastLogin": when} for user_id, when in batch.items()]
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def flush(self):
+        """Write all pending timestamps in a single batch."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, batch)
+            self.stats["flushed"] += len(batch)
+            self.stats["batches"] += 1
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.error(f"Failed to write LastLogin batch of {len(batch)}: {e}")
+            # Keep the timestamps for the next attempt unless newer ones arrived
+            for user_id, when in batch.items():
+                self._pending.setdefault(user_id, when)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"LastLogin writer started (interval={self.flush_interval}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+        await self.flush()
+
+
+_writer: Optional[LastLoginWriter] = None
+
+
+def get_last_login_writer() -> LastLoginWriter:
+    """Get the shared LastLogin writer"""
+    global _writer
+    if _writer is None:
+        from mcp.db.session import SessionLocal
+        _writer = LastLoginWriter(
+            SessionLocal,
+            flush_interval=float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", "2.0")),
+            max_pending=int(os.getenv("LAST_LOGIN_MAX_PENDING", "500")),
+        )
+    return _writer
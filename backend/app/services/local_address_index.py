@@ -0,0 +1,359 @@
+"""
+Local Address Index
+
+This module provides an offline Australian address provider backed by a
+compact on-disk index built from a bulk G-NAF-style address extract.
+
+Index layout (one directory, all arrays little-endian uint32 unless noted):
+- tokens.bin / tokens.idx: sorted unique tokens and their byte offsets
+- postings.bin / postings.idx: sorted record ids per token and their offsets
+- records.bin / records.idx: encoded address records and their byte offsets
+- states.bin: one uint8 state code per record
+- meta.json: format version, counts and the state code table
+
+Everything is memory-mapped, so opening an index is O(1) and the OS page
+cache keeps hot tokens resident. Searches match every query token exactly
+except the last, which is matched as a prefix.
+"""
+
+import bisect
+import heapq
+import json
+import logging
+import mmap
+import os
+import re
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+FIELD_SEPARATOR = "\x1f"
+RECORD_FIELDS = (
+    "id", "address", "street_number", "street_name", "street_type",
+    "suburb", "state", "postcode", "latitude", "longitude",
+)
+
+_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split an address into upper-case alphanumeric tokens"""
+    return _TOKEN_RE.findall(text.upper())
+
+
+def format_address(record: Dict[str, Any]) -> str:
+    """Format a record the way Geoscape does, e.g. ``4 MILBURN CCT, BOOLAROO NSW 2284``"""
+    street = " ".join(
+        str(part) for part in (record.get("street_number"), record.get("street_name"), record.get("street_type")) if part
+    )
+    locality = " ".join(str(part) for part in (record.get("suburb"), record.get("state"), record.get("postcode")) if part)
+    return f"{street}, {locality}".upper()
+
+
+def _write_array(path: str, typecode: str, values) -> None:
+    data = array(typecode, values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    with open(path, "wb") as f:
+        data.tofile(f)
+
+
+def build_index(records: Iterable[Dict[str, Any]], output_dir: str) -> Dict[str, Any]:
+    """
+    Build an on-disk index from address records.
+
+    Args:
+        records: Dicts with the keys in RECORD_FIELDS (``address`` is derived if missing)
+        output_dir: Directory to write the index into
+
+    Returns:
+        Index metadata
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    rows = []
+    for record in records:
+        record = {field: record.get(field) for field in RECORD_FIELDS}
+        if not record["address"]:
+            record["address"] = format_address(record)
+        rows.append(record)
+
+    # Stable, human-friendly result order: state, suburb, street, number
+    def sort_key(row):
+        number = str(row["street_number"] or "")
+        return (
+            row["state"] or "", row["suburb"] or "", row["street_name"] or "", row["street_type"] or "",
+            int(number) if number.isdigit() else sys.maxsize, number,
+        )
+
+    rows.sort(key=sort_key)
+
+    state_codes: Dict[str, int] = {}
+    postings: Dict[str, List[int]] = {}
+    record_blob = bytearray()
+    record_offsets = [0]
+    states = bytearray()
+
+    for record_id, row in enumerate(rows):
+        encoded = FIELD_SEPARATOR.join("" if row[field] is None else str(row[field]) for field in RECORD_FIELDS)
+        record_blob += encoded.encode("utf-8")
+        record_offsets.append(len(record_blob))
+
+        state = (row["state"] or "").upper()
+        if state not in state_codes:
+            state_codes[state] = len(state_codes) + 1
+        states.append(state_codes[state])
+
+        for token in set(tokenize(row["address"])):
+            postings.setdefault(token, []).append(record_id)
+
+    tokens = sorted(postings)
+    token_blob = bytearray()
+    token_offsets = [0]
+    posting_values: List[int] = []
+    posting_offsets = [0]
+    for token in tokens:
+        token_blob += token.encode("utf-8")
+        token_offsets.append(len(token_blob))
+        posting_values.extend(postings[token])
+        posting_offsets.append(len(posting_values))
+
+    with open(os.path.join(output_dir, "tokens.bin"), "wb") as f:
+        f.write(token_blob)
+    with open(os.path.join(output_dir, "records.bin"), "wb") as f:
+        f.write(record_blob)
+    with open(os.path.join(output_dir, "states.bin"), "wb") as f:
+        f.write(states)
+    _write_array(os.path.join(output_dir, "tokens.idx"), "I", token_offsets)
+    _write_array(os.path.join(output_dir, "postings.bin"), "I", posting_values)
+    _write_array(os.path.join(output_dir, "postings.idx"), "I", posting_offsets)
+    _write_array(os.path.join(output_dir, "records.idx"), "I", record_offsets)
+
+    meta = {
+        "version": INDEX_FORMAT_VERSION,
+        "records": len(rows),
+        "tokens": len(tokens),
+        "states": {state: code for state, code in state_codes.items()},
+    }
+    with open(os.path.join(output_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+    logger.info(f"Built local address index in {output_dir}: {len(rows)} records, {len(tokens)} tokens")
+    return meta
+
+
+class LocalAddressIndex:
+    """
+    Read-only, memory-mapped address index.
+
+    Args:
+        path: Directory produced by build_index
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported local address index version: {self.meta.get('version')}")
+        if sys.byteorder != "little":
+            raise ValueError("Local address index requires a little-endian host")
+
+        self._maps = []
+        self._tokens = self._map_bytes("tokens.bin")
+        self._records = self._map_bytes("records.bin")
+        self._states = self._map_bytes("states.bin")
+        self._token_offsets = self._map_uint32("tokens.idx")
+        self._postings = self._map_uint32("postings.bin")
+        self._posting_offsets = self._map_uint32("postings.idx")
+        self._record_offsets = self._map_uint32("records.idx")
+        self.token_count = len(self._token_offsets) - 1
+        self.record_count = len(self._record_offsets) - 1
+        self._state_codes = {state.upper(): code for state, code in self.meta["states"].items()}
+
+    def _map_bytes(self, name: str) -> memoryview:
+        with open(os.path.join(self.path, name), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped)
+
+    def _map_uint32(self, name: str) -> memoryview:
+        view = self._map_bytes(name)
+        return view.cast("I") if len(view) else memoryview(array("I"))
+
+    def _token(self, index: int) -> bytes:
+        return bytes(self._tokens[self._token_offsets[index]:self._token_offsets[index + 1]])
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.token_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._token(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _postings_for(self, token_index: int) -> memoryview:
+        return self._postings[self._posting_offsets[token_index]:self._posting_offsets[token_index + 1]]
+
+    def _exact(self, token: str) -> Optional[memoryview]:
+        key = token.encode("utf-8")
+        index = self._lower_bound(key)
+        if index < self.token_count and self._token(index) == key:
+            return self._postings_for(index)
+        return None
+
+    def _prefix_range(self, prefix: str):
+        key = prefix.encode("utf-8")
+        # Tokens are ASCII, so every token with this prefix sorts below prefix + 0xFF
+        return self._lower_bound(key), self._lower_bound(key + b"\xff")
+
+    def record(self, record_id: int) -> Dict[str, Any]:
+        raw = bytes(self._records[self._record_offsets[record_id]:self._record_offsets[record_id + 1]])
+        values = raw.decode("utf-8").split(FIELD_SEPARATOR)
+        return dict(zip(RECORD_FIELDS, values))
+
+    def search(self, query: str, limit: int = 10, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find records matching every query token, the last one as a prefix.
+
+        Args:
+            query: Free-text address query
+            limit: Maximum number of records
+            state: Only return records in this state (optional)
+
+        Returns:
+            Matching records in index order
+        """
+        tokens = tokenize(query)
+        if not tokens or limit <= 0:
+            return []
+
+        state_code = None
+        if state:
+            state_code = self._state_codes.get(state.upper())
+            if state_code is None:
+                return []
+
+        exact_lists = []
+        for token in tokens[:-1]:
+            postings = self._exact(token)
+            if postings is None:
+                return []
+            exact_lists.append(postings)
+
+        prefix = tokens[-1]
+        start, end = self._prefix_range(prefix)
+        if start == end:
+            return []
+
+        def accept(record_id: int) -> bool:
+            return state_code is None or self._states[record_id] == state_code
+
+        prefix_lists = [self._postings_for(token_index) for token_index in range(start, end)]
+        results: List[int] = []
+        if exact_lists:
+            # Walk the shortest exact list and probe the others (and the prefix tokens) by binary search
+            exact_lists.sort(key=len)
+            for record_id in exact_lists[0]:
+                if not all(_contains(other, record_id) for other in exact_lists[1:]):
+                    continue
+                if not accept(record_id):
+                    continue
+                if any(_contains(postings, record_id) for postings in prefix_lists):
+                    results.append(record_id)
+                    if len(results) >= limit:
+                        break
+        else:
+            # Prefix only: k-way merge of the prefix tokens' postings, stopping at the limit
+            previous = None
+            for record_id in heapq.merge(*prefix_lists):
+                if record_id == previous:
+                    continue
+                previous = record_id
+                if accept(record_id):
+                    results.append(record_id)
+                    if len(results) >= limit:
+                        break
+
+        return [self.record(record_id) for record_id in results]
+
+    def close(self):
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # Views still referenced by a caller; the OS unmaps on exit
+                pass
+        self._maps = []
+
+
+def _contains(postings: memoryview, record_id: int) -> bool:
+    index = bisect.bisect_left(postings, record_id)
+    return index < len(postings) and postings[index] == record_id
+
+
+class LocalAddressProvider:
+    """
+    Address search provider backed by a LocalAddressIndex.
+
+    Returns suggestions in the same shape as GeoscapeService.search_addresses,
+    using the G-NAF address id so Geoscape can validate the selection.
+    """
+
+    def __init__(self, index: LocalAddressIndex):
+        self.index = index
+
+    async def search_addresses(
+        self,
+        query: str,
+        limit: int = 10,
+        state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        suggestions = []
+        for rank, record in enumerate(self.index.search(query, limit=limit, state=state)):
+            suggestions.append({
+                "address": record["address"],
+                "id": record["id"],
+                "data": {
+                    "streetNumber": record["street_number"],
+                    "streetName": record["street_name"],
+                    "streetType": record["street_type"],
+                    "suburb": record["suburb"],
+                    "state": record["state"],
+                    "postcode": record["postcode"],
+                    "latitude": float(record["latitude"]) if record["latitude"] else None,
+                    "longitude": float(record["longitude"]) if record["longitude"] else None,
+                    "propertyType": None,
+                    "landArea": None,
+                    "floorArea": None
+                },
+                "confidence": 1.0 - (rank * 0.01),
+                "source": "local"
+            })
+        return suggestions
+
+    async def test_connection(self) -> bool:
+        return self.index.record_count > 0
+
+
+_indexes: Dict[str, LocalAddressIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_local_address_index(path: str) -> LocalAddressIndex:
+    """Open an index once per process and reuse it"""
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = LocalAddressIndex(path)
+            logger.info(f"Opened local address index {path}: {index.record_count} records")
+        return index
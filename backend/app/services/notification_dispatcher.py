@@ -0,0 +1,359 @@
+"""
+Notification Dispatcher
+
+This module emails pending UserNotification rows according to each user's
+UserNotificationPreference.
+
+Features:
+- Pending notifications grouped per user and frequency:
+  - immediate: sent on the next pass (several pending become one email)
+  - daily / weekly: rendered as one digest once the digest time has passed
+- Notification types with EmailEnabled = false are never emailed
+- Emails sent concurrently through the shared SMTP send queue in email_utils
+- IsEmailSent marked with bulk UPDATEs, one commit per batch
+- Sends the mail server refuses (5xx) count towards EmailAttempts; at the
+  limit the notification is no longer emailed. Connection failures and 4xx
+  replies do not count, so an outage only delays delivery
+- Runs as a periodic background task
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Dict, List, Optional, Tuple
+
+import aiosmtplib
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..models import Profile, User, UserNotification, UserNotificationPreference
+from .email_utils import SMTPSendQueue
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+IMMEDIATE = "immediate"
+DAILY = "daily"
+WEEKLY = "weekly"
+DISPATCHED_BY = "notification_dispatcher"
+UPDATE_CHUNK = 1000
+DEFAULT_MAX_EMAIL_ATTEMPTS = 5
+
+
+@dataclass
+class PendingNotification:
+    notification_id: int
+    notification_type: Optional[str]
+    title: Optional[str]
+    message: Optional[str]
+    created: datetime
+    attempts: int = 0
+
+
+@dataclass
+class EmailBatch:
+    """Notifications for one user and frequency, sent as one email"""
+    user_id: int
+    email: str
+    first_name: Optional[str]
+    frequency: str
+    notifications: List[PendingNotification] = field(default_factory=list)
+
+    @property
+    def notification_ids(self) -> List[int]:
+        return [n.notification_id for n in self.notifications]
+
+
+def digest_cutoffs(now: datetime, digest_hour: int = 8, digest_weekday: int = 0) -> Dict[str, datetime]:
+    """
+    Latest daily and weekly digest times at or before ``now``.
+
+    A digest notification is due once it was created before its cutoff, so
+    no per-user "last sent" state is needed.
+    """
+    daily = now.replace(hour=digest_hour, minute=0, second=0, microsecond=0)
+    if daily > now:
+        daily -= timedelta(days=1)
+    weekly = daily - timedelta(days=(daily.weekday() - digest_weekday) % 7)
+    return {DAILY: daily, WEEKLY: weekly}
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """True when the mail server refused the message with a 5xx reply, so resending will not help"""
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return all(refused.code >= 500 for refused in error.recipients)
+    return isinstance(error, aiosmtplib.SMTPResponseException) and error.code >= 500
+
+
+def render_email(batch: EmailBatch, from_email: Optional[str] = None) -> EmailMessage:
+    """Single notification email or a digest of several"""
+    msg = EmailMessage()
+    if from_email:
+        msg["From"] = from_email
+    msg["To"] = batch.email
+    greeting = f"Hi {batch.first_name}," if batch.first_name else "Hi,"
+
+    if len(batch.notifications) == 1 and batch.frequency == IMMEDIATE:
+        notification = batch.notifications[0]
+        msg["Subject"] = notification.title or "New notification from JobTrackerDB"
+        body = [greeting, "", notification.message or notification.title or ""]
+    else:
+        count = len(batch.notifications)
+        label = {DAILY: "daily", WEEKLY: "weekly"}.get(batch.frequency)
+        msg["Subject"] = (f"Your {label} JobTrackerDB digest: {count} notifications" if label
+                          else f"You have {count} new notifications on JobTrackerDB")
+        body = [greeting, ""]
+        for notification in batch.notifications:
+            line = f"- {notification.title}" if notification.title else "-"
+            if notification.message:
+                line += f": {notification.message}" if notification.title else f" {notification.message}"
+            body.append(line)
+    body += ["", "JobTrackerDB"]
+    msg.set_content("\n".join(body))
+    return msg
+
+
+class NotificationDispatcher:
+    """
+    Periodic email delivery of pending notifications.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        mailer: SMTP send queue used for delivery
+        interval: Seconds between passes
+        batch_size: Notifications loaded per batch
+        digest_hour: UTC hour daily and weekly digests go out
+        digest_weekday: Weekday of the weekly digest (0 = Monday)
+        max_email_attempts: Refused sends after which a notification is no longer emailed
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        mailer: SMTPSendQueue,
+        interval: float = 60.0,
+        batch_size: int = 500,
+        digest_hour: int = 8,
+        digest_weekday: int = 0,
+        max_email_attempts: int = DEFAULT_MAX_EMAIL_ATTEMPTS
+    ):
+        self.session_factory = session_factory
+        self.mailer = mailer
+        self.interval = interval
+        self.batch_size = batch_size
+        self.digest_hour = digest_hour
+        self.digest_weekday = digest_weekday
+        self.max_email_attempts = max_email_attempts
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"passes": 0, "emails_sent": 0, "notifications_sent": 0, "send_failures": 0,
+                      "refused": 0, "abandoned": 0, "failures": 0}
+
+    def load_batches(
+        self,
+        db: Session,
+        now: datetime,
+        after: Optional[Tuple[int, int]] = None
+    ) -> Tuple[List[EmailBatch], Optional[Tuple[int, int]]]:
+        """
+        Load the next batch of due notifications, grouped per user and frequency.
+
+        Args:
+            db: Database session
+            now: Current time (UTC)
+            after: Keyset position (UserID, UserNotificationID) from the previous batch
+
+        Returns:
+            Email batches and the keyset position for the next call (None when done)
+        """
+        n = UserNotification
+        pref = UserNotificationPreference
+        frequency = case(
+            (func.lower(pref.Frequency).in_((DAILY, WEEKLY)), func.lower(pref.Frequency)),
+            else_=IMMEDIATE
+        )
+        cutoffs = digest_cutoffs(now, self.digest_hour, self.digest_weekday)
+        query = (
+            select(n.UserNotificationID, n.UserID, n.NotificationType, n.Title, n.Message, n.createdDate,
+                   n.EmailAttempts, frequency.label("frequency"), User.EmailAddress, Profile.FirstName)
+            .join(User, User.UserID == n.UserID)
+            .outerjoin(Profile, Profile.ProfileID == User.ProfileID)
+            .outerjoin(pref, and_(pref.UserID == n.UserID, pref.NotificationType == n.NotificationType))
+            .where(
+                n.IsEmailSent.is_not(True),
+                func.coalesce(n.EmailAttempts, 0) < self.max_email_attempts,
+                pref.EmailEnabled.is_not(False),
+                or_(
+                    frequency == IMMEDIATE,
+                    and_(frequency == DAILY, n.createdDate < cutoffs[DAILY]),
+                    and_(frequency == WEEKLY, n.createdDate < cutoffs[WEEKLY]),
+                ),
+            )
+            .order_by(n.UserID, n.UserNotificationID)
+            .limit(self.batch_size)
+        )
+        if after is not None:
+            query = query.where(or_(n.UserID > after[0], and_(n.UserID == after[0], n.UserNotificationID > after[1])))
+        rows = db.execute(query).all()
+        if not rows:
+            return [], None
+
+        next_after = None
+        if len(rows) == self.batch_size:
+            last_user = rows[-1].UserID
+            if rows[0].UserID != last_user:
+                # Hold back the last user so their digest is not split across batches
+                rows = [row for row in rows if row.UserID != last_user]
+            next_after = (rows[-1].UserID, rows[-1].UserNotificationID)
+
+        batches: "OrderedDict[Tuple[int, str], EmailBatch]" = OrderedDict()
+        seen = set()
+        for row in rows:
+            if row.UserNotificationID in seen:
+                continue  # Duplicate preference rows for the type
+            seen.add(row.UserNotificationID)
+            batch = batches.get((row.UserID, row.frequency))
+            if batch is None:
+                batch = batches[(row.UserID, row.frequency)] = EmailBatch(
+                    row.UserID, row.EmailAddress, row.FirstName, row.frequency)
+            batch.notifications.append(PendingNotification(
+                row.UserNotificationID, row.NotificationType, row.Title, row.Message, row.createdDate,
+                row.EmailAttempts or 0))
+        return list(batches.values()), next_after
+
+    @staticmethod
+    def mark_sent(db: Session, notification_ids: List[int], now: datetime) -> int:
+        """Set IsEmailSent for delivered notifications in bulk and commit"""
+        marked = 0
+        for start in range(0, len(notification_ids), UPDATE_CHUNK):
+            marked += db.execute(
+                update(UserNotification)
+                .where(UserNotification.UserNotificationID.in_(notification_ids[start:start + UPDATE_CHUNK]))
+                .values(IsEmailSent=True, lastUpdated=now, updatedBy=DISPATCHED_BY)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+        db.commit()
+        return marked
+
+    @staticmethod
+    def record_refusals(db: Session, notification_ids: List[int], now: datetime) -> int:
+        """Count a refused send against each notification's EmailAttempts in bulk and commit"""
+        counted = 0
+        for start in range(0, len(notification_ids), UPDATE_CHUNK):
+            counted += db.execute(
+                update(UserNotification)
+                .where(UserNotification.UserNotificationID.in_(notification_ids[start:start + UPDATE_CHUNK]))
+                .values(EmailAttempts=func.coalesce(UserNotification.EmailAttempts, 0) + 1,
+                        lastUpdated=now, updatedBy=DISPATCHED_BY)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+        db.commit()
+        return counted
+
+    async def _send(self, batch: EmailBatch) -> Optional[Exception]:
+        """Send one batch; returns the error when delivery failed"""
+        try:
+            await self.mailer.send(render_email(batch, self.mailer.pool.settings.from_email))
+            return None
+        except Exception as e:
+            self.stats["send_failures"] += 1
+            logger.warning(f"Notification email to user {batch.user_id} failed: {e}")
+            return e
+
+    async def dispatch(self, now: Optional[datetime] = None) -> int:
+        """
+        Send every due notification.
+
+        Failed sends stay pending for the next pass; a notification whose
+        sends were refused ``max_email_attempts`` times is no longer emailed.
+
+        Returns:
+            Number of notifications marked as emailed
+        """
+        now = now or datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        db = self.session_factory()
+        sent_total = 0
+        after = None
+        try:
+            while True:
+                batches, after = await loop.run_in_executor(None, self.load_batches, db, now, after)
+                if batches:
+                    errors = await asyncio.gather(*(self._send(batch) for batch in batches))
+                    delivered = [batch for batch, error in zip(batches, errors) if error is None]
+                    ids = [notification_id for batch in delivered for notification_id in batch.notification_ids]
+                    if ids:
+                        sent_total += await loop.run_in_executor(None, self.mark_sent, db, ids, now)
+                    self.stats["emails_sent"] += len(delivered)
+
+                    refused = [batch for batch, error in zip(batches, errors)
+                               if error is not None and is_permanent_failure(error)]
+                    if refused:
+                        refused_ids = [n.notification_id for batch in refused for n in batch.notifications]
+                        await loop.run_in_executor(None, self.record_refusals, db, refused_ids, now)
+                        self.stats["refused"] += len(refused)
+                        for batch in refused:
+                            abandoned = [n.notification_id for n in batch.notifications
+                                         if n.attempts + 1 >= self.max_email_attempts]
+                            if abandoned:
+                                self.stats["abandoned"] += len(abandoned)
+                                logger.warning(
+                                    f"Giving up emailing notifications {abandoned} to user {batch.user_id} "
+                                    f"after {self.max_email_attempts} refused sends"
+                                )
+                if after is None:
+                    break
+        finally:
+            db.close()
+        self.stats["passes"] += 1
+        self.stats["notifications_sent"] += sent_total
+        if sent_total:
+            logger.info(f"Emailed {sent_total} notifications")
+        return sent_total
+
+    async def _run(self):
+        while True:
+            try:
+                await self.dispatch()
+            except Exception as e:
+                self.stats["failures"] += 1
+                logger.error(f"Notification dispatch failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Notification dispatcher started (interval={self.interval}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Get the shared notification dispatcher"""
+    global _dispatcher
+    if _dispatcher is None:
+        from mcp.db.session import SessionLocal
+        from app.core.api_config import APIConfig
+        from app.services.email_utils import get_mail_queue
+        _dispatcher = NotificationDispatcher(
+            SessionLocal,
+            get_mail_queue(),
+            interval=APIConfig.NOTIFICATION_DISPATCH_INTERVAL,
+            batch_size=APIConfig.NOTIFICATION_BATCH_SIZE,
+            digest_hour=APIConfig.NOTIFICATION_DIGEST_HOUR,
+            digest_weekday=APIConfig.NOTIFICATION_DIGEST_WEEKDAY,
+            max_email_attempts=APIConfig.NOTIFICATION_MAX_EMAIL_ATTEMPTS,
+        )
+    return _dispatcher
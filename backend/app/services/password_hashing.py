@@ -0,0 +1,309 @@
+"""
+Password Hashing Service
+
+This module provides pluggable password hashers with a calibrated work factor.
+
+Features:
+- scrypt and PBKDF2-SHA256 hashers from the standard library
+- Work factor calibrated at startup (warmed in app.main) to a per-login CPU budget
+- Constant-time hash comparison
+- Verification off the event loop in a bounded thread pool
+- Transparent upgrade of legacy ``salt$sha256`` hashes on successful login
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class PasswordHasher(ABC):
+    """Base class for password hashers.
+
+    Encoded hashes are prefixed with the hasher's ``scheme`` so the right
+    hasher can be picked when verifying a stored value.
+    """
+
+    scheme: str = ""
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        """Hash ``password`` into an encoded value prefixed with ``scheme``."""
+
+    @abstractmethod
+    def verify(self, password: str, encoded: str) -> bool:
+        """Whether ``password`` matches the encoded hash."""
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """Whether ``encoded`` was produced with weaker settings than this hasher."""
+        return False
+
+    def describe(self) -> Dict[str, object]:
+        return {"scheme": self.scheme}
+
+
+class ScryptHasher(PasswordHasher):
+    """scrypt hasher, encoded as ``scrypt$n$r$p$salt$hash``."""
+
+    scheme = "scrypt"
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1, dklen: int = 32):
+        self.n = n
+        self.r = r
+        self.p = p
+        self.dklen = dklen
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int, dklen: int) -> bytes:
+        # OpenSSL rejects scrypt calls that need more than maxmem bytes
+        maxmem = 2 * 128 * n * r * p + 1024 * 1024
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=dklen, maxmem=maxmem)
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(16)
+        derived = self._derive(password, salt, self.n, self.r, self.p, self.dklen)
+        return f"{self.scheme}${self.n}${self.r}${self.p}${_b64encode(salt)}${_b64encode(derived)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, n, r, p, salt, expected = encoded.split("$")
+            expected_bytes = _b64decode(expected)
+            derived = self._derive(password, _b64decode(salt), int(n), int(r), int(p), len(expected_bytes))
+        except (ValueError, TypeError):
+            return False
+        return hmac.compare_digest(derived, expected_bytes)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        try:
+            _, n, r, p, _, _ = encoded.split("$")
+        except ValueError:
+            return True
+        return (int(n), int(r), int(p)) < (self.n, self.r, self.p)
+
+    def describe(self) -> Dict[str, object]:
+        return {"scheme": self.scheme, "n": self.n, "r": self.r, "p": self.p}
+
+
+class PBKDF2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256 hasher, encoded as ``pbkdf2_sha256$iterations$salt$hash``."""
+
+    scheme = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000, dklen: int = 32):
+        self.iterations = iterations
+        self.dklen = dklen
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(16)
+        derived = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations, self.dklen)
+        return f"{self.scheme}${self.iterations}${_b64encode(salt)}${_b64encode(derived)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, iterations, salt, expected = encoded.split("$")
+            expected_bytes = _b64decode(expected)
+            derived = hashlib.pbkdf2_hmac(
+                "sha256", password.encode(), _b64decode(salt), int(iterations), len(expected_bytes)
+            )
+        except (ValueError, TypeError):
+            return False
+        return hmac.compare_digest(derived, expected_bytes)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        try:
+            return int(encoded.split("$")[1]) < self.iterations
+        except (IndexError, ValueError):
+            return True
+
+    def describe(self) -> Dict[str, object]:
+        return {"scheme": self.scheme, "iterations": self.iterations}
+
+
+class LegacySHA256Hasher(PasswordHasher):
+    """Verifier for the original ``salt$sha256(password + salt)`` format.
+
+    Only used to verify existing hashes; they are always upgraded.
+    """
+
+    scheme = "legacy_sha256"
+
+    def hash(self, password: str) -> str:
+        raise NotImplementedError("Legacy SHA-256 hashes must not be created")
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            salt, expected = encoded.split("$", 1)
+        except ValueError:
+            return False
+        provided = hashlib.sha256((password + salt).encode()).hexdigest()
+        return hmac.compare_digest(provided, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return True
+
+
+# Lowest work factors accepted regardless of the CPU budget
+MIN_SCRYPT_N = 2 ** 14
+MAX_SCRYPT_N = 2 ** 20
+MIN_PBKDF2_ITERATIONS = 100_000
+
+
+def calibrate_hasher(scheme: str = "scrypt", target_ms: float = 50.0) -> PasswordHasher:
+    """Build a hasher whose work factor costs roughly ``target_ms`` per hash.
+
+    A single cheap hash is timed and the work factor scaled to the budget.
+    The result never drops below the minimum work factor for the scheme.
+    """
+    if scheme == ScryptHasher.scheme:
+        probe = ScryptHasher(n=2 ** 12)
+        started = time.perf_counter()
+        probe.hash("calibration")
+        probe_ms = max((time.perf_counter() - started) * 1000, 0.01)
+
+        # scrypt cost grows linearly with n; keep n a power of two
+        n = probe.n
+        while n < MAX_SCRYPT_N and probe_ms * (n * 2 / probe.n) <= target_ms:
+            n *= 2
+        if n < MIN_SCRYPT_N:
+            logger.warning(f"Password hash budget of {target_ms}ms is below the scrypt minimum; using n={MIN_SCRYPT_N}")
+            n = MIN_SCRYPT_N
+        return ScryptHasher(n=n)
+
+    if scheme == PBKDF2Hasher.scheme:
+        probe_iterations = 10_000
+        started = time.perf_counter()
+        hashlib.pbkdf2_hmac("sha256", b"calibration", b"calibration-salt", probe_iterations)
+        probe_ms = max((time.perf_counter() - started) * 1000, 0.01)
+
+        iterations = int(probe_iterations * target_ms / probe_ms) // 1000 * 1000
+        if iterations < MIN_PBKDF2_ITERATIONS:
+            logger.warning(f"Password hash budget of {target_ms}ms is below the PBKDF2 minimum; using {MIN_PBKDF2_ITERATIONS} iterations")
+            iterations = MIN_PBKDF2_ITERATIONS
+        return PBKDF2Hasher(iterations=iterations)
+
+    raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+
+class PasswordHashingService:
+    """Hash and verify passwords with the current hasher.
+
+    New hashes always use ``hasher``. Stored hashes from other schemes (or
+    with an older work factor) still verify, and a replacement hash is
+    returned so the caller can upgrade the stored value.
+    """
+
+    def __init__(
+        self,
+        hasher: PasswordHasher,
+        legacy_hashers: Optional[List[PasswordHasher]] = None,
+        max_workers: int = 4
+    ):
+        self.hasher = hasher
+        self.hashers: Dict[str, PasswordHasher] = {hasher.scheme: hasher}
+        for legacy in legacy_hashers or [ScryptHasher(), PBKDF2Hasher()]:
+            self.hashers.setdefault(legacy.scheme, legacy)
+        self.legacy_hasher = LegacySHA256Hasher()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        # Verified against when the account does not exist, so a miss costs the same as a hit
+        self._dummy_hash = hasher.hash(secrets.token_urlsafe(16))
+
+    def identify(self, encoded: Optional[str]) -> Optional[PasswordHasher]:
+        """Find the hasher that produced ``encoded``."""
+        if not encoded or "$" not in encoded:
+            return None
+        scheme = encoded.split("$", 1)[0]
+        if scheme in self.hashers:
+            return self.hashers[scheme]
+        if encoded.count("$") == 1:
+            return self.legacy_hasher
+        return None
+
+    def hash(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def verify(self, password: str, encoded: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Verify ``password`` against a stored hash.
+
+        Returns ``(valid, upgraded_hash)``. ``upgraded_hash`` is a fresh hash
+        from the current hasher when the stored one should be replaced.
+        """
+        hasher = self.identify(encoded)
+        if hasher is None:
+            return False, None
+        if not hasher.verify(password, encoded):
+            return False, None
+
+        if hasher is not self.hasher or self.hasher.needs_rehash(encoded):
+            return True, self.hasher.hash(password)
+        return True, None
+
+    def burn(self, password: str):
+        """Spend the same CPU as a real verification and discard the result."""
+        self.hasher.verify(password, self._dummy_hash)
+
+    async def hash_async(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.hash, password)
+
+    async def verify_async(self, password: str, encoded: Optional[str]) -> Tuple[bool, Optional[str]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.verify, password, encoded)
+
+    async def burn_async(self, password: str):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.burn, password)
+
+
+_service: Optional[PasswordHashingService] = None
+_service_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHashingService:
+    """Get the shared password hashing service, calibrating it on first use.
+
+    Configuration (environment):
+    - PASSWORD_HASH_SCHEME: ``scrypt`` (default) or ``pbkdf2_sha256``
+    - PASSWORD_HASH_COST: fixed scrypt n / PBKDF2 iterations (skips calibration)
+    - PASSWORD_HASH_TARGET_MS: per-hash CPU budget used for calibration
+    - PASSWORD_HASH_WORKERS: size of the hashing thread pool
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                scheme = os.getenv("PASSWORD_HASH_SCHEME", ScryptHasher.scheme)
+                cost = os.getenv("PASSWORD_HASH_COST")
+                if cost and scheme == ScryptHasher.scheme:
+                    hasher = ScryptHasher(n=int(cost))
+                elif cost and scheme == PBKDF2Hasher.scheme:
+                    hasher = PBKDF2Hasher(iterations=int(cost))
+                else:
+                    hasher = calibrate_hasher(scheme, float(os.getenv("PASSWORD_HASH_TARGET_MS", "50")))
+
+                workers = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+                _service = PasswordHashingService(hasher, max_workers=workers)
+                logger.info(f"Password hashing configured: {hasher.describe()} workers={workers}")
+    return _service
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the current hasher"""
+    return get_password_hasher().hash(password)
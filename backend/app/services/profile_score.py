@@ -0,0 +1,189 @@
+"""
+Profile Score Service
+
+This module scores how complete a profile is for the profile score
+endpoint and the dashboard.
+
+Features:
+- Points per section (basic info, work experience, education, skills,
+  certifications) with a level, badge and recommendations
+- Next milestone toward a complete profile
+"""
+
+import logging
+from typing import Any, Dict
+
+from sqlalchemy.orm import Session
+
+from ..models import Profile, ProfileCertification, ProfileEducation, ProfileWorkExperience, Skills
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def calculate_profile_score(db: Session, profile: Profile) -> Dict[str, Any]:
+    """
+    Calculate profile completion score and gamification points.
+
+    Args:
+        db: Database session
+        profile: Profile to score
+
+    Returns:
+        overall_score, section_scores, recommendations and next_milestone
+    """
+    # Calculate scores for each section
+    scores = {}
+    total_points = 0
+    max_points = 0
+
+    # Basic Info (25 points)
+    basic_info_score = 0
+    basic_info_max = 25
+    if profile.FirstName and profile.LastName:
+        basic_info_score += 10
+    if profile.EmailAddress:
+        basic_info_score += 5
+    if profile.PhoneNumber:
+        basic_info_score += 5
+    if profile.DateOfBirth:
+        basic_info_score += 5
+    scores["basic_info"] = {
+        "score": basic_info_score,
+        "max": basic_info_max,
+        "percentage": (basic_info_score / basic_info_max) * 100
+    }
+    total_points += basic_info_score
+    max_points += basic_info_max
+
+    # Work Experience (30 points)
+    work_exp_count = db.query(ProfileWorkExperience).filter(
+        ProfileWorkExperience.ProfileID == profile.ProfileID
+    ).count()
+    work_exp_score = min(work_exp_count * 10, 30)  # 10 points per experience, max 30
+    work_exp_max = 30
+    scores["work_experience"] = {
+        "score": work_exp_score,
+        "max": work_exp_max,
+        "percentage": (work_exp_score / work_exp_max) * 100,
+        "count": work_exp_count
+    }
+    total_points += work_exp_score
+    max_points += work_exp_max
+
+    # Education (20 points)
+    education_count = db.query(ProfileEducation).filter(
+        ProfileEducation.ProfileID == profile.ProfileID
+    ).count()
+    education_score = min(education_count * 10, 20)  # 10 points per education, max 20
+    education_max = 20
+    scores["education"] = {
+        "score": education_score,
+        "max": education_max,
+        "percentage": (education_score / education_max) * 100,
+        "count": education_count
+    }
+    total_points += education_score
+    max_points += education_max
+
+    # Skills (15 points)
+    skills_count = db.query(Skills).filter(
+        Skills.ProfileID == profile.ProfileID
+    ).count()
+    skills_score = min(skills_count * 2, 15)  # 2 points per skill, max 15
+    skills_max = 15
+    scores["skills"] = {
+        "score": skills_score,
+        "max": skills_max,
+        "percentage": (skills_score / skills_max) * 100,
+        "count": skills_count
+    }
+    total_points += skills_score
+    max_points += skills_max
+
+    # Certifications (10 points)
+    cert_count = db.query(ProfileCertification).filter(
+        ProfileCertification.ProfileID == profile.ProfileID
+    ).count()
+    cert_score = min(cert_count * 5, 10)  # 5 points per certification, max 10
+    cert_max = 10
+    scores["certifications"] = {
+        "score": cert_score,
+        "max": cert_max,
+        "percentage": (cert_score / cert_max) * 100,
+        "count": cert_count
+    }
+    total_points += cert_score
+    max_points += cert_max
+
+    # Calculate overall score
+    overall_percentage = (total_points / max_points) * 100 if max_points > 0 else 0
+
+    # Determine profile level
+    if overall_percentage >= 90:
+        level = "Expert"
+        badge = "🏆"
+    elif overall_percentage >= 75:
+        level = "Advanced"
+        badge = "🥇"
+    elif overall_percentage >= 50:
+        level = "Intermediate"
+        badge = "🥈"
+    elif overall_percentage >= 25:
+        level = "Beginner"
+        badge = "🥉"
+    else:
+        level = "New"
+        badge = "🌟"
+
+    # Generate recommendations
+    recommendations = []
+    if basic_info_score < basic_info_max:
+        recommendations.append("Complete your basic information")
+    if work_exp_score < work_exp_max:
+        recommendations.append("Add more work experience")
+    if education_score < education_max:
+        recommendations.append("Add your education details")
+    if skills_score < skills_max:
+        recommendations.append("Add more skills to your profile")
+    if cert_score < cert_max:
+        recommendations.append("Add certifications to boost your profile")
+
+    return {
+        "overall_score": {
+            "points": total_points,
+            "max_points": max_points,
+            "percentage": overall_percentage,
+            "level": level,
+            "badge": badge
+        },
+        "section_scores": scores,
+        "recommendations": recommendations,
+        "next_milestone": get_next_milestone(overall_percentage)
+    }
+
+
+def get_next_milestone(current_percentage: float) -> dict:
+    """Get the next milestone to achieve"""
+    milestones = [
+        {"percentage": 25, "title": "Beginner", "description": "Complete basic profile"},
+        {"percentage": 50, "title": "Intermediate", "description": "Add work experience"},
+        {"percentage": 75, "title": "Advanced", "description": "Add skills and certifications"},
+        {"percentage": 90, "title": "Expert", "description": "Complete all sections"}
+    ]
+
+    for milestone in milestones:
+        if current_percentage < milestone["percentage"]:
+            return {
+                "target_percentage": milestone["percentage"],
+                "points_needed": milestone["percentage"] - current_percentage,
+                "title": milestone["title"],
+                "description": milestone["description"]
+            }
+
+    return {
+        "target_percentage": 100,
+        "points_needed": 0,
+        "title": "Perfect",
+        "description": "Your profile is complete!"
+    }
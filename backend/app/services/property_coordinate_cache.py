@@ -0,0 +1,191 @@
+"""
+Property Coordinate Cache
+
+This module caches resolved coordinates and standardized addresses per
+provider property ID, so repeat lookups of the same property (shared
+offices, apartment buildings) skip the upstream provider.
+
+Features:
+- In-process LRU in front of the PropertyCoordinateCache table
+- TTL refresh policy; stale entries are still served if the refresh fails
+- Low-confidence fallbacks (e.g. state centroids) are never cached
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.api_config import APIConfig
+from ..models import PropertyCoordinateCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Results below this confidence are approximate and must be re-resolved next time
+MIN_CACHEABLE_CONFIDENCE = 0.6
+
+
+class PropertyCoordinateStore:
+    """
+    Two-level PropertyID -> coordinates cache.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        ttl_days: Days before an entry is refreshed from the provider
+        memory_size: Maximum entries kept in process
+    """
+
+    def __init__(self, session_factory, ttl_days: int = 30, memory_size: int = 10000):
+        self.session_factory = session_factory
+        self.ttl = timedelta(days=ttl_days)
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[Dict[str, Any], datetime]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "database_hits": 0, "misses": 0, "stale": 0, "stored": 0}
+
+    def _remember(self, property_id: str, result: Dict[str, Any], expires: datetime):
+        with self._lock:
+            self._memory[property_id] = (result, expires)
+            self._memory.move_to_end(property_id)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _load(self, property_id: str) -> Optional[Tuple[Dict[str, Any], datetime]]:
+        db = self.session_factory()
+        try:
+            row = db.get(PropertyCoordinateCache, property_id)
+            if row is None:
+                return None
+            row.HitCount = (row.HitCount or 0) + 1
+            db.commit()
+            result = {
+                "success": True,
+                "latitude": float(row.Latitude),
+                "longitude": float(row.Longitude),
+                "address": json.loads(row.StandardizedAddress) if row.StandardizedAddress else {},
+                "property_id": row.PropertyID,
+                "confidence_score": float(row.ConfidenceScore) if row.ConfidenceScore is not None else None,
+            }
+            return result, row.ExpiresDate
+        finally:
+            db.close()
+
+    def _save(self, property_id: str, result: Dict[str, Any], fetched: datetime, expires: datetime):
+        db = self.session_factory()
+        try:
+            row = db.get(PropertyCoordinateCache, property_id)
+            if row is None:
+                row = PropertyCoordinateCache(PropertyID=property_id, HitCount=0, createdDate=fetched)
+                db.add(row)
+            row.Latitude = result["latitude"]
+            row.Longitude = result["longitude"]
+            row.StandardizedAddress = json.dumps(result.get("address") or {})
+            row.ConfidenceScore = result.get("confidence_score")
+            row.Source = result.get("source", "geoscape")
+            row.FetchedDate = fetched
+            row.ExpiresDate = expires
+            row.lastUpdated = fetched
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def get(self, property_id: str) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Look up a property.
+
+        Args:
+            property_id: Provider property identifier
+
+        Returns:
+            ``(result, is_fresh)`` or None when the property has never been resolved
+        """
+        now = datetime.utcnow()
+        with self._lock:
+            entry = self._memory.get(property_id)
+            if entry is not None:
+                self._memory.move_to_end(property_id)
+        if entry is not None:
+            self.stats["memory_hits"] += 1
+        else:
+            try:
+                entry = await asyncio.get_running_loop().run_in_executor(None, self._load, property_id)
+            except Exception as e:
+                logger.error(f"Failed to read coordinate cache for {property_id}: {str(e)}")
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["database_hits"] += 1
+            self._remember(property_id, *entry)
+
+        result, expires = entry
+        fresh = expires > now
+        if not fresh:
+            self.stats["stale"] += 1
+        return {**result, "cached": True}, fresh
+
+    async def put(self, result: Dict[str, Any], property_id: Optional[str] = None) -> bool:
+        """
+        Store a successful coordinate lookup.
+
+        The entry is stored under the requested ID and under the result's
+        property_id when the provider resolved the request to a different one,
+        so the next lookup of either ID is a hit.
+
+        Args:
+            result: Result from a provider's get_address_coordinates
+            property_id: ID the lookup was made for (optional)
+
+        Returns:
+            True if the result was cached
+        """
+        keys = list(dict.fromkeys(key for key in (property_id, result.get("property_id")) if key))
+        if (
+            not keys
+            or not result.get("success")
+            or result.get("latitude") is None
+            or result.get("longitude") is None
+            or (result.get("confidence_score") or 0.0) < MIN_CACHEABLE_CONFIDENCE
+        ):
+            return False
+
+        fetched = datetime.utcnow()
+        expires = fetched + self.ttl
+        entry = {key: value for key, value in result.items() if key != "cached"}
+        loop = asyncio.get_running_loop()
+        for key in keys:
+            self._remember(key, entry, expires)
+            try:
+                await loop.run_in_executor(None, self._save, key, entry, fetched, expires)
+            except Exception as e:
+                logger.error(f"Failed to write coordinate cache for {key}: {str(e)}")
+        self.stats["stored"] += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._memory)
+        return {"memory_entries": size, "ttl_days": self.ttl.days, **self.stats}
+
+
+_store: Optional[PropertyCoordinateStore] = None
+
+
+def get_property_coordinate_store() -> PropertyCoordinateStore:
+    """Get the shared property coordinate cache"""
+    global _store
+    if _store is None:
+        from mcp.db.session import SessionLocal
+        _store = PropertyCoordinateStore(
+            SessionLocal,
+            ttl_days=APIConfig.PROPERTY_CACHE_TTL_DAYS,
+            memory_size=APIConfig.PROPERTY_CACHE_MEMORY_SIZE,
+        )
+    return _store
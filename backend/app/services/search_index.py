@@ -0,0 +1,628 @@
+"""
+Search Index Service
+
+This module provides ranked full-text search over a user's tracked jobs
+(JobBoardJob), job applications and application notes.
+
+Features:
+- Pluggable backends behind one interface:
+  - SQL Server full-text (CONTAINSTABLE) when the full-text indexes exist
+  - Embedded SQLite FTS5 index in a sidecar file (BM25 ranking, snippets)
+    for local and test setups
+- Embedded index kept current incrementally: new rows by ID high-water mark,
+  edited rows by lastUpdated, woken on commits that touch indexed models
+- Results scoped per user (tracked jobs via UserJobBoardJobInteraction,
+  applications and notes via ProfileID) and paginated
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session
+
+from ..models import JobApplication, JobApplicationNote, JobBoardJob, User, UserJobBoardJobInteraction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DOC_JOB = "job"
+DOC_APPLICATION = "application"
+DOC_NOTE = "note"
+DOC_TYPES = (DOC_JOB, DOC_APPLICATION, DOC_NOTE)
+
+MAX_QUERY_TERMS = 8
+# Deepest result offset served; ranked search beyond this is not useful
+MAX_RESULT_WINDOW = 1000
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def query_terms(query: str) -> List[str]:
+    """Search terms from user input (backend query syntax is never passed through)"""
+    return [term.lower() for term in _TERM_RE.findall(query or "")][:MAX_QUERY_TERMS]
+
+
+def make_snippet(text_value: Optional[str], terms: Sequence[str], width: int = 160) -> Optional[str]:
+    """Excerpt of ``text_value`` around the first matching term"""
+    if not text_value:
+        return None
+    flat = " ".join(text_value.split())
+    lowered = flat.lower()
+    positions = [lowered.find(term) for term in terms if lowered.find(term) >= 0]
+    start = max(0, min(positions) - width // 3) if positions else 0
+    excerpt = flat[start:start + width]
+    return ("…" if start else "") + excerpt + ("…" if start + width < len(flat) else "")
+
+
+@dataclass
+class SearchHit:
+    doc_type: str
+    doc_id: int
+    title: Optional[str]
+    subtitle: Optional[str]
+    snippet: Optional[str]
+    score: float
+    job_application_id: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.doc_type,
+            "id": self.doc_id,
+            "title": self.title,
+            "subtitle": self.subtitle,
+            "snippet": self.snippet,
+            "score": round(self.score, 4),
+            "job_application_id": self.job_application_id,
+        }
+
+
+@dataclass
+class SearchPage:
+    total: int
+    hits: List[SearchHit] = field(default_factory=list)
+
+
+class SearchBackend:
+    """Interface shared by the search backends"""
+    name = "base"
+
+    def sync(self, session_factory) -> int:
+        """Bring the index up to date; returns documents (re)indexed"""
+        return 0
+
+    def reindex(self, session_factory, doc_type: str, doc_ids: Sequence[int]) -> int:
+        """Re-read specific documents (removing any that no longer exist)"""
+        return 0
+
+    def remove(self, doc_type: str, doc_ids: Sequence[int]):
+        """Drop documents whose rows no longer exist"""
+
+    def search(
+        self,
+        db: Session,
+        terms: Sequence[str],
+        user_id: int,
+        profile_id: Optional[int],
+        doc_types: Sequence[str],
+        limit: int,
+        offset: int
+    ) -> SearchPage:
+        raise NotImplementedError
+
+
+def tracked_job_ids(db: Session, user_id: int) -> List[int]:
+    """Jobs a user has viewed, logged, applied to or bookmarked"""
+    return list(db.execute(
+        select(UserJobBoardJobInteraction.JobBoardJobID)
+        .where(UserJobBoardJobInteraction.UserID == user_id)
+        .distinct()
+    ).scalars())
+
+
+class EmbeddedSearchBackend(SearchBackend):
+    """
+    SQLite FTS5 inverted index in a sidecar file.
+
+    Documents carry their owner (ProfileID) so application and note results
+    are scoped inside the index; job documents are shared and filtered by
+    the user's tracked job ids.
+
+    Args:
+        path: Index file (``:memory:`` for tests)
+        batch_size: Rows read and indexed per batch during sync
+    """
+    name = "embedded"
+
+    # Weights for the indexed columns (title, subtitle, body) in BM25
+    COLUMN_WEIGHTS = (5.0, 2.0, 1.0)
+    # Edits landing while a sync runs are picked up by the next one
+    EDIT_OVERLAP = timedelta(minutes=1)
+
+    def __init__(self, path: str, batch_size: int = 500):
+        self.path = path
+        self.batch_size = batch_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Index connection, opened (and the file created) on first use"""
+        if self._conn is None:
+            if self.path != ":memory:" and os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS search_docs USING fts5("
+                    "title, subtitle, body, doc_type UNINDEXED, doc_id UNINDEXED, "
+                    "profile_id UNINDEXED, parent_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS search_state "
+                    "(doc_type TEXT PRIMARY KEY, last_id INTEGER, last_sync TEXT)"
+                )
+            self._conn = conn
+        return self._conn
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM search_docs").fetchone()[0]
+
+    @staticmethod
+    def _rowid(doc_type: str, doc_id: int) -> int:
+        # Stable rowid per document so re-indexing replaces in place
+        return doc_id * len(DOC_TYPES) + DOC_TYPES.index(doc_type)
+
+    # Source queries: (primary key, lastUpdated column, select of
+    # id, title, subtitle, body parts..., profile_id, parent_id)
+    @staticmethod
+    def _source(doc_type: str):
+        if doc_type == DOC_JOB:
+            return JobBoardJob.JobBoardJobID, JobBoardJob.lastUpdated, select(
+                JobBoardJob.JobBoardJobID, JobBoardJob.JobTitle, JobBoardJob.CompanyName,
+                JobBoardJob.JobDescription, JobBoardJob.Location, None, None
+            )
+        if doc_type == DOC_APPLICATION:
+            return JobApplication.JobApplicationID, JobApplication.lastUpdated, select(
+                JobApplication.JobApplicationID, JobApplication.JobTitle, JobApplication.CompanyName,
+                JobApplication.Location, JobApplication.Source, JobApplication.ProfileID, None
+            )
+        return JobApplicationNote.JobApplicationNoteID, JobApplicationNote.lastUpdated, select(
+            JobApplicationNote.JobApplicationNoteID, JobApplication.JobTitle, JobApplication.CompanyName,
+            JobApplicationNote.NoteText, None, JobApplication.ProfileID, JobApplicationNote.JobApplicationID
+        ).join(JobApplication, JobApplication.JobApplicationID == JobApplicationNote.JobApplicationID)
+
+    def _write(self, doc_type: str, rows: Sequence[Tuple]):
+        docs = [
+            (self._rowid(doc_type, doc_id), title, subtitle, " ".join(part for part in (body, extra) if part),
+             doc_type, doc_id, profile_id, parent_id)
+            for doc_id, title, subtitle, body, extra, profile_id, parent_id in rows
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM search_docs WHERE rowid = ?", [(doc[0],) for doc in docs])
+            self.conn.executemany(
+                "INSERT INTO search_docs (rowid, title, subtitle, body, doc_type, doc_id, profile_id, parent_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                docs
+            )
+
+    def _state(self, doc_type: str) -> Tuple[int, Optional[datetime]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_id, last_sync FROM search_state WHERE doc_type = ?", (doc_type,)
+            ).fetchone()
+        if row is None:
+            return 0, None
+        return row[0], datetime.fromisoformat(row[1]) if row[1] else None
+
+    def _save_state(self, doc_type: str, last_id: int, last_sync: datetime):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_state (doc_type, last_id, last_sync) VALUES (?, ?, ?)",
+                (doc_type, last_id, last_sync.isoformat())
+            )
+
+    def sync(self, session_factory) -> int:
+        indexed = 0
+        db = session_factory()
+        try:
+            for doc_type in DOC_TYPES:
+                pk, updated, query = self._source(doc_type)
+                last_id, last_sync = self._state(doc_type)
+                started = datetime.utcnow()
+                known_through = last_id
+
+                # New rows since the last sync
+                while True:
+                    rows = db.execute(query.where(pk > last_id).order_by(pk).limit(self.batch_size)).all()
+                    if not rows:
+                        break
+                    self._write(doc_type, rows)
+                    last_id = rows[-1][0]
+                    indexed += len(rows)
+
+                # Rows edited since the last sync
+                if last_sync is not None:
+                    cursor = 0
+                    while True:
+                        rows = db.execute(
+                            query.where(pk > cursor, pk <= known_through, updated >= last_sync - self.EDIT_OVERLAP)
+                            .order_by(pk).limit(self.batch_size)
+                        ).all()
+                        if not rows:
+                            break
+                        self._write(doc_type, rows)
+                        cursor = rows[-1][0]
+                        indexed += len(rows)
+
+                self._save_state(doc_type, last_id, started)
+        finally:
+            db.close()
+        if indexed:
+            logger.info(f"Search index synced {indexed} documents")
+        return indexed
+
+    def reindex(self, session_factory, doc_type: str, doc_ids: Sequence[int]) -> int:
+        pk, _, query = self._source(doc_type)
+        doc_ids = sorted(set(doc_ids))
+        db = session_factory()
+        try:
+            rows = []
+            for start in range(0, len(doc_ids), self.batch_size):
+                rows.extend(db.execute(query.where(pk.in_(doc_ids[start:start + self.batch_size]))).all())
+        finally:
+            db.close()
+        if rows:
+            self._write(doc_type, rows)
+        missing = set(doc_ids) - {row[0] for row in rows}
+        if missing:
+            self.remove(doc_type, sorted(missing))
+        return len(rows)
+
+    def remove(self, doc_type: str, doc_ids: Sequence[int]):
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "DELETE FROM search_docs WHERE rowid = ?", [(self._rowid(doc_type, doc_id),) for doc_id in doc_ids]
+            )
+
+    def search(self, db, terms, user_id, profile_id, doc_types, limit, offset) -> SearchPage:
+        match = " ".join(f'"{term}"*' for term in terms)
+        type_marks = ", ".join("?" for _ in doc_types)
+        where = (
+            f"search_docs MATCH ? AND doc_type IN ({type_marks}) AND ("
+            "(doc_type != ? AND profile_id = ?) OR "
+            "(doc_type = ? AND doc_id IN (SELECT value FROM json_each(?))))"
+        )
+        params = [match, *doc_types, DOC_JOB, profile_id, DOC_JOB, json.dumps(tracked_job_ids(db, user_id))]
+        weights = ", ".join(str(weight) for weight in self.COLUMN_WEIGHTS)
+
+        with self._lock:
+            total = self.conn.execute(f"SELECT COUNT(*) FROM search_docs WHERE {where}", params).fetchone()[0]
+            rows = self.conn.execute(
+                f"SELECT doc_type, doc_id, parent_id, title, subtitle, "
+                f"snippet(search_docs, 2, '<mark>', '</mark>', '…', 24), bm25(search_docs, {weights}) AS rank "
+                f"FROM search_docs WHERE {where} ORDER BY rank, rowid LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            ).fetchall()
+        return SearchPage(total, [
+            SearchHit(doc_type, doc_id, title, subtitle, snippet or None, -rank,
+                      job_application_id=parent_id if doc_type == DOC_NOTE else doc_id if doc_type == DOC_APPLICATION else None)
+            for doc_type, doc_id, parent_id, title, subtitle, snippet, rank in rows
+        ])
+
+
+class SqlServerFullTextBackend(SearchBackend):
+    """
+    SQL Server full-text search over the source tables.
+
+    Full-text indexes are maintained by SQL Server (change tracking AUTO),
+    so there is nothing to sync.
+    """
+    name = "mssql_fulltext"
+
+    INDEXED_TABLES = ("JobBoardJob", "JobApplication", "JobApplicationNote")
+
+    @classmethod
+    def available(cls, db: Session) -> bool:
+        """Full-text is installed and every source table has a full-text index"""
+        if db.get_bind().dialect.name != "mssql":
+            return False
+        installed = db.execute(text("SELECT FULLTEXTSERVICEPROPERTY('IsFullTextInstalled')")).scalar()
+        if not installed:
+            return False
+        indexed = db.execute(text(
+            "SELECT COUNT(*) FROM sys.fulltext_indexes WHERE object_id IN "
+            "(OBJECT_ID('JobBoardJob'), OBJECT_ID('JobApplication'), OBJECT_ID('JobApplicationNote'))"
+        )).scalar()
+        return indexed == len(cls.INDEXED_TABLES)
+
+    # One ranked SELECT per document type; combined with UNION ALL
+    PARTS = {
+        DOC_JOB: (
+            "SELECT 'job' AS doc_type, j.JobBoardJobID AS doc_id, NULL AS parent_id, j.JobTitle AS title, "
+            "j.CompanyName AS subtitle, LEFT(j.JobDescription, 2000) AS body, ft.[RANK] AS rank "
+            "FROM CONTAINSTABLE(JobBoardJob, (JobTitle, CompanyName, JobDescription), :query) ft "
+            "JOIN JobBoardJob j ON j.JobBoardJobID = ft.[KEY] "
+            "WHERE EXISTS (SELECT 1 FROM UserJobBoardJobInteraction i "
+            "WHERE i.JobBoardJobID = j.JobBoardJobID AND i.UserID = :user_id)"
+        ),
+        DOC_APPLICATION: (
+            "SELECT 'application', a.JobApplicationID, a.JobApplicationID, a.JobTitle, a.CompanyName, "
+            "a.Location, ft.[RANK] "
+            "FROM CONTAINSTABLE(JobApplication, (JobTitle, CompanyName, Location), :query) ft "
+            "JOIN JobApplication a ON a.JobApplicationID = ft.[KEY] "
+            "WHERE a.ProfileID = :profile_id"
+        ),
+        DOC_NOTE: (
+            "SELECT 'note', n.JobApplicationNoteID, n.JobApplicationID, a.JobTitle, a.CompanyName, "
+            "LEFT(n.NoteText, 2000), ft.[RANK] "
+            "FROM CONTAINSTABLE(JobApplicationNote, NoteText, :query) ft "
+            "JOIN JobApplicationNote n ON n.JobApplicationNoteID = ft.[KEY] "
+            "JOIN JobApplication a ON a.JobApplicationID = n.JobApplicationID "
+            "WHERE a.ProfileID = :profile_id"
+        ),
+    }
+
+    def search(self, db, terms, user_id, profile_id, doc_types, limit, offset) -> SearchPage:
+        union = " UNION ALL ".join(self.PARTS[doc_type] for doc_type in doc_types)
+        rows = db.execute(
+            text(
+                f"SELECT doc_type, doc_id, parent_id, title, subtitle, body, rank, COUNT(*) OVER () AS total "
+                f"FROM ({union}) hits ORDER BY rank DESC, doc_type, doc_id "
+                f"OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY"
+            ),
+            {
+                "query": " AND ".join(f'"{term}*"' for term in terms),
+                "user_id": user_id,
+                "profile_id": profile_id,
+                "offset": offset,
+                "limit": limit,
+            }
+        ).all()
+        total = rows[0].total if rows else 0
+        return SearchPage(total, [
+            SearchHit(row.doc_type, row.doc_id, row.title, row.subtitle, make_snippet(row.body, terms),
+                      float(row.rank), job_application_id=row.parent_id)
+            for row in rows
+        ])
+
+
+def _exists(db: Session, doc_type: str, doc_ids: Sequence[int]) -> set:
+    pk = {DOC_JOB: JobBoardJob.JobBoardJobID, DOC_APPLICATION: JobApplication.JobApplicationID,
+          DOC_NOTE: JobApplicationNote.JobApplicationNoteID}[doc_type]
+    return set(db.execute(select(pk).where(pk.in_(doc_ids))).scalars())
+
+
+def search_documents(
+    db: Session,
+    backend: SearchBackend,
+    query: str,
+    user_id: int,
+    doc_types: Optional[Sequence[str]] = None,
+    page: int = 1,
+    page_size: int = 20
+) -> SearchPage:
+    """
+    Ranked search over a user's jobs, applications and notes.
+
+    Args:
+        db: Database session
+        backend: Search backend
+        query: Free-text query
+        user_id: User whose documents are searched
+        doc_types: Subset of DOC_TYPES (all when empty)
+        page: 1-based page number
+        page_size: Results per page
+
+    Returns:
+        SearchPage with the total match count and this page's hits
+
+    Raises:
+        LookupError: When the user does not exist
+        ValueError: When the query has no searchable terms or the page is too deep
+    """
+    terms = query_terms(query)
+    if not terms:
+        raise ValueError("Query has no searchable terms")
+    doc_types = [doc_type for doc_type in DOC_TYPES if not doc_types or doc_type in doc_types]
+    offset = (page - 1) * page_size
+    if offset + page_size > MAX_RESULT_WINDOW:
+        raise ValueError(f"Results are limited to the first {MAX_RESULT_WINDOW} matches")
+
+    profile_id = db.execute(select(User.ProfileID).where(User.UserID == user_id)).first()
+    if profile_id is None:
+        raise LookupError(f"User {user_id} not found")
+    result = backend.search(db, terms, user_id, profile_id[0], doc_types, page_size, offset)
+
+    if isinstance(backend, EmbeddedSearchBackend) and result.hits:
+        # The embedded index never sees deletes; drop hits whose rows are gone
+        for doc_type in {hit.doc_type for hit in result.hits}:
+            ids = [hit.doc_id for hit in result.hits if hit.doc_type == doc_type]
+            missing = set(ids) - _exists(db, doc_type, ids)
+            if missing:
+                backend.remove(doc_type, sorted(missing))
+                result.hits = [hit for hit in result.hits if not (hit.doc_type == doc_type and hit.doc_id in missing)]
+                result.total -= len(missing)
+    return result
+
+
+class SearchIndexSync:
+    """
+    Background sync for backends that keep their own index.
+
+    Runs every ``interval`` seconds, and right away when a commit marks
+    inserted, edited or deleted documents; marked documents are re-read by
+    id, the periodic sync catches writes made outside the ORM.
+
+    Args:
+        backend: Search backend
+        session_factory: Callable returning a new SQLAlchemy session
+        interval: Seconds between syncs
+    """
+
+    def __init__(self, backend: SearchBackend, session_factory, interval: float = 30.0):
+        self.backend = backend
+        self.session_factory = session_factory
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._marked: Dict[str, set] = {}
+        self._marked_lock = threading.Lock()
+        self.stats = {"syncs": 0, "indexed": 0, "wakeups": 0, "failures": 0}
+
+    @property
+    def pending(self) -> int:
+        with self._marked_lock:
+            return sum(len(ids) for ids in self._marked.values())
+
+    def mark(self, doc_type: str, doc_ids: Sequence[int]):
+        """Queue documents for re-indexing and wake the worker; safe from any thread"""
+        with self._marked_lock:
+            self._marked.setdefault(doc_type, set()).update(doc_ids)
+        self.wake()
+
+    def wake(self):
+        """Request a sync soon; safe to call from any thread"""
+        if self._loop is not None and self._wakeup is not None:
+            self.stats["wakeups"] += 1
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _sync(self) -> int:
+        with self._marked_lock:
+            marked, self._marked = self._marked, {}
+        indexed = self.backend.sync(self.session_factory)
+        for doc_type, doc_ids in marked.items():
+            indexed += self.backend.reindex(self.session_factory, doc_type, sorted(doc_ids))
+        return indexed
+
+    async def sync(self):
+        try:
+            indexed = await asyncio.get_running_loop().run_in_executor(None, self._sync)
+            self.stats["syncs"] += 1
+            self.stats["indexed"] += indexed
+        except Exception as e:
+            self.stats["failures"] += 1
+            logger.error(f"Search index sync failed: {e}")
+
+    async def _run(self):
+        while True:
+            await self.sync()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = self._loop.create_task(self._run())
+            logger.info(f"Search index sync started ({self.backend.name}, interval={self.interval}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+            self._loop = None
+
+
+INDEXED_MODELS = {
+    JobBoardJob: (DOC_JOB, "JobBoardJobID"),
+    JobApplication: (DOC_APPLICATION, "JobApplicationID"),
+    JobApplicationNote: (DOC_NOTE, "JobApplicationNoteID"),
+}
+
+
+def install_search_hooks(session_factory, sync: SearchIndexSync):
+    """Mark indexed rows inserted, changed or deleted by ORM commits for re-indexing"""
+
+    def after_flush(session, flush_context):
+        for obj in chain(session.new, session.dirty, session.deleted):
+            source = INDEXED_MODELS.get(type(obj))
+            if source is not None:
+                doc_id = getattr(obj, source[1], None)
+                if doc_id is not None:
+                    session.info.setdefault("search_index_marked", set()).add((source[0], doc_id))
+
+    def after_commit(session):
+        if session.in_nested_transaction():
+            return
+        marked = session.info.pop("search_index_marked", None)
+        if marked:
+            for doc_type in DOC_TYPES:
+                ids = [doc_id for marked_type, doc_id in marked if marked_type == doc_type]
+                if ids:
+                    sync.mark(doc_type, ids)
+
+    def after_rollback(session):
+        if not session.in_nested_transaction():
+            session.info.pop("search_index_marked", None)
+
+    event.listen(session_factory, "after_flush", after_flush)
+    event.listen(session_factory, "after_commit", after_commit)
+    event.listen(session_factory, "after_rollback", after_rollback)
+
+
+def create_search_backend(session_factory, setting: str = "auto", path: str = "search_index.db") -> SearchBackend:
+    """
+    Pick the search backend.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy session
+        setting: ``auto`` (SQL Server full-text when available), ``mssql`` or ``embedded``
+        path: Embedded index file
+    """
+    if setting in ("auto", "mssql"):
+        db = session_factory()
+        try:
+            if SqlServerFullTextBackend.available(db):
+                return SqlServerFullTextBackend()
+        except Exception as e:
+            logger.warning(f"SQL Server full-text check failed: {e}")
+        finally:
+            db.close()
+        if setting == "mssql":
+            logger.warning("SQL Server full-text indexes not found; using the embedded search index")
+    return EmbeddedSearchBackend(path)
+
+
+_backend: Optional[SearchBackend] = None
+_sync: Optional[SearchIndexSync] = None
+
+
+def get_search_backend() -> SearchBackend:
+    """Get the shared search backend"""
+    global _backend
+    if _backend is None:
+        from mcp.db.session import SessionLocal
+        from app.core.api_config import APIConfig
+        _backend = create_search_backend(SessionLocal, APIConfig.SEARCH_BACKEND, APIConfig.SEARCH_INDEX_PATH)
+    return _backend
+
+
+def get_search_index_sync() -> SearchIndexSync:
+    """Get the shared search index sync worker (hooks installed on first use)"""
+    global _sync
+    if _sync is None:
+        from mcp.db.session import SessionLocal
+        from app.core.api_config import APIConfig
+        _sync = SearchIndexSync(get_search_backend(), SessionLocal, interval=APIConfig.SEARCH_SYNC_INTERVAL)
+        install_search_hooks(SessionLocal, _sync)
+    return _sync
@@ -0,0 +1,331 @@
+"""
+Skill Dictionary Service
+
+This module maps free-text skill names ("JS", "Javascript", "JavaScript") to
+one canonical SkillDictionary row, so skills from resumes, job postings and
+gap resolutions can be compared by integer id.
+
+Features:
+- Case, Unicode and punctuation folding ("Node.js" == "nodejs", "C#" != "C")
+- All aliases held in memory as a folded-key hash map for O(1) lookups
+- Unknown skills become new (uncurated) dictionary entries at write time
+- Curated seed list of common skills and their aliases
+- Batch re-normalization of existing Skills, JobBoardJobSkill and
+  UserSkillGapResolution rows
+"""
+
+import logging
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import JobBoardJobSkill, SkillDictionary, SkillDictionaryAlias, Skills, UserSkillGapResolution
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CREATED_BY = "skill_dictionary"
+
+# Punctuation that distinguishes skills ("C", "C#", "C++"); everything else is dropped
+SIGNIFICANT_PUNCTUATION = "+#"
+
+# Curated canonical skills: name -> (category, aliases)
+SEED_SKILLS: Dict[str, Tuple[str, List[str]]] = {
+    "JavaScript": ("Programming Language", ["JS", "ECMAScript", "ES6"]),
+    "TypeScript": ("Programming Language", ["TS"]),
+    "Python": ("Programming Language", ["Py", "Python 3", "Python3"]),
+    "Java": ("Programming Language", []),
+    "C#": ("Programming Language", ["CSharp", "C Sharp"]),
+    "C++": ("Programming Language", ["CPP", "C Plus Plus"]),
+    "Go": ("Programming Language", ["Golang"]),
+    "SQL": ("Database", ["Structured Query Language"]),
+    "Microsoft SQL Server": ("Database", ["SQL Server", "MSSQL", "MS SQL", "T-SQL", "TSQL"]),
+    "PostgreSQL": ("Database", ["Postgres", "psql"]),
+    "MySQL": ("Database", []),
+    "MongoDB": ("Database", ["Mongo"]),
+    "React": ("Framework", ["ReactJS", "React.js"]),
+    "Angular": ("Framework", ["AngularJS", "Angular.js"]),
+    "Vue.js": ("Framework", ["Vue", "VueJS"]),
+    "Node.js": ("Framework", ["Node", "NodeJS"]),
+    ".NET": ("Framework", ["dotnet", "dot net", ".NET Core", "ASP.NET"]),
+    "Django": ("Framework", []),
+    "FastAPI": ("Framework", []),
+    "Amazon Web Services": ("Cloud", ["AWS"]),
+    "Microsoft Azure": ("Cloud", ["Azure"]),
+    "Google Cloud Platform": ("Cloud", ["GCP", "Google Cloud"]),
+    "Docker": ("DevOps", []),
+    "Kubernetes": ("DevOps", ["K8s"]),
+    "Continuous Integration/Continuous Delivery": ("DevOps", ["CI/CD", "CICD"]),
+    "Git": ("Tooling", []),
+    "Machine Learning": ("Data", ["ML"]),
+    "Microsoft Excel": ("Tooling", ["Excel", "MS Excel"]),
+    "Power BI": ("Data", ["PowerBI"]),
+    "Tableau": ("Data", []),
+}
+
+
+def fold_skill_name(name: Optional[str]) -> str:
+    """
+    Lookup key for a skill name.
+
+    Applies NFKC, case folding, and drops whitespace and punctuation other
+    than ``+`` and ``#``: ``' Node.JS '`` -> ``'nodejs'``, ``'C++'`` -> ``'c++'``.
+    """
+    text = unicodedata.normalize("NFKC", name or "").casefold()
+    return "".join(ch for ch in text if ch.isalnum() or ch in SIGNIFICANT_PUNCTUATION)
+
+
+class SkillNormalizer:
+    """
+    In-memory alias index over SkillDictionaryAlias.
+
+    Lookups are a single dict probe on the folded name. Misses fall through to
+    the database (another process may have added the skill) and, when
+    resolving for a write, create a new dictionary entry.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._canonical: Dict[int, str] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        # Session.info key for entries created in a transaction that has not committed yet
+        self._pending_key = f"skill_dictionary_pending_{id(self)}"
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def load(self, db: Session):
+        """(Re)load every alias from the database"""
+        ids = {key: skill_id for key, skill_id in db.execute(
+            select(SkillDictionaryAlias.NormalizedAlias, SkillDictionaryAlias.SkillDictionaryID)
+        )}
+        canonical = {skill_id: name for skill_id, name in db.execute(
+            select(SkillDictionary.SkillDictionaryID, SkillDictionary.CanonicalName)
+        )}
+        with self._lock:
+            self._ids, self._canonical, self._loaded = ids, canonical, True
+        logger.info(f"Loaded {len(ids)} skill aliases for {len(canonical)} canonical skills")
+
+    def lookup(self, name: Optional[str]) -> Optional[int]:
+        """SkillDictionaryID for a name from memory only (None when unknown)"""
+        return self._ids.get(fold_skill_name(name))
+
+    def canonical_name(self, skill_id: int) -> Optional[str]:
+        return self._canonical.get(skill_id)
+
+    def _remember(self, key: str, skill_id: int, canonical_name: Optional[str] = None):
+        with self._lock:
+            self._ids[key] = skill_id
+            if canonical_name is not None:
+                self._canonical[skill_id] = canonical_name
+
+    def _pending(self, db: Session) -> Dict[str, Tuple[int, str]]:
+        """
+        Entries this session created but has not committed.
+
+        They only join the shared index after commit, so a rolled back
+        transaction cannot leave ids behind that never reached the database.
+        """
+        pending = db.info.get(self._pending_key)
+        if pending is None:
+            pending = db.info[self._pending_key] = {}
+
+            # Both events also fire for savepoints; only the outermost transaction counts
+            def promote(session):
+                if session.in_nested_transaction():
+                    return
+                for key, (skill_id, canonical_name) in session.info.pop(self._pending_key, {}).items():
+                    self._remember(key, skill_id, canonical_name)
+                session.info[self._pending_key] = {}
+
+            def discard(session):
+                if session.in_nested_transaction():
+                    return
+                session.info[self._pending_key] = {}
+
+            event.listen(db, "after_commit", promote)
+            event.listen(db, "after_rollback", discard)
+        return pending
+
+    def _fetch(self, db: Session, key: str) -> Optional[int]:
+        row = db.execute(
+            select(SkillDictionaryAlias.SkillDictionaryID, SkillDictionary.CanonicalName)
+            .join(SkillDictionary, SkillDictionary.SkillDictionaryID == SkillDictionaryAlias.SkillDictionaryID)
+            .where(SkillDictionaryAlias.NormalizedAlias == key)
+        ).first()
+        if row is None:
+            return None
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def resolve(self, db: Session, name: Optional[str], created_by: str = CREATED_BY) -> Optional[int]:
+        """
+        SkillDictionaryID for a name, creating an uncurated entry if it is new.
+
+        The new rows are flushed inside a savepoint but not committed, so they
+        land with the caller's transaction.
+
+        Args:
+            db: Database session
+            name: Free-text skill name
+            created_by: Audit value for new rows
+
+        Returns:
+            SkillDictionaryID, or None when the name folds to nothing
+        """
+        key = fold_skill_name(name)
+        if not key:
+            return None
+        if not self._loaded:
+            self.load(db)
+        skill_id = self._ids.get(key)
+        if skill_id is not None:
+            return skill_id
+        pending = self._pending(db)
+        if key in pending:
+            return pending[key][0]
+        skill_id = self._fetch(db, key)
+        if skill_id is not None:
+            return skill_id
+
+        canonical_name = " ".join(name.split())[:255]
+        try:
+            with db.begin_nested():
+                skill = SkillDictionary(CanonicalName=canonical_name, IsCurated=False, createdBy=created_by)
+                db.add(skill)
+                db.flush()
+                db.add(SkillDictionaryAlias(
+                    SkillDictionaryID=skill.SkillDictionaryID, Alias=canonical_name,
+                    NormalizedAlias=key, createdBy=created_by
+                ))
+                db.flush()
+        except IntegrityError:
+            # Created concurrently under the same key (or canonical name)
+            skill_id = self._fetch(db, key)
+            if skill_id is None:
+                raise
+            return skill_id
+        pending[key] = (skill.SkillDictionaryID, canonical_name)
+        return skill.SkillDictionaryID
+
+    def resolve_many(self, db: Session, names: Iterable[Optional[str]], created_by: str = CREATED_BY) -> List[Optional[int]]:
+        return [self.resolve(db, name, created_by) for name in names]
+
+
+def seed_skill_dictionary(db: Session, normalizer: Optional[SkillNormalizer] = None) -> Dict[str, int]:
+    """
+    Add the curated SEED_SKILLS that are missing (committed).
+
+    An alias already claimed by another entry is left where it is.
+
+    Returns:
+        Counts of skills and aliases added
+    """
+    normalizer = normalizer or get_skill_normalizer()
+    existing = {name: skill_id for skill_id, name in db.execute(
+        select(SkillDictionary.SkillDictionaryID, SkillDictionary.CanonicalName)
+    )}
+    taken = set(db.execute(select(SkillDictionaryAlias.NormalizedAlias)).scalars())
+    added = {"skills": 0, "aliases": 0}
+
+    for canonical_name, (category, aliases) in SEED_SKILLS.items():
+        skill_id = existing.get(canonical_name)
+        if skill_id is None:
+            skill = SkillDictionary(
+                CanonicalName=canonical_name, Category=category, IsCurated=True, createdBy=CREATED_BY
+            )
+            db.add(skill)
+            db.flush()
+            skill_id = skill.SkillDictionaryID
+            added["skills"] += 1
+        for alias in [canonical_name, *aliases]:
+            key = fold_skill_name(alias)
+            if key in taken:
+                continue
+            db.add(SkillDictionaryAlias(
+                SkillDictionaryID=skill_id, Alias=alias, NormalizedAlias=key, createdBy=CREATED_BY
+            ))
+            taken.add(key)
+            added["aliases"] += 1
+    db.commit()
+    normalizer.load(db)
+    return added
+
+
+# Tables holding free-text skill names: (model, primary key column)
+SKILL_NAME_TABLES = (
+    (Skills, Skills.SkillID),
+    (JobBoardJobSkill, JobBoardJobSkill.JobBoardJobSkillID),
+    (UserSkillGapResolution, UserSkillGapResolution.UserSkillGapResolutionID),
+)
+
+
+def renormalize_skill_rows(
+    db: Session,
+    normalizer: Optional[SkillNormalizer] = None,
+    batch_size: int = 1000,
+    only_missing: bool = True
+) -> Dict[str, Dict[str, int]]:
+    """
+    Set SkillDictionaryID on existing skill rows, one committed batch at a time.
+
+    Args:
+        db: Database session
+        normalizer: Alias index (the shared one when None)
+        batch_size: Rows per keyset page and bulk UPDATE
+        only_missing: Only rows without a SkillDictionaryID (False re-checks every row,
+            e.g. after aliases were merged)
+
+    Returns:
+        Per table counts of rows scanned and updated
+    """
+    normalizer = normalizer or get_skill_normalizer()
+    if not normalizer.loaded:
+        normalizer.load(db)
+    results: Dict[str, Dict[str, int]] = {}
+
+    for model, pk in SKILL_NAME_TABLES:
+        counts = results[model.__tablename__] = {"scanned": 0, "updated": 0}
+        last_id = 0
+        while True:
+            query = select(pk, model.SkillName, model.SkillDictionaryID).where(pk > last_id)
+            if only_missing:
+                query = query.where(model.SkillDictionaryID.is_(None))
+            rows = db.execute(query.order_by(pk).limit(batch_size)).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            counts["scanned"] += len(rows)
+
+            changes = []
+            for row_id, name, current_id in rows:
+                skill_id = normalizer.resolve(db, name)
+                if skill_id != current_id:
+                    changes.append({pk.key: row_id, "SkillDictionaryID": skill_id})
+            if changes:
+                # ORM bulk UPDATE by primary key: one executemany per batch
+                db.execute(update(model), changes)
+                counts["updated"] += len(changes)
+            db.commit()
+        logger.info(f"Re-normalized {model.__tablename__}: {counts}")
+    return results
+
+
+_normalizer: Optional[SkillNormalizer] = None
+
+
+def get_skill_normalizer() -> SkillNormalizer:
+    """Get the shared skill alias index (loaded on first use)"""
+    global _normalizer
+    if _normalizer is None:
+        _normalizer = SkillNormalizer()
+    return _normalizer
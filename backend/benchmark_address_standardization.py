@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Address Suggestion Standardization Benchmark
+
+Times mapping a captured 50-suggestion Geoscape /predictive/address payload
+to the address API's suggestion shape, with and without the second
+standardization pass that AddressValidationService used to apply.
+
+Usage:
+    python benchmark_address_standardization.py
+    python benchmark_address_standardization.py --payload my_capture.json --iterations 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.address_suggestions import standardize_geoscape_suggestions
+from app.services.address_validation_service import AddressValidationService
+
+DEFAULT_PAYLOAD = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures", "geoscape", "predictive_address_50.json"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Geoscape suggestion standardization")
+    parser.add_argument("--payload", default=DEFAULT_PAYLOAD, help="Captured /predictive/address response")
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    with open(args.payload) as f:
+        items = json.load(f)["suggest"]
+
+    service = AddressValidationService.__new__(AddressValidationService)
+
+    def single_pass():
+        return standardize_geoscape_suggestions(items, "AU")
+
+    def double_pass():
+        return [service._standardize_suggestion(suggestion, "AU") for suggestion in single_pass()]
+
+    assert single_pass() == double_pass(), "single-pass output differs from the standardized shape"
+
+    print(f"📦 {len(items)} suggestions, {args.iterations} iterations")
+    results = {}
+    for name, fn in (("single pass", single_pass), ("single pass + re-standardize", double_pass)):
+        best = min(timeit.repeat(fn, number=args.iterations, repeat=5)) / args.iterations
+        results[name] = best
+        print(f"   {name:<30} {best * 1e6:8.1f}µs per payload ({best * 1e6 / len(items):.2f}µs per suggestion)")
+
+    saved = 1 - results["single pass"] / results["single pass + re-standardize"]
+    print(f"✅ Skipping the second pass saves {saved:.0%}")
+
+
+if __name__ == "__main__":
+    main()
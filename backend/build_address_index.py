@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Build the offline address index used for AU autocomplete
+
+Reads a bulk G-NAF-style address extract (CSV, pipe-separated PSV or
+Parquet) and writes a memory-mapped index directory. Point
+LOCAL_ADDRESS_INDEX_PATH at the output directory to enable the "local"
+address provider. Suburb and postcode centroids for the fallback geocoder
+are written to the same directory (centroids.json).
+
+Usage:
+    python build_address_index.py addresses.csv data/address_index
+    python build_address_index.py ADDRESS_VIEW.psv data/address_index --delimiter "|"
+    python build_address_index.py addresses.parquet data/address_index --state NSW --state VIC
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.local_address_index import build_index, LocalAddressIndex
+from app.services.fallback_geocoder import CENTROIDS_FILENAME, build_centroids, write_centroids
+
+# Accepted source column names for each index field, G-NAF names first
+COLUMN_ALIASES = {
+    "id": ["ADDRESS_DETAIL_PID", "ADDRESS_ID", "ID"],
+    "flat_number": ["FLAT_NUMBER", "UNIT_NUMBER"],
+    "street_number": ["NUMBER_FIRST", "STREET_NUMBER", "HOUSE_NUMBER"],
+    "street_name": ["STREET_NAME"],
+    "street_type": ["STREET_TYPE_CODE", "STREET_TYPE"],
+    "suburb": ["LOCALITY_NAME", "SUBURB", "LOCALITY"],
+    "state": ["STATE_ABBREVIATION", "STATE"],
+    "postcode": ["POSTCODE"],
+    "latitude": ["LATITUDE", "LAT"],
+    "longitude": ["LONGITUDE", "LON", "LNG"],
+}
+
+
+def resolve_columns(header):
+    """Map index fields to the source file's column names"""
+    available = {name.strip().upper(): name for name in header}
+    columns = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in available:
+                columns[field] = available[alias]
+                break
+    missing = [field for field in ("street_name", "suburb", "state") if field not in columns]
+    if missing:
+        raise SystemExit(f"Input is missing required columns for: {', '.join(missing)}")
+    return columns
+
+
+def read_rows(path, delimiter):
+    """Yield source rows as dicts"""
+    if path.lower().endswith(".parquet"):
+        import pandas as pd  # pyarrow or fastparquet must be installed for Parquet input
+        for row in pd.read_parquet(path).fillna("").to_dict("records"):
+            yield row
+        return
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f, delimiter=delimiter):
+            yield row
+
+
+def to_records(rows, states=None):
+    """Convert source rows into index records"""
+    columns = None
+    generated_id = 0
+    for row in rows:
+        if columns is None:
+            columns = resolve_columns(row.keys())
+
+        def value(field):
+            column = columns.get(field)
+            raw = row.get(column) if column else None
+            return str(raw).strip() if raw not in (None, "") else ""
+
+        state = value("state").upper()
+        if states and state not in states:
+            continue
+
+        number = value("street_number")
+        flat = value("flat_number")
+        if flat and number:
+            number = f"{flat}/{number}"
+
+        generated_id += 1
+        yield {
+            "id": value("id") or f"LOCAL{generated_id}",
+            "street_number": number,
+            "street_name": value("street_name").upper(),
+            "street_type": value("street_type").upper(),
+            "suburb": value("suburb").upper(),
+            "state": state,
+            "postcode": value("postcode"),
+            "latitude": value("latitude"),
+            "longitude": value("longitude"),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline AU address index")
+    parser.add_argument("input", help="CSV, PSV or Parquet address extract")
+    parser.add_argument("output", help="Directory to write the index into")
+    parser.add_argument("--delimiter", default=",", help="Field delimiter for CSV/PSV input")
+    parser.add_argument("--state", action="append", help="Only include these states (repeatable)")
+    args = parser.parse_args()
+
+    states = {state.upper() for state in args.state} if args.state else None
+
+    print(f"🏗️  Building address index from {args.input}")
+    started = time.perf_counter()
+    records = list(to_records(read_rows(args.input, args.delimiter), states))
+    meta = build_index(records, args.output)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Indexed {meta['records']} addresses ({meta['tokens']} tokens) in {elapsed:.1f}s")
+
+    centroids = build_centroids(records)
+    write_centroids(centroids, os.path.join(args.output, CENTROIDS_FILENAME))
+    print(f"📍 Wrote centroids for {len(centroids['postcodes'])} postcodes and {len(centroids['suburbs'])} suburbs")
+
+    # Quick sanity check and timing against the new index
+    index = LocalAddressIndex(args.output)
+    if index.record_count:
+        sample = index.record(0)["address"]
+        query = sample[: max(3, len(sample) // 2)]
+        started = time.perf_counter()
+        results = index.search(query, limit=10)
+        print(f"🔍 '{query}' -> {len(results)} results in {(time.perf_counter() - started) * 1000:.3f}ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Bulk Address Validation for JobTrackerDB
+
+Validates a CSV or JSON Lines address file, or the legacy
+Profile.AddressLine1-3 columns, through AddressValidationService and writes
+validated addresses to ProfileAddress in batches. Progress is checkpointed,
+so an interrupted run picks up where it stopped when re-run with the same
+--checkpoint file.
+
+Input rows need an ``address`` column (or ``address_line1``-``address_line3``)
+and may include ``key``, ``profile_id``, ``property_id`` and ``country``.
+Only rows with a profile_id are written to ProfileAddress.
+
+Usage:
+    python bulk_validate_addresses.py --from-profiles --checkpoint migrate_addresses.json
+    python bulk_validate_addresses.py addresses.csv --checkpoint import.json --results results.jsonl
+    python bulk_validate_addresses.py addresses.jsonl --dry-run --concurrency 8 --rate 10
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.api_config import APIConfig
+from app.services.bulk_address_validation import (
+    BulkAddressValidator,
+    iter_legacy_profile_items,
+    items_from_rows,
+)
+
+
+def read_rows(path):
+    """Yield input rows from a CSV or JSON Lines file"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.DictReader(f):
+                yield {name.strip().lower(): value for name, value in row.items() if name}
+
+
+async def run(args):
+    from mcp.db.session import SessionLocal
+
+    if args.from_profiles:
+        items = iter_legacy_profile_items(SessionLocal)
+    else:
+        items = items_from_rows(read_rows(args.input))
+
+    validator = BulkAddressValidator(
+        session_factory=None if args.dry_run else SessionLocal,
+        concurrency=args.concurrency,
+        requests_per_second=args.rate,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+    )
+    if validator.checkpoint.completed_through >= 0:
+        print(f"⏩ Resuming after item {validator.checkpoint.completed_through}")
+
+    results_file = open(args.results, "a") if args.results else None
+    started = time.perf_counter()
+    processed = 0
+    try:
+        async for result in validator.run(items):
+            processed += 1
+            if results_file:
+                results_file.write(json.dumps(result.to_dict()) + "\n")
+            if processed % 100 == 0:
+                elapsed = time.perf_counter() - started
+                print(f"   {processed} addresses ({processed / elapsed:.1f}/s)")
+    finally:
+        if results_file:
+            results_file.close()
+
+    elapsed = time.perf_counter() - started
+    summary = validator.summary()
+    print(f"\n📊 Processed {processed} addresses in {elapsed:.1f}s")
+    for name in ("validated", "not_validated", "error", "written", "billable_calls", "completed_through"):
+        print(f"   {name}: {summary[name]}")
+    if summary["aborted"]:
+        print("❌ Stopped early after repeated provider errors; re-run to resume")
+        return 1
+    print("✅ Bulk validation complete")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate addresses in bulk")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("input", nargs="?", help="CSV or JSON Lines file of addresses")
+    source.add_argument("--from-profiles", action="store_true", help="Migrate legacy Profile.AddressLine1-3")
+    parser.add_argument("--checkpoint", help="Checkpoint file for resuming (recommended)")
+    parser.add_argument("--results", help="Append per-address results to this JSON Lines file")
+    parser.add_argument("--concurrency", type=int, default=APIConfig.BULK_ADDRESS_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=APIConfig.BULK_ADDRESS_REQUESTS_PER_SECOND,
+                        help="Upstream requests per second")
+    parser.add_argument("--batch-size", type=int, default=100, help="ProfileAddress rows per insert")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only; do not write ProfileAddress")
+    args = parser.parse_args()
+
+    print("🏠 Bulk address validation")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Geoscape Replay Server
+
+Serves recorded Geoscape responses so the address stack can be load tested
+without calling the paid API.
+
+1. Record fixtures by running the backend against the real API with
+   GEOSCAPE_RECORD_DIR=fixtures/geoscape and exercising the address flows.
+2. Start this server on the recordings.
+3. Start the backend with GEOSCAPE_BASE_URL=http://127.0.0.1:8100 and drive
+   it with load_test_address_search.py.
+
+Usage:
+    python geoscape_replay_server.py fixtures/geoscape
+    python geoscape_replay_server.py fixtures/geoscape --latency-ms 120 --jitter-ms 40
+    python geoscape_replay_server.py fixtures/geoscape --error-rate 0.05 --error-status 503
+"""
+
+import argparse
+import os
+import sys
+
+import uvicorn
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.geoscape_fixtures import FixtureStore, GeoscapeReplayApp
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded Geoscape responses")
+    parser.add_argument("fixtures", help="Directory written with GEOSCAPE_RECORD_DIR")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean added latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Latency standard deviation")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests to fail")
+    parser.add_argument("--error-status", type=int, default=503, help="Status code for injected errors")
+    parser.add_argument("--exact", action="store_true", help="404 on unrecorded requests instead of reusing a fixture")
+    parser.add_argument("--prefix", default="", help="Path prefix to strip, e.g. /v1")
+    parser.add_argument("--seed", type=int, help="Random seed for latency and error injection")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    if not len(store):
+        print(f"❌ No fixtures found in {args.fixtures}")
+        sys.exit(1)
+
+    print(f"🎞️  Replaying {len(store)} fixtures for {', '.join(store.endpoints)}")
+    print(f"   Latency {args.latency_ms}±{args.jitter_ms}ms, error rate {args.error_rate:.0%} ({args.error_status})")
+    print(f"   Set GEOSCAPE_BASE_URL=http://{args.host}:{args.port}{args.prefix} on the backend")
+
+    app = GeoscapeReplayApp(
+        store,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        fallback=not args.exact,
+        prefix=args.prefix,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
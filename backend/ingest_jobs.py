@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Job Feed Ingestion for JobTrackerDB
+
+Streams a JSON Lines or CSV job feed into JobBoardJob in chunks. Postings
+are de-duplicated against every stored job by content fingerprint; reposts
+update IsRepost/RepostFrequency and changed postings get a new
+JobBoardJobVersion. The feed is read one record at a time, so file size is
+limited only by disk.
+
+Records need ``title`` and ``company`` and may include ``description``,
+``location``, ``url``, ``board``, ``units`` and ``skills`` (a list, or
+``;``-separated in CSV).
+
+Usage:
+    python ingest_jobs.py jobs.jsonl --board Seek
+    python ingest_jobs.py jobs.csv --chunk-size 1000 --repost-after-days 14
+    python ingest_jobs.py jobs.jsonl --skip-rescore
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mcp.db.session import SessionLocal
+from app.core.api_config import APIConfig
+from app.services.fit_score_engine import FitScoreEngine
+from app.services.fit_score_recompute import FitScoreRecomputer
+from app.services.job_ingestion import IngestSummary, JobIngestor, feed_format, iter_feed_records
+from app.services.skill_dictionary import get_skill_normalizer
+
+
+def rescore(new_job_ids, changed_job_ids):
+    """Score new jobs and refresh stored fit scores for jobs whose skills changed"""
+    recomputer = FitScoreRecomputer(SessionLocal, engine=FitScoreEngine(normalizer=get_skill_normalizer()))
+    for job_id in new_job_ids:
+        recomputer.mark_new_job(job_id)
+    for job_id in changed_job_ids:
+        recomputer.mark_job(job_id)
+    asyncio.run(recomputer.drain())
+    print(f"🎯 Rescored {recomputer.stats['pairs_scored']} (user, job) pairs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a job feed")
+    parser.add_argument("input", help="JSON Lines or CSV job feed")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Feed format (default: from the file name)")
+    parser.add_argument("--board", help="JobBoard name for records without one")
+    parser.add_argument("--chunk-size", type=int, default=APIConfig.JOB_INGEST_CHUNK_SIZE)
+    parser.add_argument("--repost-after-days", type=int, default=APIConfig.JOB_REPOST_AFTER_DAYS)
+    parser.add_argument("--max-distance", type=int, default=APIConfig.JOB_DEDUP_MAX_DISTANCE,
+                        help="Fingerprint bits that may differ for a near-duplicate (0-6)")
+    parser.add_argument("--skip-rescore", action="store_true", help="Do not score new jobs or refresh changed ones")
+    args = parser.parse_args()
+
+    print("📥 Job feed ingestion")
+    db = SessionLocal()
+    started = time.time()
+
+    def progress(summary):
+        elapsed = time.time() - started
+        print(f"   {summary.processed} postings ({summary.processed / elapsed:.0f}/s)")
+
+    summary = IngestSummary()
+    failed = False
+    try:
+        ingestor = JobIngestor(
+            db,
+            chunk_size=args.chunk_size,
+            max_distance=args.max_distance,
+            repost_after_days=args.repost_after_days,
+            default_board=args.board,
+        )
+        ingestor.load_index()
+        print(f"🔎 {len(ingestor.index)} stored jobs indexed")
+        with open(args.input, encoding="utf-8-sig", newline="") as f:
+            ingestor.ingest(iter_feed_records(f, args.format or feed_format(args.input)), progress, summary)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Job ingestion failed: {e}")
+        failed = True
+    finally:
+        db.close()
+
+    print(f"\n📊 Processed {summary.processed} postings in {time.time() - started:.1f}s")
+    for name, count in summary.counts.items():
+        print(f"   {name}: {count}")
+    for error in summary.errors[:10]:
+        print(f"   ⚠️ {error}")
+
+    # Chunks committed before a failure are kept, so score them either way
+    if (summary.inserted_job_ids or summary.skill_changed_job_ids) and not args.skip_rescore:
+        rescore(sorted(summary.inserted_job_ids), sorted(summary.skill_changed_job_ids))
+    if failed:
+        sys.exit(1)
+    print("✅ Job ingestion complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Address Search Load Test for JobTrackerDB
+
+Drives GET /api/address/search at a fixed request rate (open loop: requests
+are sent on schedule whether or not earlier ones have finished) and reports
+throughput and latency percentiles.
+
+Run the backend against geoscape_replay_server.py so no paid calls are made,
+with RATE_LIMIT_ENABLED=false (the per-IP search limit would reject most of
+the load) and ADDRESS_SEARCH_CACHE_SIZE=0 to measure the uncached path.
+
+Usage:
+    python load_test_address_search.py --rps 50 --duration 30
+    python load_test_address_search.py --queries queries.txt --rps 200 --duration 60
+    python load_test_address_search.py --fixtures fixtures/geoscape --rps 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+DEFAULT_QUERIES = [
+    "4 milburn", "1 george st sydney", "12 st kilda rd", "100 pacific hwy",
+    "5 victoria pde", "22 king william st", "3 old south head rd", "88 brunswick st",
+]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(round(pct / 100 * len(values))) - 1))
+    return values[index]
+
+
+def load_queries(queries_file, fixtures_dir):
+    """Queries from a text file, from recorded search fixtures, or the defaults"""
+    if queries_file:
+        with open(queries_file) as f:
+            return [line.strip() for line in f if len(line.strip()) >= 3]
+    if fixtures_dir:
+        queries = []
+        for directory, _, files in os.walk(fixtures_dir):
+            for name in files:
+                if name.endswith(".json"):
+                    with open(os.path.join(directory, name)) as f:
+                        query = json.load(f)["request"].get("params", {}).get("query")
+                    if query and len(query) >= 3:
+                        queries.append(query)
+        if queries:
+            return queries
+    return DEFAULT_QUERIES
+
+
+async def run_load_test(url: str, queries, rps: float, duration: float, timeout: float):
+    latencies = []
+    statuses = Counter()
+    total = int(rps * duration)
+    interval = 1.0 / rps
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=200)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        async def send(query):
+            started = time.perf_counter()
+            try:
+                response = await client.get("/api/address/search", params={"q": query, "country": "AU", "limit": 10})
+                statuses[response.status_code] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        tasks = []
+        lag = 0.0
+        started = time.perf_counter()
+        for n in range(total):
+            # Fixed schedule; latency is measured from the actual send, schedule lag is reported separately
+            delay = started + n * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lag = max(lag, -delay)
+            tasks.append(asyncio.ensure_future(send(queries[n % len(queries)])))
+        sent_elapsed = time.perf_counter() - started
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    print("=" * 60)
+    print(f"🏠 Address search load test: {rps} req/s for {duration}s ({total} requests)")
+    print("=" * 60)
+    print(f"Send rate:        {total / sent_elapsed:.1f} req/s (max schedule lag {lag * 1000:.0f}ms)")
+    print(f"Completed in:     {elapsed:.2f}s")
+    print(f"Status codes:     {dict(statuses)}")
+    print(f"Latency mean:     {statistics.mean(latencies):.1f}ms")
+    print(f"Latency p50:      {percentile(latencies, 50):.1f}ms")
+    print(f"Latency p95:      {percentile(latencies, 95):.1f}ms")
+    print(f"Latency p99:      {percentile(latencies, 99):.1f}ms")
+    print(f"Latency max:      {latencies[-1]:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the address search endpoint")
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend base URL")
+    parser.add_argument("--rps", type=float, default=20.0, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Test length in seconds")
+    parser.add_argument("--queries", help="Text file with one search query per line")
+    parser.add_argument("--fixtures", help="Replay fixture directory to take recorded queries from")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries, args.fixtures)
+    asyncio.run(run_load_test(args.url, queries, args.rps, args.duration, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
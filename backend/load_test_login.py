@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Login Load Test for JobTrackerDB
+
+Fires concurrent POST /api/v1/auth/login requests against a running backend
+and reports logins per second and latency percentiles.
+
+Start the backend with RATE_LIMIT_ENABLED=false, otherwise the per-IP login
+limit rejects most of the load with 429.
+
+Usage:
+    python load_test_login.py --email test@example.com --password secret
+    python load_test_login.py --url http://localhost:8000 --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(round(pct / 100 * len(values))) - 1))
+    return values[index]
+
+
+async def run_load_test(url: str, email: str, password: str, total: int, concurrency: int):
+    latencies = []
+    statuses = Counter()
+    remaining = iter(range(total))
+
+    async with httpx.AsyncClient(base_url=url, timeout=30.0) as client:
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/v1/auth/login",
+                        json={"email": email, "password": password}
+                    )
+                    statuses[response.status_code] += 1
+                except httpx.HTTPError as e:
+                    statuses[type(e).__name__] += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    successes = statuses.get(200, 0)
+
+    print("=" * 60)
+    print(f"🔐 Login load test: {total} requests, concurrency {concurrency}")
+    print("=" * 60)
+    print(f"Elapsed:          {elapsed:.2f}s")
+    print(f"Requests/sec:     {total / elapsed:.1f}")
+    print(f"Logins/sec:       {successes / elapsed:.1f}")
+    print(f"Status codes:     {dict(statuses)}")
+    print(f"Latency mean:     {statistics.mean(latencies):.1f}ms")
+    print(f"Latency p50:      {percentile(latencies, 50):.1f}ms")
+    print(f"Latency p95:      {percentile(latencies, 95):.1f}ms")
+    print(f"Latency p99:      {percentile(latencies, 99):.1f}ms")
+    print(f"Latency max:      {latencies[-1]:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the login endpoint")
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend base URL")
+    parser.add_argument("--email", required=True, help="Email of an existing test user")
+    parser.add_argument("--password", required=True, help="Password of the test user")
+    parser.add_argument("--requests", type=int, default=500, help="Total login requests")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients")
+    args = parser.parse_args()
+
+    asyncio.run(run_load_test(args.url, args.email, args.password, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
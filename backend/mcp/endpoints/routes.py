@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Security, Request, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from mcp.db.session import get_db
 from app.models import User, Profile, Role, UserPasswordResetToken
@@ -6,12 +7,13 @@ from pydantic import BaseModel, EmailStr, Field
 from typing import List, Optional
 from fastapi.security import APIKeyHeader
 import logging
-from app.services.auth_logging import log_auth_attempt_sp
-import hashlib
-import secrets
+from app.services.auth_logging import record_auth_attempt
 from datetime import datetime, timedelta
 import os
 from app.services.email_utils import send_reset_email
+from app.services.password_hashing import get_password_hasher, hash_password
+from app.services.last_login_writer import get_last_login_writer
+import time
 
 # Placeholder for actual provider validation and DB logic
 
@@ -74,12 +76,6 @@ class LoginResponse(BaseModel):
 class ForgotPasswordRequest(BaseModel):
     email: EmailStr
 
-def hash_password(password: str) -> str:
-    """Hash a password using SHA-256 with salt"""
-    salt = secrets.token_hex(16)
-    hash_obj = hashlib.sha256((password + salt).encode())
-    return f"{salt}${hash_obj.hexdigest()}"
-
 @router.post(
     "/users",
     response_model=UserOut,
@@ -154,6 +150,29 @@ def create_user(
         logging.error(f"Full traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail="Registration failed. Please try again or use another method.")
 
+def _load_login_row(db: Session, email: str):
+    """Single indexed lookup for credentials and display name"""
+    return (
+        db.query(
+            User.UserID,
+            User.Username,
+            User.EmailAddress,
+            User.HashedPassword,
+            Profile.FirstName,
+            Profile.LastName,
+        )
+        .outerjoin(Profile, Profile.ProfileID == User.ProfileID)
+        .filter(User.EmailAddress == email)
+        .first()
+    )
+
+def _store_rehash(db: Session, user_id: int, upgraded_hash: str):
+    """Replace a legacy or under-cost password hash"""
+    db.query(User).filter(User.UserID == user_id).update(
+        {User.HashedPassword: upgraded_hash}, synchronize_session=False
+    )
+    db.commit()
+
 @router.post(
     "/auth/login",
     response_model=LoginResponse,
@@ -167,95 +186,63 @@ Authenticate a user with email and password.
 - Logs authentication attempt
 """,
 )
-def login_user(
+async def login_user(
     login_data: LoginRequest,
     db: Session = Depends(get_db)
 ):
-    logging.info("=" * 60)
-    logging.info("🔐 LOGIN ATTEMPT STARTED")
-    logging.info("=" * 60)
-    logging.info(f"📧 Email provided: {login_data.email}")
-    logging.info(f"🔑 Password provided: {login_data.password}")
-    
-    # Find user by email
-    user = db.query(User).filter(User.EmailAddress == login_data.email).first()
-    if not user:
-        logging.error(f"❌ Login failed: Email not found - {login_data.email}")
-        logging.info("=" * 60)
-        raise HTTPException(status_code=401, detail="Invalid email or password")
-    
-    logging.info(f"✅ User found in database:")
-    logging.info(f"   User ID: {user.UserID}")
-    logging.info(f"   Username: {user.Username}")
-    logging.info(f"   Email: {user.EmailAddress}")
-    logging.info(f"   Stored hashed password: {user.HashedPassword}")
-    logging.info(f"   Profile ID: {user.ProfileID}")
-    logging.info(f"   Role ID: {user.RoleID}")
-    
-    # Verify password
+    hasher = get_password_hasher()
+    started = time.perf_counter()
+    outcome = "error"
+    user_id = None
+    rehashed = False
+
     try:
-        logging.info("🔍 PASSWORD VERIFICATION STARTED")
-        
-        # Extract salt and hash from stored password
-        stored_password = user.HashedPassword
-        logging.info(f"📦 Stored password format: {stored_password}")
-        
-        if not stored_password or '$' not in stored_password:
-            logging.error(f"❌ Login failed: Invalid password format for user {user.UserID}")
-            logging.error(f"   Stored password: '{stored_password}'")
-            logging.info("=" * 60)
+        # The session is synchronous, so keep its round trips off the event loop
+        row = await run_in_threadpool(_load_login_row, db, login_data.email)
+        if not row:
+            # Spend the same hashing cost so unknown emails are not distinguishable by timing
+            await hasher.burn_async(login_data.password)
+            outcome = "unknown_email"
             raise HTTPException(status_code=401, detail="Invalid email or password")
-        
-        salt, stored_hash = stored_password.split('$', 1)
-        logging.info(f"🧂 Extracted salt: {salt}")
-        logging.info(f"🔐 Stored hash: {stored_hash}")
-        
-        # Hash the provided password with the same salt
-        logging.info(f"🔄 Hashing provided password with salt...")
-        logging.info(f"   Password to hash: {login_data.password}")
-        logging.info(f"   Salt to use: {salt}")
-        
-        hash_obj = hashlib.sha256((login_data.password + salt).encode())
-        provided_hash = hash_obj.hexdigest()
-        logging.info(f"🔑 Generated hash: {provided_hash}")
-        
-        logging.info("🔍 COMPARING HASHES:")
-        logging.info(f"   Stored hash:    {stored_hash}")
-        logging.info(f"   Provided hash:  {provided_hash}")
-        logging.info(f"   Match: {stored_hash == provided_hash}")
-        
-        if provided_hash != stored_hash:
-            logging.error(f"❌ Login failed: Invalid password for user {user.UserID}")
-            logging.error(f"   Hash mismatch - stored: {stored_hash}, provided: {provided_hash}")
-            logging.info("=" * 60)
+
+        user_id = row.UserID
+
+        # Verify password off the event loop
+        valid, upgraded_hash = await hasher.verify_async(login_data.password, row.HashedPassword)
+        if not valid:
+            outcome = "invalid_password"
             raise HTTPException(status_code=401, detail="Invalid email or password")
-        
-        logging.info("✅ PASSWORD VERIFICATION SUCCESSFUL")
-        
-        # Get user profile for name
-        profile = db.query(Profile).filter(Profile.ProfileID == user.ProfileID).first()
-        user_name = f"{profile.FirstName} {profile.LastName}".strip() if profile else user.Username
-        logging.info(f"👤 User name: {user_name}")
-        
-        # Update last login time
-        user.LastLogin = datetime.utcnow()
-        db.commit()
-        
-        logging.info(f"🎉 LOGIN SUCCESSFUL for user {user.UserID}")
-        logging.info("=" * 60)
-        
+
+        # Replace legacy or under-cost hashes now that we know the plaintext
+        if upgraded_hash:
+            await run_in_threadpool(_store_rehash, db, row.UserID, upgraded_hash)
+            rehashed = True
+
+        full_name = f"{row.FirstName or ''} {row.LastName or ''}".strip()
+        user_name = full_name or row.Username
+
+        # LastLogin is written in batches by the background writer
+        get_last_login_writer().record(row.UserID)
+        outcome = "success"
+
         return LoginResponse(
             message="Login successful",
-            user_id=user.UserID,
+            user_id=row.UserID,
             name=user_name,
-            email=user.EmailAddress
+            email=row.EmailAddress
         )
-        
+
     except HTTPException:
         raise
     except Exception as e:
         logging.error(f"Login error: {str(e)}")
         raise HTTPException(status_code=500, detail="Login failed. Please try again.")
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        logging.info(
+            f"🔐 login outcome={outcome} user_id={user_id} rehashed={rehashed} "
+            f"scheme={hasher.hasher.scheme} duration_ms={duration_ms:.1f}"
+        )
 
 @router.get(
     "/users",
@@ -293,7 +280,7 @@ def social_login(provider: str, request: Request, db: Session = Depends(get_db))
         token = data.get("token")
         ip_address = request.client.host if request.client else None
         if not token:
-            log_auth_attempt_sp(db, provider, False, "Missing token", None, ip_address)
+            record_auth_attempt(provider, False, "Missing token", None, ip_address)
             raise HTTPException(status_code=400, detail="Login failed. Please try again or use another method.")
 
         # Validate token with provider (pseudo-code, replace with real validation)
@@ -311,20 +298,20 @@ def social_login(provider: str, request: Request, db: Session = Depends(get_db))
             # user_info = validate_apple_token(token)
             pass
         else:
-            log_auth_attempt_sp(db, provider, False, "Unknown provider", None, ip_address)
+            record_auth_attempt(provider, False, "Unknown provider", None, ip_address)
             raise HTTPException(status_code=400, detail="Login failed. Please try again or use another method.")
 
         if not user_info:
-            log_auth_attempt_sp(db, provider, False, "Token validation failed", None, ip_address)
+            record_auth_attempt(provider, False, "Token validation failed", None, ip_address)
             raise HTTPException(status_code=401, detail="Login failed. Please try again or use another method.")
 
         # Call stored procedure to create/update user and manage session (pseudo-code)
         user_id = None  # Replace with actual DB call
-        log_auth_attempt_sp(db, provider, True, None, user_id, ip_address)
+        record_auth_attempt(provider, True, None, user_id, ip_address)
         return {"message": "Login successful", "user_id": user_id}
 
     except Exception as e:
-        log_auth_attempt_sp(db, provider, False, str(e), None, None)
+        record_auth_attempt(provider, False, str(e), None, None)
         raise HTTPException(status_code=400, detail="Login failed. Please try again or use another method.")
 
 @router.post("/auth/forgot-password")
@@ -370,7 +357,7 @@ def reset_password(token: str, password: str, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.UserID == reset_token.user_id).first()
     if not user:
         raise HTTPException(status_code=400, detail="User not found")
-    # Hash new password (reuse your hash_password function)
+    # Hash new password with the current hasher
     user.HashedPassword = hash_password(password)
     db.delete(reset_token)
     db.commit()
@@ -8,9 +8,14 @@ import asyncio
 import json
 import logging
 import os
+import re
 import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
@@ -32,6 +37,280 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SHOWPLAN_NAMESPACE = "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+# Plan operators that read rows from a table or index
+ROW_SOURCE_OPERATORS = {
+    "Table Scan", "Index Scan", "Clustered Index Scan", "Index Seek", "Clustered Index Seek",
+    "RID Lookup", "Key Lookup", "Columnstore Index Scan",
+}
+
+def rows_read_from_showplan(plan_xml: Optional[str]) -> Optional[int]:
+    """Total rows read by the table and index access operators of an actual showplan.
+
+    Uses ``ActualRowsRead`` where SQL Server reports it (rows read before the
+    operator's residual predicate) and ``ActualRows`` otherwise. Returns None
+    when the plan is missing or has no runtime counters.
+    """
+    if not plan_xml:
+        return None
+    total = None
+    for rel_op in ET.fromstring(plan_xml).iter(f"{SHOWPLAN_NAMESPACE}RelOp"):
+        if rel_op.get("PhysicalOp") not in ROW_SOURCE_OPERATORS:
+            continue
+        runtime = rel_op.find(f"{SHOWPLAN_NAMESPACE}RunTimeInformation")
+        if runtime is None:
+            continue
+        for counters in runtime.findall(f"{SHOWPLAN_NAMESPACE}RunTimeCountersPerThread"):
+            rows = counters.get("ActualRowsRead", counters.get("ActualRows"))
+            if rows is not None:
+                total = (total or 0) + int(rows)
+    return total
+
+class SlowQueryLog:
+    """Rolling in-memory log of the slowest queries executed through the MCP server.
+
+    Entries are aggregated per query text so a tooling query that runs often
+    shows up once with its call count, worst and average execution time.
+    Only the ``capacity`` slowest distinct queries are retained.
+    """
+
+    def __init__(self, capacity: int = 20):
+        self.capacity = capacity
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, query: str, duration_ms: float, row_count: Optional[int] = None):
+        """Record one execution of ``query``."""
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                if len(self._entries) >= self.capacity:
+                    # Evict the fastest tracked query, but only if this one is slower
+                    fastest = min(self._entries.values(), key=lambda e: e["max_ms"])
+                    if fastest["max_ms"] >= duration_ms:
+                        return
+                    del self._entries[fastest["query"]]
+                entry = {
+                    "query": query,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "last_ms": 0.0,
+                    "last_row_count": None,
+                    "last_executed": None,
+                }
+                self._entries[query] = entry
+
+            entry["calls"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["last_ms"] = duration_ms
+            entry["last_row_count"] = row_count
+            entry["last_executed"] = datetime.utcnow().isoformat()
+
+    def top(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the slowest queries, worst first."""
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e["max_ms"], reverse=True)
+            return [
+                {
+                    **entry,
+                    "max_ms": round(entry["max_ms"], 3),
+                    "last_ms": round(entry["last_ms"], 3),
+                    "avg_ms": round(entry["total_ms"] / entry["calls"], 3),
+                    "total_ms": round(entry["total_ms"], 3),
+                }
+                for entry in entries[:limit]
+            ]
+
+    def clear(self):
+        """Forget all recorded queries."""
+        with self._lock:
+            self._entries.clear()
+
+# Tokenizer used to find literals that can safely be turned into bind parameters
+_SQL_TOKEN_RE = re.compile(r"""
+    (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<string>[Nn]?'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")*"|\[[^\]]*\])
+  | (?P<param>(?<!:):[A-Za-z_]\w*)
+  | (?P<hex>0[xX][0-9A-Fa-f]*)
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_@#][\w@#$]*)
+  | (?P<space>\s+)
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+
+# Statements whose literals may be parameterized (DDL is left untouched)
+_PARAMETERIZABLE_STATEMENTS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+# Type names whose length/precision arguments must stay literal, e.g. VARCHAR(50)
+_SQL_TYPE_NAMES = {
+    "VARCHAR", "NVARCHAR", "CHAR", "NCHAR", "VARBINARY", "BINARY", "DECIMAL",
+    "NUMERIC", "FLOAT", "DATETIME2", "DATETIMEOFFSET", "TIME",
+}
+
+# Keywords that end an ORDER BY / GROUP BY clause
+_CLAUSE_KEYWORDS = {
+    "SELECT", "FROM", "WHERE", "HAVING", "UNION", "EXCEPT", "INTERSECT",
+    "LIMIT", "OFFSET", "FETCH", "FOR", "OPTION", "INTO", "VALUES", "SET",
+}
+
+class StatementCache:
+    """Normalized statement cache for ad-hoc SQL.
+
+    Literals in DML statements are rewritten into bind parameters so that
+    queries differing only in their constants share one statement text. The
+    database can then reuse a single cached plan, and the compiled ``text()``
+    construct is reused in Python instead of being re-parsed on every call.
+    """
+
+    PARAM_PREFIX = "mcp_lit_"
+
+    def __init__(self, capacity: int = 256, parameterize_literals: bool = True):
+        self.capacity = capacity
+        self.parameterize_literals = parameterize_literals
+        self._normalized: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._statements: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def normalize(self, query: str) -> Tuple[str, Dict[str, Any]]:
+        """Rewrite literals into bind parameters.
+
+        Returns the normalized SQL and the extracted literal values. Queries
+        that are not DML, or whose literals cannot be rewritten safely, are
+        returned unchanged with no extracted values. That includes any
+        statement with GROUP BY: SQL Server matches grouped expressions such
+        as ``SUBSTRING(a, 1, 3)`` textually, and parameterized copies no
+        longer match. Query hints in an OPTION clause must be literals and
+        are left alone.
+        """
+        if not self.parameterize_literals:
+            return query, {}
+        
+        tokens = [(match.lastgroup, match.group()) for match in _SQL_TOKEN_RE.finditer(query)]
+        first_word = next((value.upper() for kind, value in tokens if kind == "word"), None)
+        if first_word not in _PARAMETERIZABLE_STATEMENTS:
+            return query, {}
+        if any(kind == "param" and value[1:].startswith(self.PARAM_PREFIX) for kind, value in tokens):
+            return query, {}
+        words = [value.upper() for kind, value in tokens if kind == "word"]
+        if any(word == "GROUP" and following == "BY" for word, following in zip(words, words[1:])):
+            return query, {}
+        
+        parts: List[str] = []
+        literals: Dict[str, Any] = {}
+        names_by_literal: Dict[Tuple[str, str], str] = {}
+        paren_openers: List[Optional[str]] = []
+        previous = None  # Last significant token (upper-cased)
+        in_ordinal_clause = False
+        in_option_clause = False
+        
+        for kind, value in tokens:
+            if kind in ("space", "comment"):
+                parts.append(value)
+                continue
+            
+            upper = value.upper()
+            replaceable = False
+            
+            if in_option_clause:
+                pass
+            elif kind == "string":
+                replaceable = True
+                literal = value[value.index("'") + 1:-1].replace("''", "'")
+            elif kind == "number":
+                inside_type = bool(paren_openers) and paren_openers[-1] in _SQL_TYPE_NAMES
+                ordinal = in_ordinal_clause and previous in ("BY", ",")
+                replaceable = previous != "TOP" and not inside_type and not ordinal
+                if replaceable:
+                    literal = float(value) if any(c in value for c in ".eE") else int(value)
+            
+            if replaceable:
+                key = (kind, value)
+                name = names_by_literal.get(key)
+                if name is None:
+                    name = f"{self.PARAM_PREFIX}{len(literals)}"
+                    names_by_literal[key] = name
+                    literals[name] = literal
+                parts.append(f":{name}")
+            else:
+                parts.append(value)
+            
+            if value == "(":
+                paren_openers.append(previous)
+            elif value == ")" and paren_openers:
+                paren_openers.pop()
+            elif kind == "word":
+                if upper == "BY" and previous in ("ORDER", "GROUP"):
+                    in_ordinal_clause = True
+                elif upper in _CLAUSE_KEYWORDS:
+                    in_ordinal_clause = False
+                    in_option_clause = upper == "OPTION"
+            
+            previous = upper
+        
+        return "".join(parts), literals
+
+    def prepare(self, query: str, params: Optional[Dict] = None) -> Tuple[Any, Dict[str, Any], str, bool]:
+        """Get a reusable statement for ``query``.
+
+        Returns ``(statement, bind_params, normalized_sql, cache_hit)``.
+        """
+        with self._lock:
+            normalized = self._normalized.get(query)
+            if normalized is not None:
+                self._normalized.move_to_end(query)
+        
+        if normalized is None:
+            normalized = self.normalize(query)
+            with self._lock:
+                self._normalized[query] = normalized
+                if len(self._normalized) > self.capacity:
+                    self._normalized.popitem(last=False)
+        
+        normalized_sql, literals = normalized
+        
+        with self._lock:
+            statement = self._statements.get(normalized_sql)
+            cache_hit = statement is not None
+            if cache_hit:
+                self._statements.move_to_end(normalized_sql)
+                self.hits += 1
+            else:
+                self.misses += 1
+                statement = text(normalized_sql)
+                self._statements[normalized_sql] = statement
+                if len(self._statements) > self.capacity:
+                    self._statements.popitem(last=False)
+                    self.evictions += 1
+        
+        return statement, {**(params or {}), **literals}, normalized_sql, cache_hit
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._statements),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "parameterize_literals": self.parameterize_literals,
+            }
+
+    def clear(self):
+        """Drop all cached statements and reset the counters."""
+        with self._lock:
+            self._normalized.clear()
+            self._statements.clear()
+            self.hits = self.misses = self.evictions = 0
+
 class MCPServer:
     """MCP Server for database operations and connectivity"""
     
@@ -44,6 +323,11 @@ class MCPServer:
         
         self.engine = create_engine(self.database_url, echo=False)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.slow_queries = SlowQueryLog(capacity=int(os.getenv("MCP_SLOW_QUERY_LOG_SIZE", "20")))
+        self.statement_cache = StatementCache(
+            capacity=int(os.getenv("MCP_STATEMENT_CACHE_SIZE", "256")),
+            parameterize_literals=os.getenv("MCP_PARAMETERIZE_LITERALS", "true").lower() == "true"
+        )
         
         logger.info("🚀 MCP Server initialized")
         logger.info(f"📊 Database URL: {self.database_url}")
@@ -69,35 +353,139 @@ class MCPServer:
         
         return log_entry
     
-    async def execute_query(self, query: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Execute a SQL query and return results"""
+    def _capture_plan(self, session, statement, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Capture the execution plan for a query without returning its rows.
+
+        SQL Server returns the estimated showplan XML (the statement is not
+        executed while SHOWPLAN_XML is on). SQLite, used by the test suite,
+        returns the rows of ``EXPLAIN QUERY PLAN``.
+        """
+        dialect = self.engine.dialect.name
+        
+        if dialect == "mssql":
+            session.execute(text("SET SHOWPLAN_XML ON"))
+            try:
+                row = session.execute(statement, params).fetchone()
+                return {"format": "showplan_xml", "plan": row[0] if row else None}
+            finally:
+                session.execute(text("SET SHOWPLAN_XML OFF"))
+        
+        if dialect == "sqlite":
+            rows = session.execute(text(f"EXPLAIN QUERY PLAN {statement.text}"), params).fetchall()
+            return {"format": "sqlite_query_plan", "plan": [dict(row._mapping) for row in rows]}
+        
+        return {
+            "format": None,
+            "plan": None,
+            "error": f"Query plans are not supported for the {dialect} dialect"
+        }
+    
+    def _execute_with_statistics(self, session, statement, params: Dict[str, Any]):
+        """Execute a statement on SQL Server with STATISTICS XML on.
+
+        The actual plan arrives as an extra result set after the statement's
+        own results. SQLAlchemy closes the cursor before that set can be read,
+        so the statement runs on the DBAPI cursor of the session's connection.
+
+        Returns:
+            (columns, rows, affected rows, actual showplan XML); columns and
+            rows are None when the statement returns no result set
+        """
+        compiled = statement.compile(dialect=self.engine.dialect, compile_kwargs={"render_postcompile": True})
+        args = [compiled.params[name] for name in compiled.positiontup or ()]
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute("SET STATISTICS XML ON")
+            cursor.execute(str(compiled), args)
+            columns = rows = None
+            if cursor.description is not None:
+                columns = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+            affected = cursor.rowcount
+            plan_xml = None
+            while cursor.nextset():
+                if cursor.description is not None:
+                    row = cursor.fetchone()
+                    if row and str(row[0]).lstrip().startswith("<ShowPlanXML"):
+                        plan_xml = row[0]
+            return columns, rows, affected, plan_xml
+        finally:
+            cursor.execute("SET STATISTICS XML OFF")
+            cursor.close()
+    
+    async def execute_query(
+        self,
+        query: str,
+        params: Optional[Dict] = None,
+        explain: bool = False,
+        profile: bool = False
+    ) -> Dict[str, Any]:
+        """Execute a SQL query and return results.
+
+        Literals are parameterized and the statement is reused through the
+        statement cache. Every execution is timed and fed to the slow query
+        log. ``explain`` adds the query plan to the response and ``profile``
+        adds the execution time, ``row_count`` (rows returned, or affected for
+        DML) and ``rows_read``. Rows read come from the actual plan on SQL
+        Server; other dialects do not report them and return None.
+        """
         operation = "execute_query"
         details = {"query": query, "params": params}
         
         try:
+            statement, bind_params, normalized_sql, cache_hit = self.statement_cache.prepare(query, params)
+            
             with self.get_db_session() as session:
-                result = session.execute(text(query), params or {})
+                plan = self._capture_plan(session, statement, bind_params) if explain else None
+                
+                started = time.perf_counter()
+                actual_plan = None
+                if profile and self.engine.dialect.name == "mssql":
+                    columns, rows, affected, actual_plan = self._execute_with_statistics(
+                        session, statement, bind_params
+                    )
+                else:
+                    result = session.execute(statement, bind_params)
+                    columns = rows = affected = None
+                    if query.strip().upper().startswith('SELECT'):
+                        rows = result.fetchall()
+                        columns = result.keys()
+                    else:
+                        affected = result.rowcount
                 
-                if query.strip().upper().startswith('SELECT'):
-                    # For SELECT queries, fetch results
-                    rows = result.fetchall()
-                    columns = result.keys()
+                if rows is not None:
+                    # For SELECT queries, return the fetched results
                     data = [dict(zip(columns, row)) for row in rows]
+                    row_count = len(data)
                     
                     response = {
                         "success": True,
                         "data": data,
-                        "row_count": len(data)
+                        "row_count": row_count
                     }
                 else:
                     # For INSERT/UPDATE/DELETE queries
                     session.commit()
+                    row_count = affected
                     response = {
                         "success": True,
-                        "affected_rows": result.rowcount
+                        "affected_rows": row_count
                     }
                 
-                self.log_operation(operation, details, True)
+                duration_ms = (time.perf_counter() - started) * 1000
+                self.slow_queries.record(normalized_sql, duration_ms, row_count)
+                
+                if profile:
+                    response["profile"] = {
+                        "execution_time_ms": round(duration_ms, 3),
+                        "row_count": row_count,
+                        "rows_read": rows_read_from_showplan(actual_plan),
+                        "statement_cache_hit": cache_hit
+                    }
+                if explain:
+                    response["plan"] = plan
+                
+                self.log_operation(operation, {**details, "duration_ms": round(duration_ms, 3)}, True)
                 return response
                 
         except SQLAlchemyError as e:
@@ -359,4 +747,4 @@ class MCPServer:
 mcp_server = MCPServer()
 
 # Export the server instance for use in other modules
-__all__ = ['mcp_server', 'MCPServer'] 
\ No newline at end of file
+__all__ = ['mcp_server', 'MCPServer', 'SlowQueryLog', 'StatementCache'] 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Add covering index for login lookup
+
+Revision ID: 3f1c2a9b7d40
+Revises: ecd60298de63
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9b7d40'
+down_revision: Union[str, None] = 'ecd60298de63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'IX_User_EmailAddress_Login',
+        'User',
+        ['EmailAddress'],
+        unique=False,
+        mssql_include=['UserID', 'Username', 'HashedPassword', 'ProfileID'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('IX_User_EmailAddress_Login', table_name='User')
@@ -0,0 +1,69 @@
+"""Add skill dictionary
+
+Revision ID: 5c7d2e9a4b18
+Revises: 8a4d6e2f1b93
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c7d2e9a4b18'
+down_revision: Union[str, None] = '8a4d6e2f1b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SKILL_TABLES = ('Skills', 'JobBoardJobSkill', 'UserSkillGapResolution')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'SkillDictionary',
+        sa.Column('SkillDictionaryID', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('CanonicalName', sa.Unicode(length=255), nullable=False),
+        sa.Column('Category', sa.Unicode(length=100), nullable=True),
+        sa.Column('IsCurated', sa.Boolean(), nullable=False),
+        sa.Column('createdDate', sa.DateTime(), nullable=True),
+        sa.Column('createdBy', sa.Unicode(length=100), nullable=True),
+        sa.Column('lastUpdated', sa.DateTime(), nullable=True),
+        sa.Column('updatedBy', sa.Unicode(length=100), nullable=True),
+        sa.PrimaryKeyConstraint('SkillDictionaryID'),
+        sa.UniqueConstraint('CanonicalName')
+    )
+    op.create_table(
+        'SkillDictionaryAlias',
+        sa.Column('SkillDictionaryAliasID', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('SkillDictionaryID', sa.Integer(), nullable=False),
+        sa.Column('Alias', sa.Unicode(length=255), nullable=False),
+        sa.Column('NormalizedAlias', sa.Unicode(length=255), nullable=False),
+        sa.Column('createdDate', sa.DateTime(), nullable=True),
+        sa.Column('createdBy', sa.Unicode(length=100), nullable=True),
+        sa.ForeignKeyConstraint(['SkillDictionaryID'], ['SkillDictionary.SkillDictionaryID']),
+        sa.PrimaryKeyConstraint('SkillDictionaryAliasID'),
+        sa.UniqueConstraint('NormalizedAlias')
+    )
+    op.create_index(
+        op.f('ix_SkillDictionaryAlias_SkillDictionaryID'), 'SkillDictionaryAlias', ['SkillDictionaryID'], unique=False
+    )
+
+    for table in SKILL_TABLES:
+        op.add_column(table, sa.Column('SkillDictionaryID', sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            f'FK_{table}_SkillDictionary', table, 'SkillDictionary', ['SkillDictionaryID'], ['SkillDictionaryID']
+        )
+        op.create_index(op.f(f'ix_{table}_SkillDictionaryID'), table, ['SkillDictionaryID'], unique=False)
+
+
+def downgrade() -> None:
+    for table in SKILL_TABLES:
+        op.drop_index(op.f(f'ix_{table}_SkillDictionaryID'), table_name=table)
+        op.drop_constraint(f'FK_{table}_SkillDictionary', table, type_='foreignkey')
+        op.drop_column(table, 'SkillDictionaryID')
+
+    op.drop_index(op.f('ix_SkillDictionaryAlias_SkillDictionaryID'), table_name='SkillDictionaryAlias')
+    op.drop_table('SkillDictionaryAlias')
+    op.drop_table('SkillDictionary')
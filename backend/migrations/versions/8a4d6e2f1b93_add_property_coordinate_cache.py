@@ -0,0 +1,44 @@
+"""Add property coordinate cache
+
+Revision ID: 8a4d6e2f1b93
+Revises: 3f1c2a9b7d40
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4d6e2f1b93'
+down_revision: Union[str, None] = '3f1c2a9b7d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'PropertyCoordinateCache',
+        sa.Column('PropertyID', sa.Unicode(length=100), nullable=False),
+        sa.Column('Latitude', sa.DECIMAL(precision=18, scale=15), nullable=False),
+        sa.Column('Longitude', sa.DECIMAL(precision=18, scale=15), nullable=False),
+        sa.Column('StandardizedAddress', sa.UnicodeText(), nullable=True),
+        sa.Column('ConfidenceScore', sa.DECIMAL(precision=3, scale=2), nullable=True),
+        sa.Column('Source', sa.Unicode(length=50), nullable=False),
+        sa.Column('FetchedDate', sa.DateTime(), nullable=False),
+        sa.Column('ExpiresDate', sa.DateTime(), nullable=False),
+        sa.Column('HitCount', sa.Integer(), nullable=False),
+        sa.Column('createdDate', sa.DateTime(), nullable=True),
+        sa.Column('lastUpdated', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('PropertyID')
+    )
+    op.create_index(
+        op.f('ix_PropertyCoordinateCache_ExpiresDate'), 'PropertyCoordinateCache', ['ExpiresDate'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_PropertyCoordinateCache_ExpiresDate'), table_name='PropertyCoordinateCache')
+    op.drop_table('PropertyCoordinateCache')
@@ -0,0 +1,31 @@
+"""Add notification email pending index
+
+Revision ID: a9c4e7b2d185
+Revises: f1c6a8e2d357
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e7b2d185'
+down_revision: Union[str, None] = 'f1c6a8e2d357'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'IX_UserNotification_EmailPending',
+        'UserNotification',
+        ['IsEmailSent', 'UserID', 'UserNotificationID'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('IX_UserNotification_EmailPending', table_name='UserNotification')
@@ -0,0 +1,30 @@
+"""Add job content fingerprint
+
+Revision ID: b2e8f4a61c07
+Revises: 5c7d2e9a4b18
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e8f4a61c07'
+down_revision: Union[str, None] = '5c7d2e9a4b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('JobBoardJob', sa.Column('ContentFingerprint', sa.BigInteger(), nullable=True))
+    op.add_column('JobBoardJob', sa.Column('ContentHash', sa.Unicode(length=40), nullable=True))
+    op.add_column('JobBoardJob', sa.Column('LastSeenDate', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('JobBoardJob', 'LastSeenDate')
+    op.drop_column('JobBoardJob', 'ContentHash')
+    op.drop_column('JobBoardJob', 'ContentFingerprint')
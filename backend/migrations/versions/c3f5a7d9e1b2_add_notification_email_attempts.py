@@ -0,0 +1,26 @@
+"""Add notification email attempts
+
+Revision ID: c3f5a7d9e1b2
+Revises: a9c4e7b2d185
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a7d9e1b2'
+down_revision: Union[str, None] = 'a9c4e7b2d185'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('UserNotification', sa.Column('EmailAttempts', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('UserNotification', 'EmailAttempts')
@@ -0,0 +1,71 @@
+"""Add search full-text indexes
+
+Revision ID: d7a3c9e15f42
+Revises: b2e8f4a61c07
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c9e15f42'
+down_revision: Union[str, None] = 'b2e8f4a61c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> full-text columns; SQL Server only. Other databases use the
+# embedded search index (app/services/search_index.py).
+FULLTEXT_COLUMNS = {
+    'JobBoardJob': 'JobTitle, CompanyName, JobDescription',
+    'JobApplication': 'JobTitle, CompanyName, Location',
+    'JobApplicationNote': 'NoteText',
+}
+
+
+def _fulltext_installed(bind) -> bool:
+    return bind.dialect.name == 'mssql' and bool(
+        bind.execute(sa.text("SELECT FULLTEXTSERVICEPROPERTY('IsFullTextInstalled')")).scalar()
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _fulltext_installed(bind):
+        return
+    # Full-text DDL cannot run inside a user transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = 'JobTrackerSearch') "
+            "CREATE FULLTEXT CATALOG JobTrackerSearch"
+        )
+        for table, columns in FULLTEXT_COLUMNS.items():
+            # KEY INDEX needs the primary key constraint name, which was generated
+            op.execute(
+                f"IF NOT EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('{table}')) "
+                f"BEGIN "
+                f"DECLARE @pk sysname = (SELECT name FROM sys.indexes "
+                f"WHERE object_id = OBJECT_ID('{table}') AND is_primary_key = 1); "
+                f"EXEC('CREATE FULLTEXT INDEX ON [{table}] ({columns}) KEY INDEX [' + @pk + '] "
+                f"ON JobTrackerSearch WITH CHANGE_TRACKING AUTO') "
+                f"END"
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not _fulltext_installed(bind):
+        return
+    with op.get_context().autocommit_block():
+        for table in FULLTEXT_COLUMNS:
+            op.execute(
+                f"IF EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('{table}')) "
+                f"DROP FULLTEXT INDEX ON [{table}]"
+            )
+        op.execute(
+            "IF EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = 'JobTrackerSearch') "
+            "DROP FULLTEXT CATALOG JobTrackerSearch"
+        )
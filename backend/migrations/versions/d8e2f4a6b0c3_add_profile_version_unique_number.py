@@ -0,0 +1,49 @@
+"""Add profile version unique number
+
+Revision ID: d8e2f4a6b0c3
+Revises: c3f5a7d9e1b2
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e2f4a6b0c3'
+down_revision: Union[str, None] = 'c3f5a7d9e1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Renumber versions duplicated by concurrent saves so the constraint can be created;
+    # fit scores reference ProfileVersionID, so only the display number changes
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT ProfileVersionID, ProfileID, VersionNumber FROM ProfileVersion "
+        "ORDER BY ProfileID, VersionNumber, ProfileVersionID"
+    )).all()
+    highest = {}
+    seen = set()
+    renumber = []
+    for version_id, profile_id, number in rows:
+        highest[profile_id] = max(highest.get(profile_id, 0), number)
+    for version_id, profile_id, number in rows:
+        if (profile_id, number) in seen:
+            highest[profile_id] += 1
+            renumber.append({"id": version_id, "number": highest[profile_id]})
+        else:
+            seen.add((profile_id, number))
+    if renumber:
+        bind.execute(sa.text("UPDATE ProfileVersion SET VersionNumber = :number WHERE ProfileVersionID = :id"), renumber)
+
+    op.create_unique_constraint(
+        'UQ_ProfileVersion_ProfileID_VersionNumber', 'ProfileVersion', ['ProfileID', 'VersionNumber']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('UQ_ProfileVersion_ProfileID_VersionNumber', 'ProfileVersion', type_='unique')
@@ -0,0 +1,39 @@
+"""Add application pipeline indexes
+
+Revision ID: e4b8d2a6c913
+Revises: d7a3c9e15f42
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8d2a6c913'
+down_revision: Union[str, None] = 'd7a3c9e15f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'IX_JobApplication_Profile_DateApplied',
+        'JobApplication',
+        ['ProfileID', 'DateApplied', 'JobApplicationID'],
+        unique=False,
+    )
+    op.create_index(
+        'IX_JobApplicationStatusHistory_Latest',
+        'JobApplicationStatusHistory',
+        ['JobApplicationID', 'StatusDate', 'StatusHistoryID'],
+        unique=False,
+        mssql_include=['Status'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('IX_JobApplicationStatusHistory_Latest', table_name='JobApplicationStatusHistory')
+    op.drop_index('IX_JobApplication_Profile_DateApplied', table_name='JobApplication')
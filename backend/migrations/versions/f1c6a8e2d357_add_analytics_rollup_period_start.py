@@ -0,0 +1,35 @@
+"""Add analytics rollup period start
+
+Revision ID: f1c6a8e2d357
+Revises: e4b8d2a6c913
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6a8e2d357'
+down_revision: Union[str, None] = 'e4b8d2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('UserJobBoardJobSearchAnalytics', sa.Column('PeriodStart', sa.DateTime(), nullable=True))
+    op.create_index(
+        'IX_UserJobBoardJobSearchAnalytics_Period',
+        'UserJobBoardJobSearchAnalytics',
+        ['UserID', 'Period', 'PeriodStart'],
+        unique=False,
+    )
+    op.create_index(op.f('ix_UserAnalytics_UserID'), 'UserAnalytics', ['UserID'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_UserAnalytics_UserID'), table_name='UserAnalytics')
+    op.drop_index('IX_UserJobBoardJobSearchAnalytics_Period', table_name='UserJobBoardJobSearchAnalytics')
+    op.drop_column('UserJobBoardJobSearchAnalytics', 'PeriodStart')
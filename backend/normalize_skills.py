@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Skill Re-normalization for JobTrackerDB
+
+Links existing Skills, JobBoardJobSkill and UserSkillGapResolution rows to
+SkillDictionary entries, creating uncurated entries for skills the
+dictionary does not know yet. Safe to re-run: each batch is committed and
+by default only rows without a SkillDictionaryID are scanned.
+
+Usage:
+    python normalize_skills.py --seed
+    python normalize_skills.py --all --batch-size 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mcp.db.session import SessionLocal
+from app.services.skill_dictionary import (
+    get_skill_normalizer,
+    renormalize_skill_rows,
+    seed_skill_dictionary,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize skill names to the skill dictionary")
+    parser.add_argument("--seed", action="store_true", help="Add the curated seed skills and aliases first")
+    parser.add_argument("--all", action="store_true",
+                        help="Re-check rows that already have a SkillDictionaryID (e.g. after merging aliases)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per batch")
+    args = parser.parse_args()
+
+    print("🧠 Skill normalization")
+    db = SessionLocal()
+    try:
+        normalizer = get_skill_normalizer()
+        if args.seed:
+            added = seed_skill_dictionary(db, normalizer)
+            print(f"🌱 Seeded {added['skills']} skills and {added['aliases']} aliases")
+        else:
+            normalizer.load(db)
+
+        started = time.time()
+        results = renormalize_skill_rows(db, normalizer, batch_size=args.batch_size, only_missing=not args.all)
+        for table, counts in results.items():
+            print(f"   {table}: {counts['updated']} of {counts['scanned']} rows updated")
+        print(f"\n📊 {len(normalizer)} aliases known, finished in {time.time() - started:.1f}s")
+        print("✅ Skill normalization complete; fit scores pick up the new ids on the next recompute")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Skill normalization failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Analytics Rollup Rebuild for JobTrackerDB
+
+Rebuilds UserAnalytics and UserJobBoardJobSearchAnalytics with set-based
+SQL. The API keeps both tables current incrementally and runs a full
+rebuild daily; run this after bulk imports or to backfill.
+
+Usage:
+    python rebuild_analytics.py
+    python rebuild_analytics.py --user-id 12 --user-id 40
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mcp.db.session import SessionLocal
+from app.services.analytics_rollup import rebuild_analytics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild analytics rollups")
+    parser.add_argument("--user-id", type=int, action="append", help="Only rebuild this user (repeatable)")
+    args = parser.parse_args()
+
+    scope = f"{len(set(args.user_id))} users" if args.user_id else "all users"
+    print(f"📊 Rebuilding analytics rollups for {scope}")
+    db = SessionLocal()
+    started = time.time()
+    try:
+        counts = rebuild_analytics(db, args.user_id)
+    except Exception as e:
+        print(f"❌ Analytics rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"   UserAnalytics rows: {counts['user_analytics']}")
+    print(f"   UserJobBoardJobSearchAnalytics rows: {counts['search_analytics']}")
+    print(f"✅ Analytics rebuild complete in {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,21 +8,16 @@ Use this for development/testing purposes only.
 
 import os
 import sys
-import hashlib
-import secrets
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
+from app.services.password_hashing import hash_password
 
 # Load environment variables
 load_dotenv()
 
-def hash_password(password: str) -> str:
-    """Hash a password using SHA-256 with salt"""
-    salt = secrets.token_hex(16)
-    hash_obj = hashlib.sha256((password + salt).encode())
-    return f"{salt}${hash_obj.hexdigest()}"
-
 def reset_password(email: str, new_password: str):
     """Reset password for a user"""
     
@@ -0,0 +1,69 @@
+"""
+Tests for single-pass Geoscape suggestion standardization
+"""
+
+import json
+import os
+
+import pytest
+
+from app.services import address_validation_service
+from app.services.address_suggestions import AddressSuggestion, standardize_geoscape_suggestions
+from app.services.address_validation_service import AddressValidationService
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "geoscape", "predictive_address_50.json")
+
+
+def load_items():
+    with open(FIXTURE) as f:
+        return json.load(f)["suggest"]
+
+
+def test_suggestion_parsing():
+    suggestion = AddressSuggestion.from_geoscape({"address": "4 MILBURN CCT, BOOLAROO NSW 2284", "id": "GA1", "rank": 2})
+    assert (suggestion.street_number, suggestion.street_name, suggestion.street_type) == ("4", "MILBURN", "CCT")
+    assert (suggestion.suburb, suggestion.state, suggestion.postcode) == ("BOOLAROO", "NSW", "2284")
+    assert suggestion.confidence == pytest.approx(0.8)
+
+    multi_word = AddressSuggestion.from_geoscape({"address": "12 OLD SOUTH HEAD RD, FORTITUDE VALLEY QLD 4006"})
+    assert multi_word.street_name == "OLD SOUTH HEAD" and multi_word.suburb == "FORTITUDE VALLEY"
+
+    short = AddressSuggestion.from_geoscape({"address": "4 MILBURN, BOOLAROO NSW"})
+    assert (short.street_number, short.street_name, short.street_type) == ("4", "MILBURN", "")
+    assert (short.suburb, short.state, short.postcode) == ("BOOLAROO", "NSW", "")
+
+    unparsed = AddressSuggestion.from_geoscape({"address": "LOT 5 SOMEWHERE"})
+    assert unparsed.street_name == "" and unparsed.suburb == ""
+
+
+def test_fixture_maps_to_api_shape():
+    items = load_items()
+    suggestions = standardize_geoscape_suggestions(items, "AU")
+
+    assert len(suggestions) == len(items) == 50
+    first = suggestions[0]
+    assert set(first) == {"address", "id", "data", "confidence"}
+    assert list(first["data"]) == [
+        "streetNumber", "streetName", "streetType", "suburb", "state", "postcode",
+        "country", "latitude", "longitude", "propertyType", "landArea", "floorArea",
+    ]
+    assert all(s["data"]["country"] == "AU" and s["data"]["postcode"].isdigit() for s in suggestions)
+
+
+class FakeGeoscape:
+    async def search_addresses(self, query, limit=10, state=None):
+        return standardize_geoscape_suggestions(load_items()[:limit])
+
+
+@pytest.mark.asyncio
+async def test_service_does_not_restandardize_geoscape_results(monkeypatch):
+    monkeypatch.setattr(address_validation_service, "search_cache", address_validation_service.SearchResultCache(10, 60))
+    service = AddressValidationService()
+    service.providers = {"geoscape": FakeGeoscape()}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Geoscape suggestions standardized twice")
+
+    monkeypatch.setattr(service, "_standardize_suggestion", fail)
+    suggestions = await service.search_addresses("milburn", limit=5)
+    assert len(suggestions) == 5
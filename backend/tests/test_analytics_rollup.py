@@ -0,0 +1,134 @@
+"""
+Tests for the analytics rollups
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    JobApplication, JobApplicationInterview, JobApplicationStatusHistory, JobBoard, Profile, ProfileVersion, Resume,
+    ResumeResumeVersion, User, UserAnalytics, UserJobBoardJobFitScore, UserJobBoardJobSearchAnalytics,
+)
+from app.services.analytics_rollup import (
+    AnalyticsRollupWorker, get_user_analytics, install_analytics_hooks, period_start_of, rebuild_analytics,
+)
+
+# Wednesday 10 Sep 2026 and the following Monday
+WEDNESDAY = datetime(2026, 9, 9, 14, 30)
+NEXT_MONDAY = datetime(2026, 9, 14, 8, 0)
+
+
+@pytest.fixture
+def rollup_user(db_session):
+    profile = Profile(FirstName="Roll", LastName="Up", EmailAddress="roll@example.com")
+    db_session.add(profile)
+    db_session.flush()
+    user = User(Username="roll", EmailAddress="roll@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    version = ProfileVersion(ProfileID=profile.ProfileID, VersionNumber=1)
+    seek = JobBoard(BoardName="Seek")
+    db_session.add_all([user, version, seek])
+    db_session.flush()
+
+    applications = [
+        JobApplication(ProfileID=profile.ProfileID, JobTitle="A", CompanyName="Acme", DateApplied=WEDNESDAY, Source="seek"),
+        JobApplication(ProfileID=profile.ProfileID, JobTitle="B", CompanyName="Acme", DateApplied=WEDNESDAY,
+                       Source="LinkedIn", ApplicationStatus="Offer"),
+        JobApplication(ProfileID=profile.ProfileID, JobTitle="C", CompanyName="Acme", DateApplied=NEXT_MONDAY, Source="Seek"),
+        JobApplication(ProfileID=profile.ProfileID, JobTitle="D", CompanyName="Acme", DateApplied=datetime(2025, 12, 31)),
+    ]
+    db_session.add_all(applications)
+    db_session.flush()
+    db_session.add_all([
+        JobApplicationStatusHistory(JobApplicationID=applications[0].JobApplicationID, Status="Applied", StatusDate=WEDNESDAY),
+        JobApplicationStatusHistory(JobApplicationID=applications[0].JobApplicationID, Status="interview",
+                                    StatusDate=datetime(2026, 9, 20)),
+        JobApplicationInterview(JobApplicationID=applications[2].JobApplicationID, InterviewDate=datetime(2026, 9, 21)),
+    ])
+    resume = Resume(ProfileID=profile.ProfileID, Title="Main", Content="...")
+    db_session.add(resume)
+    db_session.flush()
+    db_session.add_all([ResumeResumeVersion(ResumeID=resume.ResumeID, ProfileVersionID=version.ProfileVersionID)] * 1)
+    db_session.add_all(
+        UserJobBoardJobFitScore(UserID=user.UserID, JobBoardJobID=job_id, ProfileVersionID=version.ProfileVersionID,
+                                OverallScore=score)
+        for job_id, score in ((1, 80), (2, 65))
+    )
+    # A second user with no activity must not pick up the first user's rows
+    other = Profile(FirstName="No", LastName="Activity", EmailAddress="none@example.com")
+    db_session.add(other)
+    db_session.flush()
+    db_session.add(User(Username="none", EmailAddress="none@example.com", HashedPassword="x", ProfileID=other.ProfileID))
+    db_session.commit()
+    return user, seek
+
+
+def period_row(db_session, user_id, period, start, board_id=None):
+    return db_session.query(UserJobBoardJobSearchAnalytics).filter_by(
+        UserID=user_id, Period=period, PeriodStart=start, JobBoardID=board_id).one()
+
+
+def test_period_start_of():
+    assert period_start_of("weekly", WEDNESDAY) == datetime(2026, 9, 7)
+    assert period_start_of("weekly", NEXT_MONDAY) == datetime(2026, 9, 14)
+    assert period_start_of("monthly", WEDNESDAY) == datetime(2026, 9, 1)
+    assert period_start_of("yearly", WEDNESDAY) == datetime(2026, 1, 1)
+
+
+def test_full_rebuild_matches_expected_rollups(db_session, rollup_user):
+    user, seek = rollup_user
+    counts = rebuild_analytics(db_session)
+    # weekly: 3 periods x (all) + 2 Seek weeks; monthly: 2 + 1; yearly: 2 + 1
+    assert counts == {"user_analytics": 2, "search_analytics": 11}
+
+    week = period_row(db_session, user.UserID, "weekly", datetime(2026, 9, 7))
+    assert (week.ApplicationsCount, week.InterviewCount, week.OfferCount) == (2, 2, 1)
+    assert week.SuccessRate == Decimal("50.00")
+    month = period_row(db_session, user.UserID, "monthly", datetime(2026, 9, 1))
+    assert (month.ApplicationsCount, month.InterviewCount, month.OfferCount) == (3, 3, 1)
+    seek_month = period_row(db_session, user.UserID, "monthly", datetime(2026, 9, 1), seek.JobBoardID)
+    assert (seek_month.ApplicationsCount, seek_month.OfferCount) == (2, 0)
+    assert period_row(db_session, user.UserID, "yearly", datetime(2025, 1, 1)).ApplicationsCount == 1
+
+    analytics = db_session.query(UserAnalytics).filter_by(UserID=user.UserID).one()
+    assert analytics.TotalJobApplications == 4
+    assert analytics.AverageFitScore == Decimal("72.50")
+    assert analytics.ResumeGeneratedCount == 1
+    assert analytics.LastActivityDate == datetime(2026, 9, 20)
+
+    # Rebuilding is idempotent and keeps the existing UserAnalytics row
+    analytics.ProfileCompleteness = 90
+    db_session.commit()
+    assert rebuild_analytics(db_session, [user.UserID]) == {"user_analytics": 1, "search_analytics": 11}
+    db_session.expire_all()
+    assert db_session.query(UserAnalytics).filter_by(UserID=user.UserID).one().ProfileCompleteness == Decimal("90.00")
+    idle = db_session.query(UserAnalytics).filter(UserAnalytics.UserID != user.UserID).one()
+    assert (idle.TotalJobApplications, idle.ResumeGeneratedCount, idle.AverageFitScore) == (0, 0, None)
+
+    summary = get_user_analytics(db_session, user.UserID, now=datetime(2026, 9, 10))
+    assert summary["total_job_applications"] == 4
+    assert summary["periods"]["weekly"]["applications"] == 2
+    assert summary["periods"]["yearly"]["interviews"] == 3
+
+
+def test_worker_refreshes_users_marked_by_commits(db_session, rollup_user):
+    user, _ = rollup_user
+    factory = sessionmaker(bind=db_session.get_bind())
+    worker = AnalyticsRollupWorker(factory)
+    install_analytics_hooks(factory, worker)
+    assert get_user_analytics(db_session, user.UserID) is None
+
+    session = factory()
+    application = session.query(JobApplication).filter_by(JobTitle="C").one()
+    session.add(JobApplicationStatusHistory(JobApplicationID=application.JobApplicationID, Status="Offer"))
+    session.commit()
+    session.close()
+    assert worker.pending == 1
+
+    asyncio.run(worker.drain())
+    assert worker.pending == 0 and worker.stats["users_refreshed"] == 1
+    month = period_row(db_session, user.UserID, "monthly", datetime(2026, 9, 1))
+    assert month.OfferCount == 2
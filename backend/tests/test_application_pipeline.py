@@ -0,0 +1,104 @@
+"""
+Tests for the job application pipeline queries and endpoints
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models import (
+    JobApplication, JobApplicationInterview, JobApplicationNote, JobApplicationStatusHistory, Profile, User,
+)
+from app.services.application_pipeline import decode_cursor, list_applications
+
+START = datetime(2026, 9, 1, 9, 0)
+
+
+@pytest.fixture
+def pipeline_user(db_session):
+    profile = Profile(FirstName="Pipe", LastName="Line", EmailAddress="pipe@example.com")
+    db_session.add(profile)
+    db_session.flush()
+    user = User(Username="pipe", EmailAddress="pipe@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    db_session.add(user)
+
+    # Seven applications; two share a DateApplied to exercise the tie-breaker
+    statuses = [["Applied"], ["Applied", "Interview"], ["Applied", "Interview", "Offer"], ["Applied", "Rejected"],
+                [], ["Applied"], ["Applied", "Interview"]]
+    for index, history in enumerate(statuses):
+        application = JobApplication(
+            ProfileID=profile.ProfileID, JobTitle=f"Role {index}", CompanyName="Acme",
+            DateApplied=START + timedelta(days=min(index, 5)),
+            ApplicationStatus="Draft" if not history else "Applied",
+        )
+        db_session.add(application)
+        db_session.flush()
+        db_session.add_all(
+            JobApplicationStatusHistory(JobApplicationID=application.JobApplicationID, Status=status,
+                                        StatusDate=START + timedelta(days=index, hours=step))
+            for step, status in enumerate(history)
+        )
+    db_session.commit()
+    return user
+
+
+def test_keyset_pages_cover_every_application_once(db_session, pipeline_user):
+    profile_id = pipeline_user.ProfileID
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    seen, cursor = [], None
+    while True:
+        page = list_applications(db_session, profile_id, limit=3, cursor=cursor)
+        seen.extend(item["job_application_id"] for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+    assert decode_cursor(list_applications(db_session, profile_id, limit=2).next_cursor)[1] == 6
+    # One statement per page: rows, latest status and counts together
+    assert len(statements) == 4
+
+
+def test_latest_status_and_counts(db_session, pipeline_user):
+    page = list_applications(db_session, pipeline_user.ProfileID, limit=10)
+    statuses = {item["job_application_id"]: item["status"] for item in page.items}
+    assert statuses == {1: "Applied", 2: "Interview", 3: "Offer", 4: "Rejected", 5: "Draft", 6: "Applied", 7: "Interview"}
+    assert page.status_counts == {"Applied": 2, "Interview": 2, "Offer": 1, "Rejected": 1, "Draft": 1}
+    assert page.total == 7
+
+    interviewing = list_applications(db_session, pipeline_user.ProfileID, limit=1, status="Interview")
+    assert [item["job_application_id"] for item in interviewing.items] == [7]
+    assert interviewing.status_counts == page.status_counts
+    more = list_applications(db_session, pipeline_user.ProfileID, limit=1, status="Interview",
+                             cursor=interviewing.next_cursor)
+    assert [item["job_application_id"] for item in more.items] == [2] and more.next_cursor is None
+
+
+def test_application_endpoints(client, db_session, pipeline_user):
+    db_session.add_all([
+        JobApplicationInterview(JobApplicationID=3, InterviewDate=START, InterviewType="Phone"),
+        JobApplicationNote(JobApplicationID=3, NoteText="Negotiate start date"),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/applications", params={"user_id": pipeline_user.UserID, "limit": 4})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["job_application_id"] for item in body["items"]] == [7, 6, 5, 4]
+    assert body["total"] == 7 and body["next_cursor"]
+
+    response = client.get("/api/v1/applications",
+                          params={"user_id": pipeline_user.UserID, "cursor": body["next_cursor"]})
+    assert [item["job_application_id"] for item in response.json()["items"]] == [3, 2, 1]
+
+    assert client.get("/api/v1/applications", params={"user_id": pipeline_user.UserID, "cursor": "!!"}).status_code == 400
+    assert client.get("/api/v1/applications", params={"user_id": 999}).status_code == 404
+
+    detail = client.get("/api/v1/applications/3", params={"user_id": pipeline_user.UserID}).json()
+    assert detail["status"] == "Offer"
+    assert [h["status"] for h in detail["status_history"]] == ["Offer", "Interview", "Applied"]
+    assert len(detail["interviews"]) == 1 and detail["notes"][0]["text"] == "Negotiate start date"
+    assert client.get("/api/v1/applications/99", params={"user_id": pipeline_user.UserID}).status_code == 404
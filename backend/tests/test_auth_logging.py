@@ -0,0 +1,54 @@
+"""
+Tests for batched auth attempt logging
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import AuthLog
+from app.services.auth_logging import AuthLogBuffer
+
+
+def test_buffer_flushes_in_one_batch(db_session):
+    buffer = AuthLogBuffer(sessionmaker(bind=db_session.get_bind()), capacity=10)
+    for _ in range(3):
+        buffer.record("google", False, "Token validation failed", None, "10.0.0.1")
+
+    assert db_session.query(AuthLog).count() == 0
+    assert buffer.flush_sync() == 3
+    assert db_session.query(AuthLog).count() == 3
+    assert buffer.metrics()["depth"] == 0
+
+
+def test_full_buffer_aggregates_then_drops(db_session):
+    buffer = AuthLogBuffer(sessionmaker(bind=db_session.get_bind()), capacity=2, max_aggregates=1)
+    for _ in range(5):
+        buffer.record("google", False, "Token validation failed", None, "10.0.0.1")
+    buffer.record("apple", False, "Unknown provider", None, "10.0.0.2")
+
+    metrics = buffer.metrics()
+    assert metrics["enqueued"] == 2
+    assert metrics["aggregated"] == 3
+    assert metrics["dropped"] == 1 and metrics["dropped_since_flush"] == 1
+
+    assert buffer.flush_sync() == 3
+    assert buffer.metrics()["dropped_since_flush"] == 0
+    folded = db_session.query(AuthLog).filter(AuthLog.ErrorMessage.like("%(x3)")).one()
+    assert folded.ErrorMessage == "Token validation failed (x3)"
+
+
+def test_failed_flush_is_retried_and_messages_fit_column(db_session):
+    broken = sessionmaker(bind=create_engine("sqlite://"))  # No AuthLog table
+    buffer = AuthLogBuffer(broken, capacity=10)
+    buffer.record("google", False, "x" * 2000, None, "10.0.0.1")
+    buffer.record("apple", True)
+
+    assert buffer.flush_sync() == 0
+    assert buffer.metrics()["depth"] == 2 and buffer.metrics()["requeued"] == 2
+    assert buffer.metrics()["last_flush_failed"] is True
+
+    buffer.session_factory = sessionmaker(bind=db_session.get_bind())
+    assert buffer.flush_sync() == 2
+    # One transient failure does not leave the buffer reported as failing
+    assert buffer.metrics()["last_flush_failed"] is False and buffer.metrics()["failed"] == 2
+    assert len(db_session.query(AuthLog).filter(AuthLog.Provider == "google").one().ErrorMessage) == 500
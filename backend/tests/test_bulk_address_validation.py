@@ -0,0 +1,154 @@
+"""
+Tests for bulk address validation
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Profile, ProfileAddress
+from app.services.bulk_address_validation import (
+    BulkAddressValidator,
+    iter_legacy_profile_items,
+    items_from_rows,
+)
+
+
+def validated(address):
+    return {
+        "validated": True,
+        "confidence_score": 0.95,
+        "property_id": f"GA{abs(hash(address)) % 1000}",
+        "address": {
+            "streetNumber": "1", "streetName": "MARTIN", "streetType": "PL",
+            "suburb": "SYDNEY", "state": "NSW", "postcode": "2000",
+            "latitude": -33.8675, "longitude": 151.2070,
+        },
+        "metadata": {"validationSource": "geoscape"},
+    }
+
+
+class FakeService:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+        self.billable_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def validate_address(self, address, property_id=None, country="AU"):
+        self.calls.append(address)
+        self.billable_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if address in self.fail:
+            return {"validated": False, "address": {}, "metadata": {"error": "Geoscape unavailable"}}
+        return validated(address)
+
+
+def make_validator(service, session_factory=None, **kwargs):
+    kwargs.setdefault("requests_per_second", 10000)
+    return BulkAddressValidator(session_factory=session_factory, service=service, **kwargs)
+
+
+async def collect(validator, items):
+    return [result async for result in validator.run(items)]
+
+
+@pytest.fixture
+def session_factory(db_session):
+    return sessionmaker(bind=db_session.get_bind())
+
+
+def add_profiles(db_session, count):
+    ids = []
+    for n in range(count):
+        profile = Profile(
+            FirstName="Test", LastName=str(n), EmailAddress=f"bulk{n}@example.com",
+            AddressLine1=f"{n} Martin Place", AddressLine2="Sydney NSW 2000",
+        )
+        db_session.add(profile)
+        db_session.flush()
+        ids.append(profile.ProfileID)
+    db_session.commit()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency_and_duplicates_validated_once():
+    service = FakeService()
+    rows = [{"address": f"{n % 5} Martin Place Sydney"} for n in range(40)]
+    results = await collect(make_validator(service, concurrency=3), items_from_rows(rows))
+
+    assert len(results) == 40
+    assert all(result.status == "validated" for result in results)
+    assert len(service.calls) == 5
+    assert service.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_writes_profile_addresses_and_resumes_from_checkpoint(tmp_path, db_session, session_factory):
+    profile_ids = add_profiles(db_session, 6)
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    # First run is interrupted after three results
+    first = make_validator(FakeService(), session_factory, batch_size=2, checkpoint_path=checkpoint, concurrency=1)
+    results = []
+    async for result in first.run(iter_legacy_profile_items(session_factory)):
+        results.append(result)
+        if len(results) == 3:
+            break
+
+    written = db_session.query(ProfileAddress).count()
+    assert written == first.checkpoint.completed_through + 1
+
+    service = FakeService()
+    second = make_validator(service, session_factory, batch_size=2, checkpoint_path=checkpoint)
+    await collect(second, iter_legacy_profile_items(session_factory))
+
+    assert len(service.calls) == 6 - written
+    rows = db_session.query(ProfileAddress).order_by(ProfileAddress.ProfileID).all()
+    assert [row.ProfileID for row in rows] == profile_ids
+    assert rows[0].Suburb == "SYDNEY" and rows[0].IsValidated
+    assert second.summary()["completed_through"] == 5
+
+
+@pytest.mark.asyncio
+async def test_stops_after_consecutive_errors(tmp_path):
+    rows = [{"address": f"{n} Failing St"} for n in range(50)]
+    service = FakeService(fail={row["address"] for row in rows})
+    validator = make_validator(service, concurrency=1, max_consecutive_errors=5,
+                               checkpoint_path=str(tmp_path / "checkpoint.json"))
+
+    results = await collect(validator, items_from_rows(rows))
+
+    assert validator.aborted
+    assert len(results) < 10
+    # The failed items are not checkpointed, so a resumed run retries them
+    assert validator.summary()["completed_through"] == -1
+    assert validator.summary()["error"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_after_abort_retries_trailing_errors(tmp_path):
+    rows = [{"address": f"{n} Outage St"} for n in range(12)]
+    checkpoint = str(tmp_path / "checkpoint.json")
+    outage = FakeService(fail={row["address"] for row in rows[3:]})
+    first = make_validator(outage, concurrency=1, batch_size=2, max_consecutive_errors=4,
+                           checkpoint_path=checkpoint)
+
+    await collect(first, items_from_rows(rows))
+
+    assert first.aborted
+    assert first.summary()["completed_through"] == 2
+
+    recovered = FakeService()
+    second = make_validator(recovered, checkpoint_path=checkpoint)
+    results = await collect(second, items_from_rows(rows))
+
+    assert sorted(recovered.calls) == sorted(row["address"] for row in rows[3:])
+    assert all(result.status == "validated" for result in results)
+    assert second.summary()["completed_through"] == 11 and second.summary()["error"] == 0
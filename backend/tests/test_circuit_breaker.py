@@ -0,0 +1,79 @@
+"""
+Tests for the circuit breaker around Geoscape
+"""
+
+import pytest
+
+from app.services import geoscape_service
+from app.services.circuit_breaker import CircuitBreaker, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from app.services.geoscape_service import GeoscapeService, UNAVAILABLE_MESSAGE
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock):
+    return CircuitBreaker("test", failure_rate_threshold=0.5, minimum_calls=4, window_seconds=10, open_seconds=5, clock=clock)
+
+
+def test_opens_on_error_rate_and_recovers_through_half_open():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED  # below minimum_calls
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 5.0
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["opened"] == 2
+
+
+def test_old_failures_leave_the_window():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 11.0
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.snapshot()["window_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_make_request_fails_fast_while_open(monkeypatch):
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    monkeypatch.setattr(geoscape_service, "geoscape_breaker", breaker)
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("request should not be attempted while the circuit is open")
+
+    monkeypatch.setattr(geoscape_service.httpx, "AsyncClient", no_network)
+
+    with pytest.raises(Exception, match=UNAVAILABLE_MESSAGE):
+        await GeoscapeService()._make_request("/v1/predictive/address")
+    assert breaker.snapshot()["rejected"] == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the dashboard endpoint
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.dashboard import get_session_factory
+from app.main import app
+from app.models import (
+    Base, JobApplication, Profile, Skills, User, UserAchievement, UserGamificationPoints, UserNotification,
+)
+from app.services import dashboard as dashboard_service
+from app.services.analytics_rollup import rebuild_analytics
+from app.services.dashboard import build_dashboard, etag_matches, shares_one_connection
+
+
+def seed(db):
+    profile = Profile(FirstName="Dash", LastName="Board", EmailAddress="dash@example.com", PhoneNumber="0400")
+    db.add(profile)
+    db.flush()
+    user = User(Username="dash", EmailAddress="dash@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    db.add_all([user, Skills(ProfileID=profile.ProfileID, SkillName="Python")])
+    db.add_all(
+        JobApplication(ProfileID=profile.ProfileID, JobTitle=f"Role {i}", CompanyName="Acme",
+                       DateApplied=datetime(2026, 9, i + 1), ApplicationStatus="Applied")
+        for i in range(7)
+    )
+    db.flush()
+    db.add_all([
+        UserNotification(UserID=user.UserID, Title="New match", Message="3 new jobs"),
+        UserNotification(UserID=user.UserID, Title="Reminder", Message="Follow up", IsRead=True),
+        UserGamificationPoints(UserID=user.UserID, PointsEarned=10, PointsType="job_logging"),
+        UserGamificationPoints(UserID=user.UserID, PointsEarned=5, PointsType="job_logging"),
+        UserGamificationPoints(UserID=user.UserID, PointsEarned=20, PointsType="profile_completion"),
+        UserAchievement(UserID=user.UserID, AchievementName="First application"),
+    ])
+    db.commit()
+    rebuild_analytics(db)
+    return user.UserID
+
+
+@pytest.fixture
+def pooled_factory(tmp_path):
+    """File database with a real connection pool, so sections run concurrently"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_sections_load_concurrently(pooled_factory):
+    assert not shares_one_connection(pooled_factory)
+    session = pooled_factory()
+    user_id = seed(session)
+    session.close()
+
+    dashboard = asyncio.run(build_dashboard(pooled_factory, user_id))
+    assert dashboard["errors"] == {}
+    assert dashboard["profile_score"]["overall_score"]["points"] == 22
+    assert dashboard["analytics"]["total_job_applications"] == 7
+    assert [item["job_title"] for item in dashboard["recent_applications"]["items"]] == [
+        "Role 6", "Role 5", "Role 4", "Role 3", "Role 2"]
+    assert dashboard["recent_applications"]["status_counts"] == {"Applied": 7}
+    assert dashboard["notifications"]["unread"] == 1
+    assert dashboard["gamification"]["total_points"] == 35
+    assert dashboard["gamification"]["points_by_type"] == {"job_logging": 15, "profile_completion": 20}
+
+    assert asyncio.run(build_dashboard(pooled_factory, 999)) is None
+
+
+def test_failed_section_is_reported(db_session, monkeypatch):
+    user_id = seed(db_session)
+    factory = sessionmaker(bind=db_session.get_bind())
+    assert shares_one_connection(factory)
+
+    def broken(db, user_id, profile_id):
+        raise RuntimeError("boom")
+    monkeypatch.setitem(dashboard_service.SECTIONS, "gamification", broken)
+    dashboard = asyncio.run(build_dashboard(factory, user_id))
+    assert dashboard["errors"] == {"gamification": "unavailable"} and dashboard["gamification"] is None
+    assert dashboard["notifications"]["unread"] == 1
+
+
+def test_etag_matching():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"xyz", "abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('"abd"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+def test_dashboard_endpoint_etag(client, db_session):
+    user_id = seed(db_session)
+    app.dependency_overrides[get_session_factory] = lambda: sessionmaker(bind=db_session.get_bind())
+
+    first = client.get(f"/api/v1/dashboard/{user_id}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["gamification"]["total_points"] == 35
+
+    unchanged = client.get(f"/api/v1/dashboard/{user_id}", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304 and unchanged.headers["etag"] == etag
+
+    db_session.add(UserNotification(UserID=user_id, Title="Interview booked"))
+    db_session.commit()
+    changed = client.get(f"/api/v1/dashboard/{user_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()["notifications"]["unread"] == 2
+
+    assert client.get("/api/v1/dashboard/999").status_code == 404
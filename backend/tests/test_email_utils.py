@@ -0,0 +1,93 @@
+"""
+Tests for the pooled SMTP send queue
+"""
+
+import asyncio
+
+from app.services import email_utils
+from app.services.email_utils import SMTPConnectionPool, SMTPSendQueue, SMTPSettings, build_reset_email
+from tests.test_notification_dispatcher import SMTPStandIn
+
+
+def _queue(port, workers=2, **kwargs):
+    pool = SMTPConnectionPool(SMTPSettings(hostname="127.0.0.1", port=port, start_tls=False,
+                                           from_email="noreply@example.com"), size=workers)
+    return SMTPSendQueue(pool, workers=workers, **kwargs)
+
+
+def test_reset_email_surge_reuses_connections(monkeypatch):
+    async def run():
+        smtp = SMTPStandIn()
+        queue = _queue(await smtp.start(), keepalive_interval=0)
+        monkeypatch.setattr(email_utils, "_mail_queue", queue)
+        try:
+            await asyncio.gather(*(
+                email_utils.send_reset_email(f"user{i}@example.com", f"https://example.com/reset/{i}")
+                for i in range(20)
+            ))
+            metrics = queue.metrics()
+            await queue.stop()
+        finally:
+            await smtp.stop()
+        return smtp, metrics
+
+    smtp, metrics = asyncio.run(run())
+
+    assert sorted(recipients[0] for recipients, _ in smtp.messages) == sorted(f"user{i}@example.com" for i in range(20))
+    assert smtp.messages[0][1]["Subject"] == "Password Reset for JobTrackerDB"
+    assert smtp.connections == 2
+    assert metrics["sent"] == 20 and metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+    assert metrics["send_ms_avg"] is not None and metrics["send_ms_p95"] >= 0
+    assert metrics["smtp"]["connections_opened"] == 2 and metrics["smtp"]["idle"] == 2
+
+
+def test_reconnects_after_server_drops_idle_connections():
+    async def run():
+        smtp = SMTPStandIn()
+        queue = _queue(await smtp.start(), workers=1, keepalive_interval=0)
+        try:
+            await queue.send(build_reset_email("a@example.com", "https://example.com/a"))
+            await smtp.drop_connections()
+            assert await queue.pool.keepalive() == 1
+            await queue.send(build_reset_email("b@example.com", "https://example.com/b"))
+            await smtp.drop_connections()
+            await queue.send(build_reset_email("c@example.com", "https://example.com/c"))
+            await queue.stop()
+        finally:
+            await smtp.stop()
+        return smtp, queue
+
+    smtp, queue = asyncio.run(run())
+
+    assert [recipients[0] for recipients, _ in smtp.messages] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert smtp.connections == 3
+    assert queue.stats == {"queued": 3, "sent": 3, "failed": 0, "rejected": 0}
+
+
+def test_enqueue_and_failures():
+    async def run():
+        smtp = SMTPStandIn()
+        smtp.reject.add("bounce@example.com")
+        queue = _queue(await smtp.start(), workers=1, max_queue=2, keepalive_interval=0)
+        try:
+            queue.start()
+            accepted = [queue.enqueue(build_reset_email(f"q{i}@example.com", "https://example.com")) for i in range(3)]
+            depth = queue.pending
+            try:
+                await queue.send(build_reset_email("bounce@example.com", "https://example.com"))
+                refused = None
+            except Exception as e:
+                refused = e
+            await queue.stop()
+        finally:
+            await smtp.stop()
+        return smtp, queue, accepted, depth, refused
+
+    smtp, queue, accepted, depth, refused = asyncio.run(run())
+
+    assert accepted == [True, True, False] and depth == 2
+    assert refused is not None
+    assert [recipients[0] for recipients, _ in smtp.messages] == ["q0@example.com", "q1@example.com"]
+    assert queue.stats == {"queued": 3, "sent": 2, "failed": 1, "rejected": 1}
+    # The refused recipient did not cost the connection
+    assert smtp.connections == 1
@@ -0,0 +1,91 @@
+"""
+Tests for the local fallback geocoder
+"""
+
+import pytest
+
+from app.services import geoscape_service
+from app.services.fallback_geocoder import (
+    FallbackGeocoder,
+    MATCH_CONFIDENCE,
+    build_centroids,
+)
+from app.services.geoscape_service import GeoscapeService, RESOLUTION_FALLBACK
+from app.services.property_coordinate_cache import MIN_CACHEABLE_CONFIDENCE
+
+RECORDS = [
+    {"suburb": "BOOLAROO", "state": "NSW", "postcode": "2284", "latitude": "-32.95", "longitude": "151.62"},
+    {"suburb": "BOOLAROO", "state": "NSW", "postcode": "2284", "latitude": "-32.97", "longitude": "151.64"},
+    {"suburb": "SPEERS POINT", "state": "NSW", "postcode": "2284", "latitude": "-32.96", "longitude": "151.63"},
+    {"suburb": "ST KILDA", "state": "VIC", "postcode": "3182", "latitude": "-37.86", "longitude": "144.98"},
+    {"suburb": "NOWHERE", "state": "VIC", "postcode": "3999", "latitude": "", "longitude": ""},
+]
+
+
+@pytest.fixture
+def geocoder():
+    return FallbackGeocoder(build_centroids(RECORDS))
+
+
+def test_centroids_average_coordinates_per_suburb_and_postcode():
+    centroids = build_centroids(RECORDS)
+
+    assert [row[0] for row in centroids["postcodes"]] == [2284, 3182]
+    assert centroids["postcodes"][0][1:] == [-32.96, 151.63, 3]
+    assert dict((row[0], row[3]) for row in centroids["suburbs"]) == {
+        "BOOLAROO|NSW": 2, "SPEERS POINT|NSW": 1, "ST KILDA|VIC": 1,
+    }
+
+
+def test_lookup_prefers_suburb_then_postcode_then_state(geocoder):
+    suburb = geocoder.geocode(suburb="Boolaroo", state="nsw", postcode="2284")
+    assert suburb["match_level"] == "suburb"
+    assert suburb["latitude"] == pytest.approx(-32.96)
+
+    postcode = geocoder.geocode(suburb="Unknown", state="NSW", postcode="2284")
+    assert postcode["match_level"] == "postcode"
+
+    state = geocoder.geocode(state="TAS", postcode="7000")
+    assert state["match_level"] == "state"
+    assert state["latitude"] == pytest.approx(-42.8821)
+
+    assert geocoder.geocode(suburb="Nowhere") is None
+    assert all(confidence < MIN_CACHEABLE_CONFIDENCE for confidence in MATCH_CONFIDENCE.values())
+
+
+def test_geocode_text_parses_trailing_locality(geocoder):
+    assert geocoder.geocode_text("Unit 3, 10 Fitzroy St, St Kilda VIC 3182")["match_level"] == "suburb"
+    assert geocoder.geocode_text("4 Milburn Cct Speers Point NSW 2284")["match_level"] == "postcode"
+    assert geocoder.geocode_text("somewhere overseas") is None
+
+
+class NoCoordinatesGeoscape(GeoscapeService):
+    def __init__(self, matches):
+        super().__init__()
+        self.matches = matches
+
+    async def get_property_details(self, property_id):
+        return {"property_id": property_id}
+
+    async def search_addresses(self, query, limit=10, state=None):
+        if isinstance(self.matches, Exception):
+            raise self.matches
+        return self.matches
+
+
+@pytest.mark.asyncio
+async def test_coordinates_fall_back_to_local_centroids(monkeypatch, geocoder):
+    monkeypatch.setattr(geoscape_service, "get_fallback_geocoder", lambda: geocoder)
+    match = {"address": "1 MAIN RD, BOOLAROO NSW 2284", "id": "GANSW9",
+             "data": {"suburb": "BOOLAROO", "state": "NSW", "postcode": "2284"}}
+
+    result = await NoCoordinatesGeoscape([match]).get_address_coordinates(match["address"])
+
+    assert result["resolution_path"] == RESOLUTION_FALLBACK
+    assert result["match_level"] == "suburb"
+    assert result["property_id"] == "GANSW9"
+    assert result["confidence_score"] == MATCH_CONFIDENCE["suburb"]
+
+    # Provider unavailable: the address text alone still gives a postcode centroid
+    result = await NoCoordinatesGeoscape(RuntimeError("down")).get_address_coordinates("9 Other St, Glendale NSW 2284")
+    assert result["success"] and result["match_level"] == "postcode"
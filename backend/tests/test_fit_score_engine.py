@@ -0,0 +1,103 @@
+"""
+Tests for the vectorized fit score engine
+"""
+
+import numpy as np
+import pytest
+
+from app.models import (
+    JobBoard, JobBoardJob, JobBoardJobSkill, Profile, ProfileVersion, Skills, User,
+    UserJobBoardJobFitScore, UserJobBoardJobFitScoreDetail,
+)
+from app.services.fit_score_engine import (
+    FitScoreEngine, JobSkillMatrix, SkillVocabulary, proficiency_level, score_matrix,
+)
+
+JOBS = {
+    "Backend Engineer": [("Python", "required", 1.0), ("SQL", "required", 0.8), ("Docker", "preferred", None)],
+    "Data Analyst": [("sql", "required", None), ("Tableau", "optional", None)],
+    "Frontend Engineer": [("React", "required", 1.0), ("TypeScript", "required", 1.0)],
+}
+USER_SKILLS = [("python ", "Expert"), ("SQL", "Beginner"), ("Docker", None)]
+
+
+@pytest.fixture
+def scored_user(db_session):
+    profile = Profile(FirstName="Fit", LastName="Score", EmailAddress="fit@example.com")
+    db_session.add(profile)
+    db_session.flush()
+    user = User(Username="fit", EmailAddress="fit@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    db_session.add_all([user, ProfileVersion(ProfileID=profile.ProfileID, VersionNumber=1)])
+    db_session.add_all(Skills(ProfileID=profile.ProfileID, SkillName=name, Proficiency=level) for name, level in USER_SKILLS)
+
+    board = JobBoard(BoardName="Seek")
+    db_session.add(board)
+    db_session.flush()
+    job_ids = {}
+    for title, skills in JOBS.items():
+        job = JobBoardJob(JobBoardID=board.JobBoardID, JobTitle=title, CompanyName="Acme")
+        db_session.add(job)
+        db_session.flush()
+        job_ids[title] = job.JobBoardJobID
+        db_session.add_all(
+            JobBoardJobSkill(JobBoardJobID=job.JobBoardJobID, SkillName=name, SkillType=kind, Importance=weight)
+            for name, kind, weight in skills
+        )
+    db_session.commit()
+    return user, job_ids
+
+
+def naive_score(user_skills, job_skills):
+    """Reference per-job, per-skill loop"""
+    levels = {}
+    for name, proficiency in user_skills:
+        key = " ".join(name.lower().split())
+        levels[key] = max(levels.get(key, 0), proficiency_level(proficiency))
+    weighted = total = 0.0
+    for name, kind, weight in job_skills:
+        weight = weight if weight is not None else {"required": 1.0, "preferred": 0.6, "optional": 0.3}[kind]
+        level = levels.get(" ".join(name.lower().split()), 0.0)
+        weighted += weight * (1.0 if level >= 0.6 else level)
+        total += weight
+    return round(100 * weighted / total, 2)
+
+
+def test_matrix_scores_match_naive_loop():
+    vocabulary = SkillVocabulary()
+    user_indexes = [(vocabulary.add(name), proficiency_level(level)) for name, level in USER_SKILLS]
+    rows = [(job_id, None, name, kind, weight)
+            for job_id, skills in enumerate(JOBS.values(), start=1) for name, kind, weight in skills]
+    matrix = JobSkillMatrix.from_rows(rows, vocabulary)
+
+    levels = np.zeros(3)
+    for index, level in user_indexes:
+        levels[index] = level
+    scores = score_matrix(matrix, levels)
+
+    assert list(scores.overall) == [naive_score(USER_SKILLS, skills) for skills in JOBS.values()]
+    assert list(scores.matched) == [2, 0, 0]
+    assert list(scores.partial) == [1, 1, 0]
+    assert list(scores.missing) == [0, 1, 2]
+
+
+def test_score_user_bulk_writes_scores_and_details(db_session, scored_user):
+    user, job_ids = scored_user
+    engine = FitScoreEngine()
+
+    assert engine.score_user(db_session, user.UserID) == {"jobs": 3, "details": 7}
+    # Re-scoring the same profile version replaces rather than duplicates
+    engine.score_user(db_session, user.UserID, job_ids=[job_ids["Backend Engineer"]])
+
+    scores = {row.JobBoardJobID: row for row in db_session.query(UserJobBoardJobFitScore).all()}
+    assert len(scores) == 3
+    backend = scores[job_ids["Backend Engineer"]]
+    assert float(backend.OverallScore) == naive_score(USER_SKILLS, JOBS["Backend Engineer"])
+    assert (backend.SkillsMatched, backend.SkillsPartial, backend.SkillsMissing) == (2, 1, 0)
+
+    details = db_session.query(UserJobBoardJobFitScoreDetail).filter_by(
+        UserJobBoardJobFitScoreID=backend.UserJobBoardJobFitScoreID
+    ).all()
+    by_skill = {detail.SkillName: detail for detail in details}
+    assert by_skill["SQL"].MatchStatus == "partial" and by_skill["SQL"].UserSkillLevel == "Beginner"
+    assert by_skill["Python"].MatchStatus == "matched" and float(by_skill["Python"].Score) == 100
+    assert db_session.query(UserJobBoardJobFitScoreDetail).count() == 7
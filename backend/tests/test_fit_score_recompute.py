@@ -0,0 +1,152 @@
+"""
+Tests for incremental fit score recomputation
+"""
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import JobBoardJobSkill, Profile, ProfileVersion, Skills, User, UserJobBoardJobFitScore
+from app.services.fit_score_engine import FitScoreEngine
+from app.services.fit_score_recompute import FitScoreRecomputer, create_profile_version
+from tests.test_fit_score_engine import scored_user  # noqa: F401
+
+
+def recomputer_for(db_session, engine=None):
+    return FitScoreRecomputer(sessionmaker(bind=db_session.get_bind()), engine=engine)
+
+
+def score_rows(db_session):
+    db_session.expire_all()
+    return {(row.JobBoardJobID, row.ProfileVersionID): row for row in db_session.query(UserJobBoardJobFitScore).all()}
+
+
+@pytest.mark.asyncio
+async def test_profile_change_replaces_previous_version_scores(db_session, scored_user):
+    user, job_ids = scored_user
+    FitScoreEngine().score_user(db_session, user.UserID)
+    old_version = db_session.query(ProfileVersion).one().ProfileVersionID
+
+    db_session.add(Skills(ProfileID=user.ProfileID, SkillName="React", Proficiency="Expert"))
+    new_version = create_profile_version(db_session, user.ProfileID)
+    db_session.commit()
+
+    recomputer = recomputer_for(db_session)
+    recomputer.mark_profile(user.UserID)
+    await recomputer.drain()
+
+    rows = score_rows(db_session)
+    assert {version for _, version in rows} == {new_version.ProfileVersionID}
+    assert new_version.ProfileVersionID != old_version and new_version.VersionNumber == 2
+    assert rows[(job_ids["Frontend Engineer"], new_version.ProfileVersionID)].SkillsPartial == 0
+    assert rows[(job_ids["Frontend Engineer"], new_version.ProfileVersionID)].SkillsMatched == 1
+    assert recomputer.pending == 0 and recomputer.stats["pairs_scored"] == 3
+
+
+@pytest.mark.asyncio
+async def test_job_change_rescores_only_users_holding_a_score(db_session, scored_user):
+    user, job_ids = scored_user
+    FitScoreEngine().score_user(db_session, user.UserID, job_ids=[job_ids["Backend Engineer"]])
+
+    other = Profile(FirstName="No", LastName="Scores", EmailAddress="none@example.com")
+    db_session.add(other)
+    db_session.flush()
+    db_session.add_all([
+        User(Username="none", EmailAddress="none@example.com", HashedPassword="x", ProfileID=other.ProfileID),
+        ProfileVersion(ProfileID=other.ProfileID, VersionNumber=1),
+        JobBoardJobSkill(JobBoardJobID=job_ids["Backend Engineer"], SkillName="Kubernetes", SkillType="required"),
+    ])
+    db_session.commit()
+
+    recomputer = recomputer_for(db_session)
+    recomputer.mark_job(job_ids["Backend Engineer"])
+    recomputer.mark_job(job_ids["Data Analyst"])
+    assert recomputer.plan(db_session, set(), {job_ids["Backend Engineer"], job_ids["Data Analyst"]}) == {
+        user.UserID: {job_ids["Backend Engineer"]}
+    }
+    await recomputer.drain()
+
+    rows = score_rows(db_session)
+    assert [job for job, _ in rows] == [job_ids["Backend Engineer"]]
+    assert next(iter(rows.values())).SkillsMissing == 1
+    assert recomputer.stats["pairs_scored"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_job_is_scored_for_every_user_with_a_profile_version(db_session, scored_user):
+    user, job_ids = scored_user
+    FitScoreEngine().score_user(db_session, user.UserID, job_ids=[job_ids["Backend Engineer"]])
+
+    other = Profile(FirstName="No", LastName="Scores", EmailAddress="none@example.com")
+    unversioned = Profile(FirstName="No", LastName="Version", EmailAddress="nover@example.com")
+    db_session.add_all([other, unversioned])
+    db_session.flush()
+    other_user = User(Username="none", EmailAddress="none@example.com", HashedPassword="x", ProfileID=other.ProfileID)
+    db_session.add_all([
+        other_user,
+        User(Username="nover", EmailAddress="nover@example.com", HashedPassword="x", ProfileID=unversioned.ProfileID),
+        ProfileVersion(ProfileID=other.ProfileID, VersionNumber=1),
+    ])
+    db_session.commit()
+
+    recomputer = recomputer_for(db_session)
+    recomputer.mark_new_job(job_ids["Data Analyst"])
+    assert recomputer.pending == 1
+    assert recomputer.plan(db_session, set(), set(), {job_ids["Data Analyst"]}) == {
+        user.UserID: {job_ids["Data Analyst"]},
+        other_user.UserID: {job_ids["Data Analyst"]},
+    }
+    await recomputer.drain()
+
+    db_session.expire_all()
+    scored = {(row.UserID, row.JobBoardJobID) for row in db_session.query(UserJobBoardJobFitScore).all()}
+    assert scored == {
+        (user.UserID, job_ids["Backend Engineer"]),
+        (user.UserID, job_ids["Data Analyst"]),
+        (other_user.UserID, job_ids["Data Analyst"]),
+    }
+    assert recomputer.pending == 0
+
+
+def test_create_profile_version_retries_a_number_taken_concurrently(db_session, scored_user):
+    user, _ = scored_user
+    profile_id = user.ProfileID
+    other_session = sessionmaker(bind=db_session.get_bind())()
+    execute = db_session.execute
+    raced = []
+
+    def racing_execute(*args, **kwargs):
+        result = execute(*args, **kwargs)
+        if not raced:
+            # Another save claims the next number after this one read the maximum
+            raced.append(create_profile_version(other_session, profile_id).VersionNumber)
+            other_session.commit()
+        return result
+
+    db_session.execute = racing_execute
+    try:
+        version = create_profile_version(db_session, profile_id)
+        db_session.commit()
+    finally:
+        db_session.execute = execute
+        other_session.close()
+
+    numbers = sorted(v.VersionNumber for v in db_session.query(ProfileVersion).filter_by(ProfileID=profile_id))
+    assert raced == [2] and version.VersionNumber == 3
+    assert numbers == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_users_are_requeued(db_session, scored_user):
+    user, _ = scored_user
+
+    class FailingEngine(FitScoreEngine):
+        def score_user(self, db, user_id, job_ids=None, profile_version_id=None):
+            raise RuntimeError("database unavailable")
+
+    recomputer = recomputer_for(db_session, engine=FailingEngine())
+    recomputer.mark_profile(user.UserID)
+    await recomputer.drain()
+
+    assert recomputer.pending == 1
+    assert recomputer.stats["failures"] == 1
+    assert score_rows(db_session) == {}
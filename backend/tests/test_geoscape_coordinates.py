@@ -0,0 +1,145 @@
+"""
+Tests for concurrent coordinate resolution in GeoscapeService
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services import geoscape_service
+from app.services.geoscape_service import GeoscapeService
+
+
+class StubGeoscape(GeoscapeService):
+    def __init__(self, details_delay, search_delay, search_coordinates=False, details_fail=False):
+        super().__init__()
+        self.details_fail = details_fail
+        self.details_delay = details_delay
+        self.search_delay = search_delay
+        self.search_coordinates = search_coordinates
+        self.details_calls = []
+        self.cancelled = []
+
+    async def get_property_details(self, property_id):
+        self.details_calls.append(property_id)
+        try:
+            await asyncio.sleep(self.details_delay)
+        except asyncio.CancelledError:
+            self.cancelled.append("details")
+            raise
+        if self.details_fail:
+            raise Exception("upstream down")
+        return {"property_id": property_id, "latitude": -33.1, "longitude": 151.1}
+
+    async def search_addresses(self, query, limit=10, state=None):
+        try:
+            await asyncio.sleep(self.search_delay)
+        except asyncio.CancelledError:
+            self.cancelled.append("search")
+            raise
+        data = {"state": "NSW", "latitude": None, "longitude": None}
+        if self.search_coordinates:
+            data.update(latitude=-33.2, longitude=151.2)
+        return [{"address": query, "id": "GANSW1", "data": data}]
+
+
+@pytest.mark.asyncio
+async def test_property_details_wins_and_search_is_cancelled():
+    service = StubGeoscape(details_delay=0.01, search_delay=0.5)
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW1")
+
+    assert result["resolution_path"] == "property_details"
+    assert result["latitude"] == -33.1
+    await asyncio.sleep(0)
+    assert service.cancelled == ["search"]
+
+
+@pytest.mark.asyncio
+async def test_search_wins_when_it_resolves_the_same_property_first():
+    service = StubGeoscape(details_delay=0.5, search_delay=0.01, search_coordinates=True)
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW1")
+
+    assert result["resolution_path"] == "search"
+    assert result["latitude"] == -33.2
+    await asyncio.sleep(0)
+    assert service.cancelled == ["details"]
+
+
+@pytest.mark.asyncio
+async def test_search_for_another_property_waits_for_property_details():
+    service = StubGeoscape(details_delay=0.05, search_delay=0.01, search_coordinates=True)
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW9")
+
+    assert result["resolution_path"] == "property_details"
+    assert result["property_id"] == "GANSW9" and result["latitude"] == -33.1
+
+    failing = StubGeoscape(details_delay=0.05, search_delay=0.01, search_coordinates=True, details_fail=True)
+    result = await failing.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW9")
+    assert result["resolution_path"] == "search"
+    assert result["property_id"] == "GANSW1"
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_refetch_the_same_property():
+    service = StubGeoscape(details_delay=0.05, search_delay=0.01)
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW1")
+
+    assert result["resolution_path"] == "property_details"
+    assert service.details_calls == ["GANSW1"]
+
+
+@pytest.mark.asyncio
+async def test_search_then_property_details_without_property_id():
+    service = StubGeoscape(details_delay=0.01, search_delay=0.01)
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000")
+
+    assert result["resolution_path"] == "search_property_details"
+    assert result["property_id"] == "GANSW1"
+
+
+class SlowGeoscapeApp:
+    """ASGI stand-in for Geoscape with a per-path delay"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.paths = []
+
+    async def __call__(self, scope, receive, send):
+        path = scope["path"]
+        self.paths.append(path)
+        await asyncio.sleep(self.delays.get(path, 0))
+        if path.startswith("/property/"):
+            body = {"property": {"id": path.rsplit("/", 1)[1]}, "location": {"latitude": -33.1, "longitude": 151.1}}
+        else:
+            body = {"suggest": [{"id": "GANSW1", "rank": 0, "address": "1 TEST ST, SYDNEY NSW 2000"}]}
+        payload = json.dumps(body).encode()
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": payload})
+
+
+@pytest.mark.asyncio
+async def test_every_request_sent_is_counted(monkeypatch):
+    upstream = SlowGeoscapeApp({"/property/GANSW9": 0.1})
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        geoscape_service.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.ASGITransport(app=upstream), **kwargs)
+    )
+    service = GeoscapeService()
+    service.base_url = "http://geoscape"
+
+    result = await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW9")
+
+    # Property details, search, and the search's own property lookup
+    assert result["property_id"] == "GANSW9"
+    assert len(upstream.paths) == 3
+    assert service.requests_sent == 3
+
+    # A search cancelled after it was sent is still billed
+    upstream = SlowGeoscapeApp({"/predictive/address": 0.5})
+    service = GeoscapeService()
+    service.base_url = "http://geoscape"
+    await service.get_address_coordinates("1 TEST ST, SYDNEY NSW 2000", "GANSW1")
+    assert service.requests_sent == 2
@@ -0,0 +1,70 @@
+"""
+Tests for Geoscape record/replay fixtures
+"""
+
+import httpx
+import pytest
+
+from app.core.api_config import APIConfig
+from app.services import geoscape_service
+from app.services.geoscape_fixtures import FixtureStore, GeoscapeReplayApp, record_response
+from app.services.geoscape_service import GeoscapeService
+
+SUGGEST = {"suggest": [{"id": "GANSW1", "rank": 0, "address": "4 MILBURN CCT, BOOLAROO NSW 2284"}]}
+
+
+def client_for(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://replay")
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    record_response(str(tmp_path), "GET", "/predictive/address", {"query": "4 milburn", "limit": 10}, 200, SUGGEST)
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_query_string_to_recorded_params(recorded):
+    app = GeoscapeReplayApp(FixtureStore(str(recorded)), fallback=False)
+    async with client_for(app) as client:
+        hit = await client.get("/predictive/address", params={"query": "4 milburn", "limit": "10"})
+        miss = await client.get("/predictive/address", params={"query": "other", "limit": "10"})
+
+    assert hit.status_code == 200 and hit.json() == SUGGEST
+    assert miss.status_code == 404
+    assert app.stats == {"served": 1, "unmatched": 1}
+
+
+@pytest.mark.asyncio
+async def test_replay_fallback_and_error_injection(recorded):
+    app = GeoscapeReplayApp(FixtureStore(str(recorded)), prefix="/v1")
+    async with client_for(app) as client:
+        reused = await client.get("/v1/predictive/address", params={"query": "anything"})
+    assert reused.json() == SUGGEST
+
+    failing = GeoscapeReplayApp(FixtureStore(str(recorded)), error_rate=1.0, error_status=429, seed=1)
+    async with client_for(failing) as client:
+        response = await client.get("/predictive/address", params={"query": "4 milburn", "limit": "10"})
+    assert response.status_code == 429
+    assert failing.stats["injected_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_service_records_responses_for_replay(monkeypatch, tmp_path, recorded):
+    upstream = GeoscapeReplayApp(FixtureStore(str(recorded)))
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        geoscape_service.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.ASGITransport(app=upstream), **kwargs)
+    )
+    record_dir = tmp_path / "recorded"
+    monkeypatch.setattr(APIConfig, "GEOSCAPE_RECORD_DIR", str(record_dir))
+
+    service = GeoscapeService()
+    service.base_url = "http://geoscape"
+    suggestions = await service.search_addresses("4 milburn", limit=10)
+    assert suggestions[0]["data"]["suburb"] == "BOOLAROO"
+
+    replayed = FixtureStore(str(record_dir))
+    assert len(replayed) == 1
+    assert replayed.match("GET", "/predictive/address", {"query": "4 milburn", "limit": "10"}, fallback=False)["body"] == SUGGEST
@@ -0,0 +1,228 @@
+"""
+Tests for streaming job feed ingestion
+"""
+
+import io
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.api import jobs as jobs_api
+from app.core.api_config import APIConfig
+from app.models import JobBoard, JobBoardJob, JobBoardJobSkill, JobBoardJobVersion
+from app.services import job_ingestion
+from app.services.job_ingestion import (
+    FingerprintIndex, IndexedJob, JobIngestor, SimHasher, hamming_distance, iter_feed_records, parse_feed_record,
+    posting_from_record,
+)
+
+DESCRIPTION = (
+    "We are looking for a backend engineer to build and operate Python services on AWS. "
+    "You will design REST APIs, tune SQL Server queries and mentor junior developers. "
+    "Experience with Docker, CI/CD pipelines and observability tooling is highly regarded."
+)
+
+
+def posting(**overrides):
+    record = {"title": "Backend Engineer", "company": "Acme", "description": DESCRIPTION,
+              "location": "Sydney NSW", "skills": ["Python", "SQL Server"]}
+    record.update(overrides)
+    return record
+
+
+def ingest(db_session, records, **kwargs):
+    return JobIngestor(db_session, chunk_size=2, **kwargs).ingest(records)
+
+
+def test_simhash_is_stable_and_close_for_small_edits():
+    hasher = SimHasher()
+    base = hasher.posting_fingerprint("Backend Engineer", "Acme", DESCRIPTION)
+    assert base == SimHasher().posting_fingerprint("Backend Engineer", "Acme", DESCRIPTION)
+    for edited in (DESCRIPTION.replace("Python", "Go"), DESCRIPTION.replace("mentor", "coach")):
+        assert hamming_distance(base, hasher.posting_fingerprint("Backend Engineer", "Acme", edited)) <= 4
+    other_role = DESCRIPTION.replace("backend", "data").replace("Python services", "Spark pipelines")
+    assert hamming_distance(base, hasher.posting_fingerprint("Data Engineer", "Acme", other_role)) > 4
+
+
+def test_index_finds_near_duplicates_from_the_same_company_only():
+    index = FingerprintIndex(max_distance=4)
+    index.add(IndexedJob(1, 0b1011 << 40, "a", "acme", None))
+    near = posting_from_record(posting())
+    near.fingerprint, near.content_hash = (0b1011 << 40) ^ 0b111, "b"
+    assert index.find(near) == 0
+    near.company = "Other Co"
+    assert index.find(near) is None
+
+
+def test_feed_dedup_versions_and_reposts(db_session):
+    records = [
+        posting(),
+        posting(description=DESCRIPTION.upper()),                 # Near-identical in the same feed
+        posting(title="Data Analyst", description="Build Tableau dashboards over the sales warehouse."),
+        {"company": "No Title"},
+    ]
+    summary = ingest(db_session, records, default_board="Seek")
+    assert summary.counts["inserted"] == 2
+    assert summary.inserted_job_ids == {job.JobBoardJobID for job in db_session.query(JobBoardJob)}
+    assert summary.counts["duplicate"] == 1
+    assert summary.counts["invalid"] == 1
+    job = db_session.query(JobBoardJob).filter_by(JobTitle="Backend Engineer").one()
+    assert db_session.query(JobBoard).one().BoardName == "Seek"
+    assert db_session.query(JobBoardJobSkill).filter_by(JobBoardJobID=job.JobBoardJobID).count() == 2
+
+    # Same posting, edited, seen again after the repost window
+    db_session.query(JobBoardJob).update({JobBoardJob.LastSeenDate: datetime.utcnow() - timedelta(days=30)})
+    db_session.commit()
+    summary = ingest(db_session, [posting(description=DESCRIPTION + " Hybrid working available.", skills=["Python"])])
+    assert summary.counts == {"inserted": 0, "updated": 1, "reposted": 1, "unchanged": 0, "duplicate": 0, "invalid": 0}
+    assert summary.skill_changed_job_ids == {job.JobBoardJobID}
+
+    db_session.expire_all()
+    assert job.IsRepost is True and job.RepostFrequency == 1
+    assert job.JobDescription.endswith("Hybrid working available.")
+    versions = db_session.query(JobBoardJobVersion).filter_by(JobBoardJobID=job.JobBoardJobID).order_by(
+        JobBoardJobVersion.VersionNumber).all()
+    assert [(v.VersionNumber, v.ChangeReason) for v in versions] == [(1, "Imported"), (2, "Reposted with changes")]
+    assert [s.SkillName for s in db_session.query(JobBoardJobSkill).filter_by(JobBoardJobID=job.JobBoardJobID)] == ["Python"]
+
+    # Seen again within the window: nothing changes
+    summary = ingest(db_session, [posting(description=DESCRIPTION + " Hybrid working available.", skills=["Python"])])
+    assert summary.counts["unchanged"] == 1 and summary.counts["reposted"] == 0
+
+
+def test_csv_feed_streams_and_backfills_legacy_jobs(db_session):
+    board = JobBoard(BoardName="Legacy")
+    db_session.add(board)
+    db_session.flush()
+    db_session.add(JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="Backend Engineer", CompanyName="Acme",
+                               JobDescription=DESCRIPTION, Location="Sydney NSW"))
+    db_session.commit()
+
+    feed = io.StringIO(
+        "title,company,description,location,skills\n"
+        f"Backend Engineer,Acme,\"{DESCRIPTION}\",Sydney NSW,Python;Docker\n"
+        "QA Engineer,Acme,Manual and automated testing,Remote,\n"
+    )
+    summary = ingest(db_session, iter_feed_records(feed, "csv"), default_board="Seek")
+    assert summary.counts["inserted"] == 1
+    assert summary.counts["unchanged"] == 1
+    assert db_session.query(JobBoardJob).filter(JobBoardJob.ContentFingerprint.is_(None)).count() == 0
+
+    lines = io.StringIO(json.dumps(posting(title="QA Engineer", description="Manual and automated testing",
+                                           location="Remote", skills=None)) + "\n\n")
+    assert [parse_feed_record(r)["title"] for r in iter_feed_records(lines, "jsonl")] == ["QA Engineer"]
+
+
+def test_malformed_json_lines_are_counted_invalid(db_session):
+    feed = io.StringIO("\n".join([json.dumps(posting()), "{not json", "[1]", json.dumps(posting(title="QA Engineer"))]))
+    summary = ingest(db_session, iter_feed_records(feed, "jsonl"))
+    assert summary.counts["inserted"] == 2 and summary.counts["invalid"] == 2
+    assert [error.split(":")[0] for error in summary.errors] == ["Record 1", "Record 2"]
+
+
+def test_reused_index_loads_only_new_jobs(db_session):
+    index = FingerprintIndex()
+    first = ingest(db_session, [posting()], index=index)
+    assert len(index) == 1 and index.loaded_through == 0
+
+    board = db_session.query(JobBoard).one()
+    db_session.add(JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="QA Engineer", CompanyName="Acme",
+                               JobDescription="Manual and automated testing"))
+    db_session.commit()
+
+    summary = ingest(db_session, [posting(), posting(title="QA Engineer", description="Manual and automated testing",
+                                                     location=None, skills=None)], index=index)
+    assert summary.counts["unchanged"] == 2 and summary.counts["inserted"] == 0
+    assert len(index) == 2 and index.loaded_through > max(first.inserted_job_ids)
+    assert db_session.query(JobBoardJob).filter(JobBoardJob.ContentHash.is_(None)).count() == 0
+
+
+def test_failed_chunk_leaves_index_unchanged(db_session, monkeypatch):
+    index = FingerprintIndex()
+    ingestor = JobIngestor(db_session, chunk_size=2, index=index)
+
+    def fail(name):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(ingestor, "_board_id", fail)
+    with pytest.raises(RuntimeError):
+        ingestor.ingest([posting()])
+    assert len(index) == 0
+
+    monkeypatch.undo()
+    summary = JobIngestor(db_session, chunk_size=2, index=index).ingest([posting()])
+    assert summary.counts["inserted"] == 1 and len(index) == 1
+
+
+def test_concurrent_uploads_insert_once(db_session):
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    index = FingerprintIndex()
+    summaries = []
+
+    def upload():
+        db = session_factory()
+        try:
+            summaries.append(JobIngestor(db, chunk_size=2, index=index).ingest([posting(), posting(title="Data Analyst")]))
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=upload) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(summary.counts["inserted"] for summary in summaries) == [0, 0, 2]
+    assert db_session.query(JobBoardJob).count() == 2
+
+
+def test_ingest_endpoint(client, db_session, monkeypatch):
+    monkeypatch.setattr(job_ingestion, "_fingerprint_index", None)
+    body = "\n".join(json.dumps(record) for record in [posting(), posting(title="Data Analyst", description="SQL")])
+    response = client.post(
+        "/api/v1/jobs/ingest",
+        files={"file": ("feed.jsonl", body.encode("utf-8"), "application/x-ndjson")},
+        data={"board": "Seek"},
+    )
+    assert response.status_code == 200
+    assert response.json()["summary"]["inserted"] == 2
+
+    again = client.post("/api/v1/jobs/ingest", files={"file": ("feed.jsonl", body.encode("utf-8"), "application/x-ndjson")})
+    assert again.json()["summary"]["inserted"] == 0 and again.json()["summary"]["unchanged"] == 2
+
+    bad = client.post("/api/v1/jobs/ingest", files={"file": ("feed.jsonl", b"{not json\n[1]", "application/x-ndjson")})
+    assert bad.status_code == 200 and bad.json()["summary"]["invalid"] == 2
+
+    unreadable = client.post("/api/v1/jobs/ingest", files={"file": ("feed.csv", b"title\n\xff", "text/csv")})
+    assert unreadable.status_code == 400
+
+
+def test_ingest_endpoint_rescores_chunks_committed_before_a_failure(client, db_session, monkeypatch):
+    monkeypatch.setattr(job_ingestion, "_fingerprint_index", None)
+    monkeypatch.setattr(APIConfig, "JOB_INGEST_CHUNK_SIZE", 1)
+    marked = []
+
+    class Recomputer:
+        def mark_new_job(self, job_id):
+            marked.append(job_id)
+
+        def mark_job(self, job_id):
+            marked.append(job_id)
+
+    monkeypatch.setattr(jobs_api, "get_fit_score_recomputer", lambda: Recomputer())
+    original = JobIngestor._process_chunk
+
+    def fail_second_chunk(self, records, start, summary):
+        if start == 1:
+            raise RuntimeError("database unavailable")
+        return original(self, records, start, summary)
+
+    monkeypatch.setattr(JobIngestor, "_process_chunk", fail_second_chunk)
+    body = "\n".join(json.dumps(record) for record in [posting(), posting(title="Data Analyst", description="SQL")])
+    response = client.post("/api/v1/jobs/ingest", files={"file": ("feed.jsonl", body.encode("utf-8"), "application/x-ndjson")})
+
+    assert response.status_code == 500
+    assert marked == [db_session.query(JobBoardJob).one().JobBoardJobID]
@@ -0,0 +1,64 @@
+"""
+Tests for the offline address index
+"""
+
+import pytest
+
+from app.services.address_validation_service import AddressValidationService
+from app.services.local_address_index import LocalAddressIndex, LocalAddressProvider, build_index
+
+RECORDS = [
+    {"id": "GANSW1", "street_number": "4", "street_name": "MILBURN", "street_type": "CCT",
+     "suburb": "BOOLAROO", "state": "NSW", "postcode": "2284", "latitude": "-32.95", "longitude": "151.62"},
+    {"id": "GANSW2", "street_number": "12", "street_name": "MILBURN", "street_type": "CCT",
+     "suburb": "BOOLAROO", "state": "NSW", "postcode": "2284"},
+    {"id": "GAVIC1", "street_number": "4", "street_name": "MILL", "street_type": "RD",
+     "suburb": "BALLARAT", "state": "VIC", "postcode": "3350"},
+    {"id": "GAQLD1", "street_number": "100", "street_name": "QUEEN", "street_type": "ST",
+     "suburb": "BRISBANE CITY", "state": "QLD", "postcode": "4000"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    build_index(RECORDS, str(tmp_path))
+    index = LocalAddressIndex(str(tmp_path))
+    yield index
+    index.close()
+
+
+def test_prefix_search_on_last_token(index):
+    assert [r["id"] for r in index.search("4 mil")] == ["GANSW1", "GAVIC1"]
+    assert [r["id"] for r in index.search("4 milb")] == ["GANSW1"]
+    assert [r["id"] for r in index.search("milburn cct boo")] == ["GANSW1", "GANSW2"]
+    assert index.search("4 milburn cct, boolaroo nsw 2284")[0]["address"] == "4 MILBURN CCT, BOOLAROO NSW 2284"
+    assert index.search("nowhere") == []
+
+
+def test_prefix_only_search_merges_postings_in_index_order(index):
+    # BOOLAROO, BALLARAT and BRISBANE are separate postings lists for the prefix "B"
+    assert [r["id"] for r in index.search("b")] == ["GANSW1", "GANSW2", "GAQLD1", "GAVIC1"]
+    assert [r["id"] for r in index.search("b", limit=2)] == ["GANSW1", "GANSW2"]
+    assert [r["id"] for r in index.search("b", state="QLD")] == ["GAQLD1"]
+
+
+def test_state_filter_and_limit(index):
+    assert [r["id"] for r in index.search("mil", state="vic")] == ["GAVIC1"]
+    assert index.search("mil", state="WA") == []
+    assert len(index.search("mil", limit=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_returns_geoscape_shaped_suggestions(index):
+    suggestions = await LocalAddressProvider(index).search_addresses("4 milburn")
+    assert suggestions[0]["id"] == "GANSW1"
+    assert suggestions[0]["data"]["suburb"] == "BOOLAROO"
+    assert suggestions[0]["data"]["latitude"] == -32.95
+
+
+@pytest.mark.asyncio
+async def test_service_passes_state_filter_to_local_index(index):
+    service = AddressValidationService()
+    service.providers = {"local": LocalAddressProvider(index)}
+    suggestions = await service.search_addresses("mil", state="VIC")
+    assert [s["id"] for s in suggestions] == ["GAVIC1"]
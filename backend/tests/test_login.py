@@ -0,0 +1,66 @@
+"""
+Tests for the login fast path and the batched LastLogin writer
+"""
+
+import hashlib
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Profile, User
+from app.services.last_login_writer import LastLoginWriter
+
+
+@pytest.fixture
+def legacy_user(db_session):
+    profile = Profile(FirstName="Test", LastName="User", EmailAddress="test@example.com")
+    db_session.add(profile)
+    db_session.flush()
+
+    salt = "b" * 32
+    user = User(
+        Username="test@example.com",
+        EmailAddress="test@example.com",
+        HashedPassword=f"{salt}${hashlib.sha256(('testpassword123' + salt).encode()).hexdigest()}",
+        ProfileID=profile.ProfileID,
+        RoleID=2,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def test_login_returns_profile_name_and_upgrades_hash(client, db_session, legacy_user):
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "testpassword123"}
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Test User"
+
+    db_session.expire_all()
+    stored = db_session.query(User).filter(User.UserID == legacy_user.UserID).one()
+    assert stored.HashedPassword.startswith("scrypt$")
+
+
+def test_login_rejects_bad_credentials(client, legacy_user):
+    for email, password in (("test@example.com", "wrong"), ("missing@example.com", "testpassword123")):
+        response = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+        assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_last_login_writer_batches_updates(db_session, legacy_user):
+    writer = LastLoginWriter(sessionmaker(bind=db_session.get_bind()))
+    first, latest = datetime(2024, 1, 1, 9, 0), datetime(2024, 1, 1, 9, 5)
+    writer.record(legacy_user.UserID, first)
+    writer.record(legacy_user.UserID, latest)
+    assert writer.pending == 1
+
+    await writer.flush()
+
+    db_session.expire_all()
+    assert db_session.get(User, legacy_user.UserID).LastLogin == latest
+    assert writer.stats["batches"] == 1
+    assert writer.pending == 0
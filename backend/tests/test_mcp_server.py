@@ -0,0 +1,114 @@
+"""
+Tests for the MCP server query execution helpers
+"""
+import pytest
+from sqlalchemy import text
+
+from mcp_server import MCPServer, SlowQueryLog, StatementCache, rows_read_from_showplan
+
+@pytest.fixture
+def server(monkeypatch):
+    """MCP server bound to a private in-memory SQLite database."""
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    server = MCPServer()
+    with server.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE Widget (WidgetID INTEGER PRIMARY KEY, Name VARCHAR(50))"))
+        conn.execute(text("INSERT INTO Widget (Name) VALUES ('alpha'), ('beta'), ('gamma')"))
+    return server
+
+@pytest.mark.asyncio
+async def test_execute_query_profile_and_explain(server):
+    """Profile adds timing and the row count; explain adds the SQLite query plan."""
+    result = await server.execute_query(
+        "SELECT * FROM Widget WHERE Name = :name",
+        {"name": "beta"},
+        explain=True,
+        profile=True
+    )
+
+    assert result["success"] is True
+    assert result["row_count"] == 1
+    assert result["profile"]["row_count"] == 1
+    # SQLite does not report rows read
+    assert result["profile"]["rows_read"] is None
+    assert result["profile"]["execution_time_ms"] >= 0
+    assert result["plan"]["format"] == "sqlite_query_plan"
+    assert result["plan"]["plan"]
+
+@pytest.mark.asyncio
+async def test_execute_query_without_flags_omits_profile(server):
+    """Plain queries keep the original response shape."""
+    result = await server.execute_query("SELECT * FROM Widget")
+
+    assert result["row_count"] == 3
+    assert "profile" not in result
+    assert "plan" not in result
+
+SHOWPLAN = """<ShowPlanXML xmlns="http://schemas.microsoft.com/sqlserver/2004/07/showplan"><BatchSequence><Batch>
+<Statements><StmtSimple><QueryPlan>
+<RelOp PhysicalOp="Nested Loops"><RunTimeInformation><RunTimeCountersPerThread Thread="0" ActualRows="2"/></RunTimeInformation>
+  <NestedLoops>
+    <RelOp PhysicalOp="Clustered Index Scan"><RunTimeInformation>
+      <RunTimeCountersPerThread Thread="0" ActualRows="2" ActualRowsRead="1000"/>
+    </RunTimeInformation></RelOp>
+    <RelOp PhysicalOp="Key Lookup"><RunTimeInformation>
+      <RunTimeCountersPerThread Thread="0" ActualRows="2"/>
+    </RunTimeInformation></RelOp>
+  </NestedLoops>
+</RelOp>
+</QueryPlan></StmtSimple></Statements></Batch></BatchSequence></ShowPlanXML>"""
+
+def test_rows_read_from_actual_showplan():
+    """Rows read sum the access operators, preferring ActualRowsRead."""
+    assert rows_read_from_showplan(SHOWPLAN) == 1002
+    assert rows_read_from_showplan(None) is None
+
+def test_slow_query_log_keeps_slowest_queries():
+    """The log aggregates per query and evicts the fastest when full."""
+    log = SlowQueryLog(capacity=2)
+    log.record("SELECT 1", 5.0, 1)
+    log.record("SELECT 2", 50.0, 1)
+    log.record("SELECT 1", 15.0, 1)
+    log.record("SELECT 3", 1.0, 1)  # Faster than everything tracked - ignored
+    log.record("SELECT 4", 100.0, 1)  # Evicts SELECT 1
+
+    top = log.top()
+    assert [entry["query"] for entry in top] == ["SELECT 4", "SELECT 2"]
+    assert top[0]["calls"] == 1
+
+def test_statement_cache_parameterizes_literals():
+    """Literals become bind parameters; TOP, ordinals and type lengths stay literal."""
+    cache = StatementCache()
+    sql, literals = cache.normalize(
+        "SELECT TOP 5 CAST(Name AS VARCHAR(20)) FROM Widget "
+        "WHERE Name = N'o''neil' AND WidgetID > 2 ORDER BY 1"
+    )
+
+    assert sql == (
+        "SELECT TOP 5 CAST(Name AS VARCHAR(20)) FROM Widget "
+        "WHERE Name = :mcp_lit_0 AND WidgetID > :mcp_lit_1 ORDER BY 1"
+    )
+    assert literals == {"mcp_lit_0": "o'neil", "mcp_lit_1": 2}
+    assert cache.normalize("CREATE TABLE t (a VARCHAR(10))") == ("CREATE TABLE t (a VARCHAR(10))", {})
+
+def test_statement_cache_leaves_unsafe_literals():
+    """GROUP BY statements are not rewritten and OPTION hints stay literal."""
+    cache = StatementCache()
+    grouped = "SELECT SUBSTRING(Name, 1, 3), COUNT(*) FROM Widget GROUP BY SUBSTRING(Name, 1, 3)"
+    assert cache.normalize(grouped) == (grouped, {})
+
+    sql, literals = cache.normalize("SELECT * FROM Widget WHERE WidgetID > 2 OPTION (MAXDOP 1)")
+    assert sql == "SELECT * FROM Widget WHERE WidgetID > :mcp_lit_0 OPTION (MAXDOP 1)"
+    assert literals == {"mcp_lit_0": 2}
+
+@pytest.mark.asyncio
+async def test_execute_query_reuses_normalized_statement(server):
+    """Queries differing only in literals share one cached statement."""
+    first = await server.execute_query("SELECT * FROM Widget WHERE Name = 'alpha'", profile=True)
+    second = await server.execute_query("SELECT * FROM Widget WHERE Name = 'gamma'", profile=True)
+
+    assert first["data"][0]["Name"] == "alpha"
+    assert second["data"][0]["Name"] == "gamma"
+    assert first["profile"]["statement_cache_hit"] is False
+    assert second["profile"]["statement_cache_hit"] is True
+    assert server.statement_cache.stats()["hit_rate"] == 0.5
@@ -0,0 +1,239 @@
+"""
+Tests for notification email dispatch against a local SMTP stand-in
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from email import message_from_bytes
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Profile, User, UserNotification, UserNotificationPreference
+from app.services.email_utils import SMTPConnectionPool, SMTPSendQueue, SMTPSettings
+from app.services.notification_dispatcher import NotificationDispatcher, digest_cutoffs
+
+# Tuesday 10:00 UTC; the daily cutoff is 08:00 today, the weekly one Monday 08:00
+NOW = datetime(2026, 10, 20, 10, 0)
+
+
+class SMTPStandIn:
+    """Minimal SMTP server recording delivered messages and connections"""
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self.reject = set()
+        self.server = None
+        self._writers = set()
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def drop_connections(self):
+        """Close every open connection, like a server idle timeout"""
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.sleep(0.05)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        writer.write(b"220 standin ESMTP\r\n")
+        recipients = []
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                writer.write(b"250-standin\r\n250 8BITMIME\r\n")
+            elif command.startswith("MAIL") or command == "RSET":
+                recipients = []
+                writer.write(b"250 OK\r\n")
+            elif command.startswith("HELO") or command == "NOOP":
+                writer.write(b"250 OK\r\n")
+            elif command.startswith("RCPT"):
+                address = line.decode().split(":", 1)[1].strip().strip("<>")
+                if address in self.reject:
+                    writer.write(b"550 No such user\r\n")
+                else:
+                    recipients.append(address)
+                    writer.write(b"250 OK\r\n")
+            elif command == "DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                await writer.drain()
+                data = await reader.readuntil(b"\r\n.\r\n")
+                self.messages.append((recipients, message_from_bytes(data[:-5])))
+                writer.write(b"250 Queued\r\n")
+            elif command == "QUIT":
+                writer.write(b"221 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"502 Not implemented\r\n")
+            await writer.drain()
+        self._writers.discard(writer)
+        writer.close()
+
+
+@pytest.fixture
+def notified_users(db_session):
+    users = []
+    for name in ("ada", "bob", "cy"):
+        profile = Profile(FirstName=name.title(), LastName="Test", EmailAddress=f"{name}@example.com")
+        db_session.add(profile)
+        db_session.flush()
+        user = User(Username=name, EmailAddress=f"{name}@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+        db_session.add(user)
+        db_session.flush()
+        users.append(user)
+    ada, bob, cy = users
+
+    db_session.add_all([
+        UserNotificationPreference(UserID=bob.UserID, NotificationType="job_match", Frequency="daily"),
+        UserNotificationPreference(UserID=bob.UserID, NotificationType="reminder", EmailEnabled=False),
+        UserNotificationPreference(UserID=cy.UserID, NotificationType="job_match", Frequency="Weekly"),
+    ])
+
+    def notify(user, kind, title, created):
+        db_session.add(UserNotification(UserID=user.UserID, NotificationType=kind, Title=title,
+                                        Message=f"{title} details", createdDate=created))
+
+    notify(ada, "reminder", "Follow up with Acme", NOW - timedelta(minutes=5))
+    notify(bob, "job_match", "Data Engineer at Initech", NOW - timedelta(hours=5))
+    notify(bob, "job_match", "Analyst at Globex", NOW - timedelta(hours=4))
+    notify(bob, "job_match", "Too recent for today's digest", NOW - timedelta(hours=1))
+    notify(bob, "reminder", "Email disabled", NOW - timedelta(hours=5))
+    notify(bob, "interview", "Interview tomorrow", NOW - timedelta(minutes=1))
+    notify(cy, "job_match", "Before the weekly cutoff", NOW - timedelta(days=2))
+    notify(cy, "job_match", "After the weekly cutoff", NOW - timedelta(hours=3))
+    db_session.commit()
+    return users
+
+
+def _dispatcher(db_session, port, batch_size=500, **kwargs):
+    pool = SMTPConnectionPool(SMTPSettings(hostname="127.0.0.1", port=port, start_tls=False,
+                                           from_email="noreply@example.com"), size=2)
+    mailer = SMTPSendQueue(pool, workers=2, keepalive_interval=0)
+    return NotificationDispatcher(sessionmaker(bind=db_session.get_bind()), mailer, batch_size=batch_size, **kwargs)
+
+
+def _sent_titles(db_session):
+    db_session.expire_all()
+    return sorted(n.Title for n in db_session.query(UserNotification).filter(UserNotification.IsEmailSent.is_(True)))
+
+
+def test_digest_cutoffs():
+    cutoffs = digest_cutoffs(NOW)
+    assert cutoffs == {"daily": datetime(2026, 10, 20, 8), "weekly": datetime(2026, 10, 19, 8)}
+    early = digest_cutoffs(datetime(2026, 10, 19, 7, 0))
+    assert early == {"daily": datetime(2026, 10, 18, 8), "weekly": datetime(2026, 10, 12, 8)}
+
+
+@pytest.mark.parametrize("batch_size", [500, 3])
+def test_dispatch_groups_and_marks_sent(db_session, notified_users, batch_size):
+    ada, bob, cy = notified_users
+
+    async def run():
+        smtp = SMTPStandIn()
+        dispatcher = _dispatcher(db_session, await smtp.start(), batch_size)
+        try:
+            sent = await dispatcher.dispatch(now=NOW)
+            again = await dispatcher.dispatch(now=NOW)
+            await dispatcher.mailer.stop()
+        finally:
+            await smtp.stop()
+        return smtp, dispatcher, sent, again
+
+    smtp, dispatcher, sent, again = asyncio.run(run())
+
+    assert sent == 5 and again == 0
+    by_recipient = {}
+    for recipients, message in smtp.messages:
+        by_recipient.setdefault(recipients[0], []).append(message)
+    assert {k: len(v) for k, v in by_recipient.items()} == {
+        "ada@example.com": 1, "bob@example.com": 2, "cy@example.com": 1,
+    }
+
+    assert by_recipient["ada@example.com"][0]["Subject"] == "Follow up with Acme"
+    assert by_recipient["ada@example.com"][0]["From"] == "noreply@example.com"
+    bob_subjects = sorted(m["Subject"] for m in by_recipient["bob@example.com"])
+    assert bob_subjects == ["Interview tomorrow", "Your daily JobTrackerDB digest: 2 notifications"]
+    digest = next(m for m in by_recipient["bob@example.com"] if "digest" in m["Subject"])
+    assert "Data Engineer at Initech" in digest.get_payload() and "Analyst at Globex" in digest.get_payload()
+    assert by_recipient["cy@example.com"][0]["Subject"] == "Your weekly JobTrackerDB digest: 1 notifications"
+
+    assert _sent_titles(db_session) == sorted([
+        "Follow up with Acme", "Data Engineer at Initech", "Analyst at Globex", "Interview tomorrow",
+        "Before the weekly cutoff",
+    ])
+    # Connections are reused across emails and passes
+    assert smtp.connections <= dispatcher.mailer.pool.size
+    assert dispatcher.mailer.pool.stats["sent"] == 4 and dispatcher.stats["emails_sent"] == 4
+
+
+def test_rejected_recipient_stays_pending(db_session, notified_users):
+    async def run():
+        smtp = SMTPStandIn()
+        smtp.reject.add("bob@example.com")
+        dispatcher = _dispatcher(db_session, await smtp.start())
+        try:
+            sent = await dispatcher.dispatch(now=NOW)
+            await dispatcher.mailer.stop()
+        finally:
+            await smtp.stop()
+        return smtp, dispatcher, sent
+
+    smtp, dispatcher, sent = asyncio.run(run())
+
+    assert sent == 2
+    assert _sent_titles(db_session) == ["Before the weekly cutoff", "Follow up with Acme"]
+    assert dispatcher.stats["send_failures"] == 2 and dispatcher.stats["refused"] == 2
+    # The rejected sends reset their connection instead of dropping it
+    assert smtp.connections <= dispatcher.mailer.pool.size
+
+
+def _email_attempts(db_session):
+    db_session.expire_all()
+    return {n.Title: n.EmailAttempts for n in db_session.query(UserNotification) if n.EmailAttempts}
+
+
+def test_refused_recipient_is_abandoned_after_max_attempts(db_session, notified_users):
+    async def run():
+        smtp = SMTPStandIn()
+        smtp.reject.add("bob@example.com")
+        dispatcher = _dispatcher(db_session, await smtp.start(), max_email_attempts=2)
+        try:
+            sent = [await dispatcher.dispatch(now=NOW) for _ in range(3)]
+            await dispatcher.mailer.stop()
+        finally:
+            await smtp.stop()
+        return dispatcher, sent
+
+    dispatcher, sent = asyncio.run(run())
+
+    assert sent == [2, 0, 0]
+    # Bob's digest and interview email were refused twice, then not tried again
+    assert dispatcher.stats["send_failures"] == 4 and dispatcher.stats["abandoned"] == 3
+    assert _email_attempts(db_session) == {
+        "Data Engineer at Initech": 2, "Analyst at Globex": 2, "Interview tomorrow": 2,
+    }
+
+
+def test_unreachable_server_does_not_count_attempts(db_session, notified_users):
+    async def run():
+        smtp = SMTPStandIn()
+        port = await smtp.start()
+        await smtp.stop()
+        dispatcher = _dispatcher(db_session, port, max_email_attempts=1)
+        sent = await dispatcher.dispatch(now=NOW)
+        await dispatcher.mailer.stop()
+        return dispatcher, sent
+
+    dispatcher, sent = asyncio.run(run())
+
+    assert sent == 0 and dispatcher.stats["send_failures"] == 4
+    assert dispatcher.stats["refused"] == 0 and _email_attempts(db_session) == {}
@@ -0,0 +1,74 @@
+"""
+Tests for the password hashing service
+"""
+
+import hashlib
+
+import pytest
+
+from app.services.password_hashing import (
+    PasswordHasher,
+    PasswordHashingService,
+    PBKDF2Hasher,
+    ScryptHasher,
+    calibrate_hasher,
+    MIN_SCRYPT_N,
+)
+
+
+@pytest.fixture
+def service():
+    return PasswordHashingService(ScryptHasher(n=2 ** 14), max_workers=1)
+
+
+def test_hash_and_verify_roundtrip(service):
+    encoded = service.hash("S3cret!pass")
+    assert encoded.startswith("scrypt$")
+
+    assert service.verify("S3cret!pass", encoded) == (True, None)
+    assert service.verify("wrong", encoded) == (False, None)
+
+
+def test_legacy_sha256_hash_is_upgraded(service):
+    salt = "a" * 32
+    legacy = f"{salt}${hashlib.sha256(('OldPass1' + salt).encode()).hexdigest()}"
+
+    valid, upgraded = service.verify("OldPass1", legacy)
+    assert valid
+    assert upgraded.startswith("scrypt$")
+    assert service.verify("OldPass1", upgraded) == (True, None)
+    assert service.verify("nope", legacy) == (False, None)
+
+
+def test_weaker_work_factor_is_upgraded(service):
+    weaker = PBKDF2Hasher(iterations=1000).hash("pw")
+    valid, upgraded = service.verify("pw", weaker)
+    assert valid
+    assert upgraded.startswith("scrypt$")
+
+
+def test_malformed_hashes_are_rejected(service):
+    for encoded in (None, "", "no-separator", "scrypt$bad$values"):
+        assert service.verify("pw", encoded) == (False, None)
+
+
+def test_incomplete_hasher_cannot_be_instantiated():
+    class HashOnly(PasswordHasher):
+        scheme = "hash_only"
+
+        def hash(self, password):
+            return f"hash_only${password}"
+
+    with pytest.raises(TypeError):
+        HashOnly()
+
+
+def test_calibration_respects_minimum():
+    hasher = calibrate_hasher("scrypt", target_ms=0.001)
+    assert hasher.n == MIN_SCRYPT_N
+
+
+@pytest.mark.asyncio
+async def test_async_verify(service):
+    encoded = await service.hash_async("pw")
+    assert await service.verify_async("pw", encoded) == (True, None)
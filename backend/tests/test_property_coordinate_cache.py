@@ -0,0 +1,90 @@
+"""
+Tests for the PropertyID coordinate cache
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models import PropertyCoordinateCache
+from app.services import address_validation_service
+from app.services.address_validation_service import AddressValidationService
+from app.services.property_coordinate_cache import PropertyCoordinateStore
+
+RESULT = {
+    "success": True,
+    "latitude": -33.865143,
+    "longitude": 151.2099,
+    "address": {"suburb": "SYDNEY", "state": "NSW"},
+    "property_id": "GANSW100",
+    "confidence_score": 0.9,
+}
+
+
+class FakeGeoscape:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def get_address_coordinates(self, address, property_id=None):
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def store(db_session):
+    return PropertyCoordinateStore(sessionmaker(bind=db_session.get_bind()), ttl_days=30)
+
+
+@pytest.mark.asyncio
+async def test_store_round_trips_through_database(db_session, store):
+    assert await store.put(RESULT)
+    assert db_session.get(PropertyCoordinateCache, "GANSW100") is not None
+
+    # A new process only has the table
+    cold = PropertyCoordinateStore(store.session_factory)
+    result, fresh = await cold.get("GANSW100")
+    assert fresh and result["latitude"] == pytest.approx(-33.865143)
+    assert result["address"]["suburb"] == "SYDNEY"
+    assert cold.stats["database_hits"] == 1
+
+    assert not await store.put({**RESULT, "property_id": "GANSW101", "confidence_score": 0.5})
+
+
+@pytest.mark.asyncio
+async def test_coordinates_use_cache_and_serve_stale_on_error(monkeypatch, db_session, store):
+    monkeypatch.setattr(address_validation_service, "get_property_coordinate_store", lambda: store)
+    service = AddressValidationService()
+    provider = FakeGeoscape(RESULT)
+    service.providers["geoscape"] = provider
+
+    await service.get_address_coordinates("1 Test St", "GANSW100")
+    cached = await service.get_address_coordinates("1 Test St", "GANSW100")
+    assert provider.calls == 1
+    assert cached["cached"] is True
+
+    # Expire the entry, then fail the refresh
+    store._memory.clear()
+    row = db_session.get(PropertyCoordinateCache, "GANSW100")
+    row.ExpiresDate = datetime.utcnow() - timedelta(days=1)
+    db_session.commit()
+    provider.result = {"success": False, "error": "upstream down"}
+
+    stale = await service.get_address_coordinates("1 Test St", "GANSW100")
+    assert provider.calls == 2
+    assert stale["success"] and stale["latitude"] == pytest.approx(-33.865143)
+
+
+@pytest.mark.asyncio
+async def test_lookup_resolved_to_another_id_is_cached_under_both(monkeypatch, db_session, store):
+    monkeypatch.setattr(address_validation_service, "get_property_coordinate_store", lambda: store)
+    service = AddressValidationService()
+    provider = FakeGeoscape(RESULT)
+    service.providers["geoscape"] = provider
+
+    await service.get_address_coordinates("1 Test St", "GANSW-OLD")
+    assert (await service.get_address_coordinates("1 Test St", "GANSW-OLD"))["cached"] is True
+    assert (await service.get_address_coordinates("1 Test St", "GANSW100"))["cached"] is True
+    assert provider.calls == 1
+    assert db_session.get(PropertyCoordinateCache, "GANSW-OLD") is not None
@@ -0,0 +1,79 @@
+"""
+Tests for the token bucket rate limiter
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import InMemoryRateLimitBackend, RateLimitMiddleware, RateLimitRule, parse_rate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(rules, clock):
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        return {"ok": True}
+
+    @app.get("/search")
+    async def search():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, rules=rules, backend=InMemoryRateLimitBackend(clock=clock))
+    return TestClient(app)
+
+
+def test_bucket_rejects_then_refills():
+    clock = FakeClock()
+    client = make_client([RateLimitRule("login", "/login", ("POST",), limit=2, period=60)], clock)
+
+    assert client.post("/login").status_code == 200
+    assert client.post("/login").status_code == 200
+    rejected = client.post("/login")
+    assert rejected.status_code == 429
+    assert rejected.headers["retry-after"] == "30"
+
+    # Other endpoints and methods are not limited
+    assert client.get("/search").status_code == 200
+
+    clock.now = 30.0
+    assert client.post("/login").status_code == 200
+    assert client.post("/login").status_code == 429
+
+
+def test_user_scope_is_keyed_by_credentials():
+    clock = FakeClock()
+    client = make_client([RateLimitRule("search", "/search", ("GET",), limit=1, period=60, scope="user")], clock)
+
+    assert client.get("/search", headers={"Authorization": "Bearer a"}).status_code == 200
+    assert client.get("/search", headers={"Authorization": "Bearer a"}).status_code == 429
+    assert client.get("/search", headers={"Authorization": "Bearer b"}).status_code == 200
+    # Anonymous requests fall outside a user-scoped rule
+    assert client.get("/search").status_code == 200
+
+
+def test_parse_rate():
+    assert parse_rate("10/minute") == (10, 60.0)
+    assert parse_rate("5 / second") == (5, 1.0)
+
+
+def test_full_backend_evicts_least_recently_used():
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(max_keys=2, clock=clock)
+    rule = RateLimitRule("login", "/login", ("POST",), limit=1, period=60)
+
+    assert backend.acquire("login:ip:a", rule)[0]
+    assert backend.acquire("login:ip:b", rule)[0]
+    assert not backend.acquire("login:ip:a", rule)[0]  # a is now the most recent
+    assert backend.acquire("login:ip:c", rule)[0]  # evicts b only
+
+    assert not backend.acquire("login:ip:a", rule)[0]
+    assert backend.acquire("login:ip:b", rule)[0]
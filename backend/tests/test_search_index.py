@@ -0,0 +1,148 @@
+"""
+Tests for the full-text search index
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.models import (
+    JobApplication, JobApplicationNote, JobBoard, JobBoardJob, Profile, User, UserJobBoardJobInteraction,
+)
+from app.services import search_index
+from app.services.search_index import (
+    EmbeddedSearchBackend, SearchIndexSync, install_search_hooks, query_terms, search_documents,
+)
+
+
+def add_user(db_session, name):
+    profile = Profile(FirstName=name, LastName="Search", EmailAddress=f"{name}@example.com")
+    db_session.add(profile)
+    db_session.flush()
+    user = User(Username=name, EmailAddress=f"{name}@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+@pytest.fixture
+def search_data(db_session):
+    alice, bob = add_user(db_session, "alice"), add_user(db_session, "bob")
+    board = JobBoard(BoardName="Seek")
+    db_session.add(board)
+    db_session.flush()
+    jobs = [
+        JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="Kubernetes Platform Engineer", CompanyName="Acme",
+                    JobDescription="Run our Kubernetes clusters and CI pipelines."),
+        JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="Backend Engineer", CompanyName="Globex",
+                    JobDescription="Python services deployed on Kubernetes."),
+        JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="Kubernetes Consultant", CompanyName="Initech",
+                    JobDescription="Untracked by anyone."),
+    ]
+    db_session.add_all(jobs)
+    db_session.flush()
+    db_session.add_all(
+        UserJobBoardJobInteraction(UserID=alice.UserID, JobBoardJobID=job.JobBoardJobID, InteractionType="viewed")
+        for job in jobs[:2]
+    )
+    application = JobApplication(ProfileID=alice.ProfileID, JobTitle="Site Reliability Engineer", CompanyName="Acme",
+                                 DateApplied=datetime.utcnow(), ApplicationStatus="Applied")
+    other = JobApplication(ProfileID=bob.ProfileID, JobTitle="Kubernetes Administrator", CompanyName="Hooli",
+                           DateApplied=datetime.utcnow())
+    db_session.add_all([application, other])
+    db_session.flush()
+    db_session.add(JobApplicationNote(JobApplicationID=application.JobApplicationID,
+                                      NoteText="Recruiter asked about Kubernetes upgrades and on-call."))
+    db_session.commit()
+
+    backend = EmbeddedSearchBackend(":memory:", batch_size=2)
+    factory = sessionmaker(bind=db_session.get_bind())
+    backend.sync(factory)
+    return alice, bob, jobs, application, backend, factory
+
+
+def test_query_terms_strip_query_syntax():
+    assert query_terms('kubernetes" OR NEAR(x) c++*') == ["kubernetes", "or", "near", "x", "c"]
+    assert query_terms("  --  ") == []
+
+
+def test_search_is_scoped_ranked_and_paginated(db_session, search_data):
+    alice, bob, jobs, application, backend, _ = search_data
+    assert len(backend) == 6
+
+    result = search_documents(db_session, backend, "kubernetes", alice.UserID)
+    assert result.total == 3
+    # Title matches rank above body-only matches; untracked jobs and other users' documents are excluded
+    assert [(hit.doc_type, hit.doc_id) for hit in result.hits][0] == ("job", jobs[0].JobBoardJobID)
+    assert {(hit.doc_type, hit.doc_id) for hit in result.hits} == {
+        ("job", jobs[0].JobBoardJobID), ("job", jobs[1].JobBoardJobID), ("note", 1)
+    }
+    note = next(hit for hit in result.hits if hit.doc_type == "note")
+    assert note.job_application_id == application.JobApplicationID
+    assert "<mark>Kubernetes</mark>" in note.snippet
+
+    pages = [search_documents(db_session, backend, "kubernetes", alice.UserID, page=page, page_size=2)
+             for page in (1, 2)]
+    assert [len(page.hits) for page in pages] == [2, 1]
+    assert [hit.doc_id for page in pages for hit in page.hits] == [hit.doc_id for hit in result.hits]
+
+    assert search_documents(db_session, backend, "kube", bob.UserID, doc_types=["application"]).total == 1
+    assert search_documents(db_session, backend, "acme engineer", alice.UserID, doc_types=["application"]).total == 1
+    with pytest.raises(ValueError):
+        search_documents(db_session, backend, "?!", alice.UserID)
+    with pytest.raises(LookupError):
+        search_documents(db_session, backend, "kubernetes", 999)
+
+
+def test_sync_indexes_inserts_edits_and_drops_deleted_rows(db_session, search_data):
+    alice, _, jobs, application, backend, factory = search_data
+    db_session.add(JobApplicationNote(JobApplicationID=application.JobApplicationID, NoteText="Terraform take-home"))
+    application.CompanyName = "Acme Cloud"
+    application.lastUpdated = datetime.utcnow()
+    db_session.commit()
+    assert backend.sync(factory) == 2
+    assert search_documents(db_session, backend, "terraform", alice.UserID).total == 1
+    assert search_documents(db_session, backend, "cloud", alice.UserID, doc_types=["application"]).total == 1
+    assert backend.sync(factory) == 1  # Edit overlap re-reads the recent edit only
+
+    db_session.query(UserJobBoardJobInteraction).filter_by(JobBoardJobID=jobs[1].JobBoardJobID).delete()
+    db_session.query(JobApplicationNote).filter(JobApplicationNote.NoteText.like("Recruiter%")).delete()
+    db_session.commit()
+    result = search_documents(db_session, backend, "kubernetes", alice.UserID)
+    assert [(hit.doc_type, hit.doc_id) for hit in result.hits] == [("job", jobs[0].JobBoardJobID)]
+    assert len(backend) == 6
+
+
+def test_commit_hooks_mark_documents_for_reindex(db_session, search_data):
+    alice, _, jobs, _, backend, factory = search_data
+    worker = SearchIndexSync(backend, factory)
+    install_search_hooks(factory, worker)
+
+    session = factory()
+    job = session.get(JobBoardJob, jobs[0].JobBoardJobID)
+    job.JobDescription = "Now mostly Nomad and Consul."  # No lastUpdated: only the hook sees this edit
+    session.commit()
+    session.close()
+    assert worker.pending == 1
+
+    asyncio.run(worker.sync())
+    assert worker.pending == 0
+    assert search_documents(db_session, backend, "nomad", alice.UserID).total == 1
+
+
+def test_search_endpoint(client, db_session, search_data, monkeypatch):
+    alice, _, _, _, backend, _ = search_data
+    monkeypatch.setattr(search_index, "_backend", backend)
+
+    response = client.get("/api/v1/search", params={"q": "kubernetes", "user_id": alice.UserID, "page_size": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3 and body["backend"] == "embedded"
+    assert len(body["results"]) == 2 and body["results"][0]["type"] == "job"
+
+    assert client.get("/api/v1/search", params={"q": "x", "user_id": alice.UserID, "types": "jobs"}).status_code == 400
+    assert client.get("/api/v1/search", params={"q": "x", "user_id": 999}).status_code == 404
+    assert app.url_path_for("search") == "/api/v1/search"
@@ -0,0 +1,75 @@
+"""
+Tests for the skill dictionary and alias normalization
+"""
+
+from app.models import (
+    JobBoard, JobBoardJob, JobBoardJobSkill, Profile, ProfileVersion, SkillDictionary, Skills, User,
+    UserJobBoardJobFitScore,
+)
+from app.services.fit_score_engine import FitScoreEngine
+from app.services.skill_dictionary import (
+    SkillNormalizer, fold_skill_name, renormalize_skill_rows, seed_skill_dictionary,
+)
+
+
+def test_fold_keeps_distinguishing_punctuation():
+    assert fold_skill_name(" Node.JS ") == fold_skill_name("nodejs") == "nodejs"
+    assert fold_skill_name("Ｐｙｔｈｏｎ ３") == "python3"
+    assert len({fold_skill_name(name) for name in ("C", "C#", "C++")}) == 3
+
+
+def test_aliases_resolve_to_one_canonical_id(db_session):
+    normalizer = SkillNormalizer()
+    seed_skill_dictionary(db_session, normalizer)
+
+    ids = {normalizer.resolve(db_session, name) for name in ("JS", "Javascript", "JavaScript", "ecmascript")}
+    assert len(ids) == 1
+    assert normalizer.canonical_name(ids.pop()) == "JavaScript"
+    assert normalizer.resolve(db_session, "k8s") == normalizer.lookup("Kubernetes")
+    assert normalizer.resolve(db_session, "  ") is None
+
+
+def test_unknown_skills_are_created_once_and_forgotten_on_rollback(db_session):
+    normalizer = SkillNormalizer()
+    created = normalizer.resolve(db_session, "Terraform")
+    assert normalizer.resolve(db_session, "terraform") == created
+    assert normalizer.lookup("Terraform") is None  # Not shared until committed
+    db_session.rollback()
+    assert normalizer.lookup("Terraform") is None
+
+    created = normalizer.resolve(db_session, "Terraform")
+    db_session.commit()
+    assert normalizer.lookup("TERRAFORM") == created
+    # Another process' index finds the committed entry instead of duplicating it
+    assert SkillNormalizer().resolve(db_session, "terra-form") == created
+    assert db_session.query(SkillDictionary).filter_by(IsCurated=False).count() == 1
+
+
+def test_renormalize_links_rows_and_fit_scores_match_by_id(db_session):
+    profile = Profile(FirstName="Skill", LastName="Alias", EmailAddress="alias@example.com")
+    db_session.add(profile)
+    db_session.flush()
+    user = User(Username="alias", EmailAddress="alias@example.com", HashedPassword="x", ProfileID=profile.ProfileID)
+    db_session.add_all([user, ProfileVersion(ProfileID=profile.ProfileID, VersionNumber=1)])
+    db_session.add_all(Skills(ProfileID=profile.ProfileID, SkillName=name, Proficiency="Expert")
+                       for name in ("JS", "Postgres"))
+    board = JobBoard(BoardName="Seek")
+    db_session.add(board)
+    db_session.flush()
+    job = JobBoardJob(JobBoardID=board.JobBoardID, JobTitle="Full Stack", CompanyName="Acme")
+    db_session.add(job)
+    db_session.flush()
+    db_session.add_all(JobBoardJobSkill(JobBoardJobID=job.JobBoardJobID, SkillName=name, SkillType="required")
+                       for name in ("JavaScript", "PostgreSQL", "Rust"))
+    db_session.commit()
+
+    normalizer = SkillNormalizer()
+    seed_skill_dictionary(db_session, normalizer)
+    results = renormalize_skill_rows(db_session, normalizer, batch_size=2)
+    assert results["Skills"] == {"scanned": 2, "updated": 2}
+    assert results["JobBoardJobSkill"] == {"scanned": 3, "updated": 3}
+    assert renormalize_skill_rows(db_session, normalizer)["Skills"] == {"scanned": 0, "updated": 0}
+
+    FitScoreEngine().score_user(db_session, user.UserID)
+    score = db_session.query(UserJobBoardJobFitScore).one()
+    assert (score.SkillsMatched, score.SkillsMissing) == (2, 1)